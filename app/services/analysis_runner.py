@@ -7,9 +7,10 @@
 """
 
 import time
+from typing import Optional
 import streamlit as st
 from app.components.analysis_status import render_analysis_progress
-from app.services.api_client import get_analysis_status, upload_file, run_analysis
+from app.services.api_client import get_analysis_status, stream_analysis_status, upload_file, run_analysis
 from app.utils.logger import get_logger
 
 # 로거 선언
@@ -61,8 +62,16 @@ def execute_analysis_steps(filter_options: dict) -> bool:
                 filter_options=filter_options)
     
     """
-    상태 API 응답을 기반으로 분석 단계 진행 UI 표시
+    상태 구독(SSE) 이벤트를 기반으로 분석 단계 진행 UI 표시 (구독 실패 시 polling으로 전환)
     """
+    try:
+        for response in stream_analysis_status(project_id=st.session_state.project_id):
+            finished = _apply_status_response(response)
+            if finished is not None:
+                return finished
+    except Exception as e:
+        logger.error(f"❌ Status 구독 실패, polling으로 전환: {str(e)}")
+    
     for _ in range(300):  # 최대 5분간 polling
         try:
             response = get_analysis_status(project_id=st.session_state.project_id)
@@ -72,48 +81,69 @@ def execute_analysis_steps(filter_options: dict) -> bool:
             time.sleep(2)  # 2초 대기 후 재시도
             continue
 
-        st.session_state.status_result = response
-        
-        status = response.get("status")
-        step = response.get("step", 1)
-        total_steps = response.get("total_steps", 13)
-        message = response.get("message", "")
-        updated_at = response.get("updated_at", "")
-        
-        # 응답값 반영
-        st.session_state.total_analysis_steps = status
-        st.session_state.current_analysis_step = step
-        st.session_state.total_analysis_steps = total_steps
-        st.session_state.current_status_message = message
-
-        # 상태 표시 UI 갱신
-        with st.session_state.progress_placeholder.container():
-            render_analysis_progress()
-            
-        # ✅ 상태에 따른 분기 처리
-        if status == "done": # 완료되면 종료
-            return True
-        elif status == "error" or step < 0:
-            logger.error(f"분석 실패. status: {status}")
-            st.session_state.analysis_in_progress = False
-            st.session_state.show_results = False  # 결과 표시 방지
-            st.session_state.error_message = f"❌ 분석 중 오류 발생: {message}"
-            return False
-        elif status == "failed":
-            logger.error(f"분석 실패. status: {status}")
-            st.session_state.analysis_in_progress = False
-            st.session_state.show_results = False  # 결과 표시 방지
-            st.session_state.error_message = f"❌ 분석 중 오류 발생: {message}"
-            return False
-        elif step == 0:
-            logger.error(f"분석 진행 중단. step: {step}")
-            st.session_state.analysis_in_progress = False
-            st.session_state.show_results = False  # 결과 표시 방지
-            st.session_state.error_message = f"❌ 분석 중단"
-            return False
+        finished = _apply_status_response(response)
+        if finished is not None:
+            return finished
         time.sleep(1)  # 1초 간격 polling
 
     st.session_state.analysis_in_progress = False
     st.session_state.show_results = False  # 결과 표시 방지
     st.session_state.error_message = f"Time Out"
     return False
+
+def _apply_status_response(response: dict) -> Optional[bool]:
+    """
+    분석 상태 응답을 세션 상태와 진행 UI에 반영
+
+    Returns:
+        Optional[bool]: 종료 상태면 분석 성공 여부, 진행 중이면 None
+    """
+    st.session_state.status_result = response
+    
+    status = response.get("status")
+    step = response.get("step", 1)
+    total_steps = response.get("total_steps", 13)
+    message = response.get("message", "")
+    updated_at = response.get("updated_at", "")
+    
+    # 작업 큐 대기 중이면 최신 대기 순번 표시
+    if status == "queued" and response.get("queue_position"):
+        message = f"⏳ 분석 대기중(대기 순번 {response.get('queue_position')})"
+    
+    # 예상 잔여 시간 표시
+    if response.get("eta_sec"):
+        message = f"{message} - 예상 잔여 {int(response.get('eta_sec'))}초"
+    
+    # 응답값 반영
+    st.session_state.current_analysis_step = step
+    st.session_state.total_analysis_steps = total_steps
+    st.session_state.current_status_message = message
+
+    # 상태 표시 UI 갱신
+    with st.session_state.progress_placeholder.container():
+        render_analysis_progress()
+        
+    # ✅ 상태에 따른 분기 처리
+    if status == "done": # 완료되면 종료
+        return True
+    elif status == "queued": # 작업 큐 대기 중
+        return None
+    elif status == "error" or step < 0:
+        logger.error(f"분석 실패. status: {status}")
+        st.session_state.analysis_in_progress = False
+        st.session_state.show_results = False  # 결과 표시 방지
+        st.session_state.error_message = f"❌ 분석 중 오류 발생: {message}"
+        return False
+    elif status == "failed":
+        logger.error(f"분석 실패. status: {status}")
+        st.session_state.analysis_in_progress = False
+        st.session_state.show_results = False  # 결과 표시 방지
+        st.session_state.error_message = f"❌ 분석 중 오류 발생: {message}"
+        return False
+    elif step == 0:
+        logger.error(f"분석 진행 중단. step: {step}")
+        st.session_state.analysis_in_progress = False
+        st.session_state.show_results = False  # 결과 표시 방지
+        st.session_state.error_message = f"❌ 분석 중단"
+        return False
+    return None
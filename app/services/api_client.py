@@ -8,7 +8,8 @@ Streamlit UI에서 FastAPI 백엔드와 통신하는 API 클라이언트 제공
 
 import requests
 import os
-from typing import Optional, Dict
+import json
+from typing import Optional, Dict, Iterator
 from dotenv import load_dotenv
 
 # .env 파일에서 환경 변수 로드
@@ -73,6 +74,36 @@ def get_analysis_status(project_id: str) -> dict:
     """
     return _post_and_extract(api_path="/analyze/status", payload={"project_id": project_id}, multipart=False, uploaded_file=None)
 
+def stream_analysis_status(project_id: str, read_timeout: int = 60) -> Iterator[dict]:
+    """
+    분석 상태 구독 (SSE)
+
+    Args:
+        project_id (str): 프로젝트 ID
+        read_timeout (int, optional): 이벤트(heartbeat 포함) 최대 대기 시간(초). Defaults to 60.
+
+    Yields:
+        dict: 상태 변경 시마다 분석 상태
+    """
+    if not API_BASE_URL:
+        raise Exception("🌧️API_BASE_URL 환경변수가 설정되지 않았습니다.")
+    
+    url = f"{API_BASE_URL}/analyze/status/stream"
+    
+    with requests.get(url, params={"project_id": project_id}, stream=True, timeout=(10, read_timeout)) as response:
+        response.raise_for_status()
+        data_lines = []
+        
+        for line in response.iter_lines(decode_unicode=True):
+            if line is None:
+                continue
+            if line.startswith("data:"):
+                data_lines.append(line[len("data:"):].strip())
+            elif line == "" and data_lines:
+                # 빈 줄 = 이벤트 종료
+                yield json.loads("\n".join(data_lines))
+                data_lines = []
+
 def run_analysis(session_id: str, project_id: str, project_name: str, analyzed_date: str, file_info: Dict, filter_options: Dict) -> dict:
     """
     분석 시작
@@ -0,0 +1,229 @@
+# benchmarks/run_benchmark.py
+
+"""
+분석 파이프라인 벤치마크 실행 모듈
+- 합성 Spring 프로젝트를 생성하고, 오프라인 대체 LLM/임베딩으로 run_autodiagenti_graph를 실행하여
+  단계(에이전트)별 실행 시간, 메모리, 모델 호출 건수를 JSON으로 출력
+- 기본 파서 백엔드는 javalang (Java 런타임/파서 JAR 없이 실행), --parser-backend jar로 JAR 파서 측정
+
+사용법:
+    python -m benchmarks.run_benchmark --size small --llm-latency 0.05 --output bench_small.json
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import asyncio
+import argparse
+import resource
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from benchmarks.synthetic_project import SIZE_PRESETS, SyntheticProjectSpec, generate_spring_project
+from benchmarks.stub_models import StubCallStats, create_stub_factories
+from server.utils.config import settings, set_model_factories
+from server.utils.constants import DirInfo, LLMModel, ParserBackend
+from server.db import model  # noqa: F401 - 테이블 메타데이터 등록
+from server.db.database import Base, engine, run_with_db_session
+from server.db.dao.entry_point_list_dao import delete_entry_points_by_project_and_date
+from server.db.dao.analysis_history_dao import delete_analysis_history_by_project_id_and_date
+from server.utils.vectorstore_utils import delete_faiss_index_by_project
+from server.workflow.agents.base.base_agent import BaseAgent
+from server.workflow.artifact_store import delete_project_artifacts
+from server.workflow.checkpointer import get_checkpointer
+from server.workflow.graph import run_autodiagenti_graph
+from server.workflow.state import get_project_status
+
+BENCH_PROJECT_NAME = "bench-project"
+
+
+class StageProfiler:
+    """
+    BaseAgent.run을 감싸 에이전트(단계)별 실행 시간, 메모리, 모델 호출 건수를 집계
+    (단계가 동시에 실행되면 호출 건수/메모리 피크는 겹치는 단계에 함께 집계됨)
+    """
+    def __init__(self, stats: StubCallStats, trace_memory: bool):
+        self.stats = stats
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def patch_agents(self) -> Iterator[None]:
+        original_run = BaseAgent.run
+        profiler = self
+
+        async def _profiled_run(agent: BaseAgent, state):
+            before = profiler.stats.snapshot()
+            rss_before = _max_rss_mb()
+            if profiler.trace_memory:
+                tracemalloc.reset_peak()
+            started = time.perf_counter()
+            try:
+                return await original_run(agent, state)
+            finally:
+                profiler._record(
+                    role=str(agent.role),
+                    wall_sec=time.perf_counter() - started,
+                    before=before,
+                    after=profiler.stats.snapshot(),
+                    peak_mb=tracemalloc.get_traced_memory()[1] / 1024 / 1024 if profiler.trace_memory else None,
+                    rss_growth_mb=_max_rss_mb() - rss_before
+                )
+
+        BaseAgent.run = _profiled_run
+        try:
+            yield
+        finally:
+            BaseAgent.run = original_run
+
+    def _record(self, role: str, wall_sec: float, before: Dict, after: Dict, peak_mb: Optional[float], rss_growth_mb: float) -> None:
+        stage = self.stages.setdefault(role, {"runs": 0, "wall_sec": 0.0, "llm_calls": 0, "embedding_calls": 0, "embedded_texts": 0, "peak_traced_mb": None, "max_rss_growth_mb": 0.0})
+        stage["runs"] += 1
+        stage["wall_sec"] = round(stage["wall_sec"] + wall_sec, 3)
+        stage["llm_calls"] += after["llm_calls"] - before["llm_calls"]
+        stage["embedding_calls"] += after["embedding_calls"] - before["embedding_calls"]
+        stage["embedded_texts"] += after["embedded_texts"] - before["embedded_texts"]
+        if peak_mb is not None:
+            stage["peak_traced_mb"] = round(max(stage["peak_traced_mb"] or 0.0, peak_mb), 2)
+        stage["max_rss_growth_mb"] = round(max(stage["max_rss_growth_mb"], rss_growth_mb), 2)
+
+
+def _max_rss_mb() -> float:
+    # Linux ru_maxrss 단위: KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _cleanup(project_id: str, analyzed_date: str) -> None:
+    shutil.rmtree(os.path.join(DirInfo.UNPACK_DIR, project_id), ignore_errors=True)
+    shutil.rmtree(os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id), ignore_errors=True)
+    delete_project_artifacts(project_id=project_id)
+    delete_faiss_index_by_project(project_id=project_id)
+    checkpointer = get_checkpointer()
+    if checkpointer is not None:
+        checkpointer.delete_thread(project_id)
+    run_with_db_session(delete_entry_points_by_project_and_date, analyzed_date=analyzed_date, project_id=project_id)
+    run_with_db_session(delete_analysis_history_by_project_id_and_date, analyzed_date=analyzed_date, project_id=project_id)
+
+
+def run_benchmark(spec: SyntheticProjectSpec, llm_latency: float = 0.05, embedding_latency: float = 0.01, embedding_dimension: int = 64, trace_memory: bool = False, keep_outputs: bool = False, parser_backend: str = ParserBackend.JAVALANG) -> Dict[str, Any]:
+    """
+    합성 프로젝트 1건에 대해 전체 분석 그래프 실행
+
+    Args:
+        spec (SyntheticProjectSpec): 합성 프로젝트 규모
+        llm_latency (float): LLM 호출 1회 지연 시간 (초)
+        embedding_latency (float): 임베딩 호출 1회 지연 시간 (초)
+        embedding_dimension (int): 임베딩 벡터 차원
+        trace_memory (bool): tracemalloc으로 단계별 메모리 피크 측정 여부 (실행 시간 증가)
+        keep_outputs (bool): 생성 프로젝트/파서 출력/벡터 스토어/DB 데이터 유지 여부
+        parser_backend (str): 파서 백엔드 (ParserBackend, 기본값 javalang)
+
+    Returns:
+        Dict[str, Any]: 벤치마크 리포트
+
+    Raises:
+        RuntimeError: JAR 백엔드 선택 시 Java 파서 실행 환경이 없는 경우
+    """
+    if parser_backend == ParserBackend.JAR and (not os.path.isfile(settings.JAVA_PARSER_JAR_PATH) or shutil.which("java") is None):
+        raise RuntimeError(f"Java 파서 실행 환경이 없습니다. (java, {settings.JAVA_PARSER_JAR_PATH})")
+
+    project_id = f"bench-{uuid.uuid4().hex[:8]}"
+    analyzed_date = datetime.now().strftime("%Y%m%d")
+    project_path = os.path.join(DirInfo.UNPACK_DIR, project_id, BENCH_PROJECT_NAME)
+    project_info = generate_spring_project(output_dir=project_path, project_name=BENCH_PROJECT_NAME, spec=spec)
+
+    stats = StubCallStats()
+    llm_factory, embeddings_factory = create_stub_factories(llm_latency=llm_latency, embedding_latency=embedding_latency, embedding_dimension=embedding_dimension, stats=stats)
+    profiler = StageProfiler(stats=stats, trace_memory=trace_memory)
+    llm_model_info = LLMModel.AZURE_GPT_4O_MINI
+
+    Base.metadata.create_all(bind=engine)
+    set_model_factories(llm_factory=llm_factory, embeddings_factory=embeddings_factory)
+    original_backend, settings.JAVA_PARSER_BACKEND = settings.JAVA_PARSER_BACKEND, parser_backend
+    if trace_memory:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    try:
+        with profiler.patch_agents():
+            asyncio.run(run_autodiagenti_graph(
+                session_id=project_id,
+                project_id=project_id,
+                project_name=BENCH_PROJECT_NAME,
+                analyzed_date=analyzed_date,
+                file_info={"file_name": f"{BENCH_PROJECT_NAME}.zip", "file_path": "", "orig_file_name": f"{BENCH_PROJECT_NAME}.zip"},
+                filter_options={"include_method_text": True, "exclude_packages": None, "custom_annotations": None, "llm_model": llm_model_info.model_name, "llm_version": llm_model_info.version},
+                llm_model_info=llm_model_info
+            ))
+        total_sec = time.perf_counter() - started
+        status = get_project_status(project_id=project_id)
+    finally:
+        set_model_factories(None, None)
+        settings.JAVA_PARSER_BACKEND = original_backend
+        if trace_memory:
+            tracemalloc.stop()
+        if not keep_outputs:
+            _cleanup(project_id=project_id, analyzed_date=analyzed_date)
+
+    return {
+        "project_id": project_id,
+        "project": project_info,
+        "config": {
+            "llm_latency": llm_latency,
+            "embedding_latency": embedding_latency,
+            "embedding_dimension": embedding_dimension,
+            "parser_backend": parser_backend,
+            "max_concurrent": settings.MAX_CONCURRENT,
+            "pipeline_scheduler_enabled": settings.PIPELINE_SCHEDULER_ENABLED,
+            "hierarchical_summary_enabled": settings.HIERARCHICAL_SUMMARY_ENABLED,
+            "sequence_diagram_mode": settings.SEQUENCE_DIAGRAM_MODE
+        },
+        "status": status.get("status"),
+        "total_sec": round(total_sec, 3),
+        "max_rss_mb": round(_max_rss_mb(), 2),
+        "calls": stats.snapshot(),
+        "stages": profiler.stages
+    }
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="AutoDiagenti 분석 파이프라인 벤치마크 (오프라인 대체 LLM/임베딩)")
+    parser.add_argument("--size", choices=sorted(SIZE_PRESETS.keys()), default="small", help="합성 프로젝트 크기")
+    parser.add_argument("--domains", type=int, help="도메인 수 (크기 기본값 대체)")
+    parser.add_argument("--endpoints", type=int, help="도메인별 API 수 (크기 기본값 대체)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="LLM 호출 지연 시간 (초)")
+    parser.add_argument("--embedding-latency", type=float, default=0.01, help="임베딩 호출 지연 시간 (초)")
+    parser.add_argument("--embedding-dimension", type=int, default=64, help="임베딩 벡터 차원")
+    parser.add_argument("--parser-backend", choices=[ParserBackend.JAVALANG, ParserBackend.JAR], default=ParserBackend.JAVALANG, help="파서 백엔드 (jar는 Java 런타임 필요)")
+    parser.add_argument("--trace-memory", action="store_true", help="tracemalloc 단계별 메모리 피크 측정")
+    parser.add_argument("--keep-outputs", action="store_true", help="생성 프로젝트 및 분석 결과 유지")
+    parser.add_argument("--output", help="리포트 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    spec = SIZE_PRESETS[args.size]
+    if args.domains is not None:
+        spec = replace(spec, domains=args.domains)
+    if args.endpoints is not None:
+        spec = replace(spec, endpoints_per_domain=args.endpoints)
+
+    try:
+        report = run_benchmark(spec=spec, llm_latency=args.llm_latency, embedding_latency=args.embedding_latency, embedding_dimension=args.embedding_dimension, trace_memory=args.trace_memory, keep_outputs=args.keep_outputs, parser_backend=args.parser_backend)
+    except RuntimeError as err:
+        print(f"❌ {err}", file=sys.stderr)
+        return 2
+
+    report_json = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json)
+    print(report_json)
+    return 0 if report["status"] == "done" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# benchmarks/stub_models.py
+
+"""
+오프라인 LLM/임베딩 대체 모델
+- AzureChatOpenAI / AzureOpenAIEmbeddings 대신 사용하는 결정적(deterministic) 모델로, 설정한 지연 시간만큼 대기 후 입력 해시 기반 결과 반환
+- server.utils.config.set_model_factories로 교체하여 네트워크 없이 전체 파이프라인 실행
+"""
+
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Type, get_args, get_origin
+import numpy as np
+from pydantic import BaseModel
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+# 다이어그램 보정(LLM_REFINE) 모드에서도 검증을 통과하는 최소 Mermaid 코드
+STUB_MERMAID_CODE = "sequenceDiagram\n    participant Client\n    participant Service\n    Client->>Service: request\n    Service-->>Client: response"
+
+
+class StubCallStats:
+    """
+    대체 모델 호출 건수 집계 (스레드 안전)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.llm_calls = 0
+        self.llm_calls_by_schema: Dict[str, int] = {}
+        self.embedding_calls = 0
+        self.embedded_texts = 0
+
+    def record_llm(self, schema_name: str) -> None:
+        with self._lock:
+            self.llm_calls += 1
+            self.llm_calls_by_schema[schema_name] = self.llm_calls_by_schema.get(schema_name, 0) + 1
+
+    def record_embedding(self, texts: int) -> None:
+        with self._lock:
+            self.embedding_calls += 1
+            self.embedded_texts += texts
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "llm_calls": self.llm_calls,
+                "llm_calls_by_schema": dict(self.llm_calls_by_schema),
+                "embedding_calls": self.embedding_calls,
+                "embedded_texts": self.embedded_texts
+            }
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _messages_text(messages: List[Any]) -> str:
+    return "\n".join(message.content if isinstance(message, BaseMessage) else str(message) for message in messages)
+
+
+def _stub_value(field_name: str, annotation: Any, digest: str) -> Any:
+    origin = get_origin(annotation)
+    if origin is not None and type(None) in get_args(annotation):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        origin = get_origin(annotation)
+
+    if field_name == "mermaid_code":
+        return STUB_MERMAID_CODE
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return int(digest[:6], 16) % 100
+    if annotation is float:
+        return int(digest[:6], 16) % 100 / 100
+    if origin in (list, List):
+        return [_stub_value(field_name, (get_args(annotation) or (str,))[0], digest)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return build_stub_output(annotation, digest)
+    return f"[stub] {field_name} {digest[:12]}"
+
+
+def build_stub_output(schema: Type[BaseModel], digest: str) -> BaseModel:
+    """
+    스키마 필드 타입에 맞는 결정적 응답 생성
+    """
+    values = {name: _stub_value(name, field.annotation, digest) for name, field in schema.model_fields.items()}
+    return schema(**values)
+
+
+class _StubStructuredOutput:
+    def __init__(self, model: "StubChatModel", schema: Type[BaseModel]):
+        self.model = model
+        self.schema = schema
+
+    def _respond(self, messages: List[Any], config: Optional[Dict[str, Any]]) -> BaseModel:
+        prompt = _messages_text(messages)
+        output = build_stub_output(self.schema, _digest(prompt))
+        self.model.stats.record_llm(self.schema.__name__)
+
+        # 토큰 사용량 콜백 (문자 수 / 4 근사)
+        output_text = output.model_dump_json()
+        usage = {"input_tokens": len(prompt) // 4, "output_tokens": len(output_text) // 4, "total_tokens": (len(prompt) + len(output_text)) // 4}
+        llm_result = LLMResult(generations=[[ChatGeneration(message=AIMessage(content=output_text, usage_metadata=usage))]])
+        for callback in (config or {}).get("callbacks") or []:
+            if hasattr(callback, "on_llm_end"):
+                callback.on_llm_end(llm_result)
+        return output
+
+    async def ainvoke(self, messages: List[Any], config: Optional[Dict[str, Any]] = None, **kwargs) -> BaseModel:
+        await asyncio.sleep(self.model.latency)
+        return self._respond(messages, config)
+
+    def invoke(self, messages: List[Any], config: Optional[Dict[str, Any]] = None, **kwargs) -> BaseModel:
+        time.sleep(self.model.latency)
+        return self._respond(messages, config)
+
+
+class StubChatModel:
+    """
+    AzureChatOpenAI 대체 모델 (with_structured_output만 지원)
+    """
+    def __init__(self, deployment_name: str, openai_api_version: str, temperature: float, max_tokens: int, latency: float, stats: StubCallStats):
+        self.deployment_name = deployment_name
+        self.openai_api_version = openai_api_version
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.latency = latency
+        self.stats = stats
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs) -> _StubStructuredOutput:
+        return _StubStructuredOutput(model=self, schema=schema)
+
+
+class StubEmbeddings(Embeddings):
+    """
+    AzureOpenAIEmbeddings 대체 모델 (텍스트 해시 기반 정규화 벡터)
+    """
+    def __init__(self, deployment: str, dimension: int, latency: float, stats: StubCallStats):
+        self.deployment = deployment
+        self.dimension = dimension
+        self.latency = latency
+        self.stats = stats
+
+    def _embed(self, text: str) -> List[float]:
+        seed = int(_digest(text)[:16], 16)
+        vector = np.random.default_rng(seed).standard_normal(self.dimension)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.latency)
+        self.stats.record_embedding(len(texts))
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.latency)
+        self.stats.record_embedding(1)
+        return self._embed(text)
+
+
+def create_stub_factories(llm_latency: float, embedding_latency: float, embedding_dimension: int, stats: StubCallStats):
+    """
+    set_model_factories에 전달할 LLM/임베딩 생성 함수 반환
+
+    Returns:
+        tuple: (llm_factory, embeddings_factory)
+    """
+    def llm_factory(llm_model: str, llm_version: str, temperature: float, max_tokens: int) -> StubChatModel:
+        return StubChatModel(deployment_name=llm_model, openai_api_version=llm_version, temperature=temperature, max_tokens=max_tokens, latency=llm_latency, stats=stats)
+
+    def embeddings_factory(api_model: str, api_version: str) -> StubEmbeddings:
+        return StubEmbeddings(deployment=api_model, dimension=embedding_dimension, latency=embedding_latency, stats=stats)
+
+    return llm_factory, embeddings_factory
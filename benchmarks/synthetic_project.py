@@ -0,0 +1,236 @@
+# benchmarks/synthetic_project.py
+
+"""
+합성 Spring 프로젝트 생성 모듈
+- 도메인별 Controller → Service → Repository 호출 구조와 DTO를 가진 Java 소스를 크기별로 생성
+- 동일 인자면 항상 동일한 소스를 생성하여 실행 간 성능 비교가 가능하도록 함
+"""
+
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, List
+
+BASE_PACKAGE = "com.example.bench"
+
+DOMAIN_NAMES = [
+    "Order", "Customer", "Product", "Payment", "Inventory", "Shipment", "Invoice", "Review",
+    "Coupon", "Member", "Cart", "Delivery", "Refund", "Category", "Store", "Notice"
+]
+
+
+@dataclass
+class SyntheticProjectSpec:
+    domains: int = 5                    # 도메인 수 (도메인당 Controller/Service/Repository/DTO 4개 파일)
+    endpoints_per_domain: int = 3       # 도메인별 API(entry point) 수
+    helper_lines: int = 8               # Service 내부 보조 메서드 본문 줄 수 (메서드 텍스트 크기)
+    cross_domain_calls: bool = True     # 다음 도메인 Service 호출 여부 (호출 트리 깊이 증가)
+
+
+# 크기별 기본 구성
+SIZE_PRESETS: Dict[str, SyntheticProjectSpec] = {
+    "small": SyntheticProjectSpec(domains=4, endpoints_per_domain=3, helper_lines=6),
+    "medium": SyntheticProjectSpec(domains=16, endpoints_per_domain=5, helper_lines=12),
+    "large": SyntheticProjectSpec(domains=48, endpoints_per_domain=8, helper_lines=20),
+}
+
+
+def _domain_name(idx: int) -> str:
+    base = DOMAIN_NAMES[idx % len(DOMAIN_NAMES)]
+    return base if idx < len(DOMAIN_NAMES) else f"{base}{idx // len(DOMAIN_NAMES)}"
+
+
+def _controller_source(domain: str, spec: SyntheticProjectSpec) -> str:
+    var = domain[0].lower() + domain[1:]
+    methods = []
+    for k in range(spec.endpoints_per_domain):
+        mapping = "GetMapping" if k % 2 == 0 else "PostMapping"
+        methods.append(f"""
+    /**
+     * {domain} API {k}
+     */
+    @{mapping}("/{var}/{k}")
+    public {domain}Dto handle{domain}{k}(@RequestParam Long id) {{
+        return {var}Service.process{domain}{k}(id);
+    }}""")
+    return f"""package {BASE_PACKAGE}.controller;
+
+import {BASE_PACKAGE}.dto.{domain}Dto;
+import {BASE_PACKAGE}.service.{domain}Service;
+import org.springframework.web.bind.annotation.*;
+
+@RestController
+@RequestMapping("/api")
+public class {domain}Controller {{
+
+    private final {domain}Service {var}Service;
+
+    public {domain}Controller({domain}Service {var}Service) {{
+        this.{var}Service = {var}Service;
+    }}
+{chr(10).join(methods)}
+}}
+"""
+
+
+def _service_source(domain: str, next_domain: str, spec: SyntheticProjectSpec) -> str:
+    var = domain[0].lower() + domain[1:]
+    next_var = next_domain[0].lower() + next_domain[1:] if next_domain else ""
+    imports = [f"import {BASE_PACKAGE}.dto.{domain}Dto;", f"import {BASE_PACKAGE}.repository.{domain}Repository;"]
+    fields = [f"    private final {domain}Repository {var}Repository;"]
+    ctor_params = [f"{domain}Repository {var}Repository"]
+    ctor_body = [f"        this.{var}Repository = {var}Repository;"]
+    if next_domain:
+        imports.append(f"import {BASE_PACKAGE}.service.{next_domain}Service;")
+        fields.append(f"    private final {next_domain}Service {next_var}Service;")
+        ctor_params.append(f"{next_domain}Service {next_var}Service")
+        ctor_body.append(f"        this.{next_var}Service = {next_var}Service;")
+
+    helper_body = "\n".join(f"        total = total * 31 + (id + {line}) % 7;" for line in range(spec.helper_lines))
+    methods = []
+    for k in range(spec.endpoints_per_domain):
+        cross_call = f"\n        {next_var}Service.process{next_domain}0(id);" if next_domain else ""
+        methods.append(f"""
+    /**
+     * {domain} 처리 {k}
+     */
+    public {domain}Dto process{domain}{k}(Long id) {{
+        validate{k}(id);
+        {domain}Dto dto = {var}Repository.load{domain}{k}(id);{cross_call}
+        dto.setScore(calculate{k}(id));
+        return dto;
+    }}
+
+    private void validate{k}(Long id) {{
+        if (id == null || id < 0) {{
+            throw new IllegalArgumentException("invalid id");
+        }}
+    }}
+
+    private long calculate{k}(Long id) {{
+        long total = 0;
+{helper_body}
+        return total;
+    }}""")
+    return f"""package {BASE_PACKAGE}.service;
+
+{chr(10).join(imports)}
+import org.springframework.stereotype.Service;
+
+@Service
+public class {domain}Service {{
+
+{chr(10).join(fields)}
+
+    public {domain}Service({', '.join(ctor_params)}) {{
+{chr(10).join(ctor_body)}
+    }}
+{chr(10).join(methods)}
+}}
+"""
+
+
+def _repository_source(domain: str, spec: SyntheticProjectSpec) -> str:
+    methods = []
+    for k in range(spec.endpoints_per_domain):
+        methods.append(f"""
+    public {domain}Dto load{domain}{k}(Long id) {{
+        {domain}Dto dto = new {domain}Dto();
+        dto.setId(id);
+        dto.setName("{domain}-{k}-" + id);
+        return dto;
+    }}""")
+    return f"""package {BASE_PACKAGE}.repository;
+
+import {BASE_PACKAGE}.dto.{domain}Dto;
+import org.springframework.stereotype.Repository;
+
+@Repository
+public class {domain}Repository {{
+{chr(10).join(methods)}
+}}
+"""
+
+
+def _dto_source(domain: str) -> str:
+    return f"""package {BASE_PACKAGE}.dto;
+
+public class {domain}Dto {{
+
+    private Long id;
+    private String name;
+    private long score;
+
+    public Long getId() {{
+        return id;
+    }}
+
+    public void setId(Long id) {{
+        this.id = id;
+    }}
+
+    public String getName() {{
+        return name;
+    }}
+
+    public void setName(String name) {{
+        this.name = name;
+    }}
+
+    public long getScore() {{
+        return score;
+    }}
+
+    public void setScore(long score) {{
+        this.score = score;
+    }}
+}}
+"""
+
+
+def _pom_source(project_name: str) -> str:
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <modelVersion>4.0.0</modelVersion>
+    <groupId>{BASE_PACKAGE}</groupId>
+    <artifactId>{project_name}</artifactId>
+    <version>0.0.1</version>
+</project>
+"""
+
+
+def generate_spring_project(output_dir: str, project_name: str, spec: SyntheticProjectSpec) -> Dict:
+    """
+    합성 Spring 프로젝트 생성
+
+    Args:
+        output_dir (str): 프로젝트 루트 디렉토리 (없으면 생성)
+        project_name (str): 프로젝트명 (pom.xml artifactId)
+        spec (SyntheticProjectSpec): 생성 규모
+
+    Returns:
+        Dict: {spec, files, methods, entry_points}
+    """
+    source_root = os.path.join(output_dir, "src", "main", "java", *BASE_PACKAGE.split("."))
+    domains: List[str] = [_domain_name(idx) for idx in range(spec.domains)]
+
+    files: Dict[str, str] = {os.path.join(output_dir, "pom.xml"): _pom_source(project_name)}
+    for idx, domain in enumerate(domains):
+        next_domain = domains[idx + 1] if spec.cross_domain_calls and idx + 1 < len(domains) else ""
+        files[os.path.join(source_root, "controller", f"{domain}Controller.java")] = _controller_source(domain, spec)
+        files[os.path.join(source_root, "service", f"{domain}Service.java")] = _service_source(domain, next_domain, spec)
+        files[os.path.join(source_root, "repository", f"{domain}Repository.java")] = _repository_source(domain, spec)
+        files[os.path.join(source_root, "dto", f"{domain}Dto.java")] = _dto_source(domain)
+
+    for path, source in files.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+
+    # 생성자 제외 메서드 수: Controller(n) + Service(3n) + Repository(n) + DTO getter/setter 6개
+    endpoints = spec.endpoints_per_domain
+    return {
+        "spec": asdict(spec),
+        "files": len(files) - 1,
+        "methods": spec.domains * (endpoints * 5 + 6),
+        "entry_points": spec.domains * endpoints
+    }
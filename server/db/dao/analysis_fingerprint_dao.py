@@ -0,0 +1,46 @@
+# server/db/dao/analysis_fingerprint_dao.py
+
+from typing import Optional
+from sqlalchemy.orm import Session
+from server.db.model import AnalysisFingerprint
+from server.db.schema import AnalysisFingerprintCreate
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+def get_analysis_fingerprint(db: Session, fingerprint: str) -> Optional[AnalysisFingerprint]:
+    """
+    fingerprint에 해당하는 완료된 분석 결과 조회
+    """
+    return db.query(AnalysisFingerprint).filter_by(fingerprint=fingerprint).first()
+
+def upsert_analysis_fingerprint(db: Session, data: AnalysisFingerprintCreate) -> bool:
+    """
+    fingerprint별 최근 완료된 분석 결과 저장 (기존 건은 갱신)
+    """
+    try:
+        db.merge(AnalysisFingerprint(**data.model_dump()))
+        db.commit()
+        return True
+    except Exception as err:
+        logger.error(f"🌧️ Error upsert_analysis_fingerprint. {str(err)}")
+        db.rollback()
+        return False
+
+def delete_analysis_fingerprints_by_project(db: Session, analyzed_date: str, project_id: str) -> int:
+    """
+    특정 날짜 + 프로젝트의 분석 결과를 가리키는 fingerprint 전체 삭제
+    → 삭제된 건수를 반환
+    """
+    try:
+        deleted_count = db.query(AnalysisFingerprint).filter_by(
+                            analyzed_date=analyzed_date,
+                            project_id=project_id
+                        ).delete()
+        db.commit()
+        return deleted_count
+    except Exception as err:
+        logger.error(f"🌧️ Error delete_analysis_fingerprints_by_project. {str(err)}")
+        db.rollback()
+        return -1
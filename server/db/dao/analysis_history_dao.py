@@ -44,6 +44,26 @@ def delete_analysis_history_by_project_id_and_date(db: Session, analyzed_date: s
         db.rollback()
         return -1
 
+def copy_analysis_histories(db: Session, src_analyzed_date: str, src_project_id: str, analyzed_date: str, project_id: str, **overrides) -> int:
+    """
+    다른 프로젝트의 분석 이력을 지정한 날짜 + project_id로 복사 (overrides로 세션/업로드 파일 정보 대체)
+    → 복사된 건수를 반환 (실패 시 -1)
+    """
+    try:
+        rows = db.query(AnalysisHistory).filter_by(analyzed_date=src_analyzed_date, project_id=src_project_id).all()
+        columns = [column.name for column in AnalysisHistory.__table__.columns if column.name != "timestamp"]
+        models = [
+            AnalysisHistory(**{**{name: getattr(row, name) for name in columns}, **overrides, "analyzed_date": analyzed_date, "project_id": project_id})
+            for row in rows
+        ]
+        db.bulk_save_objects(models)
+        db.commit()
+        return len(models)
+    except Exception as err:
+        logger.error(f"🌧️ Error copy_analysis_histories. {str(err)}")
+        db.rollback()
+        return -1
+
 def get_analysis_history_by_entry_point(
     db: Session,
     analyzed_date: str,
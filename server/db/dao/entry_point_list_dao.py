@@ -62,6 +62,35 @@ def delete_entry_points_by_project_and_date(db: Session, analyzed_date: str, pro
         db.rollback()
         return -1
 
+def copy_entry_points(db: Session, src_analyzed_date: str, src_project_id: str, analyzed_date: str, project_id: str, session_id: str = None) -> int:
+    """
+    다른 프로젝트의 entry_point 목록을 지정한 날짜 + project_id로 복사
+    → 복사된 건수를 반환 (실패 시 -1)
+    """
+    try:
+        rows = db.query(EntryPoint).filter_by(analyzed_date=src_analyzed_date, project_id=src_project_id).all()
+        models = [
+            EntryPoint(
+                analyzed_date=analyzed_date,
+                project_id=project_id,
+                entry_point=row.entry_point,
+                session_id=session_id or row.session_id,
+                api_name=row.api_name,
+                api_method=row.api_method,
+                annotation=row.annotation,
+                file_path=row.file_path,
+                analyzed_at=row.analyzed_at
+            )
+            for row in rows
+        ]
+        db.bulk_save_objects(models)
+        db.commit()
+        return len(models)
+    except Exception as err:
+        logger.error(f"🌧️ Error copy_entry_points. {str(err)}")
+        db.rollback()
+        return -1
+
 def get_entry_point_by_pk(db: Session, analyzed_date: str, project_id: str, entry_point: str) -> EntryPoint:
     """
     특정 일자, project_id, Entry Point 에 해당하는 Entry Point 정보를 조회
@@ -90,3 +90,24 @@ class ProjectSequence(Base):
     __table_args__ = (
         PrimaryKeyConstraint('origin_name', 'analyzed_date', name='pk_project_sequence'),
     )
+
+
+# 4.analysis_fingerprint 테이블 모델
+class AnalysisFingerprint(Base):
+    __tablename__ = "analysis_fingerprint"
+
+    fingerprint = Column(String, nullable=False)                # 소스 + 분석 옵션 + LLM 모델 기준 sha256
+    source_fingerprint = Column(String, nullable=False)         # 정규화된 Java 소스 집합 sha256
+    
+    analyzed_date = Column(String, nullable=False)              # 재사용할 분석 결과 (YYYYMMDD)
+    project_id = Column(String, nullable=False)
+    project_name = Column(String, nullable=True)
+    llm_model = Column(String, nullable=True)
+    llm_version = Column(String, nullable=True)
+
+    analyzed_at = Column(DateTime, nullable=False, default=datetime.now)
+    timestamp = Column(DateTime(timezone=True), server_default=func.now())  # 생성 시점 자동 기록
+
+    __table_args__ = (
+        PrimaryKeyConstraint('fingerprint', name='pk_analysis_fingerprint'),
+    )
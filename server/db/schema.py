@@ -54,4 +54,13 @@ class AnalysisHistoryCreate(BaseModel):
 
     analysis_results: Any                      # 전체 분석 JSON
     analyzed_at: datetime
-    
\ No newline at end of file
+    
+class AnalysisFingerprintCreate(BaseModel):
+    fingerprint: str
+    source_fingerprint: str
+    analyzed_date: str                          # YYYYMMDD
+    project_id: str
+    project_name: Optional[str] = None
+    llm_model: Optional[str] = None
+    llm_version: Optional[str] = None
+    analyzed_at: datetime
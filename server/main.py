@@ -1,11 +1,20 @@
 # server/main.py
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import inspect
 from server.routers import analysis, entry_point, upload, history
+from server.routers.response import BaseResponse
 from server.db.database import Base, engine
 from server.db import model
+from server.utils.config import settings
+from server.utils.metrics_utils import METRICS_CONTENT_TYPE, render_metrics
+from server.utils.parser_worker_utils import get_parser_worker, get_parser_worker_status, shutdown_parser_worker
+from server.utils.javalang_parser_utils import shutdown_javalang_pool
+from server.workflow.source_watcher import shutdown_source_watcher
 from server.utils.logger import get_logger
 
 # 로거 선언
@@ -23,11 +32,22 @@ logger.info("테이블 생성 완료!")
 inspector = inspect(engine)
 logger.info(inspector.get_table_names())
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 파서 상주 워커 예열 (첫 분석에서 JVM 기동 비용을 부담하지 않도록 서버 기동 시 백그라운드 기동)
+    if settings.JAVA_PARSER_WORKER_ENABLED:
+        asyncio.get_running_loop().run_in_executor(None, get_parser_worker().warm_up)
+    yield
+    shutdown_parser_worker()
+    shutdown_javalang_pool()
+    shutdown_source_watcher()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="AutoDiagentiAI API",
     description="Java Spring 프로젝트 분석 및 시퀀스 다이어그램 생성 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -39,6 +59,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    # 업로드 크기 상한 초과 요청은 본문을 받기 전에 거부 (Content-Length가 없는 요청은 저장 중 확인)
+    content_length = request.headers.get("content-length", "")
+    if settings.UPLOAD_MAX_BYTES and content_length.isdigit() and int(content_length) > settings.UPLOAD_MAX_BYTES:
+        logger.warning(f"🚫 요청 크기 초과 - {request.url.path}: {content_length} bytes")
+        message = f"request size {content_length} exceeds limit {settings.UPLOAD_MAX_BYTES} bytes"
+        return JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content=BaseResponse(success=False, message=message).model_dump())
+    return await call_next(request)
+
 # 라우터 등록
 app.include_router(upload.router)
 app.include_router(analysis.router)
@@ -51,7 +81,14 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # 파서 워커 헬스 체크는 파이프 응답 대기가 있으므로 스레드에서 실행
+    return {"status": "healthy", "parser_worker": await asyncio.to_thread(get_parser_worker_status)}
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        # Prometheus 수집용 (워커 프로세스별 집계값)
+        return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
 
 if __name__ == "__main__":
     import uvicorn
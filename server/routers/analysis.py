@@ -4,18 +4,28 @@
 분석 라우터
 """
 
+import os
+import json
+import time
+import asyncio
 from typing import Optional
-from fastapi import APIRouter, Depends
-from fastapi import BackgroundTasks
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from server.db.database import get_db
+from server.db.database import get_db, run_with_db_session
 from server.db.model import AnalysisHistory
 from server.db.dao.analysis_history_dao import get_analysis_history_by_entry_point
 from server.routers.response import BaseResponse
-from server.workflow.state import get_project_status
-from server.workflow.graph import run_autodiagenti_graph
-from server.utils.constants import LLMModel
+from server.workflow.state import get_project_status, is_terminal_status
+from server.workflow.job_queue import get_job_queue, JobQueueFullError, JobAlreadyExistsError
+from server.workflow.graph import run_autodiagenti_graph, resume_autodiagenti_graph, can_resume_autodiagenti_graph
+from server.workflow.analysis_reuse import SOURCE_FINGERPRINT_KEY, find_reusable_analysis, reuse_analysis_result
+from server.workflow.source_watcher import get_source_watcher
+from server.utils.config import settings
+from server.utils.constants import LLMModel, SourceType
+from server.utils.analysis_fingerprint_utils import build_analysis_fingerprint, build_source_fingerprint, get_source_fingerprint
+from server.utils.local_source_utils import LocalSourceError, is_local_source, resolve_project_path
 from server.utils.document_retrieval_utils import load_sequence_diagram_doc
 from server.utils.logger import get_logger
 
@@ -34,14 +44,55 @@ class StatusRequest(BaseModel):
 @router.post("/status", response_model=BaseResponse)
 def get_analysis_status_post(request: StatusRequest):
     logger.info(f"🖥️ get_analysis_status_post - request: {request}")
-    result = get_project_status(request.project_id)
+    result = _build_status_result(request.project_id)
     return BaseResponse(success=True, result=result)
 
+@router.get("/status/stream", summary="분석 상태 구독", description="분석 상태가 변경될 때마다 SSE(text/event-stream)로 전송하고, 완료/실패/취소 시 종료합니다.")
+async def stream_analysis_status(project_id: str, request: Request):
+    logger.info(f"🖥️ stream_analysis_status - project_id: {project_id}")
+    return StreamingResponse(_status_events(project_id=project_id, request=request), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+async def _status_events(project_id: str, request: Request):
+    # 상태 저장소(SQLite)의 version 변경을 감지하여 전송 (분석을 실행 중인 워커와 다른 워커에서도 동일하게 동작)
+    last_change_key = None
+    last_sent_at = time.monotonic()
+    
+    while not await request.is_disconnected():
+        result = _build_status_result(project_id)
+        change_key = (result.get("version", 0), result.get("queue_position"))
+        
+        if change_key != last_change_key:
+            last_change_key = change_key
+            last_sent_at = time.monotonic()
+            yield f"event: status\ndata: {json.dumps(result, ensure_ascii=False)}\n\n"
+            if is_terminal_status(result.get("status", "")):
+                break
+        elif time.monotonic() - last_sent_at >= settings.STATUS_STREAM_HEARTBEAT_SEC:
+            last_sent_at = time.monotonic()
+            yield ": heartbeat\n\n"
+        
+        await asyncio.sleep(settings.STATUS_STREAM_POLL_INTERVAL)
+
+def _build_status_result(project_id: str) -> dict:
+    result = {**get_project_status(project_id)}
+    
+    # 작업 큐 대기/실행 정보 (대기 순번 등)
+    job_info = get_job_queue().get_job_info(project_id)
+    if job_info:
+        result.update(job_info)
+    
+    # 로컬 디렉토리 감시 여부
+    result["watching"] = get_source_watcher().is_watching(project_id)
+    return result
+
 
 class FileInfo(BaseModel):
     file_name: str
     file_path: str
     orig_file_name: str
+    source_fingerprint: Optional[str] = None
+    source_type: str = SourceType.UPLOAD    # UPLOAD: 압축 해제 디렉토리, LOCAL: 서버 로컬 디렉토리 (source_path)
+    source_path: Optional[str] = None
     
 class FilterOptions(BaseModel):    
     include_method_text: bool = True
@@ -57,9 +108,11 @@ class AnalysisRequest(BaseModel):
     analyzed_date: str
     file_info: FileInfo
     filter_options: FilterOptions
+    force_reanalyze: bool = False       # 동일 소스/옵션/모델의 완료된 분석이 있어도 다시 분석 (로컬 디렉토리는 증분 분석 미사용)
+    watch: bool = False                 # 로컬 디렉토리 변경 감지 시 증분 재분석
     
-@router.post("/run-analysis", summary="분석 실행", description="LangGraph 분석 파이프라인을 시작합니다.", response_model=BaseResponse)
-def run_analysis(request: AnalysisRequest, background_tasks: BackgroundTasks):
+@router.post("/run-analysis", summary="분석 실행", description="LangGraph 분석 파이프라인을 시작합니다. 동일 소스/옵션/모델로 완료된 분석이 있으면 결과를 복사하여 즉시 완료합니다.", response_model=BaseResponse)
+def run_analysis(request: AnalysisRequest):
     logger.info(f"🖥️ run_analysis - request: {request}")
     #--------------------------------------------
     # 옵션값 확인
@@ -79,13 +132,113 @@ def run_analysis(request: AnalysisRequest, background_tasks: BackgroundTasks):
     
     logger.info(f"🖥️ run_analysis - request:{llm_model_name}/{llm_version} - llm_model: {llm_model_info.model_name}/{llm_model_info.version}")
     
+    #--------------------------------------------
+    # 분석 대상 경로 확인 (로컬 디렉토리는 허용 루트 하위인지 다시 검증)
+    #--------------------------------------------
+    file_info = request.file_info.model_dump()
+    local_source = is_local_source(file_info)
+    try:
+        project_path = resolve_project_path(project_id=project_id, project_name=request.project_name, file_info=file_info)
+    except LocalSourceError as err:
+        return BaseResponse(success=False, message=str(err))
+    
+    # 로컬 디렉토리 프로젝트명은 디렉토리명 (파서 산출물 경로 기준)
+    project_name = os.path.basename(project_path) if local_source else request.project_name
+    
+    #--------------------------------------------
+    # 분석 결과 재사용 (서버에서 계산한 소스 핑거프린트 기준, 클라이언트 전달값은 사용하지 않음)
+    #--------------------------------------------
+    file_info[SOURCE_FINGERPRINT_KEY] = None
+    reused = None
+    if settings.ANALYSIS_REUSE_ENABLED:
+        # 로컬 디렉토리는 요청 시점 소스로 다시 계산 (업로드 이후 변경 가능)
+        if local_source:
+            file_info[SOURCE_FINGERPRINT_KEY] = build_source_fingerprint(project_path) or None
+        else:
+            file_info[SOURCE_FINGERPRINT_KEY] = get_source_fingerprint(project_id=project_id, project_path=project_path) or None
+        if file_info[SOURCE_FINGERPRINT_KEY] and not request.force_reanalyze and get_job_queue().get_job_info(project_id) is None:
+            reused = run_with_db_session(_reuse_analysis, request, file_info)
+            if reused:
+                response = BaseResponse(success=True, result={"message": f"기존 분석 결과를 재사용했습니다: {project_id}", **reused})
+    
     #--------------------------------------------
     # 분석 진행
     #--------------------------------------------
-    # 백그라운드에서 분석 파이프라인 실행 (add_task는 param 순서대로 매핑함)
-    background_tasks.add_task(run_autodiagenti_graph, request.session_id, project_id, request.project_name, request.analyzed_date, request.file_info.model_dump(), request.filter_options.model_dump(), llm_model_info)
+    # 로컬 디렉토리는 이전 실행의 메서드/흐름 요약/다이어그램 결과를 재사용하는 증분 분석
+    incremental = local_source and not request.force_reanalyze
+    job_args = (request.session_id, project_id, project_name, request.analyzed_date, file_info, request.filter_options.model_dump(), llm_model_info)
+    
+    # 작업 큐에 분석 파이프라인 등록 (워커에서 param 순서대로 실행)
+    if not reused:
+        response = _submit_job(request.session_id, project_id, run_autodiagenti_graph, *job_args, incremental)
+    
+    # 감시 모드: 변경 감지 시 증분 재분석 등록
+    if request.watch and local_source and isinstance(response, BaseResponse) and response.success:
+        get_source_watcher().watch(project_id, project_path, request.session_id, run_autodiagenti_graph, *job_args, True)
+        response.result["watching"] = True
+    return response
+
+def _reuse_analysis(db: Session, request: AnalysisRequest, file_info: dict) -> Optional[dict]:
+    fingerprint = build_analysis_fingerprint(source_fingerprint=file_info[SOURCE_FINGERPRINT_KEY], filter_options=request.filter_options.model_dump())
+    record = find_reusable_analysis(db, fingerprint=fingerprint)
+    if record is None or record.project_id == request.project_id:
+        return None
+    return reuse_analysis_result(db, record=record, session_id=request.session_id, project_id=request.project_id, project_name=request.project_name, analyzed_date=request.analyzed_date, file_info=file_info)
+
+
+class WatchStopRequest(BaseModel):
+    project_id: str
+    
+@router.post("/watch/stop", summary="감시 종료", description="로컬 디렉토리 변경 감지 재분석을 종료합니다. (실행 중인 분석은 계속 진행)", response_model=BaseResponse)
+def stop_watch(request: WatchStopRequest):
+    logger.info(f"🖥️ stop_watch - request: {request}")
+    
+    if not get_source_watcher().stop(request.project_id):
+        return BaseResponse(success=False, message="감시 중인 로컬 디렉토리가 없습니다.")
+    return BaseResponse(success=True, result={"message": f"감시를 종료했습니다: {request.project_id}"})
+
+
+class ResumeRequest(BaseModel):
+    session_id: str
+    project_id: str
+    
+@router.post("/resume", summary="분석 재개", description="마지막으로 완료된 단계 이후부터 LangGraph 분석 파이프라인을 재개합니다.", response_model=BaseResponse)
+def resume_analysis(request: ResumeRequest):
+    logger.info(f"🖥️ resume_analysis - request: {request}")
+    project_id = request.project_id
+    
+    if not can_resume_autodiagenti_graph(project_id=project_id):
+        return BaseResponse(success=False, message="재개할 분석 이력이 없습니다. 분석을 다시 실행해주세요.")
+    
+    # 작업 큐에 체크포인트 이후 단계 실행 등록
+    return _submit_job(request.session_id, project_id, resume_autodiagenti_graph, request.session_id, project_id)
+
+
+class CancelRequest(BaseModel):
+    project_id: str
+    
+@router.post("/cancel", summary="분석 취소", description="대기 중인 분석은 대기열에서 제거하고, 실행 중인 분석은 진행 중인 LLM 호출을 중단합니다.", response_model=BaseResponse)
+def cancel_analysis(request: CancelRequest):
+    logger.info(f"🖥️ cancel_analysis - request: {request}")
+    
+    if not get_job_queue().cancel(request.project_id):
+        return BaseResponse(success=False, message="대기 또는 실행 중인 분석이 없습니다.")
+    
+    result = {"message": f"분석 취소를 요청했습니다: {request.project_id}"}
+    return BaseResponse(success=True, result=result)
+
+
+def _submit_job(tenant_id: str, project_id: str, func, *args):
+    try:
+        job = get_job_queue().submit(project_id, tenant_id, func, *args)
+    except JobQueueFullError as err:
+        logger.warning(f"🚫 작업 큐 초과 - project_id: {project_id}, {str(err)}")
+        return JSONResponse(status_code=status.HTTP_429_TOO_MANY_REQUESTS, content=BaseResponse(success=False, message=str(err)).model_dump())
+    except JobAlreadyExistsError as err:
+        return BaseResponse(success=False, message=str(err))
     
-    result = {"message": f"분석을 시작했습니다: {project_id}"}
+    job_info = get_job_queue().get_job_info(project_id) or {}
+    result = {"message": f"분석을 등록했습니다: {project_id}", "job_id": job.job_id, "queue_position": job_info.get("queue_position", 0)}
     return BaseResponse(success=True, result=result)
 
 
@@ -11,6 +11,9 @@ from pydantic import BaseModel
 from server.db.database import get_db
 from server.db.model import AnalysisHistory
 from server.db.dao.analysis_history_dao import get_recent_project_summaries, search_project_summaries_by_keyword, delete_analysis_history_by_project_id_and_date
+from server.db.dao.analysis_fingerprint_dao import delete_analysis_fingerprints_by_project
+from server.workflow.analysis_memo import delete_analysis_memo
+from server.workflow.source_watcher import get_source_watcher
 from server.routers.response import BaseResponse
 from server.utils.logger import get_logger
 
@@ -55,6 +58,13 @@ def delete_history(request: DeleteHistoryRequest, db: Session = Depends(get_db))
     logger.info(f"🖥️ delete_history - request: {request}")
     deleted_count = delete_analysis_history_by_project_id_and_date(db, analyzed_date=request.analyzed_date, project_id=request.project_id)
     
+    # 삭제된 분석은 재사용 대상에서 제외
+    delete_analysis_fingerprints_by_project(db, analyzed_date=request.analyzed_date, project_id=request.project_id)
+    
+    # 로컬 디렉토리 감시 종료 및 증분 분석 결과 삭제
+    get_source_watcher().stop(request.project_id)
+    delete_analysis_memo(project_id=request.project_id)
+    
     if deleted_count < 0:
         return BaseResponse(success=False, message="히스토리 삭제 처리에 실패했습니다. 잠시 후 다시 시도해주세요.")
     
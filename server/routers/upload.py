@@ -6,15 +6,23 @@
 
 import os
 import uuid
+import asyncio
+import zipfile
+from functools import partial
 from datetime import datetime
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, File, UploadFile, Depends
+from fastapi import APIRouter, File, UploadFile, Depends, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from server.db.database import get_db
 from server.routers.response import BaseResponse
 from server.db.dao.project_sequence_dao import generate_project_id
-from server.utils.file_utils import save_upload_file, unzip_file, ensure_directory_exists
-from server.utils.constants import AgentType, AgentRunType, DirInfo
-from server.workflow.state import set_project_status, set_project_fail_status
+from server.utils.file_utils import UploadTooLargeError, save_upload_file, ensure_directory_exists
+from server.utils.archive_utils import UnsafeArchiveError, extract_project_archive
+from server.utils.analysis_fingerprint_utils import build_source_fingerprint, get_source_fingerprint
+from server.utils.local_source_utils import LocalSourceError, resolve_local_source
+from server.utils.constants import AgentType, AgentRunType, DirInfo, PipelineStage, SourceType
+from server.workflow.state import set_project_status, set_project_fail_status, set_project_stage_progress
 from server.utils.logger import get_logger
 
 # 로거 선언
@@ -47,7 +55,7 @@ async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db
         project_id = generate_project_id(db, origin_name=orig_file_name, analyzed_date=analyzed_date)
         
         if not project_id:
-            logger.error(f"❌ 파일 업로드 오류. project_id is empty.")
+            logger.error("❌ 파일 업로드 오류. project_id is empty.")
             logger.info("📢 END === upload_file ===")
             return BaseResponse(success=False, message="Fail to File Upload. project_id is empty.")
         
@@ -58,13 +66,29 @@ async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db
         zip_file_name = f"{project_id}.zip"
         zip_path = os.path.join(DirInfo.UPLOAD_DIR, zip_file_name)
         
-        # 파일 업로드
-        await save_upload_file(file, zip_path)
-        logger.info("🟢 Complete - save_upload_file")
+        # 파일 업로드 (청크 단위 스트리밍 저장 + sha256)
+        try:
+            upload_info = await save_upload_file(file, zip_path)
+        except UploadTooLargeError as err:
+            logger.warning(f"🚫 업로드 크기 초과 - project_id: {project_id}, {str(err)}")
+            set_project_fail_status(project_id=project_id, error_message=str(err))
+            logger.info("📢 END === upload_file ===")
+            return JSONResponse(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, content=BaseResponse(success=False, message=str(err)).model_dump())
+        logger.info(f"🟢 Complete - save_upload_file ({upload_info['size']} bytes, sha256: {upload_info['sha256']})")
 
-        # 압축 해제
-        unzip_file(zip_path, extract_path)
-        logger.info("🟢 Complete - unzip_file")
+        # 압축 해제 (Java 소스/빌드 설정 파일만, 이벤트 루프를 막지 않도록 스레드에서 실행)
+        on_progress = partial(set_project_stage_progress, project_id, PipelineStage.EXTRACT)
+        try:
+            extract_info = await asyncio.to_thread(extract_project_archive, zip_path, extract_path, on_progress=on_progress)
+        except (UnsafeArchiveError, zipfile.BadZipFile) as err:
+            logger.warning(f"🚫 압축 파일 거부 - project_id: {project_id}, {str(err)}")
+            set_project_fail_status(project_id=project_id, error_message=str(err))
+            logger.info("📢 END === upload_file ===")
+            return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content=BaseResponse(success=False, message=str(err)).model_dump())
+        logger.info(f"🟢 Complete - extract_project_archive ({extract_info['extracted']} files, {extract_info['skipped']} skipped)")
+        
+        # 소스 핑거프린트 (동일 소스의 완료된 분석 결과 재사용 기준)
+        source_fingerprint = await asyncio.to_thread(get_source_fingerprint, project_id, os.path.join(extract_path, project_id, orig_file_name))
         
         # 상태저장
         set_project_status(project_id=project_id, role=AgentType.UPLOADER, runStatus=AgentRunType.END)
@@ -76,7 +100,10 @@ async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db
             "file_info": {
                 "file_name": zip_file_name,
                 "file_path": extract_path,
-                "orig_file_name": orig_file_name
+                "orig_file_name": orig_file_name,
+                "file_size": upload_info["size"],
+                "sha256": upload_info["sha256"],
+                "source_fingerprint": source_fingerprint
             },
             "analyzed_date": analyzed_date
         }
@@ -87,5 +114,57 @@ async def upload_file(file: UploadFile = File(...), db: Session = Depends(get_db
         logger.error(f"❌ 파일 업로드 오류. error: [{str(err)}]")
         logger.info("📢 END === upload_file ===")
         return BaseResponse(success=False, message=f"Fail to File Upload. err({str(err)})")
+
+
+class LocalSourceRequest(BaseModel):
+    path: str
+
+@router.post("/local", summary="로컬 디렉토리 등록", description="서버 로컬 소스 디렉토리(LOCAL_SOURCE_ROOTS 하위)를 업로드/압축 해제 없이 분석 대상으로 등록합니다.", response_model=BaseResponse)
+async def register_local_source(request: LocalSourceRequest, db: Session = Depends(get_db)):
+    logger.info("📢 START === register_local_source ===")
+    
+    try:
+        source_path = resolve_local_source(request.path)
+    except LocalSourceError as err:
+        logger.warning(f"🚫 로컬 디렉토리 거부 - {str(err)}")
+        logger.info("📢 END === register_local_source ===")
+        return BaseResponse(success=False, message=str(err))
     
-    
\ No newline at end of file
+    try:
+        session_id = str(uuid.uuid4())
+        analyzed_date = datetime.now().strftime('%Y%m%d')
+        
+        # 프로젝트명은 디렉토리명 (파서 산출물 경로 기준)
+        project_name = os.path.basename(source_path)
+        project_id = generate_project_id(db, origin_name=project_name, analyzed_date=analyzed_date)
+        
+        if not project_id:
+            logger.error("❌ 로컬 디렉토리 등록 오류. project_id is empty.")
+            logger.info("📢 END === register_local_source ===")
+            return BaseResponse(success=False, message="Fail to register local source. project_id is empty.")
+        
+        set_project_status(project_id=project_id, role=AgentType.UPLOADER, runStatus=AgentRunType.START)
+        source_fingerprint = await asyncio.to_thread(build_source_fingerprint, source_path)
+        set_project_status(project_id=project_id, role=AgentType.UPLOADER, runStatus=AgentRunType.END)
+        
+        result = {
+            "session_id": session_id,
+            "project_id": project_id,
+            "project_name": project_name,
+            "file_info": {
+                "file_name": project_name,
+                "file_path": os.path.dirname(source_path),
+                "orig_file_name": project_name,
+                "source_type": SourceType.LOCAL,
+                "source_path": source_path,
+                "source_fingerprint": source_fingerprint
+            },
+            "analyzed_date": analyzed_date
+        }
+        
+        logger.info("📢 END === register_local_source ===")
+        return BaseResponse(success=True, result=result)
+    except Exception as err:
+        logger.error(f"❌ 로컬 디렉토리 등록 오류. error: [{str(err)}]")
+        logger.info("📢 END === register_local_source ===")
+        return BaseResponse(success=False, message=f"Fail to register local source. err({str(err)})")
@@ -0,0 +1,106 @@
+# server/utils/analysis_fingerprint_utils.py
+
+"""
+분석 결과 재사용용 핑거프린트 유틸리티 모듈
+- 소스 핑거프린트: 프로젝트 루트 기준 상대 경로 + 정규화한 Java 소스 내용 (ZIP 파일명, 최상위 폴더명, 압축 방식, 줄바꿈 차이와 무관)
+- 분석 핑거프린트: 소스 핑거프린트 + 분석 옵션(메서드 본문 포함 여부, 제외 패키지, 사용자 정의 어노테이션) + LLM 모델
+"""
+
+import os
+import json
+import hashlib
+from typing import Any, Dict, Optional
+from server.utils.constants import DirInfo
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 소스 핑거프린트 저장 파일 (압축 해제 디렉토리 하위, 프로젝트 소스 디렉토리 밖)
+SOURCE_FINGERPRINT_FILE_NAME = "source_fingerprint.txt"
+
+# 핑거프린트 계산 시 제외 디렉토리 (VCS 메타데이터)
+_EXCLUDED_DIR_NAMES = {".git", ".svn", ".hg"}
+
+
+def _normalize_source(data: bytes) -> bytes:
+    # UTF-8 BOM, 줄바꿈(CRLF/CR), 파일 끝 공백 차이 제거
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n").rstrip() + b"\n"
+
+
+def build_source_fingerprint(project_path: str) -> str:
+    """
+    프로젝트 Java 소스 집합 핑거프린트
+
+    Args:
+        project_path (str): 프로젝트 루트 경로
+
+    Returns:
+        str: 핑거프린트 (sha256, 파일 경로 순으로 '상대 경로 + 파일 sha256' 연결)
+    """
+    digest = hashlib.sha256()
+    for dir_path, dir_names, file_names in os.walk(project_path):
+        dir_names[:] = sorted(name for name in dir_names if name not in _EXCLUDED_DIR_NAMES)
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".java"):
+                continue
+            full_path = os.path.join(dir_path, file_name)
+            with open(full_path, "rb") as f:
+                file_hash = hashlib.sha256(_normalize_source(f.read())).hexdigest()
+            relative_path = os.path.relpath(full_path, project_path).replace(os.sep, "/")
+            digest.update(f"{relative_path}\0{file_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_source_fingerprint(project_id: str, project_path: str) -> str:
+    """
+    업로드 프로젝트의 소스 핑거프린트 조회 (최초 1회 계산 후 압축 해제 디렉토리에 저장)
+
+    Args:
+        project_id (str): 프로젝트 ID
+        project_path (str): 프로젝트 루트 경로
+
+    Returns:
+        str: 소스 핑거프린트 (소스 디렉토리가 없으면 빈 문자열)
+    """
+    fingerprint_path = os.path.join(DirInfo.UNPACK_DIR, project_id, SOURCE_FINGERPRINT_FILE_NAME)
+    if os.path.isfile(fingerprint_path):
+        with open(fingerprint_path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    if not os.path.isdir(project_path):
+        return ""
+
+    fingerprint = build_source_fingerprint(project_path)
+    os.makedirs(os.path.dirname(fingerprint_path), exist_ok=True)
+    with open(fingerprint_path, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+    return fingerprint
+
+
+def _normalize_names(value: Optional[str]) -> list:
+    # 쉼표/공백 구분 목록 (순서, 중복 무관)
+    return sorted({name.strip() for name in (value or "").replace(",", " ").split() if name.strip()})
+
+
+def build_analysis_fingerprint(source_fingerprint: str, filter_options: Dict[str, Any]) -> str:
+    """
+    분석 결과 재사용 기준 핑거프린트 (소스 + 분석 옵션 + LLM 모델)
+
+    Args:
+        source_fingerprint (str): 소스 핑거프린트
+        filter_options (Dict[str, Any]): 분석 옵션 (include_method_text, exclude_packages, custom_annotations, llm_model, llm_version)
+
+    Returns:
+        str: 핑거프린트 (sha256)
+    """
+    key = {
+        "source": source_fingerprint,
+        "include_method_text": bool(filter_options.get("include_method_text", True)),
+        "exclude_packages": _normalize_names(filter_options.get("exclude_packages")),
+        "custom_annotations": _normalize_names(filter_options.get("custom_annotations")),
+        "llm_model": filter_options.get("llm_model") or "",
+        "llm_version": filter_options.get("llm_version") or ""
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
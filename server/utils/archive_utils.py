@@ -0,0 +1,133 @@
+# server/utils/archive_utils.py
+
+"""
+프로젝트 압축 파일 해제 유틸리티 모듈
+- 파서에 필요한 Java 소스와 빌드 설정 파일만 선택 해제 (VCS, 의존성, 빌드 산출물, 바이너리 제외)
+- 해제 전 전체 크기/항목 수/압축률 상한과 경로 탈출(zip slip) 검사
+- 항목을 작업 스레드별로 나누어 병렬 해제 (스레드마다 ZipFile 핸들을 따로 열어 zlib 해제 구간 병렬 실행)
+"""
+
+import os
+import stat
+import time
+import shutil
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from server.utils.config import settings
+from server.utils.parser_shard_utils import BUILD_DESCRIPTOR_NAMES, EXCLUDED_DIR_NAMES
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 해제 대상 파일 (Java 소스 + 모듈 구성 판단용 빌드 설정 파일)
+EXTRACT_SUFFIXES = (".java",)
+EXTRACT_FILE_NAMES = set(BUILD_DESCRIPTOR_NAMES) | {"settings.gradle", "settings.gradle.kts"}
+
+# 위치와 무관하게 제외하는 디렉토리 (빌드 산출물 이름은 패키지명과 겹칠 수 있어 src 상위에서만 제외)
+ALWAYS_EXCLUDED_DIR_NAMES = {"node_modules"}
+
+
+class UnsafeArchiveError(Exception):
+    """압축 파일이 해제 상한(크기/항목 수/압축률)을 초과했거나 해제 경로를 벗어나는 항목을 포함한 경우"""
+
+
+def _is_extract_target(info: zipfile.ZipInfo) -> bool:
+    if info.is_dir() or stat.S_ISLNK(info.external_attr >> 16):
+        return False
+    parts = info.filename.replace("\\", "/").split("/")
+    dir_parts, file_name = parts[:-1], parts[-1]
+    if not (file_name.endswith(EXTRACT_SUFFIXES) or file_name in EXTRACT_FILE_NAMES):
+        return False
+    in_source_tree = False
+    for part in dir_parts:
+        if (part.startswith(".") and part not in (".", "..")) or part in ALWAYS_EXCLUDED_DIR_NAMES:
+            return False
+        if not in_source_tree and part in EXCLUDED_DIR_NAMES:
+            return False
+        in_source_tree = in_source_tree or part == "src"
+    return True
+
+
+def _target_path(extract_root: str, info: zipfile.ZipInfo) -> str:
+    # 절대 경로 또는 '..'로 해제 경로를 벗어나는 항목 거부
+    target = os.path.realpath(os.path.join(extract_root, info.filename))
+    if os.path.commonpath([extract_root, target]) != extract_root:
+        raise UnsafeArchiveError(f"archive member escapes extract path: {info.filename}")
+    return target
+
+
+def _check_limits(members: List[zipfile.ZipInfo], max_total_bytes: int, max_entries: int, max_ratio: float) -> int:
+    if max_entries and len(members) > max_entries:
+        raise UnsafeArchiveError(f"archive has {len(members)} entries to extract (limit {max_entries})")
+    total_bytes = sum(info.file_size for info in members)
+    if max_total_bytes and total_bytes > max_total_bytes:
+        raise UnsafeArchiveError(f"archive uncompressed size {total_bytes} exceeds limit {max_total_bytes} bytes")
+    if max_ratio:
+        for info in members:
+            # 작은 파일은 압축률이 높게 나올 수 있으므로 1MB 이상만 검사
+            if info.file_size >= 1024 ** 2 and info.file_size > info.compress_size * max_ratio:
+                raise UnsafeArchiveError(f"archive member compression ratio exceeds {max_ratio}: {info.filename}")
+    return total_bytes
+
+
+def extract_project_archive(zip_path: str, extract_to: str, workers: Optional[int] = None, on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """
+    프로젝트 ZIP 파일에서 Java 소스와 빌드 설정 파일만 병렬 해제 (해제 경로는 unzip_file과 동일)
+    - 선언된 크기는 zipfile이 읽기 시 검증하므로 해제 전 상한 검사로 실제 기록량도 제한됨
+
+    Args:
+        zip_path (str): ZIP 파일 경로
+        extract_to (str): 해제 대상 디렉토리 (하위에 ZIP 파일명 디렉토리 생성)
+        workers (int): 해제 스레드 수 (기본값: settings.ARCHIVE_EXTRACT_WORKERS, 0이면 CPU 코어 수)
+        on_progress (Callable[[int, int], None]): 항목 해제 시 호출 (해제 건수, 전체 건수)
+    Returns:
+        Dict[str, Any]: {extract_root, extracted, skipped, bytes, elapsed_sec}
+    Raises:
+        UnsafeArchiveError: 해제 상한 초과 또는 경로 탈출 항목 포함
+    """
+    started = time.perf_counter()
+    base_name = os.path.splitext(os.path.basename(zip_path))[0]
+    extract_root = os.path.realpath(os.path.join(extract_to, base_name))
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+    members = [info for info in infos if _is_extract_target(info)]
+    total_bytes = _check_limits(members, settings.ARCHIVE_MAX_TOTAL_BYTES, settings.ARCHIVE_MAX_ENTRIES, settings.ARCHIVE_MAX_COMPRESSION_RATIO)
+    targets = [(info, _target_path(extract_root, info)) for info in members]
+
+    # 디렉토리는 미리 생성하여 스레드 간 생성 경합 방지
+    os.makedirs(extract_root, exist_ok=True)
+    for dir_path in {os.path.dirname(target) for _, target in targets}:
+        os.makedirs(dir_path, exist_ok=True)
+
+    workers = workers or settings.ARCHIVE_EXTRACT_WORKERS or os.cpu_count() or 1
+    workers = max(1, min(workers, len(targets)))
+    done = 0
+    done_lock = threading.Lock()
+
+    def _extract(chunk):
+        nonlocal done
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            for info, target in chunk:
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1024 ** 2)
+                with done_lock:
+                    done += 1
+                    current = done
+                if on_progress:
+                    on_progress(current, len(targets))
+
+    if targets:
+        # 크기 순으로 번갈아 배분하여 스레드별 해제량 균등화
+        targets.sort(key=lambda item: item[0].file_size, reverse=True)
+        chunks = [targets[idx::workers] for idx in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive-extract") as executor:
+            for future in [executor.submit(_extract, chunk) for chunk in chunks]:
+                future.result()
+
+    elapsed = round(time.perf_counter() - started, 3)
+    logger.info(f"📦 압축 해제 완료: {len(targets)}/{len(infos)}개 항목, {total_bytes} bytes, {elapsed}s ({workers} threads)")
+    return {"extract_root": extract_root, "extracted": len(targets), "skipped": len(infos) - len(targets), "bytes": total_bytes, "elapsed_sec": elapsed}
@@ -0,0 +1,213 @@
+# server/utils/call_tree_utils.py
+
+"""
+호출 트리 유틸리티 모듈
+- 하위 트리 해시 계산, 재사용/대형 하위 트리 선별, 하위 트리 요약으로 치환한 압축 호출 트리 생성
+"""
+
+import json
+import hashlib
+from typing import Dict, List, Optional
+
+
+def compute_subtree_hash(node: Dict, memo: Optional[Dict[int, str]] = None) -> str:
+    """
+    하위 트리 구조(method_fqn과 자식 순서)로 해시 계산
+
+    Args:
+        node (Dict): 호출 트리 노드 ({"method_fqn": str, "calls": List[Dict]})
+        memo (Optional[Dict[int, str]]): 노드 객체별 해시 캐시
+
+    Returns:
+        str: sha256 해시 문자열
+    """
+    if memo is not None and id(node) in memo:
+        return memo[id(node)]
+
+    child_hashes = [compute_subtree_hash(child, memo) for child in node.get("calls", [])]
+    payload = json.dumps([node.get("method_fqn", ""), child_hashes], ensure_ascii=False, separators=(",", ":"))
+    subtree_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    if memo is not None:
+        memo[id(node)] = subtree_hash
+    return subtree_hash
+
+
+def collect_reusable_subtrees(call_trees: List[Dict], min_refs: int = 2, max_inline_nodes: int = 30) -> Dict[str, Dict]:
+    """
+    entry point 호출 트리 목록에서 별도로 요약할 하위 트리를 선별
+
+    - 서로 다른 entry point min_refs개 이상에서 공유되는 하위 트리
+    - 하위 트리 요약으로 치환하지 않으면 노드 수가 max_inline_nodes를 초과하는 트리의 큰 자식 하위 트리
+    (entry point 루트 자체와 호출이 없는 단말 노드는 제외)
+
+    Args:
+        call_trees (List[Dict]): entry point별 호출 트리 루트 노드 목록
+        min_refs (int): 공유 하위 트리로 판단할 최소 entry point 수
+        max_inline_nodes (int): 프롬프트에 그대로 포함할 최대 노드 수
+
+    Returns:
+        Dict[str, Dict]: 하위 트리 해시 → {subtree_hash, method_fqn, node, size, height, ref_count, child_hashes}
+    """
+    memo: Dict[int, str] = {}
+    stats: Dict[str, Dict] = {}
+
+    # 1. 하위 트리별 크기/높이/참조 entry point 수 집계
+    for root_idx, root in enumerate(call_trees):
+        if not root:
+            continue
+        _collect_stats(root, root_idx, stats, memo, is_root=True)
+
+    selected = {subtree_hash for subtree_hash, stat in stats.items() if stat["height"] > 1 and len(stat["refs"]) >= min_refs}
+
+    # 2. 프롬프트 크기 제한을 넘는 트리는 큰 자식 하위 트리부터 추가 선별
+    effective_memo: Dict[str, int] = {}
+    for root in call_trees:
+        if root:
+            _select_oversized(root, selected, stats, memo, effective_memo, max_inline_nodes)
+
+    # 3. 선별 결과 구성
+    subtrees = {}
+    for subtree_hash in selected:
+        stat = stats[subtree_hash]
+        subtrees[subtree_hash] = {
+            "subtree_hash": subtree_hash,
+            "method_fqn": stat["node"].get("method_fqn", ""),
+            "node": stat["node"],
+            "size": stat["size"],
+            "height": stat["height"],
+            "ref_count": len(stat["refs"]),
+            "child_hashes": find_child_subtrees(stat["node"], selected, memo)
+        }
+    return subtrees
+
+
+def order_subtrees_bottom_up(subtrees: Dict[str, Dict]) -> List[str]:
+    """
+    하위 트리를 역위상 순서(자식 하위 트리 먼저)로 정렬
+
+    Args:
+        subtrees (Dict[str, Dict]): collect_reusable_subtrees 결과
+
+    Returns:
+        List[str]: 하위 트리 해시 목록
+    """
+    return sorted(subtrees, key=lambda subtree_hash: (subtrees[subtree_hash]["height"], subtree_hash))
+
+
+def find_child_subtrees(node: Dict, selected: set, memo: Optional[Dict[int, str]] = None) -> List[str]:
+    """
+    노드 하위에서 가장 가까운 선별 하위 트리 해시 목록 (노드 자신 제외, 중복 제거)
+    """
+    found: List[str] = []
+
+    def _walk(current: Dict):
+        for child in current.get("calls", []):
+            child_hash = compute_subtree_hash(child, memo)
+            if child_hash in selected:
+                found.append(child_hash)
+            else:
+                _walk(child)
+
+    _walk(node)
+    return list(dict.fromkeys(found))
+
+
+def compress_call_tree(node: Dict, subtree_summaries: Dict[str, str], memo: Optional[Dict[int, str]] = None, is_root: bool = True) -> Dict:
+    """
+    요약이 존재하는 하위 트리를 subtree_summary 노드로 치환한 호출 트리 생성
+
+    Args:
+        node (Dict): 호출 트리 노드
+        subtree_summaries (Dict[str, str]): 하위 트리 해시 → 요약 문장
+        memo (Optional[Dict[int, str]]): 노드 객체별 해시 캐시
+        is_root (bool): 루트 노드 여부 (루트는 치환하지 않음)
+
+    Returns:
+        Dict: 압축된 호출 트리
+    """
+    if not is_root and node.get("calls"):
+        summary = subtree_summaries.get(compute_subtree_hash(node, memo))
+        if summary:
+            return {
+                "method_fqn": node.get("method_fqn", ""),
+                "subtree_summary": summary
+            }
+
+    return {
+        "method_fqn": node.get("method_fqn", ""),
+        "calls": [compress_call_tree(child, subtree_summaries, memo, is_root=False) for child in node.get("calls", [])]
+    }
+
+
+def collect_method_fqns(node: Dict) -> List[str]:
+    """
+    호출 트리에 포함된 메서드 FQN 목록 (pre-order, 중복 제거)
+    """
+    fqns: List[str] = []
+
+    def _walk(current: Dict):
+        fqns.append(current.get("method_fqn", ""))
+        for child in current.get("calls", []):
+            _walk(child)
+
+    _walk(node)
+    return [fqn for fqn in dict.fromkeys(fqns) if fqn]
+
+
+def _collect_stats(node: Dict, root_idx: int, stats: Dict[str, Dict], memo: Dict[int, str], is_root: bool) -> Dict:
+    subtree_hash = compute_subtree_hash(node, memo)
+    stat = stats.get(subtree_hash)
+
+    if stat is None:
+        children = [_collect_stats(child, root_idx, stats, memo, is_root=False) for child in node.get("calls", [])]
+        stat = {
+            "node": node,
+            "size": 1 + sum(child["size"] for child in children),
+            "height": 1 + max((child["height"] for child in children), default=0),
+            "refs": set()
+        }
+        stats[subtree_hash] = stat
+    else:
+        # 동일 하위 트리는 자식 통계를 다시 계산하지 않고 참조 entry point만 전파
+        _propagate_ref(node, root_idx, stats, memo)
+
+    if not is_root:
+        stat["refs"].add(root_idx)
+    return stat
+
+
+def _propagate_ref(node: Dict, root_idx: int, stats: Dict[str, Dict], memo: Dict[int, str]) -> None:
+    for child in node.get("calls", []):
+        child_stat = stats[compute_subtree_hash(child, memo)]
+        if root_idx in child_stat["refs"]:
+            continue
+        child_stat["refs"].add(root_idx)
+        _propagate_ref(child, root_idx, stats, memo)
+
+
+def _select_oversized(node: Dict, selected: set, stats: Dict[str, Dict], memo: Dict[int, str], effective_memo: Dict[str, int], max_inline_nodes: int) -> int:
+    # 반환값: 선별 하위 트리를 1개 노드로 치환했을 때의 유효 노드 수
+    subtree_hash = compute_subtree_hash(node, memo)
+    if subtree_hash in effective_memo:
+        return effective_memo[subtree_hash]
+
+    children = []
+    for child in node.get("calls", []):
+        child_hash = compute_subtree_hash(child, memo)
+        child_size = _select_oversized(child, selected, stats, memo, effective_memo, max_inline_nodes)
+        children.append((child_hash, 1 if child_hash in selected else child_size, bool(child.get("calls"))))
+
+    effective = 1 + sum(size for _, size, _ in children)
+
+    if effective > max_inline_nodes:
+        for child_hash, size, has_calls in sorted(children, key=lambda item: item[1], reverse=True):
+            if effective <= max_inline_nodes:
+                break
+            if not has_calls or child_hash in selected:
+                continue
+            selected.add(child_hash)
+            effective -= size - 1
+
+    effective_memo[subtree_hash] = effective
+    return effective
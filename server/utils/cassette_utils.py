@@ -0,0 +1,310 @@
+# server/utils/cassette_utils.py
+
+"""
+LLM/임베딩 호출 기록(record) 및 재생(replay) 유틸리티 모듈
+- RECORD: 실제 Azure OpenAI 호출의 요청 해시, 응답, 지연 시간, 토큰 사용량을 gzip JSON Lines 카세트에 기록
+- REPLAY: 동일 요청에 대해 카세트의 응답을 원래 지연 시간(또는 지연 없이)으로 반환하여 오프라인 재현
+"""
+
+import os
+import json
+import time
+import gzip
+import base64
+import atexit
+import asyncio
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type
+import numpy as np
+from pydantic import BaseModel
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from server.utils.constants import CassetteMode
+from server.utils.metrics_utils import LLMUsageCallbackHandler
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+
+class CassetteMissError(Exception):
+    """재생 모드에서 카세트에 없는 요청인 경우"""
+
+
+class CassetteReplayedError(Exception):
+    """기록 당시 실패한 호출을 재생한 경우"""
+
+
+def _hash(payload: Any) -> str:
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _serialize_messages(messages: List[Any]) -> List[Tuple[str, Any]]:
+    return [(message.type, message.content) if isinstance(message, BaseMessage) else ("raw", str(message)) for message in messages]
+
+
+def build_llm_key(deployment: str, temperature: float, schema: Type[BaseModel], messages: List[Any]) -> str:
+    """
+    LLM 요청 키 (배포명, temperature, 출력 스키마, 메시지 내용 기준)
+    """
+    return _hash(["llm", deployment, temperature, schema.__name__, schema.model_json_schema(), _serialize_messages(messages)])
+
+
+def build_embedding_key(deployment: str, text: str) -> str:
+    """
+    임베딩 요청 키 (배포명, 텍스트 기준 - 배치 구성과 무관하게 텍스트 단위로 재생)
+    """
+    return _hash(["embedding", deployment, text])
+
+
+def _encode_vector(vector: List[float]) -> str:
+    # float32 바이트를 base64로 저장 (JSON 실수 목록 대비 약 1/3 크기)
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def _decode_vector(encoded: str) -> List[float]:
+    return np.frombuffer(base64.b64decode(encoded), dtype=np.float32).astype(float).tolist()
+
+
+class Cassette:
+    """
+    카세트 파일 (gzip JSON Lines)
+
+    - 동일 키가 여러 번 기록되면 재생 시 기록 순서대로 반환하고, 소진 후에는 마지막 응답을 반복 반환
+    - 임베딩은 텍스트 단위로 1회만 기록
+    """
+    def __init__(self, path: str, mode: str):
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._replay_index: Dict[str, int] = {}
+        self._writer = None
+
+        if os.path.isfile(path):
+            self._load()
+        if mode == CassetteMode.RECORD:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._writer = gzip.open(path, "at", encoding="utf-8")
+            atexit.register(self.close)
+        logger.info(f"📼 [CASSETTE] {mode}: {path} (기록 {sum(len(entries) for entries in self._entries.values())}건)")
+
+    def _load(self) -> None:
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self._entries.setdefault(entry["key"], []).append(entry)
+        except EOFError:
+            # 기록 중 비정상 종료된 카세트는 마지막 gzip 블록 이전까지만 사용
+            logger.warning(f"⚠️ [CASSETTE] 카세트 파일 끝이 손상되어 일부만 로드: {self.path}")
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.setdefault(entry["key"], []).append(entry)
+            if self._writer is not None:
+                self._writer.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                self._writer.flush()
+
+    def lookup(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMissError(f"카세트에 없는 요청입니다: {key[:16]} ({self.path})")
+            idx = self._replay_index.get(key, 0)
+            self._replay_index[key] = idx + 1
+            return entries[min(idx, len(entries) - 1)]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+# ------------------------------------------------------------------
+# LLM 클라이언트
+# ------------------------------------------------------------------
+def _notify_usage(config: Optional[Dict[str, Any]], input_tokens: int, output_tokens: int) -> None:
+    # 재생 시에도 토큰 메트릭 등 콜백이 기록 당시 사용량을 받도록 전달
+    if not input_tokens and not output_tokens:
+        return
+    usage = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+    result = LLMResult(generations=[[ChatGeneration(message=AIMessage(content="", usage_metadata=usage))]])
+    for callback in (config or {}).get("callbacks") or []:
+        if hasattr(callback, "on_llm_end"):
+            callback.on_llm_end(result)
+
+
+class _RecordingStructuredOutput:
+    def __init__(self, model: "RecordingChatModel", schema: Type[BaseModel], runnable: Any):
+        self.model = model
+        self.schema = schema
+        self.runnable = runnable
+
+    async def ainvoke(self, messages: List[Any], config: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        usage = LLMUsageCallbackHandler()
+        config = {**(config or {}), "callbacks": [*((config or {}).get("callbacks") or []), usage]}
+        key = build_llm_key(self.model.deployment_name, self.model.temperature, self.schema, messages)
+        started = time.perf_counter()
+        try:
+            response = await self.runnable.ainvoke(messages, config=config, **kwargs)
+        except asyncio.CancelledError:
+            # 타임아웃/작업 취소로 중단된 호출은 기록하지 않음 (재시도 응답이 기록됨)
+            raise
+        except Exception as err:
+            self.model.cassette.record({"key": key, "kind": "llm", "deployment": self.model.deployment_name, "schema": self.schema.__name__, "latency": round(time.perf_counter() - started, 4), "error": {"type": type(err).__name__, "message": str(err)}})
+            raise
+
+        self.model.cassette.record({
+            "key": key,
+            "kind": "llm",
+            "deployment": self.model.deployment_name,
+            "schema": self.schema.__name__,
+            "latency": round(time.perf_counter() - started, 4),
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "response": response.model_dump(mode="json") if isinstance(response, BaseModel) else response
+        })
+        return response
+
+
+class RecordingChatModel:
+    """
+    실제 채팅 모델을 감싸 with_structured_output 호출을 카세트에 기록 (그 외 속성은 원본 모델 위임)
+    """
+    def __init__(self, llm: Any, cassette: Cassette):
+        self._llm = llm
+        self.cassette = cassette
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs) -> _RecordingStructuredOutput:
+        return _RecordingStructuredOutput(model=self, schema=schema, runnable=self._llm.with_structured_output(schema, **kwargs))
+
+
+class _ReplayStructuredOutput:
+    def __init__(self, model: "ReplayChatModel", schema: Type[BaseModel]):
+        self.model = model
+        self.schema = schema
+
+    async def ainvoke(self, messages: List[Any], config: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        entry = self.model.cassette.lookup(build_llm_key(self.model.deployment_name, self.model.temperature, self.schema, messages))
+        if self.model.replay_latency:
+            await asyncio.sleep(entry.get("latency", 0))
+
+        error = entry.get("error")
+        if error:
+            raise CassetteReplayedError(f"{error.get('type')}: {error.get('message')}")
+
+        _notify_usage(config, entry.get("input_tokens", 0), entry.get("output_tokens", 0))
+        return self.schema.model_validate(entry["response"])
+
+
+class ReplayChatModel:
+    """
+    카세트 응답을 반환하는 채팅 모델 (AzureChatOpenAI와 동일한 배포 정보 속성 제공)
+    """
+    def __init__(self, deployment_name: str, openai_api_version: str, temperature: float, max_tokens: int, cassette: Cassette, replay_latency: bool):
+        self.deployment_name = deployment_name
+        self.openai_api_version = openai_api_version
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.cassette = cassette
+        self.replay_latency = replay_latency
+
+    def with_structured_output(self, schema: Type[BaseModel], **kwargs) -> _ReplayStructuredOutput:
+        return _ReplayStructuredOutput(model=self, schema=schema)
+
+
+# ------------------------------------------------------------------
+# 임베딩 클라이언트
+# ------------------------------------------------------------------
+class RecordingEmbeddings(Embeddings):
+    """
+    실제 임베딩 모델을 감싸 텍스트별 벡터를 카세트에 기록
+    """
+    def __init__(self, embeddings: Embeddings, deployment: str, cassette: Cassette):
+        self._embeddings = embeddings
+        self.deployment = deployment
+        self.cassette = cassette
+
+    def _record(self, texts: List[str], vectors: List[List[float]], latency: float) -> None:
+        per_text_latency = round(latency / max(len(texts), 1), 6)
+        for text, vector in zip(texts, vectors):
+            key = build_embedding_key(self.deployment, text)
+            if not self.cassette.has(key):
+                self.cassette.record({"key": key, "kind": "embedding", "deployment": self.deployment, "latency": per_text_latency, "vector": _encode_vector(vector)})
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        started = time.perf_counter()
+        vectors = self._embeddings.embed_documents(texts)
+        self._record(texts, vectors, time.perf_counter() - started)
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        started = time.perf_counter()
+        vector = self._embeddings.embed_query(text)
+        self._record([text], [vector], time.perf_counter() - started)
+        return vector
+
+
+class ReplayEmbeddings(Embeddings):
+    """
+    카세트의 텍스트별 벡터를 반환하는 임베딩 모델
+    """
+    def __init__(self, deployment: str, cassette: Cassette, replay_latency: bool):
+        self.deployment = deployment
+        self.cassette = cassette
+        self.replay_latency = replay_latency
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        entries = [self.cassette.lookup(build_embedding_key(self.deployment, text)) for text in texts]
+        if self.replay_latency:
+            time.sleep(sum(entry.get("latency", 0) for entry in entries))
+        return [_decode_vector(entry["vector"]) for entry in entries]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+# 카세트 경로/모드별 공용 인스턴스
+_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str, mode: str) -> Cassette:
+    """
+    카세트 조회 (없으면 파일을 로드하여 생성)
+
+    Args:
+        path (str): 카세트 파일 경로
+        mode (str): CassetteMode.RECORD 또는 CassetteMode.REPLAY
+
+    Returns:
+        Cassette: 카세트
+    """
+    with _cassettes_lock:
+        cassette = _cassettes.get((path, mode))
+        if cassette is None:
+            cassette = Cassette(path=path, mode=mode)
+            _cassettes[(path, mode)] = cassette
+        return cassette
+
+
+def close_cassettes() -> None:
+    with _cassettes_lock:
+        for cassette in _cassettes.values():
+            cassette.close()
+        _cassettes.clear()
@@ -5,14 +5,28 @@
 """
 
 import os
+import threading
+import httpx
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 from dotenv import load_dotenv
+from server.utils.constants import CassetteMode
+from server.utils.cassette_utils import get_cassette, RecordingChatModel, ReplayChatModel, RecordingEmbeddings, ReplayEmbeddings
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
+# LLM 클라이언트 캐시 (배포(deployment)별 HTTP 연결 풀 1개를 모든 단계/프로젝트가 공유)
+_llm_cache: Dict[Tuple, AzureChatOpenAI] = {}
+_http_async_clients: Dict[str, httpx.AsyncClient] = {}
+_llm_cache_lock = threading.Lock()
+
+# LLM/임베딩 생성 함수 교체 (벤치마크/테스트용 오프라인 모델, None이면 Azure OpenAI 사용)
+_llm_factory: Optional[Callable[..., Any]] = None
+_embeddings_factory: Optional[Callable[..., Any]] = None
+
 class Settings(BaseSettings):
     # Azure OpenAI 설정
     AOAI_API_KEY: str
@@ -25,6 +39,24 @@ class Settings(BaseSettings):
     DB_PATH: str = "autodiagenti.db"
     SQLALCHEMY_DATABASE_URI: str = f"sqlite:///./server/storage/db/{DB_PATH}"
     
+    # LangGraph 체크포인트 설정 (노드 실행 단위 상태 저장, 실패 시 /analyze/resume으로 재개)
+    CHECKPOINT_ENABLED: bool = True
+    CHECKPOINT_DB_PATH: str = "server/storage/db/checkpoints.db"
+    
+    # 분석 상태 저장 설정 (API 워커 간 공유, SSE 구독)
+    STATUS_DB_PATH: str = "server/storage/db/status.db"
+    STATUS_PROGRESS_MIN_INTERVAL: float = 0.5           # 단계별 진행 건수 최소 저장 간격 (초)
+    STATUS_STREAM_POLL_INTERVAL: float = 0.5            # SSE 상태 변경 확인 간격 (초)
+    STATUS_STREAM_HEARTBEAT_SEC: int = 15               # SSE 연결 유지용 heartbeat 간격 (초)
+    
+    # 메트릭 설정 (/metrics 엔드포인트에 에이전트/LLM/파서 실행 시간, 토큰 수 등 Prometheus 포맷으로 노출)
+    METRICS_ENABLED: bool = True
+    
+    # LLM/임베딩 호출 기록/재생 설정 (OFF, RECORD: 실제 호출 기록, REPLAY: 카세트 응답 재생)
+    LLM_CASSETTE_MODE: str = CassetteMode.OFF
+    LLM_CASSETTE_PATH: str = "server/storage/cassettes/default.jsonl.gz"
+    LLM_CASSETTE_REPLAY_LATENCY: bool = True            # 재생 시 기록 당시 지연 시간 적용 여부 (False면 즉시 반환)
+    
     # FAISS 경로
     FIASS_INDEX_PATH: str = "server/storage/vectorstore/faiss_db"
     
@@ -32,46 +64,143 @@ class Settings(BaseSettings):
     ENTRY_POINT_INFO_FILE_NAME: str = "entry_points.json"
     ALL_METHODS_FILE_NAME: str = "all_methods.json"
     
+    # 파서 산출물 번들 설정 (javalang 파싱/증분 구성/샤드 병합 시 클래스 단위 JSON 파일과 함께 NDJSON 1개로 기록하여 RAG 인덱싱 시 순차 읽기, JAR 단독 실행 산출물은 파일 단위로 읽음)
+    PARSER_BUNDLE_ENABLED: bool = True
+    PARSER_BUNDLE_FILE_NAME: str = "parser_bundle.ndjson"
+    
+    # 업로드 설정 (청크 단위 스트리밍 저장, 크기 상한 초과 시 413 응답 - 0: 제한 없음)
+    UPLOAD_MAX_BYTES: int = 2 * 1024 ** 3
+    UPLOAD_CHUNK_SIZE: int = 1024 ** 2
+    
+    # 압축 해제 설정 (Java 소스와 빌드 설정 파일만 병렬 해제, 상한 초과 압축 파일은 거부 - 0: 제한 없음)
+    ARCHIVE_EXTRACT_WORKERS: int = 0                    # 해제 스레드 수 (0: CPU 코어 수)
+    ARCHIVE_MAX_TOTAL_BYTES: int = 4 * 1024 ** 3        # 해제 대상 파일의 압축 해제 후 전체 크기
+    ARCHIVE_MAX_ENTRIES: int = 200000                   # 해제 대상 파일 수
+    ARCHIVE_MAX_COMPRESSION_RATIO: float = 100.0        # 항목별 압축률 (1MB 이상 항목)
+    
+    # 로컬 디렉토리 분석 설정 (허용 루트 하위 디렉토리만 등록 가능, 쉼표 구분 - 비어 있으면 사용 안 함)
+    LOCAL_SOURCE_ROOTS: str = ""
+    LOCAL_WATCH_DEBOUNCE_SEC: float = 3.0               # 감시 모드에서 마지막 파일 변경 후 재분석까지 대기 시간 (초)
+    
+    # 분석 결과 재사용 설정 (동일 Java 소스 + 분석 옵션 + LLM 모델의 완료된 분석이 있으면 결과를 복사하여 즉시 완료)
+    ANALYSIS_REUSE_ENABLED: bool = True
+    
     # 병렬처리 설정
     MAX_CONCURRENT: int = 20
     LLM_TIMEOUT: int = 30
+    LLM_HTTP_MAX_CONNECTIONS: int = 50          # 배포별 공유 HTTP 연결 풀 최대 연결 수
+    
+    # 분석 작업 큐 설정 (워커 수 = 전체 동시 분석 수, 요청자(session_id)별 동시 분석 수 제한, 대기열 초과 시 429)
+    ANALYSIS_MAX_WORKERS: int = 2
+    ANALYSIS_MAX_JOBS_PER_TENANT: int = 1
+    ANALYSIS_MAX_QUEUE_SIZE: int = 20
+    
+    # 단계 파이프라인 스케줄러 설정 (메서드 분석 → 흐름 요약 → 다이어그램을 entry point 단위로 연쇄 실행)
+    PIPELINE_SCHEDULER_ENABLED: bool = True
+    
+    # 병렬 분기 실행 설정 (호출 트리 구성/인덱싱을 메서드 분석 또는 단계 파이프라인과 동시에 실행)
+    PARALLEL_BRANCHES_ENABLED: bool = True
+    
+    # 계층적 흐름 요약 설정 (재사용 하위 트리를 먼저 요약하고 entry point 요약 시 하위 트리 요약으로 대체)
+    HIERARCHICAL_SUMMARY_ENABLED: bool = False
+    HIERARCHICAL_SUMMARY_MIN_REFS: int = 2              # 하위 트리를 공유하는 최소 entry point 수
+    HIERARCHICAL_SUMMARY_MAX_INLINE_NODES: int = 30     # 이 노드 수를 초과하는 하위 트리는 공유 여부와 무관하게 요약
+    
+    # 시퀀스 다이어그램 생성 모드 (DETERMINISTIC: call_tree 기반 로컬 생성, LLM_REFINE: 로컬 초안을 LLM으로 보정)
+    SEQUENCE_DIAGRAM_MODE: str = "DETERMINISTIC"
+    MERMAID_MAX_REPROMPTS: int = 1                      # 로컬 보정으로 해결되지 않는 다이어그램의 재요청 횟수
+    
+    # 휴리스틱 분석 설정 (단순 메서드는 LLM 호출 없이 템플릿 요약)
+    HEURISTIC_ANALYSIS_ENABLED: bool = True
     
     # parser 설정
     JAR_VERSION: str = "0.4.0"
     JAR_DIR: str = "server/storage/jars"
     JAR_FILENAME: str = f"sg-custom-java-parser-{JAR_VERSION}.jar"
     JAVA_PARSER_JAR_PATH: str = os.path.join(JAR_DIR, JAR_FILENAME)
+    JAVA_PARSER_TIMEOUT: int = 1800                     # 파서 전체 실행 시간 상한 (초, 0: 미사용)
+    JAVA_PARSER_IDLE_TIMEOUT: int = 300                 # 파서 출력 없이 경과 가능한 시간 (초, 초과 시 정지로 보고 종료, 0: 미사용)
+    
+    # 파서 백엔드 설정 (jar: JavaParser JAR, javalang: Java 런타임 없이 Python으로 파싱 - 산출물 형식 동일)
+    JAVA_PARSER_BACKEND: str = "jar"
+    JAVA_PARSER_JAVALANG_WORKERS: int = 0               # javalang 파싱 프로세스 수 (0: CPU 코어 수)
+    JAVA_PARSER_JAVALANG_MIN_POOL_FILES: int = 64       # 프로세스 풀을 사용할 최소 파일 수 (미만이면 순차 파싱)
+    
+    # 멀티 모듈 프로젝트 샤드 파싱 설정 (모듈별 파서 병렬 실행 후 산출물 병합, 단일 모듈은 전체 파싱)
+    JAVA_PARSER_SHARDING_ENABLED: bool = True
+    JAVA_PARSER_SHARD_WORKERS: int = 0                  # 동시 실행 파서 수 (0: CPU 코어 수)
+    
+    # 파서 증분 캐시 설정 (파일 sha256 + 파서 버전 + 분석 옵션 기준, 변경 파일만 파싱)
+    JAVA_PARSER_CACHE_ENABLED: bool = True
+    
+    # 파서 상주 워커 설정 (jpype로 JVM을 1회 기동하여 재사용, 사용할 수 없으면 java -jar 실행으로 대체)
+    JAVA_PARSER_WORKER_ENABLED: bool = False
+    JAVA_PARSER_WORKER_JVM_OPTIONS: str = "-Dfile.encoding=UTF-8"
+    JAVA_PARSER_WORKER_START_TIMEOUT: float = 30.0      # 워커(JVM) 기동 대기 시간 (초)
+    JAVA_PARSER_WORKER_HEALTH_TIMEOUT: float = 5.0      # 헬스 체크 응답 대기 시간 (초)
     
     model_config = SettingsConfigDict(env_file=str(Path(__file__).resolve().parents[1] / ".env"), case_sensitive=True)
     
     def _get_azure_llm(self, azure_llm_model: str, azure_llm_version: str, temperature=0.3, max_tokens=1500):
-        return AzureChatOpenAI(
-            openai_api_key=self.AOAI_API_KEY,
-            azure_endpoint=self.AOAI_ENDPOINT,
-            azure_deployment=azure_llm_model,
-            api_version=azure_llm_version,
-            temperature=temperature,
-            streaming=False,
-            max_tokens=max_tokens
-            
-        )
+        # 동일 설정의 클라이언트는 재사용 (분석 이벤트 루프에서 사용하는 비동기 연결 풀은 배포별로 공유)
+        cache_key = (azure_llm_model, azure_llm_version, temperature, max_tokens)
+        with _llm_cache_lock:
+            llm = _llm_cache.get(cache_key)
+            if llm is None:
+                llm = AzureChatOpenAI(
+                    openai_api_key=self.AOAI_API_KEY,
+                    azure_endpoint=self.AOAI_ENDPOINT,
+                    azure_deployment=azure_llm_model,
+                    api_version=azure_llm_version,
+                    temperature=temperature,
+                    streaming=False,
+                    max_tokens=max_tokens,
+                    http_async_client=self._get_http_async_client(azure_llm_model)
+                )
+                _llm_cache[cache_key] = llm
+            return llm
+    
+    def _get_http_async_client(self, azure_llm_model: str) -> httpx.AsyncClient:
+        client = _http_async_clients.get(azure_llm_model)
+        if client is None:
+            limits = httpx.Limits(max_connections=self.LLM_HTTP_MAX_CONNECTIONS, max_keepalive_connections=self.LLM_HTTP_MAX_CONNECTIONS)
+            client = httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(self.LLM_TIMEOUT))
+            _http_async_clients[azure_llm_model] = client
+        return client
         
     def get_llm_with_custom(self, llm_model: str, llm_version: str, temperature=0.3, max_tokens=1500):
-        return self._get_azure_llm(azure_llm_model=llm_model, azure_llm_version=llm_version, temperature=temperature, max_tokens=max_tokens)
+        if _llm_factory is not None:
+            return _llm_factory(llm_model=llm_model, llm_version=llm_version, temperature=temperature, max_tokens=max_tokens)
+        if self.LLM_CASSETTE_MODE == CassetteMode.REPLAY:
+            cassette = get_cassette(path=self.LLM_CASSETTE_PATH, mode=CassetteMode.REPLAY)
+            return ReplayChatModel(deployment_name=llm_model, openai_api_version=llm_version, temperature=temperature, max_tokens=max_tokens, cassette=cassette, replay_latency=self.LLM_CASSETTE_REPLAY_LATENCY)
+        
+        llm = self._get_azure_llm(azure_llm_model=llm_model, azure_llm_version=llm_version, temperature=temperature, max_tokens=max_tokens)
+        if self.LLM_CASSETTE_MODE == CassetteMode.RECORD:
+            return RecordingChatModel(llm=llm, cassette=get_cassette(path=self.LLM_CASSETTE_PATH, mode=CassetteMode.RECORD))
+        return llm
         
     def get_llm(self):
-        return self._get_azure_llm(azure_llm_model=self.AOAI_DEPLOY_GPT, azure_llm_version=self.AOAI_API_VERSION, temperature=0.3, max_tokens=1500)
+        return self.get_llm_with_custom(llm_model=self.AOAI_DEPLOY_GPT, llm_version=self.AOAI_API_VERSION, temperature=0.3, max_tokens=1500)
 
     def get_embeddings(self, api_model: str = "", api_version: str = ""):
         embedding_api_model = api_model if api_model else self.AOAI_EMBEDDING_DEPLOYMENT
         embedding_api_version = api_version if api_version else self.AOAI_API_VERSION
+        
+        if _embeddings_factory is not None:
+            return _embeddings_factory(api_model=embedding_api_model, api_version=embedding_api_version)
+        if self.LLM_CASSETTE_MODE == CassetteMode.REPLAY:
+            return ReplayEmbeddings(deployment=embedding_api_model, cassette=get_cassette(path=self.LLM_CASSETTE_PATH, mode=CassetteMode.REPLAY), replay_latency=self.LLM_CASSETTE_REPLAY_LATENCY)
 
-        return AzureOpenAIEmbeddings(
+        embeddings = AzureOpenAIEmbeddings(
             model=embedding_api_model,
             openai_api_version=embedding_api_version,
             api_key=self.AOAI_API_KEY,
             azure_endpoint=self.AOAI_ENDPOINT
         )
+        if self.LLM_CASSETTE_MODE == CassetteMode.RECORD:
+            return RecordingEmbeddings(embeddings=embeddings, deployment=embedding_api_model, cassette=get_cassette(path=self.LLM_CASSETTE_PATH, mode=CassetteMode.RECORD))
+        return embeddings
 
 # 설정 인스턴스 생성
 settings = Settings()
@@ -85,3 +214,15 @@ def get_llm_with_custom(llm_model: str, llm_version: str, temperature=0.3, max_t
 
 def get_embeddings():
     return settings.get_embeddings()
+
+def set_model_factories(llm_factory: Optional[Callable[..., Any]] = None, embeddings_factory: Optional[Callable[..., Any]] = None) -> None:
+    """
+    LLM/임베딩 생성 함수 교체 (None 전달 시 Azure OpenAI 클라이언트로 복원)
+
+    Args:
+        llm_factory (Callable): (llm_model, llm_version, temperature, max_tokens) -> 채팅 모델
+        embeddings_factory (Callable): (api_model, api_version) -> 임베딩 모델
+    """
+    global _llm_factory, _embeddings_factory
+    _llm_factory = llm_factory
+    _embeddings_factory = embeddings_factory
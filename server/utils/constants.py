@@ -15,6 +15,10 @@ class AgentType:
     CALL_TREE_SUMMARIZER = "CALL_TREE_SUMMARIZER_AGENT"
     CODE_ANALYSIS = "CODE_ANALYSIS_AGENT"
     SEQUENCE_DIAGRAM = "SEQUENCE_DIAGRAM_AGENT"
+    STAGE_PIPELINE = "STAGE_PIPELINE_AGENT"
+    CALL_TREE_INDEXER = "CALL_TREE_RAG_INDEXER_AGENT"           # 병렬 분기용 호출 트리 RAG 인덱서
+    CODE_ANALYSIS_INDEXER = "CODE_ANALYSIS_RAG_INDEXER_AGENT"   # 병렬 분기용 메서드 분석 결과 RAG 인덱서
+    BRANCH_JOIN = "BRANCH_JOIN"                                 # 병렬 분기 합류 노드
     
 class AgentRunType:
     START = "START"
@@ -26,6 +30,15 @@ class IndexInputType:
     CALLTREE = "CALLTREE"                       
     CALLTREE_SUMMARY = "CALLTREE_SUMMARY"       
     SEQUENCE_DIAGRAM = "SEQUENCE_DIAGRAM"       
+    PIPELINE = "PIPELINE"                       # 단계 파이프라인 결과 (LLM_CODE, CALLTREE_SUMMARY, SEQUENCE_DIAGRAM 묶음)
+
+class PipelineStage:
+    EXTRACT = "EXTRACT"                         # 업로드 압축 해제 (해제 파일 수)
+    PARSER = "PARSER"                           # Java 파서 (파싱 파일 수)
+    METHOD = "METHOD"
+    SUBTREE = "SUBTREE"
+    SUMMARY = "SUMMARY"
+    DIAGRAM = "DIAGRAM"
 
 class RagSourceType:
     PARSER = "PARSER"
@@ -36,7 +49,51 @@ class RagSourceType:
     CODE_ANALYSIS = "CODE_ANALYSIS"
     SEQUENCE_DIAGRAM = "SEQUENCE_DIAGRAM"
     
+class ParserRecordKind:
+    CALL_TREE = "call_tree"                     # *_call_tree.json (클래스별 호출 관계)
+    COMMENTS = "comments"                       # *_comments.json (메서드 주석)
+    METHODS = "methods"                         # *_methods.json (메서드 본문)
+
+class SourceType:
+    UPLOAD = "UPLOAD"                           # ZIP 업로드 (압축 해제 디렉토리)
+    LOCAL = "LOCAL"                             # 서버 로컬 디렉토리 (허용 루트 하위, 복사 없이 직접 읽기)
+
+class ParserBackend:
+    JAR = "jar"                                 # JavaParser JAR (Java 런타임 필요)
+    JAVALANG = "javalang"                       # Python javalang 파서 (프로세스 풀 병렬 파싱)
+
+class AnalysisType:
+    LLM = "LLM"
+    HEURISTIC = "HEURISTIC"
+
+class HeuristicKind:
+    ABSTRACT = "ABSTRACT"                       # 추상/인터페이스 선언 (본문 없음)
+    EMPTY_BODY = "EMPTY_BODY"                   # 빈 본문
+    DELEGATION = "DELEGATION"                   # 단일 호출 위임 (return repo.findById(id))
+    SIMPLE_MAPPER = "SIMPLE_MAPPER"             # 단순 객체 매핑 (new + setter/getter)
     
+class SequenceDiagramMode:
+    DETERMINISTIC = "DETERMINISTIC"             # call_tree 기반 로컬 생성 (LLM 미사용)
+    LLM_REFINE = "LLM_REFINE"                   # 로컬 생성 초안을 LLM으로 보정
+
+class DiagramValidationStatus:
+    VALID = "VALID"                             # 생성 결과 그대로 유효
+    REPAIRED = "REPAIRED"                       # 로컬 보정 후 유효
+    REPROMPTED = "REPROMPTED"                   # 오류 내용을 포함한 재요청 후 유효
+    FALLBACK = "FALLBACK"                       # 재요청 실패로 로컬 생성 초안 사용
+    INVALID = "INVALID"                         # 보정/재요청 후에도 오류
+
+class JobStatus:
+    QUEUED = "QUEUED"                           # 작업 큐 대기
+    RUNNING = "RUNNING"                         # 워커에서 실행 중
+    DONE = "DONE"                               # 실행 종료
+    CANCELLED = "CANCELLED"                     # 사용자 취소
+
+class CassetteMode:
+    OFF = "OFF"                                 # Azure OpenAI 직접 호출
+    RECORD = "RECORD"                           # 실제 호출 요청/응답을 카세트 파일에 기록
+    REPLAY = "REPLAY"                           # 카세트 파일의 응답 재생 (네트워크 미사용)
+
 class AgentResultGroupKey:
     CURRENT_SOURCE_DATA = "current_source_data"
     RAG_INDEXING_RESULT = "rag_indexing_result"
@@ -45,11 +102,15 @@ class AgentResultGroupKey:
     CALL_TREE_SUMMARY = "call_tree_summary"
     CODE_ANALYSIS_RESULT = "code_analysis_result"
     SEQUENCE_DIAGRAM_RESULT = "sequence_diagram_result"
+    PIPELINE_RESULT = "pipeline_result"
     
 class DirInfo:
     UPLOAD_DIR = "server/storage/uploads"
     UNPACK_DIR = "server/storage/tmp/unpacked"
     PARSER_OUTPUT_DIR = "server/storage/tmp/analyzer-output"
+    PARSER_CACHE_DIR = "server/storage/tmp/parser-cache"
+    ARTIFACT_DIR = "server/storage/tmp/artifacts"
+    ANALYSIS_MEMO_DIR = "server/storage/tmp/analysis-memo"
     
 
 class LLMModel(Enum):
@@ -61,6 +122,13 @@ class LLMModel(Enum):
         self.version = version
         self.provider = provider
         
+    @classmethod
+    def _missing_(cls, value):
+        # 체크포인트 역직렬화 시 tuple 값이 list로 복원되는 경우 처리
+        if isinstance(value, list):
+            return cls(tuple(value))
+        return None
+        
     @classmethod
     def get_by_name(cls, model_name):
         """모델명으로 모델을 찾는 함수"""
@@ -8,29 +8,63 @@ import os
 import zipfile
 import shutil
 import json
+import hashlib
+import anyio
 from pathlib import Path
 from fastapi import UploadFile
-from typing import Union, Any
+from typing import Union, Any, Dict, Optional
+from server.utils.config import settings
 from server.utils.logger import get_logger
 
 # 로거 선언
 logger = get_logger(__name__)
 
-async def save_upload_file(upload_file: UploadFile, dest_path: str) -> None:
+class UploadTooLargeError(Exception):
+    """업로드 파일 크기가 허용 상한을 초과한 경우"""
+
+
+async def save_upload_file(upload_file: UploadFile, dest_path: str, max_bytes: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict[str, Any]:
     """
     업로드된 파일을 지정된 경로에 저장
+    - 고정 크기 청크 단위로 읽어 비동기 파일 I/O로 기록 (파일 크기와 무관하게 메모리 사용량 일정)
+    - 기록하면서 sha256 계산, 크기 상한 초과 시 즉시 중단하고 기록 중인 파일 삭제
     
     Args:
         upload_file: FastAPI UploadFile 객체
         dest_path: 저장할 파일 경로
+        max_bytes: 허용 최대 크기 (기본값: settings.UPLOAD_MAX_BYTES, 0: 제한 없음)
+        chunk_size: 읽기/쓰기 청크 크기 (기본값: settings.UPLOAD_CHUNK_SIZE)
+    Returns:
+        Dict[str, Any]: {size, sha256}
+    Raises:
+        UploadTooLargeError: 파일 크기가 max_bytes를 초과한 경우
     """
+    max_bytes = settings.UPLOAD_MAX_BYTES if max_bytes is None else max_bytes
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    
+    # 크기를 알 수 있으면 기록 전에 확인
+    declared_size = getattr(upload_file, "size", None)
+    if max_bytes and isinstance(declared_size, int) and declared_size > max_bytes:
+        raise UploadTooLargeError(f"upload size {declared_size} exceeds limit {max_bytes} bytes")
+    
     # 디렉토리가 없으면 생성
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
     
     # 파일 저장
-    with open(dest_path, "wb") as buffer:
-        contents = await upload_file.read()
-        buffer.write(contents)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with await anyio.open_file(dest_path, "wb") as buffer:
+            while chunk := await upload_file.read(chunk_size):
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise UploadTooLargeError(f"upload size exceeds limit {max_bytes} bytes")
+                digest.update(chunk)
+                await buffer.write(chunk)
+    except BaseException:
+        cleanup_temp_files(dest_path)
+        raise
+    return {"size": size, "sha256": digest.hexdigest()}
 
 
 def unzip_file(zip_path: str, extract_to: str) -> None:
@@ -102,6 +136,15 @@ def load_json(path: Union[str, Path]) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
+def load_json_if_exists(path: Union[str, Path]) -> Any:
+    """
+    JSON 파일을 로드 (파일이 없으면 None)
+    
+    Args:
+        path: 로드할 JSON 파일 경로
+    """
+    return load_json(path) if os.path.isfile(path) else None
+
 def save_json(data: Any, path: Union[str, Path]) -> None:
     """
     JSON 파일을 저장
@@ -0,0 +1,592 @@
+# server/utils/javalang_parser_utils.py
+
+"""
+javalang 기반 Java 파서 유틸리티 모듈
+- JavaParser JAR 대체 백엔드 (Java 런타임 불필요), JAR과 동일한 산출물 스키마 생성
+  (<Class>_call_tree.json, <Class>_methods.json, <Class>_comments.json, all_methods.json, entry_point_fqns.json, entry_points.json)
+- 1단계: 파일 단위 파싱 (javalang_source_utils - 선언, 주석, 어노테이션, 호출 체인 추출) - multiprocessing 풀에서 병렬 실행
+- 2단계: 프로젝트 전체 선언 색인으로 타입/호출 대상 해석, 엔트리 포인트 판별 후 산출물 저장
+- 호출 대상은 프로젝트 소스에 선언된 메서드만 해석 (라이브러리 메서드 호출은 호출 관계에 포함하지 않음)
+"""
+
+import os
+import re
+import time
+import atexit
+import threading
+import multiprocessing
+from datetime import datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from server.utils.config import settings
+from server.utils.file_utils import save_json
+from server.utils.parser_bundle_utils import ParserBundleWriter
+from server.utils.logger import get_logger
+from server.utils.javalang_source_utils import parse_java_file, parse_java_chunk
+
+logger = get_logger(__name__)
+
+# 산출물 형식 버전 (산출물이 달라지는 변경 시 증가 - 파서 캐시 무효화)
+JAVALANG_PARSER_REVISION = "1"
+
+_PRIMITIVE_TYPES = {"boolean", "byte", "char", "short", "int", "long", "float", "double", "void"}
+# import 없이 사용하는 java.lang 타입
+_JAVA_LANG_TYPES = {
+    "Object", "String", "StringBuilder", "StringBuffer", "CharSequence", "Boolean", "Byte", "Character", "Short", "Integer",
+    "Long", "Float", "Double", "Number", "Void", "Math", "System", "Thread", "Runnable", "Iterable", "Comparable", "Class",
+    "Enum", "Record", "Throwable", "Exception", "Error", "RuntimeException", "IllegalArgumentException",
+    "IllegalStateException", "NullPointerException", "UnsupportedOperationException", "IndexOutOfBoundsException",
+    "ArithmeticException", "ClassCastException", "NumberFormatException", "InterruptedException", "CloneNotSupportedException",
+    "AutoCloseable", "Cloneable", "Override", "Deprecated", "SuppressWarnings", "FunctionalInterface", "SafeVarargs"
+}
+
+# Spring 요청 매핑 어노테이션 → HTTP 메서드 (RequestMapping은 method 속성으로 판별)
+_MAPPING_ANNOTATIONS = {
+    "GetMapping": "GET",
+    "PostMapping": "POST",
+    "PutMapping": "PUT",
+    "DeleteMapping": "DELETE",
+    "PatchMapping": "PATCH",
+    "RequestMapping": None
+}
+_CONTROLLER_ANNOTATIONS = {"RestController", "Controller"}
+
+# 타입 문자열의 타입명 (예: "Map<String, List<User>>" → Map, String, List, User)
+_TYPE_NAME_PATTERN = re.compile(r"[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*")
+_GENERIC_PATTERN = re.compile(r"<.*>")
+
+
+def get_javalang_parser_version() -> str:
+    """
+    javalang 파서 버전 (파서 캐시 핑거프린트용 - javalang 버전 + 산출물 형식 버전)
+    """
+    try:
+        javalang_version = metadata.version("javalang")
+    except metadata.PackageNotFoundError:
+        javalang_version = "unknown"
+    return f"javalang-{javalang_version}-r{JAVALANG_PARSER_REVISION}"
+
+
+# ==================== 2단계: 프로젝트 단위 해석 ====================
+
+def _base_type(type_name: str) -> Optional[str]:
+    # 제네릭 인자 제거 (배열은 멤버 추적 대상이 아니므로 None)
+    if not type_name or type_name.endswith("]") or type_name.endswith("..."):
+        return None
+    return _GENERIC_PATTERN.sub("", type_name)
+
+
+def _join_path(base: str, path: str) -> str:
+    if not base:
+        return path or "/"
+    if not path:
+        return base
+    return base.rstrip("/") + "/" + path.lstrip("/")
+
+
+class _ProjectIndex:
+    """
+    프로젝트 선언 색인 (타입/필드/메서드/상수 조회 및 호출 대상 해석)
+    """
+    def __init__(self, units: List[Dict[str, Any]]):
+        self.units = units
+        self.types: Dict[str, Dict[str, Any]] = {}          # 타입 FQN → {info, unit}
+        self.methods: Dict[str, List[Dict[str, Any]]] = {}  # 타입 FQN → 메서드 목록 (fqn 포함)
+        for unit in units:
+            prefix = f"{unit['package']}." if unit["package"] else ""
+            for info in unit["types"]:
+                self.types[prefix + info["name"]] = {"info": info, "unit": unit}
+        self._resolved: Dict[Tuple, str] = {}
+        self._supertypes: Dict[str, List[str]] = {}
+        for type_fqn, entry in self.types.items():
+            self.methods[type_fqn] = [dict(method, fqn=self._method_fqn(type_fqn, method), owner=type_fqn) for method in entry["info"]["methods"]]
+
+    # ---------- 타입 해석 ----------
+
+    def resolve_name(self, name: str, type_fqn: str) -> str:
+        """
+        타입명을 FQN으로 해석 (해석할 수 없으면 그대로 반환)
+        - 탐색 순서: 중첩/외부 타입 → 단일 import → 같은 패키지 → 와일드카드 import → java.lang
+        """
+        key = (type_fqn, name)
+        if key in self._resolved:
+            return self._resolved[key]
+        head, _, rest = name.partition(".")
+        resolved = self._resolve_head(head, type_fqn)
+        if resolved is None:
+            result = name
+        else:
+            result = f"{resolved}.{rest}" if rest else resolved
+        self._resolved[key] = result
+        return result
+
+    def _resolve_head(self, head: str, type_fqn: str) -> Optional[str]:
+        if head in _PRIMITIVE_TYPES:
+            return head
+        entry = self.types.get(type_fqn)
+        if entry is None:
+            return None
+        unit = entry["unit"]
+        scope = type_fqn
+        while scope:
+            if f"{scope}.{head}" in self.types:
+                return f"{scope}.{head}"
+            if scope.rsplit(".", 1)[-1] == head and scope in self.types:
+                return scope
+            scope = scope.rsplit(".", 1)[0] if "." in scope and scope.rsplit(".", 1)[0] in self.types else ""
+        if head in unit["imports"]:
+            return unit["imports"][head]
+        same_package = f"{unit['package']}.{head}" if unit["package"] else head
+        if same_package in self.types:
+            return same_package
+        for wildcard in unit["wildcards"]:
+            if f"{wildcard}.{head}" in self.types:
+                return f"{wildcard}.{head}"
+        if head in _JAVA_LANG_TYPES:
+            return f"java.lang.{head}"
+        return None
+
+    def resolve_type(self, type_name: str, type_fqn: str, type_parameters: Iterable[str] = ()) -> str:
+        """
+        타입 문자열의 모든 타입명을 FQN으로 해석 (예: "Map<String, User>" → "java.util.Map<java.lang.String, com.ex.User>")
+        """
+        type_parameters = set(type_parameters)
+
+        def _replace(match: re.Match) -> str:
+            name = match.group(0)
+            if name in ("extends", "super") or name in type_parameters:
+                return name
+            return self.resolve_name(name, type_fqn)
+        return _TYPE_NAME_PATTERN.sub(_replace, type_name)
+
+    def _method_fqn(self, type_fqn: str, method: Dict[str, Any]) -> str:
+        type_parameters = self.types[type_fqn]["info"]["type_parameters"] + method["type_parameters"]
+        parameters = []
+        for parameter in method["parameters"]:
+            resolved = self.resolve_type(parameter["type"], type_fqn, type_parameters)
+            parameters.append(resolved + "..." if parameter["varargs"] else resolved)
+        return f"{type_fqn}.{method['name']}({', '.join(parameters)})"
+
+    def supertypes(self, type_fqn: str) -> List[str]:
+        if type_fqn not in self._supertypes:
+            info = self.types[type_fqn]["info"]
+            names = [_base_type(name) for name in info["extends"] + info["implements"]]
+            self._supertypes[type_fqn] = [resolved for resolved in (self.resolve_name(name, type_fqn) for name in names if name) if resolved in self.types]
+        return self._supertypes[type_fqn]
+
+    def _hierarchy(self, type_fqn: str) -> List[str]:
+        # 자기 자신 → 상위 타입 순 (너비 우선)
+        ordered, queue = [], [type_fqn]
+        while queue:
+            current = queue.pop(0)
+            if current in ordered or current not in self.types:
+                continue
+            ordered.append(current)
+            queue.extend(self.supertypes(current))
+        return ordered
+
+    def _outer_types(self, type_fqn: str) -> List[str]:
+        outers = []
+        while "." in type_fqn and type_fqn.rsplit(".", 1)[0] in self.types:
+            type_fqn = type_fqn.rsplit(".", 1)[0]
+            outers.append(type_fqn)
+        return outers
+
+    # ---------- 멤버 조회 ----------
+
+    def field_type(self, type_fqn: str, name: str) -> Optional[str]:
+        for owner in self._hierarchy(type_fqn):
+            fields = self.types[owner]["info"]["fields"]
+            if name in fields:
+                return _base_type(self.resolve_type(fields[name], owner, self.types[owner]["info"]["type_parameters"]))
+        return None
+
+    def find_method(self, type_fqn: str, name: str, argument_count: int, hints: List[Optional[str]]) -> Optional[Dict[str, Any]]:
+        """
+        이름/인자 수로 메서드 조회 (하위 타입 선언 우선, 오버로드는 추론 가능한 인자 타입 일치 수로 선택)
+        """
+        for owner in self._hierarchy(type_fqn):
+            candidates = [
+                method for method in self.methods[owner]
+                if method["name"] == name and (
+                    len(method["parameters"]) == argument_count
+                    or (method["parameters"] and method["parameters"][-1]["varargs"] and argument_count >= len(method["parameters"]) - 1)
+                )
+            ]
+            if len(candidates) == 1:
+                return candidates[0]
+            if candidates:
+                return max(candidates, key=lambda method: self._hint_score(method, hints))
+        return None
+
+    @staticmethod
+    def _hint_score(method: Dict[str, Any], hints: List[Optional[str]]) -> int:
+        score = 0
+        for parameter, hint in zip(method["parameters"], hints):
+            if hint and _base_type(parameter["type"]).rsplit(".", 1)[-1] == (_base_type(hint) or hint).rsplit(".", 1)[-1]:
+                score += 1
+        return score
+
+    def return_type(self, method: Dict[str, Any]) -> Optional[str]:
+        owner = method["owner"]
+        type_parameters = self.types[owner]["info"]["type_parameters"] + method["type_parameters"]
+        return _base_type(self.resolve_type(method["return_type"], owner, type_parameters))
+
+    def constant(self, reference: str, type_fqn: str, depth: int = 0) -> Optional[str]:
+        """
+        상수 참조(예: "Constants.API_PATH", "API_PATH")를 문자열 값으로 해석
+        """
+        owner_name, _, name = reference.rpartition(".")
+        owners = [self.resolve_name(owner_name, type_fqn)] if owner_name else self._hierarchy(type_fqn) + self._outer_types(type_fqn)
+        if not owner_name:
+            entry = self.types.get(type_fqn)
+            static_owner = entry["unit"]["static_imports"].get(name) if entry else None
+            if static_owner:
+                owners.append(static_owner)
+        for owner in owners:
+            parts = self.types[owner]["info"]["constants"].get(name) if owner in self.types else None
+            if parts is not None and depth < 8:
+                return self.expression_value(parts, owner, depth + 1)
+        return None
+
+    def expression_value(self, parts: List[List[str]], type_fqn: str, depth: int = 0) -> Optional[str]:
+        values = []
+        for kind, value in parts:
+            if kind == "lit":
+                values.append(value)
+            else:
+                resolved = self.constant(value, type_fqn, depth)
+                if resolved is None:
+                    return None
+                values.append(resolved)
+        return "".join(values)
+
+    # ---------- 호출 해석 ----------
+
+    def resolve_call(self, call: Dict[str, Any], type_fqn: str) -> List[str]:
+        """
+        호출 체인에서 프로젝트 메서드 호출 대상 FQN 목록 해석
+        """
+        kind = call["receiver"][0]
+        chain = list(call["chain"])
+        current: Optional[str] = None
+        if kind == "type":
+            current = _base_type(self.resolve_type(call["receiver"][1], type_fqn))
+        elif kind == "this":
+            current = type_fqn
+        elif kind == "super":
+            supertypes = self.supertypes(type_fqn)
+            current = supertypes[0] if supertypes else None
+        elif kind == "name":
+            current, fields = self._resolve_qualifier(call["receiver"][1], type_fqn)
+            chain = [["field", name] for name in fields] + chain
+        elif kind == "implicit":
+            current = self._implicit_owner(chain[0], type_fqn)
+
+        callees = []
+        for step in chain:
+            if current is None:
+                break
+            if current not in self.types:
+                # 파싱 대상에 없는 프로젝트 타입(증분/샤드 파싱) 호출은 파라미터 수만 표기한 미해석 callee로 기록 (병합 시 재해석)
+                if step[0] == "call" and self._is_project_type(current, type_fqn):
+                    callees.append(f"{current}.{step[1]}({', '.join('?' * step[2])})")
+                break
+            if step[0] == "field":
+                current = self.field_type(current, step[1])
+                continue
+            method = self.find_method(current, step[1], step[2], step[3])
+            if method is None:
+                break
+            callees.append(method["fqn"])
+            current = self.return_type(method)
+        return callees
+
+    def _is_project_type(self, name: str, type_fqn: str) -> bool:
+        # 호출측 루트 패키지(상위 2단계) 하위의 FQN이면 프로젝트 타입으로 간주
+        package = self.types[type_fqn]["unit"]["package"].split(".")
+        return len(package) >= 2 and "." in name and name.startswith(".".join(package[:2]) + ".")
+
+    def _resolve_qualifier(self, qualifier: str, type_fqn: str) -> Tuple[Optional[str], List[str]]:
+        # 한정자 해석: 필드(상속/외부 타입 포함) → 타입명 (가장 긴 타입명 우선, 나머지는 필드 접근)
+        segments = qualifier.split(".")
+        for owner in [type_fqn] + self._outer_types(type_fqn):
+            field_type = self.field_type(owner, segments[0])
+            if field_type:
+                return field_type, segments[1:]
+        for idx in range(len(segments), 0, -1):
+            resolved = self.resolve_name(".".join(segments[:idx]), type_fqn)
+            if resolved in self.types:
+                return resolved, segments[idx:]
+        # import로 해석되는 파싱 대상 밖 타입 (미해석 callee 기록용)
+        resolved = self.resolve_name(segments[0], type_fqn)
+        return (resolved, segments[1:]) if resolved != segments[0] else (None, [])
+
+    def _implicit_owner(self, step: List, type_fqn: str) -> Optional[str]:
+        # 한정자 없는 호출: 자기 타입(상속 포함) → 외부 타입 → static import
+        for owner in [type_fqn] + self._outer_types(type_fqn):
+            if self.find_method(owner, step[1], step[2], step[3]):
+                return owner
+        entry = self.types.get(type_fqn)
+        static_owner = entry["unit"]["static_imports"].get(step[1]) if entry else None
+        return static_owner if static_owner in self.types else None
+
+
+def _entry_point(index: _ProjectIndex, type_fqn: str, method: Dict[str, Any], custom_annotations: set) -> Optional[Dict[str, Any]]:
+    """
+    엔트리 포인트 정보 (Controller의 요청 매핑 메서드 또는 사용자 정의 어노테이션 메서드, 해당 없으면 None)
+    """
+    class_annotations = {annotation["name"]: annotation for annotation in index.types[type_fqn]["info"]["annotations"]}
+    mapping = next((annotation for annotation in method["annotations"] if annotation["name"] in _MAPPING_ANNOTATIONS), None)
+    is_controller = bool(_CONTROLLER_ANNOTATIONS & set(class_annotations)) or "RequestMapping" in class_annotations
+
+    if mapping is not None and is_controller:
+        base_path = _annotation_path(index, class_annotations.get("RequestMapping"), type_fqn)
+        api_method = _MAPPING_ANNOTATIONS[mapping["name"]]
+        if api_method is None:
+            methods = [parts[-1][1].rsplit(".", 1)[-1] for parts in mapping["values"].get("method", []) if parts]
+            api_method = ",".join(methods) or None
+        return {"api_name": _join_path(base_path, _annotation_path(index, mapping, type_fqn)), "api_method": api_method, "annotation": mapping["text"]}
+
+    custom = next((annotation for annotation in method["annotations"] if annotation["name"] in custom_annotations), None)
+    if custom is not None:
+        return {"api_name": _annotation_path(index, custom, type_fqn) or None, "api_method": None, "annotation": custom["text"]}
+    return None
+
+
+def _annotation_path(index: _ProjectIndex, annotation: Optional[Dict[str, Any]], type_fqn: str) -> str:
+    if annotation is None:
+        return ""
+    values = annotation["values"]
+    for key in ("value", "path"):
+        for parts in values.get(key, []):
+            resolved = index.expression_value(parts, type_fqn)
+            # 해석할 수 없는 상수 참조는 참조식 그대로 표기
+            return resolved if resolved is not None else "".join(value if kind == "lit" else "{" + value + "}" for kind, value in parts)
+    return ""
+
+
+def _split_names(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _is_excluded(package: str, exclude_prefixes: List[str]) -> bool:
+    return any(f"{package}.".startswith(prefix if prefix.endswith(".") else f"{prefix}.") for prefix in exclude_prefixes)
+
+
+def _primary_type_name(unit: Dict[str, Any]) -> str:
+    stem = Path(unit["file_path"]).stem
+    top_level = [info["name"] for info in unit["types"] if "." not in info["name"]]
+    return stem if stem in top_level else (top_level[0] if top_level else stem)
+
+
+def write_javalang_output(units: List[Dict[str, Any]], project_output_dir: str, include_method_text: bool = True, exclude_packages: Optional[str] = "", custom_annotations: Optional[str] = "", bundle: bool = False) -> Dict[str, int]:
+    """
+    파일 단위 파싱 결과를 해석하여 JAR과 동일한 형식의 산출물 저장
+
+    Args:
+        units (List[Dict[str, Any]]): parse_java_file 결과 목록
+        project_output_dir (str): 산출물 디렉토리 (클래스별 산출물은 패키지 경로 하위에 저장)
+        include_method_text (bool): 메서드 본문 포함 여부
+        exclude_packages (str): 제외할 패키지 접두어 (쉼표 구분)
+        custom_annotations (str): 엔트리 포인트 구분용 사용자 정의 어노테이션 (쉼표 구분)
+        bundle (bool): 클래스 단위 산출물 번들 기록 여부
+    Returns:
+        Dict[str, int]: {files, methods, entry_points, call_edges}
+    """
+    exclude_prefixes = _split_names(exclude_packages)
+    custom = {name.lstrip("@").rsplit(".", 1)[-1] for name in _split_names(custom_annotations)}
+    units = sorted((unit for unit in units if not unit["error"] and unit["types"] and not _is_excluded(unit["package"], exclude_prefixes)), key=lambda unit: unit["file_path"])
+    index = _ProjectIndex(units)
+    analyzed_at = datetime.now().isoformat()
+
+    all_methods: List[str] = []
+    entry_point_fqns: List[str] = []
+    entry_points: List[Dict[str, Any]] = []
+    edge_count = 0
+    with ParserBundleWriter(project_output_dir, enabled=bundle) as writer:
+        for unit in units:
+            package = unit["package"]
+            prefix = f"{package}." if package else ""
+            call_edges: List[Dict[str, str]] = []
+            method_meta_map: Dict[str, Dict[str, Any]] = {}
+            methods_json: Dict[str, Dict[str, Any]] = {}
+            comments_json: Dict[str, Dict[str, Any]] = {}
+            for info in unit["types"]:
+                type_fqn = prefix + info["name"]
+                for method in index.methods[type_fqn]:
+                    method_fqn = method["fqn"]
+                    entry_point = _entry_point(index, type_fqn, method, custom)
+                    seen = set()
+                    for call in method["calls"]:
+                        for callee in index.resolve_call(call, type_fqn):
+                            if callee not in seen:
+                                seen.add(callee)
+                                call_edges.append({"caller": method_fqn, "callee": callee})
+
+                    modifiers = " ".join(method["modifiers"])
+                    type_parameters = f"<{', '.join(method['type_parameters'])}> " if method["type_parameters"] else ""
+                    parameters = ", ".join(f"{parameter['type']}{'...' if parameter['varargs'] else ''} {parameter['name']}" for parameter in method["parameters"])
+                    throws = f" throws {', '.join(method['throws'])}" if method["throws"] else ""
+                    meta = {
+                        "method_fqn": method_fqn,
+                        "method_signature": f"{modifiers + ' ' if modifiers else ''}{type_parameters}{method['return_type']} {method['name']}({parameters}){throws}",
+                        "return_type": method["return_type"],
+                        "parameters": [{"name": parameter["name"], "type": parameter["type"]} for parameter in method["parameters"]],
+                        "modifiers": method["modifiers"],
+                        "annotations": [annotation["text"] for annotation in method["annotations"]],
+                        "comment": method["comment"],
+                        "file_path": unit["file_path"],
+                        "package_name": package,
+                        "class_name": info["name"],
+                        "line": method["line"],
+                        "entry_point": entry_point is not None
+                    }
+                    method_meta_map[method_fqn] = meta
+                    methods_json[method_fqn] = dict(meta, method_text=method["method_text"] if include_method_text else "")
+                    comments_json[method_fqn] = {"comment": method["comment"], "entry_point": entry_point is not None}
+                    if method_fqn not in all_methods:
+                        all_methods.append(method_fqn)
+                    if entry_point is not None and method_fqn not in entry_point_fqns:
+                        entry_point_fqns.append(method_fqn)
+                        entry_points.append({"method_fqn": method_fqn, "file_path": unit["file_path"], "class_name": info["name"], **entry_point})
+
+            class_name = _primary_type_name(unit)
+            out_dir = os.path.join(project_output_dir, *package.split(".")) if package else project_output_dir
+            writer.save({"file_path": unit["file_path"], "package_name": package, "class_name": class_name, "analyzed_at": analyzed_at, "call_edges": call_edges, "method_meta_map": method_meta_map}, os.path.join(out_dir, f"{class_name}_call_tree.json"))
+            writer.save(methods_json, os.path.join(out_dir, f"{class_name}_methods.json"))
+            writer.save(comments_json, os.path.join(out_dir, f"{class_name}_comments.json"))
+            edge_count += len(call_edges)
+
+    save_json(all_methods, os.path.join(project_output_dir, settings.ALL_METHODS_FILE_NAME))
+    save_json(entry_point_fqns, os.path.join(project_output_dir, settings.ENTRY_POINT_FILE_NAME))
+    save_json(entry_points, os.path.join(project_output_dir, settings.ENTRY_POINT_INFO_FILE_NAME))
+    return {"files": len(units), "methods": len(all_methods), "entry_points": len(entry_points), "call_edges": edge_count}
+
+
+# ==================== 실행 ====================
+
+# 프로세스 공용 파싱 풀 (spawn 작업 프로세스는 __main__ 모듈까지 다시 import하므로 기동 비용은 최초 1회만 부담)
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_javalang_pool(workers: int):
+    """
+    파싱 프로세스 풀 조회 (없거나 프로세스 수가 다르면 생성)
+    - fork는 실행 중인 스레드(상태 저장, 상주 워커 등)의 잠금 상태까지 복제하므로 spawn 사용
+
+    Args:
+        workers (int): 파싱 프로세스 수
+    Returns:
+        multiprocessing.pool.Pool: 프로세스 풀
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.terminate()
+            _pool = None
+        if _pool is None:
+            _pool = multiprocessing.get_context("spawn").Pool(processes=workers)
+            _pool_workers = workers
+            logger.info(f"🚀 javalang 파싱 프로세스 풀 생성: {workers}개")
+        return _pool
+
+
+def shutdown_javalang_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+
+
+atexit.register(shutdown_javalang_pool)
+
+
+def list_java_files(source_dir: str) -> List[Tuple[str, str]]:
+    """
+    소스 디렉토리의 .java 파일 목록 (경로, 상대 경로) - 상대 경로 순 정렬
+    """
+    files = []
+    for root, dir_names, file_names in os.walk(source_dir):
+        dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+        for name in file_names:
+            if name.endswith(".java"):
+                path = os.path.join(root, name)
+                files.append((path, Path(path).relative_to(source_dir).as_posix()))
+    return sorted(files, key=lambda item: item[1])
+
+
+def parse_java_files(files: List[Tuple[str, str]], include_method_text: bool = True, workers: int = 1, on_file: Optional[Callable[[Dict[str, Any]], None]] = None, idle_timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Java 파일 목록 파싱 (workers > 1이면 프로세스 공용 풀에서 병렬 파싱)
+
+    Args:
+        files (List[Tuple[str, str]]): (파일 경로, 상대 경로) 목록
+        workers (int): 파싱 프로세스 수 (1 이하: 현재 프로세스에서 순차 파싱)
+        on_file (Callable): 파일 1개 파싱 완료 시 호출 (파싱 결과 전달, 진행 상황 보고용)
+        idle_timeout (float): 파싱 결과 없이 경과 가능한 시간 (초, 풀 실행 시 작업 묶음 단위, 초과 시 TimeoutError)
+    Returns:
+        List[Dict[str, Any]]: 파일별 파싱 결과 (입력 순서와 무관)
+    """
+    tasks = [(path, relative_path, include_method_text) for path, relative_path in files]
+    units: List[Dict[str, Any]] = []
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            unit = parse_java_file(task)
+            units.append(unit)
+            if on_file:
+                on_file(unit)
+        return units
+
+    # 프로세스 간 통신 비용을 줄이기 위해 작업을 묶어서 전달 (프로세스당 약 4묶음)
+    chunk_size = max(1, len(tasks) // (workers * 4))
+    chunks = [tasks[idx:idx + chunk_size] for idx in range(0, len(tasks), chunk_size)]
+    results = get_javalang_pool(workers).imap_unordered(parse_java_chunk, chunks)
+    for _ in range(len(chunks)):
+        try:
+            chunk_units = results.next(timeout=idle_timeout or None)
+        except multiprocessing.TimeoutError as e:
+            # 정지된 작업 프로세스가 남지 않도록 풀 종료 (다음 실행 시 재생성)
+            shutdown_javalang_pool()
+            raise TimeoutError(f"no file parsed for {idle_timeout} seconds") from e
+        for unit in chunk_units:
+            units.append(unit)
+            if on_file:
+                on_file(unit)
+    return units
+
+
+def run_javalang_parser(source_dir: str, output_dir: str, include_method_text: bool = True, exclude_packages: Optional[str] = "", custom_annotations: Optional[str] = "", workers: int = 1, on_file: Optional[Callable[[Dict[str, Any]], None]] = None, idle_timeout: Optional[float] = None, bundle: bool = False) -> Dict[str, Any]:
+    """
+    javalang 파서 실행 (JAR과 동일하게 output_dir 하위 소스 디렉토리명으로 산출물 생성)
+
+    Args:
+        source_dir (str): 분석 대상 Java 소스 루트 경로
+        output_dir (str): 파서 출력 루트
+        workers (int): 파싱 프로세스 수
+        bundle (bool): 클래스 단위 산출물 번들 기록 여부
+    Returns:
+        Dict[str, Any]: {files, parsed, errors, methods, entry_points, call_edges, elapsed_sec, output_dir}
+    """
+    started = time.perf_counter()
+    files = list_java_files(source_dir)
+    units = parse_java_files(files, include_method_text=include_method_text, workers=workers, on_file=on_file, idle_timeout=idle_timeout)
+    errors = [unit for unit in units if unit["error"]]
+    for unit in errors:
+        logger.warning(f"⚠️ javalang 파싱 실패: {unit['file_path']} ({unit['error']})")
+
+    project_output_dir = os.path.join(output_dir, os.path.basename(os.path.normpath(source_dir)))
+    report = write_javalang_output(units, project_output_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations, bundle=bundle)
+    return {
+        **report,
+        "files": len(files),
+        "parsed": len(units) - len(errors),
+        "errors": len(errors),
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+        "output_dir": project_output_dir
+    }
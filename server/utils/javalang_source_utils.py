@@ -0,0 +1,402 @@
+# server/utils/javalang_source_utils.py
+
+"""
+javalang 소스 파일 추출 유틸리티 모듈
+- Java 파일 1개를 파싱하여 패키지/import, 타입 선언, 메서드(주석, 어노테이션, 본문), 호출 체인을 직렬화 가능한 dict로 추출
+- 프로세스 풀(spawn) 작업 함수가 포함되므로 표준 라이브러리와 javalang만 import (작업 프로세스 기동 비용 최소화)
+"""
+
+import textwrap
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import javalang
+from javalang import tree as jtree
+
+_MODIFIER_ORDER = ["public", "protected", "private", "abstract", "static", "final", "transient", "volatile", "synchronized", "native", "strictfp", "default"]
+
+
+def _type_str(node) -> str:
+    """
+    javalang 타입 노드를 소스 표기 문자열로 변환 (예: "Map<String, List<User>>", "int[]")
+    """
+    if node is None:
+        return "void"
+    if isinstance(node, jtree.BasicType):
+        return node.name + "[]" * len(node.dimensions or [])
+    text = node.name
+    if node.arguments:
+        text += "<" + ", ".join(_type_argument_str(argument) for argument in node.arguments) + ">"
+    elif node.arguments is not None and not node.sub_type:
+        text += "<>"
+    if node.sub_type:
+        text += "." + _type_str(node.sub_type)
+    return text + "[]" * len(node.dimensions or [])
+
+
+def _type_argument_str(argument) -> str:
+    if argument.type is None:
+        return "?"
+    if argument.pattern_type in ("extends", "super"):
+        return f"? {argument.pattern_type} {_type_str(argument.type)}"
+    return _type_str(argument.type)
+
+
+def _sorted_modifiers(modifiers: Iterable[str]) -> List[str]:
+    return sorted(modifiers or [], key=lambda m: _MODIFIER_ORDER.index(m) if m in _MODIFIER_ORDER else len(_MODIFIER_ORDER))
+
+
+def _literal_value(value: str) -> str:
+    # 문자열 리터럴의 따옴표/기본 이스케이프 제거
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _value_parts(expression) -> Optional[List[List[str]]]:
+    """
+    상수/어노테이션 값 표현식을 [종류, 값] 목록으로 변환 (문자열 연결 지원, 해석 불가 표현식은 None)
+    - ["lit", "/api"]: 리터럴, ["ref", "Constants.API_PATH"]: 상수 참조 (2단계에서 해석)
+    """
+    if isinstance(expression, jtree.Literal):
+        return [["lit", _literal_value(expression.value)]]
+    if isinstance(expression, jtree.MemberReference) and not expression.selectors:
+        return [["ref", f"{expression.qualifier}.{expression.member}" if expression.qualifier else expression.member]]
+    if isinstance(expression, jtree.BinaryOperation) and expression.operator == "+":
+        left, right = _value_parts(expression.operandl), _value_parts(expression.operandr)
+        return left + right if left is not None and right is not None else None
+    return None
+
+
+def _element_values(element) -> Dict[str, List[List[List[str]]]]:
+    """
+    어노테이션 속성값 추출 (속성명 → 값 표현식 목록, 단일 값 속성명은 "value")
+    """
+    if element is None:
+        return {}
+    pairs = element if isinstance(element, list) else [jtree.ElementValuePair(name="value", value=element)]
+    values: Dict[str, List[List[List[str]]]] = {}
+    for pair in pairs:
+        items = pair.value.values if isinstance(pair.value, jtree.ElementArrayValue) else [pair.value]
+        values[pair.name] = [parts for parts in (_value_parts(item) for item in items or []) if parts is not None]
+    return values
+
+
+class _SourceFile:
+    """
+    소스 원문과 토큰 (메서드/어노테이션 원문 추출용)
+    """
+    def __init__(self, source: str, tokens: List):
+        self.lines = source.splitlines()
+        self.tokens = tokens
+        self._index = {(token.position.line, token.position.column): idx for idx, token in enumerate(tokens)}
+
+    def token_index(self, position) -> Optional[int]:
+        return self._index.get((position.line, position.column)) if position else None
+
+    def span_text(self, start_idx: int, end_idx: int) -> str:
+        # 시작 토큰 ~ 종료 토큰 원문 (첫 줄 들여쓰기 기준으로 내어쓰기)
+        start, end = self.tokens[start_idx], self.tokens[end_idx]
+        first_line, last_line = start.position.line - 1, end.position.line - 1
+        if first_line == last_line:
+            return self.lines[first_line][start.position.column - 1:end.position.column - 1 + len(end.value)]
+        indent = " " * (start.position.column - 1)
+        text = [indent + self.lines[first_line][start.position.column - 1:]]
+        text.extend(self.lines[first_line + 1:last_line])
+        text.append(self.lines[last_line][:end.position.column - 1 + len(end.value)])
+        return textwrap.dedent("\n".join(text)).strip()
+
+    def match_close(self, open_idx: int) -> int:
+        # 여는 괄호 토큰에 대응하는 닫는 괄호 토큰 위치
+        opener = self.tokens[open_idx].value
+        closer = {"(": ")", "{": "}", "[": "]"}[opener]
+        depth = 0
+        for idx in range(open_idx, len(self.tokens)):
+            value = self.tokens[idx].value
+            if value == opener:
+                depth += 1
+            elif value == closer:
+                depth -= 1
+                if depth == 0:
+                    return idx
+        return len(self.tokens) - 1
+
+    def declaration_end(self, start_idx: int) -> int:
+        # 메서드 선언 종료 토큰 위치 (본문 닫는 중괄호 또는 추상 메서드의 세미콜론)
+        depth = 0
+        for idx in range(start_idx, len(self.tokens)):
+            value = self.tokens[idx].value
+            if value == "(":
+                depth += 1
+            elif value == ")":
+                depth -= 1
+            elif depth == 0 and value == "{":
+                return self.match_close(idx)
+            elif depth == 0 and value == ";":
+                return idx
+        return len(self.tokens) - 1
+
+    def annotation_text(self, annotation) -> str:
+        start_idx = self.token_index(annotation.position)
+        if start_idx is None:
+            return f"@{annotation.name}"
+        end_idx = start_idx + 1
+        while end_idx + 2 < len(self.tokens) and self.tokens[end_idx + 1].value == ".":
+            end_idx += 2
+        if end_idx + 1 < len(self.tokens) and self.tokens[end_idx + 1].value == "(":
+            end_idx = self.match_close(end_idx + 1)
+        return self.span_text(start_idx, end_idx)
+
+
+def _annotations(source: _SourceFile, annotations) -> List[Dict[str, Any]]:
+    return [
+        {"name": annotation.name.rsplit(".", 1)[-1], "text": source.annotation_text(annotation), "values": _element_values(annotation.element)}
+        for annotation in annotations or []
+    ]
+
+
+def _literal_type(value: str) -> Optional[str]:
+    if value.startswith('"'):
+        return "String"
+    if value.startswith("'"):
+        return "char"
+    if value in ("true", "false"):
+        return "boolean"
+    if value == "null":
+        return None
+    lowered = value.lower()
+    if lowered.endswith("l"):
+        return "long"
+    if lowered.endswith("f"):
+        return "float"
+    if "." in value or lowered.endswith("d"):
+        return "double"
+    return "int"
+
+
+def _argument_hint(argument, scope: Dict[str, str]) -> Optional[str]:
+    # 오버로드 선택용 인자 타입 (추론 불가 시 None)
+    if isinstance(argument, jtree.Literal) and not argument.selectors:
+        return _literal_type(argument.value)
+    if isinstance(argument, jtree.MemberReference) and not argument.qualifier and not argument.selectors:
+        return scope.get(argument.member)
+    if isinstance(argument, jtree.ClassCreator) and not argument.selectors:
+        return _type_str(argument.type)
+    if isinstance(argument, jtree.Cast):
+        return _type_str(argument.type)
+    return None
+
+
+def _call_step(invocation, scope: Dict[str, str]) -> List:
+    return ["call", invocation.member, len(invocation.arguments or []), [_argument_hint(argument, scope) for argument in invocation.arguments or []]]
+
+
+def _selector_chain(selectors, scope: Dict[str, str]) -> List[List]:
+    chain = []
+    for selector in selectors or []:
+        if isinstance(selector, jtree.MethodInvocation):
+            chain.append(_call_step(selector, scope))
+        elif isinstance(selector, jtree.MemberReference):
+            chain.append(["field", selector.member])
+        else:
+            # 배열 접근 등 타입을 이어서 추적할 수 없는 선택자
+            break
+    return chain
+
+
+def _iter_nodes(node) -> Iterable:
+    """
+    하위 노드 전위 순회 (javalang filter()는 노드마다 경로 튜플을 만들어 메서드 단위 반복 순회 시 비용이 큼)
+    """
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, javalang.ast.Node):
+            yield current
+            stack.extend(reversed(current.children))
+        elif isinstance(current, (list, tuple)):
+            stack.extend(reversed(current))
+
+
+def _method_body(method) -> Tuple[Dict[str, str], List]:
+    """
+    메서드 본문 1회 순회로 변수 타입과 호출 후보 노드 수집
+
+    Returns:
+        Tuple[Dict[str, str], List]: (파라미터/지역 변수 → 타입 문자열 - 블록 범위 구분 없이 메서드 단위, 선택자가 아닌 Primary 노드 목록)
+    """
+    scope = {parameter.name: _type_str(parameter.type) for parameter in method.parameters or []}
+    primaries, selector_ids = [], set()
+    for node in _iter_nodes(method.body or []):
+        if isinstance(node, jtree.Primary):
+            if id(node) not in selector_ids:
+                primaries.append(node)
+            selector_ids.update(id(selector) for selector in node.selectors or [])
+        elif isinstance(node, jtree.VariableDeclaration):
+            type_name = _type_str(node.type)
+            for declarator in node.declarators:
+                if type_name == "var":
+                    initializer = declarator.initializer
+                    if not isinstance(initializer, jtree.ClassCreator) or initializer.selectors:
+                        continue
+                    type_name = _type_str(initializer.type)
+                scope[declarator.name] = type_name
+        elif isinstance(node, jtree.CatchClauseParameter):
+            scope[node.name] = node.types[0] if node.types else "Exception"
+        elif isinstance(node, jtree.TryResource) and node.type is not None:
+            scope[node.name] = _type_str(node.type)
+    return scope, primaries
+
+
+def _method_calls(primaries: List, scope: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    메서드 본문의 호출 체인 추출
+    - receiver: ["type", 타입] / ["name", 한정자] / ["this"] / ["super"] / ["implicit"] (한정자 없는 호출)
+    - chain: ["call", 메서드명, 인자 수, 인자 타입] / ["field", 필드명]
+    """
+    calls = []
+    for node in primaries:
+        if isinstance(node, jtree.MethodInvocation):
+            chain = [_call_step(node, scope)] + _selector_chain(node.selectors, scope)
+            if not node.qualifier:
+                receiver = ["implicit"]
+            else:
+                head, *rest = node.qualifier.split(".")
+                if head in scope:
+                    receiver = ["type", scope[head]]
+                    chain = [["field", name] for name in rest] + chain
+                else:
+                    receiver = ["name", node.qualifier]
+        elif isinstance(node, jtree.SuperMethodInvocation):
+            receiver, chain = ["super"], [_call_step(node, scope)] + _selector_chain(node.selectors, scope)
+        elif isinstance(node, jtree.This):
+            receiver, chain = ["this"], _selector_chain(node.selectors, scope)
+        elif isinstance(node, jtree.ClassCreator):
+            receiver, chain = ["type", _type_str(node.type)], _selector_chain(node.selectors, scope)
+        else:
+            continue
+        if any(step[0] == "call" for step in chain):
+            calls.append({"receiver": receiver, "chain": chain, "line": node.position.line if node.position else None})
+    return calls
+
+
+def _method_info(source: _SourceFile, method, include_method_text: bool) -> Dict[str, Any]:
+    scope, primaries = _method_body(method)
+    annotations = _annotations(source, method.annotations)
+    method_text = ""
+    if include_method_text:
+        start_idx = source.token_index(method.position)
+        anchors = [idx for idx in (source.token_index(annotation.position) for annotation in method.annotations or []) if idx is not None]
+        if start_idx is not None:
+            # 메서드 위치는 반환 타입 토큰이므로 앞쪽 수정자 토큰까지 포함
+            while start_idx > 0 and isinstance(source.tokens[start_idx - 1], javalang.tokenizer.Modifier):
+                start_idx -= 1
+            method_text = source.span_text(min(anchors + [start_idx]), source.declaration_end(start_idx))
+    return {
+        "name": method.name,
+        "line": method.position.line if method.position else None,
+        "modifiers": _sorted_modifiers(method.modifiers),
+        "annotations": annotations,
+        "type_parameters": [parameter.name for parameter in method.type_parameters or []],
+        "return_type": _type_str(method.return_type),
+        "parameters": [{"name": parameter.name, "type": _type_str(parameter.type), "varargs": bool(parameter.varargs)} for parameter in method.parameters or []],
+        "throws": list(method.throws or []),
+        "comment": method.documentation or "",
+        "method_text": method_text,
+        "calls": _method_calls(primaries, scope)
+    }
+
+
+def _type_infos(source: _SourceFile, declaration, outer_name: str, include_method_text: bool) -> List[Dict[str, Any]]:
+    """
+    타입 선언 정보 (중첩 타입 포함, 어노테이션 타입 제외)
+    """
+    if isinstance(declaration, jtree.AnnotationDeclaration):
+        return []
+    name = f"{outer_name}.{declaration.name}" if outer_name else declaration.name
+    body = declaration.body.declarations if isinstance(declaration, jtree.EnumDeclaration) else declaration.body
+    extends = getattr(declaration, "extends", None)
+    extends = extends if isinstance(extends, list) else ([extends] if extends else [])
+    is_interface = isinstance(declaration, jtree.InterfaceDeclaration)
+
+    fields: Dict[str, str] = {}
+    constants: Dict[str, List[List[str]]] = {}
+    for field in declaration.fields:
+        for declarator in field.declarators:
+            fields[declarator.name] = _type_str(field.type)
+            if (is_interface or {"static", "final"} <= set(field.modifiers or [])) and declarator.initializer is not None:
+                parts = _value_parts(declarator.initializer)
+                if parts is not None:
+                    constants[declarator.name] = parts
+    if isinstance(declaration, jtree.EnumDeclaration):
+        for constant in declaration.body.constants or []:
+            fields[constant.name] = name
+
+    info = {
+        "name": name,
+        "kind": type(declaration).__name__.replace("Declaration", "").lower(),
+        "annotations": _annotations(source, declaration.annotations),
+        "type_parameters": [parameter.name for parameter in getattr(declaration, "type_parameters", None) or []],
+        "extends": [_type_str(node) for node in extends],
+        "implements": [_type_str(node) for node in getattr(declaration, "implements", None) or []],
+        "fields": fields,
+        "constants": constants,
+        "methods": [_method_info(source, method, include_method_text) for method in declaration.methods]
+    }
+    infos = [info]
+    for member in body or []:
+        if isinstance(member, jtree.TypeDeclaration):
+            infos.extend(_type_infos(source, member, name, include_method_text))
+    return infos
+
+
+def parse_java_file(task: Tuple[str, str, bool]) -> Dict[str, Any]:
+    """
+    Java 파일 1개 파싱 (프로세스 풀 작업 단위 - 결과는 직렬화 가능한 dict)
+
+    Args:
+        task (Tuple[str, str, bool]): (파일 경로, 소스 루트 기준 상대 경로, 메서드 본문 포함 여부)
+    Returns:
+        Dict[str, Any]: {file_path, package, imports, static_imports, wildcards, types, error}
+    """
+    path, relative_path, include_method_text = task
+    unit: Dict[str, Any] = {"file_path": relative_path, "package": "", "imports": {}, "static_imports": {}, "wildcards": [], "types": [], "error": None}
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+        tokens = list(javalang.tokenizer.tokenize(text))
+        compilation_unit = javalang.parser.Parser(tokens).parse()
+        source = _SourceFile(text, tokens)
+    except (javalang.parser.JavaSyntaxError, javalang.tokenizer.LexerError, OSError) as e:
+        unit["error"] = f"{type(e).__name__}: {getattr(e, 'description', None) or e}"
+        return unit
+    except Exception as e:
+        # javalang 미지원 문법에서 발생하는 내부 오류 포함
+        unit["error"] = f"{type(e).__name__}: {e}"
+        return unit
+
+    unit["package"] = compilation_unit.package.name if compilation_unit.package else ""
+    for declaration in compilation_unit.imports or []:
+        if declaration.static:
+            owner, _, member = declaration.path.rpartition(".")
+            if declaration.wildcard:
+                unit["static_imports"].setdefault("*", []).append(declaration.path)
+            else:
+                unit["static_imports"][member] = owner
+        elif declaration.wildcard:
+            unit["wildcards"].append(declaration.path)
+        else:
+            unit["imports"][declaration.path.rsplit(".", 1)[-1]] = declaration.path
+
+    try:
+        for declaration in compilation_unit.types or []:
+            unit["types"].extend(_type_infos(source, declaration, "", include_method_text))
+    except Exception as e:
+        unit["types"] = []
+        unit["error"] = f"{type(e).__name__}: {e}"
+    return unit
+
+
+def parse_java_chunk(tasks: List[Tuple[str, str, bool]]) -> List[Dict[str, Any]]:
+    """
+    Java 파일 묶음 파싱 (프로세스 풀 작업 단위)
+    """
+    return [parse_java_file(task) for task in tasks]
@@ -0,0 +1,101 @@
+# server/utils/local_source_utils.py
+
+"""
+로컬 디렉토리 분석 소스 유틸리티 모듈
+- 서버와 같은 호스트의 소스 디렉토리를 압축/업로드/해제 없이 직접 분석 (settings.LOCAL_SOURCE_ROOTS 하위만 허용)
+- 분석 대상 프로젝트 경로 결정 (업로드: 압축 해제 디렉토리, 로컬: 등록한 디렉토리)
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+from server.utils.config import settings
+from server.utils.constants import DirInfo, SourceType
+from server.utils.parser_shard_utils import BUILD_DESCRIPTOR_NAMES, EXCLUDED_DIR_NAMES
+
+# 변경 감지 대상 파일 (파서 입력과 동일: Java 소스 + 빌드 설정 파일)
+WATCH_FILE_NAMES = set(BUILD_DESCRIPTOR_NAMES) | {"settings.gradle", "settings.gradle.kts"}
+
+
+class LocalSourceError(Exception):
+    """로컬 디렉토리를 분석 소스로 사용할 수 없는 경우 (미허용 경로, 디렉토리 없음)"""
+
+
+def get_local_source_roots() -> List[str]:
+    """
+    로컬 분석 허용 루트 목록 (실제 경로, 설정값 쉼표 구분)
+    """
+    return [os.path.realpath(root.strip()) for root in settings.LOCAL_SOURCE_ROOTS.split(",") if root.strip()]
+
+
+def resolve_local_source(path: str) -> str:
+    """
+    로컬 소스 디렉토리 경로 검증 (심볼릭 링크 해석 후 허용 루트 하위인지 확인)
+
+    Args:
+        path (str): 소스 디렉토리 경로
+
+    Returns:
+        str: 실제 경로
+
+    Raises:
+        LocalSourceError: 로컬 분석 미사용, 허용 루트 밖의 경로, 디렉토리가 없는 경우
+    """
+    roots = get_local_source_roots()
+    if not roots:
+        raise LocalSourceError("local source analysis is disabled (LOCAL_SOURCE_ROOTS is empty)")
+    if not path or not os.path.isabs(path):
+        raise LocalSourceError(f"local source path must be absolute: {path}")
+
+    real_path = os.path.realpath(path)
+    if not any(os.path.commonpath([root, real_path]) == root for root in roots):
+        raise LocalSourceError(f"local source path is not under an allowed root: {path}")
+    if not os.path.isdir(real_path):
+        raise LocalSourceError(f"local source directory not found: {path}")
+    return real_path
+
+
+def is_local_source(file_info: Optional[Dict[str, Any]]) -> bool:
+    return (file_info or {}).get("source_type") == SourceType.LOCAL
+
+
+def resolve_project_path(project_id: str, project_name: str, file_info: Optional[Dict[str, Any]]) -> str:
+    """
+    분석 대상 프로젝트 경로
+
+    Args:
+        project_id (str): 프로젝트 ID
+        project_name (str): 프로젝트명
+        file_info (Dict[str, Any]): 파일 정보 (source_type, source_path)
+
+    Returns:
+        str: 프로젝트 루트 경로
+
+    Raises:
+        LocalSourceError: 로컬 소스 경로가 허용되지 않는 경우
+    """
+    if is_local_source(file_info):
+        return resolve_local_source(file_info.get("source_path", ""))
+    return os.path.join(DirInfo.UNPACK_DIR, project_id, project_name)
+
+
+def is_watch_target(path: str, source_dir: str) -> bool:
+    """
+    감시 모드에서 재분석을 유발하는 파일 여부
+    - Java 소스/빌드 설정 파일만 대상, 숨김 디렉토리 하위와 src 상위의 빌드 산출물 디렉토리(target, build 등) 하위 제외
+
+    Args:
+        path (str): 변경된 파일 경로
+        source_dir (str): 소스 디렉토리 루트
+
+    Returns:
+        bool: 재분석 대상 여부
+    """
+    file_name = os.path.basename(path)
+    if not (file_name.endswith(".java") or file_name in WATCH_FILE_NAMES):
+        return False
+    in_source_tree = False
+    for part in os.path.relpath(path, source_dir).split(os.sep)[:-1]:
+        if part.startswith(".") or (not in_source_tree and part in EXCLUDED_DIR_NAMES):
+            return False
+        in_source_tree = in_source_tree or part == "src"
+    return True
@@ -0,0 +1,334 @@
+# server/utils/mermaid_utils.py
+
+"""
+Mermaid 시퀀스 다이어그램 유틸리티 모듈
+- call_tree와 method_definitions(class_name, display_name, return_type, summary)로 시퀀스 다이어그램을 결정적으로 생성
+- 시퀀스 다이어그램 구문 검증 및 로컬 보정
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 응답 없이 메시지만 발신하는 메서드 (리턴 화살표 생략)
+_MESSAGE_METHODS = re.compile(r"^(send|sendDefault|emit|publish|publishEvent|convertAndSend|convertAndSendToUser|produce)$")
+_MESSAGE_CLASSES = re.compile(r"(KafkaTemplate|RabbitTemplate|AmqpTemplate|JmsTemplate|SimpMessagingTemplate|ApplicationEventPublisher|StreamBridge)$")
+
+# participant 식별자에 허용되지 않는 문자
+_INVALID_PARTICIPANT_CHARS = re.compile(r"[^\w]")
+
+_VOID_TYPES = ("", "void", "java.lang.void")
+
+# 검증 대상 구문 (에이전트가 생성하는 시퀀스 다이어그램 부분집합)
+_HEADER = re.compile(r"^sequenceDiagram\b")
+_PARTICIPANT = re.compile(r"^(participant|actor)\s+(.+?)(?:\s+as\s+(.+))?$")
+_MESSAGE = re.compile(r"^(?P<src>[^\s:]+?)\s*(?P<arrow>-->>|->>|--x|-x|--\)|-\)|-->|->)\s*(?P<act>[+-]?)(?P<dst>[^\s:]+)\s*(?P<colon>:)?(?P<text>.*)$")
+_NOTE = re.compile(r"^note\s+(?P<pos>right of|left of|over)\s+(?P<target>[^\s:,]+(?:\s*,\s*[^\s:,]+)*)\s*(?P<colon>:)?(?P<text>.*)$", re.I)
+_BLOCK_START = re.compile(r"^(loop|alt|opt|par|critical|break|rect|box)\b")
+_BLOCK_MIDDLE = re.compile(r"^(else|and|option)\b")
+_BLOCK_END = re.compile(r"^end$")
+_MISC = re.compile(r"^(%%.*|autonumber.*|title\s.*|(activate|deactivate)\s+\S+)$")
+_VALID_PARTICIPANT = re.compile(r"^[\w.$]+$")
+_UNESCAPED_SEPARATOR = re.compile(r"#\w+;|[#;]")
+_CODE_FENCE = re.compile(r"^```(mermaid)?\s*$", re.I)
+
+
+def build_sequence_diagram(entry_point: str, call_tree: Dict, method_definitions: Dict[str, Dict]) -> str:
+    """
+    호출 트리를 재귀 순회하여 Mermaid 시퀀스 다이어그램 코드 생성
+
+    - participant: 등장 순서대로 class_name 1회 선언
+    - 호출: caller->>callee: display_name, 요약이 있으면 Note right of callee
+    - 리턴: entry_point와 메시지 발신 메서드를 제외하고 callee-->>caller: return_type (void는 빈 라벨)
+
+    Args:
+        entry_point (str): 엔트리포인트 FQN
+        call_tree (Dict): 호출 트리 ({"method_fqn": str, "calls": List[Dict]})
+        method_definitions (Dict[str, Dict]): method_fqn → {class_name, display_name, return_type, summary}
+
+    Returns:
+        str: Mermaid 시퀀스 다이어그램 코드
+    """
+    root = call_tree if call_tree and call_tree.get("method_fqn") else {"method_fqn": entry_point, "calls": []}
+
+    participants: List[str] = []
+    _collect_participants(root, method_definitions, participants)
+
+    lines = ["sequenceDiagram"]
+    lines.extend(f"    participant {participant}" for participant in participants)
+
+    root_participant = _participant_of(root["method_fqn"], method_definitions)
+    root_summary = _definition_of(root["method_fqn"], method_definitions).get("summary")
+    if root_summary:
+        lines.append(f"    Note right of {root_participant}: {sanitize_text(root_summary)}")
+
+    for child in root.get("calls", []):
+        _append_call(lines, root_participant, child, method_definitions)
+
+    return "\n".join(lines)
+
+
+def is_message_method(method_fqn: str, class_name: str = "") -> bool:
+    """
+    메시지 발신 메서드 여부 (예: kafkaTemplate.send, rabbitTemplate.convertAndSend)
+    """
+    method_name = extract_method_name(method_fqn)
+    owner = class_name or extract_class_name(method_fqn)
+    return bool(_MESSAGE_METHODS.match(method_name)) and bool(_MESSAGE_CLASSES.search(owner))
+
+
+def extract_class_name(method_fqn: str) -> str:
+    """
+    메서드 FQN에서 단순 클래스명 추출 (예: sg.sample.UserService.getUser(java.lang.Long) → UserService)
+    """
+    parts = method_fqn.split("(")[0].split(".")
+    return parts[-2] if len(parts) >= 2 else parts[0]
+
+
+def extract_method_name(method_fqn: str) -> str:
+    return method_fqn.split("(")[0].split(".")[-1]
+
+
+def extract_display_name(method_fqn: str) -> str:
+    """
+    메서드 FQN에서 메서드명과 인자 부분만 추출 (예: getUser(java.lang.Long))
+    """
+    if "(" not in method_fqn:
+        return extract_method_name(method_fqn)
+    name_part, args_part = method_fqn.split("(", 1)
+    return f"{name_part.split('.')[-1]}({args_part}"
+
+
+def sanitize_participant(name: str) -> str:
+    """
+    Mermaid participant 식별자로 사용할 수 있도록 정리 (제네릭/특수문자 제거)
+    """
+    cleaned = _INVALID_PARTICIPANT_CHARS.sub("_", name.split("<")[0].strip()).strip("_")
+    return cleaned or "Unknown"
+
+
+def sanitize_text(text: Optional[str]) -> str:
+    """
+    화살표 라벨/노트 텍스트 정리 (줄바꿈 및 Mermaid 구문 구분자 ';', '#' 치환)
+    """
+    if not text:
+        return ""
+    text = re.sub(r"\s*[\r\n]+\s*", " ", str(text))
+    # 이미 치환된 엔티티 코드(#59; 등)는 유지
+    return _UNESCAPED_SEPARATOR.sub(lambda m: m.group(0) if len(m.group(0)) > 1 else f"#{ord(m.group(0))};", text).strip()
+
+
+def validate_sequence_diagram(mermaid_code: str) -> List[str]:
+    """
+    Mermaid 시퀀스 다이어그램 구문 검증 (participant, ->>, -->>, Note, 블록 구문)
+
+    Args:
+        mermaid_code (str): Mermaid 코드
+
+    Returns:
+        List[str]: 오류 목록 (비어 있으면 유효)
+    """
+    errors: List[str] = []
+    lines = [line.strip() for line in (mermaid_code or "").splitlines()]
+    body = [(idx + 1, line) for idx, line in enumerate(lines) if line]
+
+    if not body:
+        return ["다이어그램 코드가 비어 있습니다."]
+
+    if not _HEADER.match(body[0][1]):
+        errors.append(f"line {body[0][0]}: 첫 구문이 sequenceDiagram이 아닙니다.")
+
+    declared = set()
+    depth = 0
+    for line_no, line in body[1:] if _HEADER.match(body[0][1]) else body:
+        participant = _PARTICIPANT.match(line)
+        message = _MESSAGE.match(line)
+        note = _NOTE.match(line)
+
+        if participant:
+            name = participant.group(2).strip()
+            if not _VALID_PARTICIPANT.match(name):
+                errors.append(f"line {line_no}: participant 이름에 사용할 수 없는 문자가 있습니다. [{name}]")
+            if name in declared:
+                errors.append(f"line {line_no}: participant 중복 선언 [{name}]")
+            declared.add(name)
+        elif message:
+            for name in (message.group("src"), message.group("dst")):
+                if not _VALID_PARTICIPANT.match(name):
+                    errors.append(f"line {line_no}: 화살표 양 끝에 사용할 수 없는 participant 이름 [{name}]")
+            if not message.group("colon"):
+                errors.append(f"line {line_no}: 화살표 라벨 구분자(:)가 없습니다.")
+            elif _has_unescaped_separator(message.group("text")):
+                errors.append(f"line {line_no}: 라벨에 구문 구분자(; 또는 #)가 있습니다.")
+        elif note:
+            if not note.group("colon"):
+                errors.append(f"line {line_no}: Note 구분자(:)가 없습니다.")
+            elif _has_unescaped_separator(note.group("text")):
+                errors.append(f"line {line_no}: Note에 구문 구분자(; 또는 #)가 있습니다.")
+        elif _BLOCK_START.match(line):
+            depth += 1
+        elif _BLOCK_MIDDLE.match(line):
+            if depth == 0:
+                errors.append(f"line {line_no}: 블록 밖에서 사용된 구문 [{line}]")
+        elif _BLOCK_END.match(line):
+            if depth == 0:
+                errors.append(f"line {line_no}: 짝이 없는 end")
+            depth = max(depth - 1, 0)
+        elif not _MISC.match(line):
+            errors.append(f"line {line_no}: 알 수 없는 구문 [{line}]")
+
+    if depth > 0:
+        errors.append(f"닫히지 않은 블록 {depth}개")
+
+    return errors
+
+
+def repair_sequence_diagram(mermaid_code: str) -> Tuple[str, List[str]]:
+    """
+    흔한 구문 오류를 로컬에서 보정
+
+    - 코드 펜스(```mermaid) 및 이스케이프된 줄바꿈(\\n) 정리, sequenceDiagram 헤더 보완
+    - 화살표/Note의 누락된 ':' 보완 및 빈 라벨 ': ' 처리, 라벨 내 ';' '#' 치환
+    - participant 이름 정리 및 중복 선언 제거, 미선언 participant 선언 추가
+    - 짝이 없는 end 제거, 닫히지 않은 블록에 end 추가
+    (알 수 없는 구문은 그대로 두어 재요청 대상으로 남김)
+
+    Args:
+        mermaid_code (str): Mermaid 코드
+
+    Returns:
+        Tuple[str, List[str]]: (보정된 코드, 적용한 보정 목록)
+    """
+    fixes: List[str] = []
+    code = (mermaid_code or "").strip()
+
+    if "\n" not in code and "\\n" in code:
+        code = code.replace("\\n", "\n")
+        fixes.append("이스케이프된 줄바꿈 변환")
+
+    lines = [line.strip() for line in code.splitlines() if line.strip()]
+    if any(_CODE_FENCE.match(line) for line in lines):
+        lines = [line for line in lines if not _CODE_FENCE.match(line)]
+        fixes.append("코드 펜스 제거")
+
+    if not lines or not _HEADER.match(lines[0]):
+        lines.insert(0, "sequenceDiagram")
+        fixes.append("sequenceDiagram 헤더 추가")
+
+    participants: List[str] = []
+    used: List[str] = []
+    statements: List[str] = []
+    depth = 0
+
+    for line in lines[1:]:
+        participant = _PARTICIPANT.match(line)
+        message = _MESSAGE.match(line)
+        note = _NOTE.match(line)
+
+        if participant:
+            name = _repair_participant(participant.group(2), fixes)
+            if name in participants:
+                fixes.append(f"participant 중복 선언 제거 [{name}]")
+                continue
+            participants.append(name)
+            alias = f" as {participant.group(3).strip()}" if participant.group(3) else ""
+            statements.append(f"    {participant.group(1)} {name}{alias}")
+        elif message:
+            src = _repair_participant(message.group("src"), fixes)
+            dst = _repair_participant(message.group("dst"), fixes)
+            used.extend([src, dst])
+            if not message.group("colon"):
+                fixes.append(f"화살표 라벨 구분자 추가 [{line}]")
+            text = _repair_text(message.group("text"), fixes)
+            statements.append(f"    {src}{message.group('arrow')}{message.group('act')}{dst}: {text}")
+        elif note:
+            targets = [_repair_participant(target, fixes) for target in note.group("target").split(",")]
+            used.extend(targets)
+            if not note.group("colon"):
+                fixes.append(f"Note 구분자 추가 [{line}]")
+            text = _repair_text(note.group("text"), fixes)
+            statements.append(f"    Note {note.group('pos').lower()} {','.join(targets)}: {text}")
+        elif _BLOCK_START.match(line):
+            depth += 1
+            statements.append(f"    {line}")
+        elif _BLOCK_END.match(line):
+            if depth == 0:
+                fixes.append("짝이 없는 end 제거")
+                continue
+            depth -= 1
+            statements.append(f"    {line}")
+        else:
+            statements.append(f"    {line}")
+
+    if depth > 0:
+        statements.extend(["    end"] * depth)
+        fixes.append(f"닫히지 않은 블록 end 추가 ({depth}개)")
+
+    undeclared = [name for name in dict.fromkeys(used) if name not in participants and _VALID_PARTICIPANT.match(name)]
+    if undeclared:
+        fixes.append(f"미선언 participant 추가 {undeclared}")
+
+    declarations = [statement for statement in statements if _PARTICIPANT.match(statement.strip())]
+    others = [statement for statement in statements if not _PARTICIPANT.match(statement.strip())]
+    repaired = ["sequenceDiagram"] + declarations + [f"    participant {name}" for name in undeclared] + others
+
+    return "\n".join(repaired), fixes
+
+
+def _append_call(lines: List[str], caller: str, node: Dict, method_definitions: Dict[str, Dict]) -> None:
+    method_fqn = node.get("method_fqn", "")
+    definition = _definition_of(method_fqn, method_definitions)
+    callee = _participant_of(method_fqn, method_definitions)
+    label = sanitize_text(definition.get("display_name") or extract_display_name(method_fqn))
+
+    lines.append(f"    {caller}->>{callee}: {label}")
+
+    summary = definition.get("summary")
+    if summary:
+        lines.append(f"    Note right of {callee}: {sanitize_text(summary)}")
+
+    for child in node.get("calls", []):
+        _append_call(lines, callee, child, method_definitions)
+
+    if is_message_method(method_fqn, definition.get("class_name", "")):
+        return
+
+    return_type = (definition.get("return_type") or "").strip()
+    return_label = "" if return_type.lower() in _VOID_TYPES else sanitize_text(return_type)
+    lines.append(f"    {callee}-->>{caller}: {return_label}")
+
+
+def _collect_participants(node: Dict, method_definitions: Dict[str, Dict], participants: List[str]) -> None:
+    participant = _participant_of(node.get("method_fqn", ""), method_definitions)
+    if participant not in participants:
+        participants.append(participant)
+    for child in node.get("calls", []):
+        _collect_participants(child, method_definitions, participants)
+
+
+def _participant_of(method_fqn: str, method_definitions: Dict[str, Dict]) -> str:
+    class_name = _definition_of(method_fqn, method_definitions).get("class_name") or extract_class_name(method_fqn)
+    return sanitize_participant(class_name)
+
+
+def _definition_of(method_fqn: str, method_definitions: Dict[str, Dict]) -> Dict:
+    return method_definitions.get(method_fqn) or {}
+
+
+def _repair_participant(name: str, fixes: List[str]) -> str:
+    name = name.strip()
+    if _VALID_PARTICIPANT.match(name):
+        return name
+    repaired = sanitize_participant(name)
+    fixes.append(f"participant 이름 정리 [{name}] → [{repaired}]")
+    return repaired
+
+
+def _repair_text(text: str, fixes: List[str]) -> str:
+    text = text.strip()
+    if _has_unescaped_separator(text):
+        fixes.append(f"라벨 구분자 치환 [{text}]")
+    return sanitize_text(text)
+
+
+def _has_unescaped_separator(text: str) -> bool:
+    return any(len(match.group(0)) == 1 for match in _UNESCAPED_SEPARATOR.finditer(text or ""))
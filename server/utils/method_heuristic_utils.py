@@ -0,0 +1,334 @@
+# server/utils/method_heuristic_utils.py
+
+"""
+메서드 휴리스틱 분석 유틸리티 모듈
+- LLM 호출 없이 요약 가능한 단순 메서드(추상 선언, 빈 본문, 단순 위임, 단순 매핑)를 판별하고 템플릿 요약을 생성
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from server.utils.constants import HeuristicKind
+
+# 제어문이 포함된 메서드는 휴리스틱 대상에서 제외
+_CONTROL_KEYWORDS = re.compile(r"\b(if|else|for|while|do|switch|case|try|catch|finally|throw|synchronized|yield)\b")
+
+# 단순 인자 (식별자, this.x, 리터럴, 단순 getter 호출)
+_SIMPLE_ARG = re.compile(r"^(this\.)?[A-Za-z_$][\w$]*(\.[A-Za-z_$][\w$]*)*(\(\))?$|^\".*\"$|^'.'$|^-?\d+(\.\d+)?[LlFfDd]?$|^(true|false|null)$")
+
+# 단일 호출 위임: [return] target.method(args);
+_DELEGATION_CALL = re.compile(r"^(?:return\s+)?((?:this\.)?[A-Za-z_$][\w$]*(?:\.[A-Za-z_$][\w$]*)*)\.([A-Za-z_$][\w$]*)\((.*)\)$", re.S)
+
+# 매핑 구문
+_NEW_OBJECT = re.compile(r"^(?:final\s+)?([A-Za-z_$][\w$.<>, ?]*)\s+([A-Za-z_$][\w$]*)\s*=\s*new\s+([A-Za-z_$][\w$.<>]*)\s*\((.*)\)$", re.S)
+_SETTER_CALL = re.compile(r"^([A-Za-z_$][\w$]*)\.(set[A-Z][\w$]*)\((.*)\)$", re.S)
+_RETURN_VAR = re.compile(r"^return\s+([A-Za-z_$][\w$]*)$")
+_RETURN_NEW = re.compile(r"^return\s+new\s+([A-Za-z_$][\w$.<>]*)\s*\((.*)\)$", re.S)
+
+
+def classify_trivial_method(method_fqn: str, meta: Dict) -> Optional[Tuple[str, Dict]]:
+    """
+    파서 메타데이터와 메서드 본문으로 LLM 분석이 불필요한 단순 메서드인지 판별
+
+    Args:
+        method_fqn (str): 메서드 FQN
+        meta (Dict): 파서가 생성한 메서드 메타 정보 (method_text, modifiers, parameters 등)
+
+    Returns:
+        Optional[Tuple[str, Dict]]: (HeuristicKind, 템플릿 생성용 세부정보) 또는 None (LLM 분석 필요)
+    """
+    modifiers = [str(m).lower() for m in (meta.get("modifiers") or [])]
+    method_text = meta.get("method_text") or ""
+    method_name = _extract_method_name(method_fqn)
+
+    # 1. abstract / native 선언
+    if "abstract" in modifiers or "native" in modifiers:
+        return HeuristicKind.ABSTRACT, {}
+
+    if not method_text.strip():
+        return None
+
+    body = extract_method_body(method_text, method_name)
+
+    # 2. 본문 없는 선언 (인터페이스 메서드)
+    if body is None:
+        return HeuristicKind.ABSTRACT, {}
+
+    statements = split_statements(body)
+
+    # 3. 빈 본문
+    if not statements:
+        return HeuristicKind.EMPTY_BODY, {}
+
+    # 제어문/람다/내부 블록이 있으면 실제 로직으로 판단
+    if any(_CONTROL_KEYWORDS.search(_strip_literals(stmt)) or "->" in stmt or "{" in _strip_literals(stmt) for stmt in statements):
+        return None
+
+    # 4. 단일 호출 위임
+    if len(statements) == 1:
+        delegation = _match_delegation(statements[0])
+        if delegation:
+            return HeuristicKind.DELEGATION, delegation
+
+    # 5. 단순 매핑
+    mapper = _match_simple_mapper(statements)
+    if mapper:
+        return HeuristicKind.SIMPLE_MAPPER, mapper
+
+    return None
+
+
+def build_heuristic_summary(method_fqn: str, meta: Dict, kind: str, detail: Dict) -> Tuple[str, str]:
+    """
+    휴리스틱 분류 결과로 템플릿 요약(summary)과 설명(description)을 생성
+
+    Args:
+        method_fqn (str): 메서드 FQN
+        meta (Dict): 메서드 메타 정보
+        kind (str): HeuristicKind 값
+        detail (Dict): classify_trivial_method가 반환한 세부정보
+
+    Returns:
+        Tuple[str, str]: (summary, description)
+    """
+    method_name = _extract_method_name(method_fqn)
+    class_name = meta.get("class_name") or ""
+    return_type = meta.get("return_type") or "void"
+    params = _format_parameters(meta.get("parameters") or [])
+    comment = _first_comment_sentence(meta.get("comment") or "")
+    owner = f"{class_name}." if class_name else ""
+
+    if kind == HeuristicKind.ABSTRACT:
+        summary = f"{owner}{method_name}의 구현부 없는 추상/인터페이스 선언입니다."
+        description = f"{params or '파라미터 없이'} 호출되어 {return_type}을(를) 반환하도록 계약만 정의하며, 실제 처리는 구현체에서 수행됩니다."
+    elif kind == HeuristicKind.EMPTY_BODY:
+        summary = f"{owner}{method_name}은(는) 본문이 비어 있어 아무 동작도 수행하지 않습니다."
+        description = "메서드 본문에 실행 구문이 없어 호출되더라도 별도의 처리 없이 종료됩니다."
+    elif kind == HeuristicKind.DELEGATION:
+        target = detail.get("target", "")
+        returns = detail.get("returns", False)
+        summary = f"{target}을(를) 호출하여 처리를 위임{'하고 그 결과를 반환' if returns else ''}합니다."
+        description = f"{params + '를 ' if params else ''}그대로 전달하여 {target}을(를) 호출하며, 추가 로직 없이 {'호출 결과를 반환합니다' if returns else '종료합니다'}."
+    elif kind == HeuristicKind.SIMPLE_MAPPER:
+        target_type = detail.get("target_type", return_type)
+        field_count = detail.get("field_count", 0)
+        summary = f"입력 값을 {target_type} 객체로 옮겨 담아 반환하는 단순 매핑 메서드입니다."
+        description = f"{target_type} 객체를 생성하고 {field_count}개의 필드 값을 설정한 뒤 반환합니다."
+    else:
+        return "", ""
+
+    if comment:
+        summary = f"{comment} {summary}"
+
+    return summary, description
+
+
+def extract_method_body(method_text: str, method_name: str = "") -> Optional[str]:
+    """
+    메서드 텍스트에서 본문(중괄호 내부)을 추출
+
+    Args:
+        method_text (str): 메서드 원문
+        method_name (str): 메서드명 (시그니처 위치 탐색용)
+
+    Returns:
+        Optional[str]: 본문 문자열, 본문 없는 선언이면 None
+    """
+    text = strip_comments(method_text)
+
+    # 메서드명 이후의 파라미터 괄호를 닫은 지점부터 본문 탐색 (어노테이션 괄호 회피)
+    start = 0
+    match = re.search(rf"\b{re.escape(method_name)}\s*\(", text) if method_name else None
+    if match:
+        start = _find_matching(text, match.end() - 1, "(", ")")
+        if start < 0:
+            return None
+
+    brace = text.find("{", start)
+    semicolon = text.find(";", start)
+    if brace < 0 or (0 <= semicolon < brace):
+        return None
+
+    end = _find_matching(text, brace, "{", "}")
+    if end < 0:
+        return None
+    return text[brace + 1:end]
+
+
+def split_statements(body: str) -> List[str]:
+    """
+    본문을 최상위 세미콜론 기준 구문 목록으로 분리 (괄호/문자열 내부 세미콜론 무시)
+    """
+    statements = []
+    depth = 0
+    current = []
+    in_string = None
+    prev = ""
+
+    for ch in body:
+        if in_string:
+            current.append(ch)
+            if ch == in_string and prev != "\\":
+                in_string = None
+        elif ch in ("\"", "'"):
+            in_string = ch
+            current.append(ch)
+        elif ch in "({[":
+            depth += 1
+            current.append(ch)
+        elif ch in ")}]":
+            depth -= 1
+            current.append(ch)
+        elif ch == ";" and depth == 0:
+            stmt = "".join(current).strip()
+            if stmt:
+                statements.append(stmt)
+            current = []
+        else:
+            current.append(ch)
+        prev = ch
+
+    rest = "".join(current).strip()
+    if rest:
+        statements.append(rest)
+    return statements
+
+
+def strip_comments(text: str) -> str:
+    """
+    자바 소스에서 주석(//, /* */)을 제거 (문자열 리터럴은 유지)
+    """
+    return re.sub(r"//[^\n]*|/\*.*?\*/|(\"(?:\\.|[^\"\\])*\")", lambda m: m.group(1) or "", text, flags=re.S)
+
+
+def _match_delegation(statement: str) -> Optional[Dict]:
+    match = _DELEGATION_CALL.match(statement.strip())
+    if not match:
+        return None
+
+    receiver, callee, args = match.group(1), match.group(2), match.group(3)
+    if not all(_is_simple_arg(arg) for arg in _split_args(args)):
+        return None
+
+    return {
+        "target": f"{receiver}.{callee}",
+        "returns": statement.strip().startswith("return")
+    }
+
+
+def _match_simple_mapper(statements: List[str]) -> Optional[Dict]:
+    # return new Target(a.getX(), a.getY());
+    if len(statements) == 1:
+        match = _RETURN_NEW.match(statements[0])
+        if match and all(_is_simple_arg(arg) for arg in _split_args(match.group(2))):
+            return {"target_type": match.group(1), "field_count": len(_split_args(match.group(2)))}
+        return None
+
+    # Target t = new Target(); t.setX(..); ... return t;
+    new_match = _NEW_OBJECT.match(statements[0])
+    return_match = _RETURN_VAR.match(statements[-1])
+    if not new_match or not return_match:
+        return None
+
+    var_name = new_match.group(2)
+    if return_match.group(1) != var_name:
+        return None
+
+    setters = statements[1:-1]
+    if not setters:
+        return None
+
+    for stmt in setters:
+        setter = _SETTER_CALL.match(stmt)
+        if not setter or setter.group(1) != var_name:
+            return None
+        if not all(_is_simple_arg(arg) for arg in _split_args(setter.group(3))):
+            return None
+
+    return {"target_type": new_match.group(3), "field_count": len(setters)}
+
+
+def _split_args(args: str) -> List[str]:
+    args = args.strip()
+    if not args:
+        return []
+
+    result = []
+    depth = 0
+    current = []
+    for ch in args:
+        if ch in "(<[":
+            depth += 1
+        elif ch in ")>]":
+            depth -= 1
+        if ch == "," and depth == 0:
+            result.append("".join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    result.append("".join(current).strip())
+    return result
+
+
+def _is_simple_arg(arg: str) -> bool:
+    return bool(_SIMPLE_ARG.match(arg.strip()))
+
+
+def _strip_literals(text: str) -> str:
+    return re.sub(r"\"(?:\\.|[^\"\\])*\"", "\"\"", text)
+
+
+def _find_matching(text: str, open_idx: int, open_ch: str, close_ch: str) -> int:
+    depth = 0
+    in_string = None
+    prev = ""
+    for idx in range(open_idx, len(text)):
+        ch = text[idx]
+        if in_string:
+            if ch == in_string and prev != "\\":
+                in_string = None
+        elif ch in ("\"", "'"):
+            in_string = ch
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return idx
+        prev = ch
+    return -1
+
+
+def _extract_method_name(method_fqn: str) -> str:
+    return method_fqn.split("(")[0].split(".")[-1]
+
+
+def _format_parameters(parameters: List) -> str:
+    names = []
+    for param in parameters:
+        if isinstance(param, dict):
+            name = param.get("name") or param.get("type") or ""
+        else:
+            name = str(param)
+        if name:
+            names.append(name)
+    return ", ".join(names)
+
+
+def _first_comment_sentence(comment: str) -> str:
+    for line in strip_javadoc(comment).splitlines():
+        line = line.strip()
+        if line and not line.startswith("@"):
+            return line if line.endswith(".") else f"{line}."
+    return ""
+
+
+def strip_javadoc(comment: str) -> str:
+    """
+    Javadoc 주석 기호(/**, *, */)를 제거한 본문 반환
+    """
+    lines = []
+    for line in str(comment).splitlines():
+        line = re.sub(r"^\s*(/\*\*|/\*|\*/|\*)", "", line)
+        line = line.replace("*/", "").strip()
+        lines.append(line)
+    return "\n".join(lines)
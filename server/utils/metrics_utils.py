@@ -0,0 +1,312 @@
+# server/utils/metrics_utils.py
+
+"""
+메트릭 수집 유틸리티 모듈
+- Prometheus 텍스트 포맷(0.0.4)으로 노출할 Counter/Histogram을 프로세스 메모리에 집계
+- 값은 API 워커(프로세스)별로 집계되며, 수집 측(Prometheus)에서 워커별 target을 합산
+"""
+
+import math
+import time
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+# 응답 Content-Type
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 버킷 (초)
+DEFAULT_DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+# 토큰 수 버킷
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = []
+    for name, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 레이블 불일치: expected={self.labelnames}, actual={tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    @abstractmethod
+    def collect(self) -> List[str]:
+        """
+        Prometheus 텍스트 포맷 행 목록 (HELP/TYPE 헤더 포함)
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        집계값 초기화
+        """
+        pass
+
+
+class Counter(_Metric):
+    """
+    단조 증가 카운터 (이름은 _total로 끝나도록 정의)
+    """
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("카운터는 감소할 수 없습니다.")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def collect(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(list(zip(self.labelnames, key)))} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """
+    누적 버킷 히스토그램 (_bucket/_sum/_count 노출)
+    """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # 레이블 값 → [버킷별 건수, 합계, 건수]
+        self._values: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = [[0] * len(self.buckets), 0.0, 0]
+                self._values[key] = entry
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][idx] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """
+        블록 실행 시간(초) 기록 (예외 발생 시에도 기록)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def get_count(self, **labels) -> int:
+        key = self._label_values(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return entry[2] if entry else 0
+
+    def get_sum(self, **labels) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return entry[1] if entry else 0.0
+
+    def collect(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            for key, (bucket_counts, total, count) in sorted(self._values.items()):
+                labels = list(zip(self.labelnames, key))
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', _format_value(bound))])} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """
+    메트릭 등록 및 텍스트 포맷 출력
+    """
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+# 프로세스 공용 레지스트리
+registry = MetricsRegistry()
+
+# ------------------------------------------------------------------
+# 메트릭 정의
+# ------------------------------------------------------------------
+AGENT_DURATION = registry.register(Histogram(
+    "autodiagenti_agent_duration_seconds", "에이전트 실행 시간 (초)", ["agent", "result"]
+))
+LLM_REQUEST_DURATION = registry.register(Histogram(
+    "autodiagenti_llm_request_duration_seconds", "LLM 호출 1회(재시도 시도 단위) 응답 시간 (초)", ["deployment", "result"]
+))
+LLM_TOKENS = registry.register(Histogram(
+    "autodiagenti_llm_tokens", "LLM 호출 1회 토큰 수", ["deployment", "direction"], buckets=TOKEN_BUCKETS
+))
+LLM_RETRIES = registry.register(Counter(
+    "autodiagenti_llm_retries_total", "LLM 호출 재시도 횟수", ["deployment"]
+))
+LLM_TIMEOUTS = registry.register(Counter(
+    "autodiagenti_llm_timeouts_total", "LLM 호출 타임아웃 횟수", ["deployment"]
+))
+LLM_LENGTH_LIMIT_SKIPS = registry.register(Counter(
+    "autodiagenti_llm_length_limit_skips_total", "응답 길이 제한(LengthFinishReasonError)으로 실패한 LLM 호출 수", ["deployment"]
+))
+EMBEDDING_REQUESTS = registry.register(Counter(
+    "autodiagenti_embedding_requests_total", "임베딩 요청(벡터스토어 생성/추가) 횟수", ["deployment"]
+))
+EMBEDDING_DOCUMENTS = registry.register(Counter(
+    "autodiagenti_embedding_documents_total", "임베딩한 문서 수", ["deployment"]
+))
+FAISS_LOAD_DURATION = registry.register(Histogram(
+    "autodiagenti_faiss_load_duration_seconds", "FAISS 인덱스 로드 시간 (초)", ["result"]
+))
+FAISS_LOAD_BYTES = registry.register(Counter(
+    "autodiagenti_faiss_load_bytes_total", "로드한 FAISS 인덱스 파일 크기 (바이트)"
+))
+PARSER_DURATION = registry.register(Histogram(
+    "autodiagenti_parser_duration_seconds", "Java 파서 실행 시간 (초)", ["backend", "result"]
+))
+PARSER_WORKER_RESTARTS = registry.register(Counter(
+    "autodiagenti_parser_worker_restarts_total", "Java 파서 상주 워커 재기동 횟수"
+))
+PARSER_WORKER_FALLBACKS = registry.register(Counter(
+    "autodiagenti_parser_worker_fallbacks_total", "상주 워커를 사용할 수 없어 subprocess로 실행한 횟수"
+))
+PARSER_FILES = registry.register(Counter(
+    "autodiagenti_parser_files_total", "파서 출력 기준 처리 파일 수", ["result"]
+))
+PARSER_IDLE_TIMEOUTS = registry.register(Counter(
+    "autodiagenti_parser_idle_timeouts_total", "출력 없는 상태 지속으로 종료한 파서 실행 횟수"
+))
+PARSER_CACHE_FILES = registry.register(Counter(
+    "autodiagenti_parser_cache_files_total", "파서 증분 캐시 조회 파일 수", ["result"]
+))
+
+
+def render_metrics() -> str:
+    """
+    등록된 메트릭을 Prometheus 텍스트 포맷으로 출력
+
+    Returns:
+        str: 메트릭 텍스트
+    """
+    return registry.render()
+
+
+def get_llm_deployment(llm: Any) -> str:
+    """
+    LLM 클라이언트의 배포(deployment)명 조회 (메트릭 레이블용)
+    """
+    return getattr(llm, "deployment_name", None) or getattr(llm, "model_name", None) or "unknown"
+
+
+class LLMUsageCallbackHandler(BaseCallbackHandler):
+    """
+    LLM 응답의 토큰 사용량을 수집하는 콜백 (호출 1회당 1개 생성)
+    """
+    def __init__(self):
+        super().__init__()
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        usage: Optional[Dict[str, Any]] = None
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if getattr(message, "usage_metadata", None):
+                    usage = message.usage_metadata
+        if usage:
+            self.input_tokens += usage.get("input_tokens", 0)
+            self.output_tokens += usage.get("output_tokens", 0)
+            return
+
+        token_usage = (response.llm_output or {}).get("token_usage") or {}
+        self.input_tokens += token_usage.get("prompt_tokens", 0)
+        self.output_tokens += token_usage.get("completion_tokens", 0)
+
+    def observe(self, deployment: str) -> None:
+        """
+        수집한 토큰 수를 히스토그램에 기록 (사용량 정보가 없는 응답은 제외)
+        """
+        if self.input_tokens or self.output_tokens:
+            LLM_TOKENS.observe(self.input_tokens, deployment=deployment, direction="input")
+            LLM_TOKENS.observe(self.output_tokens, deployment=deployment, direction="output")
@@ -0,0 +1,188 @@
+# server/utils/parser_bundle_utils.py
+
+"""
+파서 산출물 번들 유틸리티 모듈
+- 클래스 단위 산출물(*_call_tree.json, *_comments.json, *_methods.json)을 NDJSON 파일 1개로 묶어 저장
+- 번들은 산출물을 생성하는 단계(javalang 파서, 증분 파싱 구성, 샤드 병합)에서 파일 저장과 함께 기록 (JAR 단독 실행 산출물은 번들 없음)
+- 번들은 mmap으로 열어 레코드를 한 줄씩 지연 로딩 (디렉토리 탐색/파일별 open 없이 순차 읽기)
+- 번들이 없는 산출물(기존 분석 결과 등)은 파일 단위 산출물을 같은 레코드 형태로 읽는 어댑터 사용
+"""
+
+import os
+import json
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+from server.utils.config import settings
+from server.utils.constants import ParserRecordKind
+from server.utils.file_utils import load_json, save_json
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 파일명 접미사 → 레코드 종류
+_KIND_SUFFIXES = (
+    ("_call_tree.json", ParserRecordKind.CALL_TREE),
+    ("_comments.json", ParserRecordKind.COMMENTS),
+    ("_methods.json", ParserRecordKind.METHODS)
+)
+
+
+@dataclass(frozen=True)
+class ParserRecord:
+    """
+    파서 산출물 레코드 (클래스 단위 산출물 파일 1개)
+    """
+    kind: str               # 레코드 종류 (ParserRecordKind)
+    name: str               # 원본 파일명 (예: OrderController_call_tree.json)
+    path: str               # 산출물 디렉토리 기준 상대 경로
+    data: Any               # 파일 내용 (JSON)
+
+
+def get_record_kind(file_name: str) -> Optional[str]:
+    """
+    산출물 파일명으로 레코드 종류 조회 (집계 파일 all_methods.json 등은 None)
+
+    Args:
+        file_name (str): 산출물 파일명
+
+    Returns:
+        Optional[str]: 레코드 종류 (ParserRecordKind)
+    """
+    for suffix, kind in _KIND_SUFFIXES:
+        if file_name.endswith(suffix):
+            return None if kind == ParserRecordKind.METHODS and file_name.startswith("all_") else kind
+    return None
+
+
+def get_bundle_path(output_dir: str) -> str:
+    return os.path.join(output_dir, settings.PARSER_BUNDLE_FILE_NAME)
+
+
+def iter_parser_files(output_dir: str, kinds: Optional[Iterable[str]] = None) -> Iterator[ParserRecord]:
+    """
+    파일 단위 산출물을 레코드로 읽는 어댑터 (번들이 없는 경우)
+
+    Args:
+        output_dir (str): 파서 산출물 디렉토리
+        kinds (Optional[Iterable[str]]): 조회할 레코드 종류 (None이면 전체)
+
+    Returns:
+        Iterator[ParserRecord]: 파일 경로 순 레코드
+    """
+    kinds = set(kinds) if kinds is not None else None
+    for file_path in sorted(Path(output_dir).rglob("*.json")):
+        kind = get_record_kind(file_path.name)
+        if kind is None or (kinds is not None and kind not in kinds):
+            continue
+        yield ParserRecord(kind=kind, name=file_path.name, path=file_path.relative_to(output_dir).as_posix(), data=load_json(file_path))
+
+
+def _line_prefix(kind: str) -> bytes:
+    # 번들 레코드는 kind를 첫 키로 기록하므로 디코딩 없이 종류 판별 가능
+    return ('{"kind": ' + json.dumps(kind)).encode("utf-8")
+
+
+def iter_parser_bundle(bundle_path: str, kinds: Optional[Iterable[str]] = None) -> Iterator[ParserRecord]:
+    """
+    번들 레코드 지연 로딩 (mmap, 요청한 종류의 줄만 JSON 디코딩)
+
+    Args:
+        bundle_path (str): 번들 파일 경로
+        kinds (Optional[Iterable[str]]): 조회할 레코드 종류 (None이면 전체)
+
+    Returns:
+        Iterator[ParserRecord]: 기록 순 레코드
+    """
+    prefixes = tuple(_line_prefix(kind) for kind in kinds) if kinds is not None else None
+    with open(bundle_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if not line.strip() or (prefixes is not None and not line.startswith(prefixes)):
+                    continue
+                record = json.loads(line)
+                yield ParserRecord(kind=record["kind"], name=record["name"], path=record["path"], data=record["data"])
+
+
+class ParserBundleWriter:
+    """
+    파서 산출물 저장과 함께 번들 레코드 기록 (산출물 생성 시점의 데이터를 그대로 기록하므로 파일을 다시 읽지 않음)
+    - 임시 파일에 기록 후 정상 종료 시 교체, 오류 시 임시 파일 삭제
+    - enabled=False이면 파일 단위 산출물만 저장
+    """
+
+    def __init__(self, output_dir: str, enabled: bool = True):
+        """
+        Args:
+            output_dir (str): 파서 산출물 디렉토리 (레코드 path 기준)
+            enabled (bool): 번들 기록 여부
+        """
+        self.output_dir = output_dir
+        self.enabled = enabled
+        self.count = 0
+        self._bundle_path = get_bundle_path(output_dir)
+        self._temp_path = f"{self._bundle_path}.tmp"
+        self._file = None
+
+    def __enter__(self) -> "ParserBundleWriter":
+        if self.enabled:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._file = open(self._temp_path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if exc_type is None:
+            os.replace(self._temp_path, self._bundle_path)
+            logger.info(f"📦 [PARSER_BUNDLE] 산출물 번들 생성 완료: {self._bundle_path} (레코드 {self.count}건)")
+        elif os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def save(self, data: Any, file_path: str) -> None:
+        """
+        산출물 파일 저장 (클래스 단위 산출물이면 번들 레코드도 기록)
+
+        Args:
+            data (Any): 산출물 내용 (JSON)
+            file_path (str): 산출물 파일 경로 (output_dir 하위)
+        """
+        save_json(data, file_path)
+        name = os.path.basename(file_path)
+        kind = get_record_kind(name)
+        if self._file is None or kind is None:
+            return
+        path = Path(os.path.relpath(file_path, self.output_dir)).as_posix()
+        # 문자열 내 개행은 이스케이프되므로 레코드 1개 = 1줄
+        self._file.write(json.dumps({"kind": kind, "name": name, "path": path, "data": data}, ensure_ascii=False))
+        self._file.write("\n")
+        self.count += 1
+
+
+def remove_parser_bundle(output_dir: str) -> None:
+    bundle_path = get_bundle_path(output_dir)
+    if os.path.exists(bundle_path):
+        os.remove(bundle_path)
+
+
+def iter_parser_records(output_dir: str, kinds: Optional[Iterable[str]] = None) -> Iterator[ParserRecord]:
+    """
+    파서 산출물 레코드 조회 (번들이 있으면 번들, 없으면 파일 단위 산출물)
+
+    Args:
+        output_dir (str): 파서 산출물 디렉토리
+        kinds (Optional[Iterable[str]]): 조회할 레코드 종류 (None이면 전체)
+
+    Returns:
+        Iterator[ParserRecord]: 레코드
+    """
+    bundle_path = get_bundle_path(output_dir)
+    if os.path.isfile(bundle_path):
+        return iter_parser_bundle(bundle_path, kinds=kinds)
+    return iter_parser_files(output_dir, kinds=kinds)
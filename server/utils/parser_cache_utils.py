@@ -0,0 +1,327 @@
+# server/utils/parser_cache_utils.py
+
+"""
+Java 파서 증분 캐시 유틸리티 모듈
+- 소스 파일별 sha256 + 파서 버전(JAR 해시) + 분석 옵션(include_method_text, exclude_packages, custom_annotations)으로 파싱 결과 캐시
+- 재업로드 시 변경된 파일만 파서에 전달하고, 나머지는 캐시된 파일별 결과로 전체 산출물 구성
+- 옵션 또는 파서 JAR가 바뀌면 핑거프린트가 달라져 전체 캐시 미적중 (전체 파싱)
+- 캐시는 프로젝트 간 공유되므로 산출물의 프로젝트 루트 절대 경로는 치환값으로 저장하고 조회 시 현재 프로젝트 경로로 복원
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from server.utils.config import settings
+from server.utils.constants import ParserRecordKind
+from server.utils.file_utils import load_json_if_exists, save_json
+from server.utils.parser_bundle_utils import ParserBundleWriter, ParserRecord, iter_parser_files
+from server.utils.parser_shard_utils import CrossModuleResolver
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 캐시 항목의 프로젝트 루트 절대 경로 치환값
+PROJECT_ROOT_TOKEN = "${PROJECT_ROOT}"
+
+# 캐시 항목 형식 버전 (형식이 바뀌면 이전 항목 미사용)
+_CACHE_FORMAT_VERSION = 2
+
+# 해시 계산 시 제외 디렉토리 (VCS 메타데이터)
+_HASH_EXCLUDED_DIR_NAMES = {".git", ".svn", ".hg"}
+
+# 파서 버전 캐시 (JAR 경로, 수정 시각, 크기) → sha256
+_parser_version_cache: Dict[Tuple[str, float, int], str] = {}
+_parser_version_lock = threading.Lock()
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_parser_version(jar_path: str) -> str:
+    """
+    파서 버전 (JAR 파일 sha256, JAR가 변경되지 않으면 재계산하지 않음)
+
+    Args:
+        jar_path (str): 파서 JAR 경로
+
+    Returns:
+        str: 파서 버전 해시 (JAR가 없으면 빈 문자열)
+    """
+    if not os.path.isfile(jar_path):
+        return ""
+    stat = os.stat(jar_path)
+    key = (os.path.abspath(jar_path), stat.st_mtime, stat.st_size)
+    with _parser_version_lock:
+        if key not in _parser_version_cache:
+            _parser_version_cache[key] = _sha256_file(jar_path)
+        return _parser_version_cache[key]
+
+
+def build_parser_fingerprint(parser_version: str, include_method_text: bool, exclude_packages: Optional[str], custom_annotations: Optional[str]) -> str:
+    """
+    캐시 핑거프린트 (캐시 형식 버전 + 파서 버전 + 전역 분석 옵션)
+
+    Returns:
+        str: 핑거프린트 (sha256)
+    """
+    options = {
+        "cache_format": _CACHE_FORMAT_VERSION,
+        "parser_version": parser_version,
+        "include_method_text": bool(include_method_text),
+        "exclude_packages": exclude_packages or "",
+        "custom_annotations": custom_annotations or ""
+    }
+    return hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def hash_source_files(project_path: str) -> Dict[str, str]:
+    """
+    프로젝트 .java 파일별 sha256 (파서와 동일하게 프로젝트 전체 대상, VCS 디렉토리만 제외)
+
+    Args:
+        project_path (str): 프로젝트 루트 경로
+
+    Returns:
+        Dict[str, str]: 프로젝트 기준 상대 경로(/ 구분) → sha256
+    """
+    hashes = {}
+    for dir_path, dir_names, file_names in os.walk(project_path):
+        dir_names[:] = sorted(name for name in dir_names if name not in _HASH_EXCLUDED_DIR_NAMES)
+        for file_name in sorted(file_names):
+            if file_name.endswith(".java"):
+                full_path = os.path.join(dir_path, file_name)
+                hashes[os.path.relpath(full_path, project_path).replace(os.sep, "/")] = _sha256_file(full_path)
+    return hashes
+
+
+class ParserCache:
+    """
+    파일별 파싱 결과 캐시 (디렉토리 기반)
+    - 키: sha256(상대 경로 + 파일 sha256) - 산출물의 file_path가 경로에 의존하므로 경로 포함
+    - 값: 해당 파일의 산출물 레코드와 집계 항목 (all_methods, entry_point_fqns, entry_points)
+    - 프로젝트 루트 절대 경로는 PROJECT_ROOT_TOKEN으로 저장 (같은 파일을 가진 다른 프로젝트에 이전 프로젝트 경로가 노출되지 않도록)
+    """
+    def __init__(self, cache_dir: str, fingerprint: str):
+        self.cache_dir = os.path.join(cache_dir, fingerprint[:32])
+        self.fingerprint = fingerprint
+
+    def _entry_path(self, relative_path: str, file_hash: str) -> str:
+        key = hashlib.sha256(f"{relative_path}\0{file_hash}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def lookup(self, sources: Dict[str, str], project_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시 조회
+
+        Args:
+            sources (Dict[str, str]): 상대 경로 → sha256
+            project_path (str): 현재 프로젝트 루트 경로 (캐시 항목의 프로젝트 루트 경로 복원)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 캐시 적중 파일의 상대 경로 → 캐시 항목
+        """
+        entries = {}
+        for relative_path, file_hash in sources.items():
+            entry = load_json_if_exists(self._entry_path(relative_path, file_hash))
+            if isinstance(entry, dict) and entry.get("fingerprint") == self.fingerprint:
+                entries[relative_path] = _rebase_path_prefix(entry, PROJECT_ROOT_TOKEN, os.path.abspath(project_path))
+        return entries
+
+    def store(self, sources: Dict[str, str], entries: Dict[str, Dict[str, Any]], project_path: str) -> None:
+        """
+        캐시 저장
+
+        Args:
+            sources (Dict[str, str]): 상대 경로 → sha256
+            entries (Dict[str, Dict[str, Any]]): 상대 경로 → 캐시 항목
+            project_path (str): 현재 프로젝트 루트 경로 (PROJECT_ROOT_TOKEN으로 치환하여 저장)
+        """
+        project_path = os.path.abspath(project_path)
+        for relative_path, entry in entries.items():
+            if relative_path in sources:
+                entry = _rebase_path_prefix(entry, project_path, PROJECT_ROOT_TOKEN)
+                save_json({**entry, "fingerprint": self.fingerprint}, self._entry_path(relative_path, sources[relative_path]))
+
+
+# ------------------------------------------------------------------
+# 산출물 ↔ 소스 파일 매핑
+# ------------------------------------------------------------------
+class _SourceMatcher:
+    # 산출물의 file_path(소스 루트 기준 상대 경로 또는 절대 경로)를 프로젝트 기준 상대 경로로 매칭
+    def __init__(self, relative_paths: Iterable[str], source_dir: str):
+        self.source_dir = os.path.abspath(source_dir)
+        self._by_name: Dict[str, List[str]] = {}
+        for relative_path in relative_paths:
+            self._by_name.setdefault(relative_path.rsplit("/", 1)[-1], []).append(relative_path)
+
+    def match_path(self, file_path: Any) -> Optional[str]:
+        if not isinstance(file_path, str) or not file_path:
+            return None
+        if os.path.isabs(file_path):
+            file_path = os.path.relpath(file_path, self.source_dir)
+        file_path = file_path.replace(os.sep, "/")
+        if file_path.startswith("./"):
+            file_path = file_path[2:]
+        candidates = [path for path in self._by_name.get(file_path.rsplit("/", 1)[-1], []) if path == file_path or path.endswith("/" + file_path) or file_path.endswith("/" + path)]
+        return candidates[0] if len(candidates) == 1 else None
+
+    def match_stem(self, stem: str) -> Optional[str]:
+        candidates = self._by_name.get(f"{stem}.java", [])
+        return candidates[0] if len(candidates) == 1 else None
+
+
+def _record_stem(record: ParserRecord) -> str:
+    for suffix in ("_call_tree.json", "_comments.json", "_methods.json"):
+        if record.name.endswith(suffix):
+            return record.name[:-len(suffix)]
+    return record.name
+
+
+def _record_file_path(record: ParserRecord) -> Any:
+    if not isinstance(record.data, dict):
+        return None
+    if record.kind == ParserRecordKind.METHODS:
+        first_method = next(iter(record.data.values()), None)
+        return first_method.get("file_path") if isinstance(first_method, dict) else None
+    return record.data.get("file_path")
+
+
+def _record_method_fqns(record: ParserRecord) -> List[str]:
+    if not isinstance(record.data, dict):
+        return []
+    if record.kind == ParserRecordKind.CALL_TREE:
+        return list((record.data.get("method_meta_map") or {}).keys())
+    return [key for key in record.data.keys() if "(" in key]
+
+
+def _owner_of(method_fqn: str, class_owners: Dict[str, str]) -> Optional[str]:
+    # 메서드 FQN의 클래스 부분으로 소유 파일 조회 (중첩 클래스는 바깥 클래스까지 거슬러 올라감)
+    name = method_fqn.split("(", 1)[0]
+    parts = name.split(".")[:-1]
+    while parts:
+        owner = class_owners.get(".".join(parts))
+        if owner is not None:
+            return owner
+        parts.pop()
+    return None
+
+
+def split_output_by_source(output_dir: str, relative_paths: Iterable[str], source_dir: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    파서 산출물을 소스 파일별 캐시 항목으로 분리
+    - 레코드: file_path 필드 → 같은 디렉토리의 동일 클래스명 레코드 → 소스 파일명 순으로 매칭
+    - 집계 항목: 메서드 FQN의 클래스로 매칭 (entry_points는 file_path 우선)
+
+    Args:
+        output_dir (str): 파서 산출물 디렉토리
+        relative_paths (Iterable[str]): 파싱 대상 소스 파일 상대 경로
+        source_dir (str): 파서에 전달한 소스 디렉토리 (절대 경로 file_path 변환용)
+
+    Returns:
+        Optional[Dict[str, Dict[str, Any]]]: 상대 경로 → 캐시 항목 (소스 파일을 특정할 수 없는 산출물이 있으면 None)
+    """
+    relative_paths = list(relative_paths)
+    matcher = _SourceMatcher(relative_paths, source_dir)
+    entries = {path: {"records": [], "all_methods": [], "entry_point_fqns": [], "entry_points": []} for path in relative_paths}
+
+    # 1. 레코드 매핑 (file_path가 없는 주석 레코드는 같은 클래스의 다른 레코드 결과 사용)
+    records = list(iter_parser_files(output_dir))
+    owners: List[Optional[str]] = [matcher.match_path(_record_file_path(record)) for record in records]
+    stem_owners = {(os.path.dirname(record.path), _record_stem(record)): owner for record, owner in zip(records, owners) if owner is not None}
+    class_owners: Dict[str, str] = {}
+    for idx, record in enumerate(records):
+        owner = owners[idx] or stem_owners.get((os.path.dirname(record.path), _record_stem(record))) or matcher.match_stem(_record_stem(record))
+        if owner is None:
+            logger.warning(f"⚠️ [PARSER_CACHE] 소스 파일을 특정할 수 없는 산출물: {record.path}")
+            return None
+        entries[owner]["records"].append({"kind": record.kind, "name": record.name, "path": record.path, "data": record.data})
+        for method_fqn in _record_method_fqns(record):
+            class_owners.setdefault(method_fqn.split("(", 1)[0].rsplit(".", 1)[0], owner)
+
+    # 2. 집계 항목 매핑
+    for key, file_name in (("all_methods", settings.ALL_METHODS_FILE_NAME), ("entry_point_fqns", settings.ENTRY_POINT_FILE_NAME), ("entry_points", settings.ENTRY_POINT_INFO_FILE_NAME)):
+        for item in load_json_if_exists(os.path.join(output_dir, file_name)) or []:
+            if isinstance(item, dict):
+                owner = matcher.match_path(item.get("file_path")) or _owner_of(item.get("method_fqn") or "", class_owners)
+            else:
+                owner = _owner_of(str(item), class_owners)
+            if owner is None:
+                logger.warning(f"⚠️ [PARSER_CACHE] 소스 파일을 특정할 수 없는 {file_name} 항목: {item}")
+                return None
+            entries[owner][key].append(item)
+    return entries
+
+
+def _rebase_path_prefix(value: Any, old_prefix: str, new_prefix: str) -> Any:
+    # old_prefix 하위 경로를 new_prefix 하위로 치환 (임시 소스 디렉토리 → 프로젝트 경로, 프로젝트 경로 ↔ PROJECT_ROOT_TOKEN)
+    if isinstance(value, str):
+        return new_prefix + value[len(old_prefix):] if value == old_prefix or value.startswith((old_prefix + os.sep, old_prefix + "/")) else value
+    if isinstance(value, dict):
+        return {key: _rebase_path_prefix(item, old_prefix, new_prefix) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rebase_path_prefix(item, old_prefix, new_prefix) for item in value]
+    return value
+
+
+def rebase_entries(entries: Dict[str, Dict[str, Any]], source_dir: str, project_path: str) -> Dict[str, Dict[str, Any]]:
+    return {path: _rebase_path_prefix(entry, os.path.abspath(source_dir), os.path.abspath(project_path)) for path, entry in entries.items()}
+
+
+def copy_source_subset(project_path: str, relative_paths: Iterable[str], target_dir: str) -> str:
+    """
+    변경된 소스 파일만 디렉토리 구조를 유지하여 임시 소스 디렉토리로 복사 (가능하면 하드 링크)
+
+    Returns:
+        str: 임시 소스 디렉토리 경로
+    """
+    for relative_path in relative_paths:
+        source = os.path.join(project_path, relative_path)
+        target = os.path.join(target_dir, relative_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+    return target_dir
+
+
+def assemble_parser_output(entries: Dict[str, Dict[str, Any]], output_dir: str, bundle: bool = False) -> Dict[str, int]:
+    """
+    파일별 캐시 항목으로 전체 파서 산출물 구성 (소스 경로 순)
+    - 변경 파일은 단독 파싱되어 다른 파일 메서드 호출이 해석되지 않을 수 있으므로 전체 메서드 목록으로 callee 재해석
+
+    Args:
+        entries (Dict[str, Dict[str, Any]]): 상대 경로 → 캐시 항목
+        output_dir (str): 산출물 디렉토리
+        bundle (bool): 클래스 단위 산출물 번들 기록 여부
+
+    Returns:
+        Dict[str, int]: 구성 결과 건수 (files, records, methods, resolved_edges)
+    """
+    ordered = [entries[path] for path in sorted(entries)]
+    all_methods = [method_fqn for entry in ordered for method_fqn in entry.get("all_methods", [])]
+    resolver = CrossModuleResolver(all_methods)
+
+    record_count = 0
+    with ParserBundleWriter(output_dir, enabled=bundle) as writer:
+        for entry in ordered:
+            for record in entry.get("records", []):
+                data = record["data"]
+                if record["kind"] == ParserRecordKind.CALL_TREE and isinstance(data, dict):
+                    data = {**data, "call_edges": resolver.resolve_edges(data.get("call_edges") or [])}
+                writer.save(data, os.path.join(output_dir, record["path"]))
+                record_count += 1
+
+    save_json(all_methods, os.path.join(output_dir, settings.ALL_METHODS_FILE_NAME))
+    save_json([item for entry in ordered for item in entry.get("entry_point_fqns", [])], os.path.join(output_dir, settings.ENTRY_POINT_FILE_NAME))
+    save_json([item for entry in ordered for item in entry.get("entry_points", [])], os.path.join(output_dir, settings.ENTRY_POINT_INFO_FILE_NAME))
+    return {"files": len(ordered), "records": record_count, "methods": len(all_methods), "resolved_edges": resolver.resolved}
@@ -0,0 +1,116 @@
+# server/utils/parser_progress_utils.py
+
+"""
+Java 파서 진행 상황 유틸리티 모듈
+- 파서 표준 출력 줄을 분류하여 발견/파싱/오류 파일 수 집계
+- 처리량(파일/초)과 잔여 시간(ETA) 계산, 마지막 출력 이후 경과 시간으로 정지(hang) 판단
+"""
+
+import os
+import re
+import time
+import threading
+from typing import Any, Dict, Optional
+
+# 발견 파일 수 (예: "Found 1234 java files", "Total files: 1234") - 'file'이 포함된 줄만 대상
+_DISCOVERED_PATTERN = re.compile(r"(?i)\b(?:found|discovered|total)\b\D{0,20}?(\d+)")
+# 진행 카운터 (예: "[12/345]", "12 / 345")
+_COUNTER_PATTERN = re.compile(r"\b(\d+)\s*/\s*(\d+)\b")
+# 파일 단위 처리 로그 (예: "Parsing com/example/OrderController.java")
+_PARSED_PATTERN = re.compile(r"(?i)\b(?:pars(?:ed|ing)|process(?:ed|ing)|analy[sz](?:ed|ing))\b.*\.java\b")
+# 오류 로그
+_ERROR_PATTERN = re.compile(r"(?i)\b(?:error|exception|failed)\b")
+
+
+def count_java_files(source_dir: str) -> int:
+    """
+    소스 디렉토리의 .java 파일 수 (파서 출력에 전체 건수가 없을 때 초기 전체 건수로 사용)
+    """
+    return sum(1 for _, _, file_names in os.walk(source_dir) for name in file_names if name.endswith(".java"))
+
+
+class ParserProgress:
+    """
+    파서 진행 상황 (샤드 병렬 실행 시 여러 파서 출력을 함께 집계하므로 스레드 안전)
+
+    - 출력의 진행 카운터(12/345)가 있으면 카운터 우선, 없으면 파일 처리 로그 줄 수로 집계
+    - 출력의 발견 파일 수가 없으면 소스 디렉토리 .java 파일 수를 전체 건수로 사용
+    """
+    def __init__(self, total: int = 0):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.initial_total = total
+        self.parsed = 0
+        self.errors = 0
+        self.lines = 0
+        self._discovered: Dict[Any, int] = {}   # 파서별 발견 파일 수 (파서 구분 키 → 건수)
+        self._counters: Dict[Any, int] = {}     # 파서별 진행 카운터 (파서 구분 키 → 완료 건수)
+        self._line_parsed = 0
+
+    def feed(self, line: str, source: Any = None) -> None:
+        """
+        파서 출력 줄 반영
+
+        Args:
+            line (str): 파서 표준 출력 1줄
+            source (Any): 파서 구분 키 (동시 실행 파서별 발견 건수/진행 카운터 구분, 예: 프로세스 ID)
+        """
+        with self._lock:
+            self.lines += 1
+            self.last_activity = time.monotonic()
+
+            reader = source
+            discovered = _DISCOVERED_PATTERN.search(line) if "file" in line.lower() else None
+            if discovered:
+                self._discovered[reader] = int(discovered.group(1))
+            if _ERROR_PATTERN.search(line):
+                self.errors += 1
+
+            counter = _COUNTER_PATTERN.search(line)
+            if counter and int(counter.group(1)) <= int(counter.group(2)):
+                self._counters[reader] = int(counter.group(1))
+                self._discovered.setdefault(reader, int(counter.group(2)))
+            elif _PARSED_PATTERN.search(line):
+                self._line_parsed += 1
+            self.parsed = max(sum(self._counters.values()), self._line_parsed)
+
+    def advance(self, error: bool = False) -> None:
+        """
+        파일 1개 처리 반영 (출력 줄 대신 파일 단위 결과를 직접 전달하는 파서용)
+        """
+        with self._lock:
+            self.last_activity = time.monotonic()
+            self._line_parsed += 1
+            if error:
+                self.errors += 1
+            self.parsed = max(sum(self._counters.values()), self._line_parsed)
+
+    def idle_sec(self) -> float:
+        return time.monotonic() - self.last_activity
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        진행 상황 조회
+
+        Returns:
+            Dict[str, Any]: {total, parsed, errors, elapsed_sec, rate_per_sec, eta_sec, idle_sec}
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.started
+            total = max(self.initial_total, sum(self._discovered.values()), self.parsed)
+            rate = self.parsed / elapsed if elapsed > 0 else 0.0
+            eta: Optional[float] = None
+            if self.parsed and total:
+                eta = round((total - self.parsed) / rate, 1) if rate > 0 else None
+            return {
+                "total": total,
+                "parsed": self.parsed,
+                "errors": self.errors,
+                "elapsed_sec": round(elapsed, 1),
+                "rate_per_sec": round(rate, 2),
+                "eta_sec": eta,
+                "idle_sec": round(now - self.last_activity, 1)
+            }
+
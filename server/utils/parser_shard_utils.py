@@ -0,0 +1,285 @@
+# server/utils/parser_shard_utils.py
+
+"""
+멀티 모듈 프로젝트 파서 샤딩 유틸리티 모듈
+- Maven/Gradle 멀티 모듈 프로젝트의 소스 루트(src/<source set>/java)를 감지하고 모듈 단위 샤드로 묶어 파서를 병렬 실행
+- 샤드별 산출물(*_call_tree.json, *_methods.json, *_comments.json, entry_points.json, entry_point_fqns.json, all_methods.json)을
+  하나의 산출물 디렉토리로 병합하고, 모듈 경계를 넘는 호출(callee)을 병합된 메서드 목록 기준으로 재해석
+"""
+
+import os
+import re
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from server.utils.config import settings
+from server.utils.file_utils import load_json, load_json_if_exists, save_json
+from server.utils.parser_bundle_utils import ParserBundleWriter
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 소스 탐색 제외 디렉토리 (VCS, 빌드 산출물, 의존성)
+EXCLUDED_DIR_NAMES = {".git", ".svn", ".hg", ".idea", ".gradle", ".mvn", "node_modules", "target", "build", "out", "bin"}
+
+# 모듈 디렉토리 판단용 빌드 설정 파일
+BUILD_DESCRIPTOR_NAMES = ("pom.xml", "build.gradle", "build.gradle.kts")
+
+
+@dataclass(frozen=True)
+class ParserShard:
+    """
+    파서 실행 단위 (모듈 1개 - 모듈의 main/test 등 소스 루트 전체)
+    """
+    name: str               # 샤드 이름 (프로젝트 기준 상대 경로를 '__'로 연결)
+    source_dir: str         # 파서에 전달할 모듈 디렉토리 절대 경로
+    relative_path: str      # 프로젝트 루트 기준 모듈 디렉토리 상대 경로 (산출물 file_path 보정용)
+
+
+def _walk_dirs(root: str) -> Iterable[Tuple[str, List[str], List[str]]]:
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(name for name in dir_names if name not in EXCLUDED_DIR_NAMES and not name.startswith("."))
+        yield dir_path, dir_names, file_names
+
+
+def detect_source_roots(project_path: str) -> List[str]:
+    """
+    Java 소스 루트(src/<source set>/java) 목록 조회 (경로 순 정렬)
+
+    Args:
+        project_path (str): 프로젝트 루트 경로
+
+    Returns:
+        List[str]: 소스 루트 절대 경로 목록
+    """
+    roots = []
+    for dir_path, dir_names, _ in _walk_dirs(project_path):
+        parent = os.path.dirname(dir_path)
+        if os.path.basename(dir_path) == "java" and os.path.basename(os.path.dirname(parent)) == "src":
+            roots.append(dir_path)
+            dir_names[:] = []   # 소스 루트 하위는 탐색하지 않음
+    return roots
+
+
+def count_modules(project_path: str) -> int:
+    """
+    빌드 설정 파일(pom.xml, build.gradle)이 있는 디렉토리 수
+    """
+    return sum(1 for _, _, file_names in _walk_dirs(project_path) if any(name in file_names for name in BUILD_DESCRIPTOR_NAMES))
+
+
+def _has_sources_outside(project_path: str, source_roots: List[str]) -> bool:
+    root_set = set(source_roots)
+    for dir_path, dir_names, file_names in _walk_dirs(project_path):
+        if dir_path in root_set:
+            dir_names[:] = []
+            continue
+        if any(name.endswith(".java") for name in file_names):
+            return True
+    return False
+
+
+def plan_parser_shards(project_path: str) -> List[ParserShard]:
+    """
+    샤드 실행 계획 조회
+    - 빌드 설정 파일이 있는 모듈이 2개 이상이고, 소스 루트가 2개 이상의 모듈에 나뉘어 있고, 모든 .java 파일이 소스 루트 안에 있는 경우에만 샤드 목록 반환
+    - 소스 루트는 모듈(src 상위 디렉토리) 단위로 묶음 (단일 모듈의 src/main/java, src/test/java는 한 번에 파싱)
+    - 표준 레이아웃이 아니거나 모듈 디렉토리가 중첩된 프로젝트는 빈 목록 (프로젝트 전체를 한 번에 파싱)
+
+    Args:
+        project_path (str): 프로젝트 루트 경로
+
+    Returns:
+        List[ParserShard]: 샤드 목록
+    """
+    if not os.path.isdir(project_path):
+        return []
+
+    module_count = count_modules(project_path)
+    if module_count < 2:
+        return []
+
+    source_roots = detect_source_roots(project_path)
+    module_dirs = sorted({os.path.dirname(os.path.dirname(os.path.dirname(source_root))) for source_root in source_roots})
+    if len(module_dirs) < 2:
+        return []
+    if _has_sources_outside(project_path, source_roots):
+        logger.info(f"📦 [SHARD] 소스 루트 밖의 Java 파일이 있어 전체 파싱: {project_path}")
+        return []
+    if any(os.path.commonpath([outer, inner]) == outer for outer in module_dirs for inner in module_dirs if outer != inner):
+        logger.info(f"📦 [SHARD] 소스를 가진 모듈 디렉토리가 중첩되어 전체 파싱: {project_path}")
+        return []
+
+    shards = []
+    for module_dir in module_dirs:
+        relative_path = os.path.relpath(module_dir, project_path)
+        shards.append(ParserShard(name=relative_path.replace(os.sep, "__"), source_dir=module_dir, relative_path=relative_path))
+    logger.info(f"📦 [SHARD] 모듈 {module_count}개, 소스 루트 {len(source_roots)}개 감지: {[shard.relative_path for shard in shards]}")
+    return shards
+
+
+# ------------------------------------------------------------------
+# 모듈 간 호출 재해석
+# ------------------------------------------------------------------
+_SIGNATURE_PATTERN = re.compile(r"^(?P<name>[^(]*)\((?P<params>.*)\)$")
+
+
+def _split_params(params: str) -> List[str]:
+    # 제네릭 인자 내부의 쉼표는 구분자가 아님 (예: java.util.Map<java.lang.String, java.lang.String>)
+    items, depth, current = [], 0, ""
+    for char in params:
+        if char == "<":
+            depth += 1
+        elif char == ">":
+            depth -= 1
+        if char == "," and depth == 0:
+            items.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        items.append(current.strip())
+    return items
+
+
+def method_signature_key(method_fqn: str) -> Optional[Tuple[str, str, int]]:
+    """
+    모듈 간 호출 매칭 키 (클래스 단순명, 메서드명, 파라미터 수)
+
+    Args:
+        method_fqn (str): 메서드 FQN (예: com.example.OrderService.create(java.lang.String))
+
+    Returns:
+        Optional[Tuple[str, str, int]]: 매칭 키 (해석 불가 형식이면 None)
+    """
+    match = _SIGNATURE_PATTERN.match(method_fqn or "")
+    if not match:
+        return None
+    parts = match.group("name").split(".")
+    if len(parts) < 2 or not parts[-1] or not parts[-2]:
+        return None
+    return parts[-2], parts[-1], len(_split_params(match.group("params")))
+
+
+class CrossModuleResolver:
+    """
+    샤드 단독 파싱에서 해석되지 않은 callee를 병합된 메서드 목록으로 재해석
+    - 병합 메서드 목록에 없는 callee만 대상
+    - (클래스 단순명, 메서드명, 파라미터 수)가 유일하게 일치하는 메서드로 치환 (모호하면 유지)
+    """
+    def __init__(self, all_method_fqns: Iterable[str]):
+        self.known: Set[str] = set(all_method_fqns)
+        self._by_key: Dict[Tuple[str, str, int], List[str]] = {}
+        for method_fqn in self.known:
+            key = method_signature_key(method_fqn)
+            if key is not None:
+                self._by_key.setdefault(key, []).append(method_fqn)
+        self.resolved = 0
+        self.unresolved = 0
+
+    def resolve(self, callee: str) -> str:
+        if not callee or callee in self.known:
+            return callee
+        candidates = self._by_key.get(method_signature_key(callee), [])
+        if len(candidates) == 1:
+            self.resolved += 1
+            return candidates[0]
+        self.unresolved += 1
+        return callee
+
+    def resolve_edges(self, call_edges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{**edge, "callee": self.resolve(edge.get("callee"))} if isinstance(edge, dict) else edge for edge in call_edges]
+
+
+# ------------------------------------------------------------------
+# 산출물 병합
+# ------------------------------------------------------------------
+def _rebase_file_paths(value: Any, relative_path: str) -> Any:
+    # 샤드 소스 루트 기준 상대 경로를 프로젝트 루트 기준으로 보정 (절대 경로는 유지)
+    if isinstance(value, dict):
+        return {
+            key: (os.path.join(relative_path, item) if key == "file_path" and isinstance(item, str) and item and not os.path.isabs(item) else _rebase_file_paths(item, relative_path))
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_rebase_file_paths(item, relative_path) for item in value]
+    return value
+
+
+def _merge_unique(target: List[Any], seen: Set[Any], items: Optional[List[Any]], key=lambda item: item) -> None:
+    for item in items or []:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            target.append(item)
+
+
+def get_shard_project_dir(shard_output_dir: str, shard: ParserShard) -> str:
+    """
+    샤드 산출물 위치 (파서는 --output-dir 하위에 소스 디렉토리명으로 산출물 디렉토리 생성)
+    """
+    nested = os.path.join(shard_output_dir, os.path.basename(shard.source_dir))
+    return nested if os.path.isdir(nested) else shard_output_dir
+
+
+def merge_shard_outputs(shards: List[ParserShard], shard_output_dirs: Dict[str, str], merged_dir: str, bundle: bool = False) -> Dict[str, int]:
+    """
+    샤드 산출물 병합
+    - entry_points.json / entry_point_fqns.json / all_methods.json: 샤드 순서대로 중복 제거 병합
+    - 파일 단위 산출물: merged_dir/<샤드 이름>/ 하위로 이동 (모듈 간 동일 클래스명 파일 충돌 방지), file_path 보정 및 callee 재해석
+
+    Args:
+        shards (List[ParserShard]): 샤드 목록
+        shard_output_dirs (Dict[str, str]): 샤드 이름 → 파서 --output-dir
+        merged_dir (str): 병합 산출물 디렉토리 (단일 파싱 시 산출물 위치와 동일)
+        bundle (bool): 클래스 단위 산출물 번들 기록 여부
+
+    Returns:
+        Dict[str, int]: 병합 결과 건수 (files, methods, entry_points, resolved_edges, unresolved_edges)
+    """
+    aggregate_names = {settings.ENTRY_POINT_FILE_NAME, settings.ENTRY_POINT_INFO_FILE_NAME, settings.ALL_METHODS_FILE_NAME}
+    all_methods, entry_point_fqns, entry_point_infos = [], [], []
+    seen_methods, seen_entry_points, seen_entry_point_infos = set(), set(), set()
+
+    # 1. 집계 파일 병합 (모듈 간 호출 재해석에 전체 메서드 목록 필요)
+    for shard in shards:
+        project_dir = get_shard_project_dir(shard_output_dirs[shard.name], shard)
+        _merge_unique(all_methods, seen_methods, load_json_if_exists(os.path.join(project_dir, settings.ALL_METHODS_FILE_NAME)))
+        _merge_unique(entry_point_fqns, seen_entry_points, load_json_if_exists(os.path.join(project_dir, settings.ENTRY_POINT_FILE_NAME)))
+        _merge_unique(entry_point_infos, seen_entry_point_infos, _rebase_file_paths(load_json_if_exists(os.path.join(project_dir, settings.ENTRY_POINT_INFO_FILE_NAME)), shard.relative_path), key=lambda info: info.get("method_fqn") if isinstance(info, dict) else json.dumps(info, sort_keys=True))
+
+    # 2. 파일 단위 산출물 이동 (file_path 보정, callee 재해석)
+    resolver = CrossModuleResolver(all_methods)
+    file_count = 0
+    with ParserBundleWriter(merged_dir, enabled=bundle) as writer:
+        for shard in shards:
+            project_dir = get_shard_project_dir(shard_output_dirs[shard.name], shard)
+            for file_path in sorted(Path(project_dir).rglob("*.json")):
+                if file_path.name in aggregate_names and file_path.parent == Path(project_dir):
+                    continue
+                payload = _rebase_file_paths(load_json(str(file_path)), shard.relative_path)
+                if file_path.name.endswith("_call_tree.json") and isinstance(payload, dict):
+                    payload["call_edges"] = resolver.resolve_edges(payload.get("call_edges") or [])
+                writer.save(payload, os.path.join(merged_dir, shard.name, str(file_path.relative_to(project_dir))))
+                file_count += 1
+
+    save_json(all_methods, os.path.join(merged_dir, settings.ALL_METHODS_FILE_NAME))
+    save_json(entry_point_fqns, os.path.join(merged_dir, settings.ENTRY_POINT_FILE_NAME))
+    save_json(entry_point_infos, os.path.join(merged_dir, settings.ENTRY_POINT_INFO_FILE_NAME))
+
+    report = {
+        "files": file_count,
+        "methods": len(all_methods),
+        "entry_points": len(entry_point_fqns),
+        "resolved_edges": resolver.resolved,
+        "unresolved_edges": resolver.unresolved
+    }
+    logger.info(f"📦 [SHARD] 샤드 {len(shards)}개 산출물 병합 완료: {report}")
+    return report
+
+
+def remove_shard_outputs(shard_root: str) -> None:
+    shutil.rmtree(shard_root, ignore_errors=True)
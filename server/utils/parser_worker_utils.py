@@ -0,0 +1,418 @@
+# server/utils/parser_worker_utils.py
+
+"""
+Java 파서 상주 워커 유틸리티 모듈
+- 분석마다 java -jar 프로세스를 띄우는 대신, jpype로 JVM을 1회 기동한 워커 프로세스가 파서 JAR의 Main-Class를 반복 호출
+- JVM 기동/JIT 워밍업 비용을 첫 요청(또는 서버 기동 시 예열)에서만 부담
+- 워커가 비정상 종료되면 다음 요청 시 재기동하고, 워커를 사용할 수 없으면 호출 측에서 subprocess 실행으로 대체
+- 워커 프로세스의 표준 출력/오류(JVM System.out/err 포함)는 파이프로 받아 요청 측에 줄 단위로 전달 (진행 상황 집계, 출력 없음 타임아웃)
+"""
+
+import os
+import time
+import atexit
+import zipfile
+import threading
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional
+from server.utils.config import settings
+from server.utils.metrics_utils import PARSER_WORKER_RESTARTS
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+
+class ParserWorkerUnavailableError(Exception):
+    """워커를 사용할 수 없는 경우 (jpype 미설치, JVM 기동 실패, 워커 비정상 종료) - subprocess 실행으로 대체"""
+
+
+class ParserWorkerError(Exception):
+    """파서 실행 실패 (Java 예외 또는 0이 아닌 종료 코드)"""
+
+
+class ParserWorkerIdleTimeoutError(TimeoutError):
+    """파서 출력이 없는 상태가 지속된 경우 (정지로 보고 워커 종료)"""
+
+
+# 요청 처리 완료 시 워커 출력 파이프에 기록하는 표시 (이전 출력이 모두 전달된 뒤 응답 전송)
+_OUTPUT_DONE_MARKER = "\0parser-worker-done\n"
+
+
+def read_main_class(jar_path: str) -> str:
+    """
+    JAR 매니페스트의 Main-Class 조회
+
+    Args:
+        jar_path (str): JAR 파일 경로
+
+    Returns:
+        str: Main-Class (예: sg.parser.Main)
+
+    Raises:
+        ParserWorkerUnavailableError: 매니페스트에 Main-Class가 없는 경우
+    """
+    with zipfile.ZipFile(jar_path) as jar:
+        manifest = jar.read("META-INF/MANIFEST.MF").decode("utf-8")
+
+    # 72바이트 초과 항목은 공백으로 시작하는 다음 줄에 이어짐
+    attributes: Dict[str, str] = {}
+    name = None
+    for line in manifest.splitlines():
+        if line.startswith(" ") and name:
+            attributes[name] += line[1:]
+        elif ":" in line:
+            name, value = line.split(":", 1)
+            attributes[name.strip()] = value.strip()
+
+    main_class = attributes.get("Main-Class")
+    if not main_class:
+        raise ParserWorkerUnavailableError(f"JAR 매니페스트에 Main-Class가 없습니다: {jar_path}")
+    return main_class
+
+
+def _forward_output(read_fd: int, conn, send_lock: threading.Lock, done: threading.Event) -> None:
+    # 워커 프로세스의 출력 파이프를 읽어 줄 단위로 요청 측에 전달
+    with os.fdopen(read_fd, "r", encoding="utf-8", errors="replace") as stream:
+        for line in stream:
+            is_done = line.endswith(_OUTPUT_DONE_MARKER)
+            if is_done:
+                line = line[:-len(_OUTPUT_DONE_MARKER)]
+            if line:
+                with send_lock:
+                    conn.send({"output": line.rstrip("\n")})
+            if is_done:
+                done.set()
+
+
+def _worker_main(conn, jar_path: str, main_class: str, jvm_options: List[str]) -> None:
+    # 워커 프로세스 진입점 (spawn) - JVM 1회 기동 후 요청 반복 처리
+    # JVM이 표준 출력/오류(fd 1, 2)를 상속하도록 기동 전에 파이프로 교체 (서버 표준 출력으로 직접 출력하지 않음)
+    read_fd, write_fd = os.pipe()
+    os.dup2(write_fd, 1)
+    os.dup2(write_fd, 2)
+    os.close(write_fd)
+    send_lock = threading.Lock()
+    output_done = threading.Event()
+    threading.Thread(target=_forward_output, args=(read_fd, conn, send_lock, output_done), name="parser-worker-output", daemon=True).start()
+
+    def _send(message: Dict[str, Any]) -> None:
+        with send_lock:
+            conn.send(message)
+
+    try:
+        import jpype
+        jpype.startJVM(*jvm_options, classpath=[jar_path], convertStrings=False)
+        entry = jpype.JClass(main_class)
+        string_array = jpype.JArray(jpype.JString)
+        java_system = jpype.JClass("java.lang.System")
+    except Exception as err:
+        _send({"ok": False, "error": f"{type(err).__name__}: {err}"})
+        conn.close()
+        return
+
+    _send({"ok": True, "pid": os.getpid()})
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+
+        op = request.get("op")
+        if op == "stop":
+            break
+        if op == "ping":
+            _send({"ok": True})
+            continue
+
+        started = time.perf_counter()
+        try:
+            entry.main(string_array(request["args"]))
+            response = {"ok": True}
+        except Exception as err:
+            # Java 예외(jpype.JException 포함)는 메시지만 전달하고 워커는 유지
+            response = {"ok": False, "error": f"{type(err).__name__}: {err}"}
+        finally:
+            java_system.out.flush()
+            java_system.err.flush()
+        # 파서 출력이 모두 전달된 뒤 응답 전송
+        output_done.clear()
+        os.write(1, _OUTPUT_DONE_MARKER.encode("utf-8"))
+        output_done.wait(timeout=5)
+        _send({**response, "elapsed": time.perf_counter() - started})
+    conn.close()
+
+
+class ParserWorker:
+    """
+    Java 파서 상주 워커 (요청은 순차 처리)
+
+    - parse(): 워커가 없거나 종료된 경우 기동(재기동) 후 파서 실행
+    - 파서 main()이 System.exit(0)으로 종료하면 해당 요청은 성공으로 처리하고 다음 요청 시 재기동
+    - 타임아웃(전체 실행 시간, 출력 없음) 시 JVM 상태를 신뢰할 수 없으므로 워커 종료
+    """
+    def __init__(self, jar_path: str, jvm_options: List[str], start_timeout: float):
+        self.jar_path = jar_path
+        self.jvm_options = jvm_options
+        self.start_timeout = start_timeout
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._busy = False
+        self.requests = 0
+        self.restarts = 0
+        self.last_error = ""
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def warm_up(self) -> bool:
+        """
+        워커 예열 (JVM 기동 및 파서 클래스 로드)
+
+        Returns:
+            bool: 기동 성공 여부
+        """
+        with self._lock:
+            try:
+                self._ensure_started()
+                return True
+            except ParserWorkerUnavailableError as err:
+                logger.warning(f"⚠️ [PARSER_WORKER] 예열 실패: {err}")
+                return False
+
+    def parse(self, args: List[str], timeout: float, on_output: Optional[Callable[[str], None]] = None, idle_timeout: float = 0) -> float:
+        """
+        파서 실행
+
+        Args:
+            args (List[str]): 파서 실행 인자 (--source-dir=... 등, java -jar 이후 인자와 동일)
+            timeout (float): 실행 타임아웃 (초)
+            on_output (Optional[Callable[[str], None]]): 파서 출력 줄 콜백 (진행 상황 집계)
+            idle_timeout (float): 파서 출력 없이 대기할 최대 시간 (초, 0이면 미사용)
+
+        Returns:
+            float: 파서 실행 시간 (초)
+
+        Raises:
+            ParserWorkerUnavailableError: 워커 기동 실패 또는 실행 중 비정상 종료 (subprocess 실행으로 대체 가능)
+            ParserWorkerError: 파서 실행 실패
+            ParserWorkerIdleTimeoutError: 파서 출력 없음 시간 초과
+            TimeoutError: 실행 시간 초과
+        """
+        with self._lock:
+            self._ensure_started()
+            started = time.perf_counter()
+            self._busy = True
+            try:
+                try:
+                    self._conn.send({"op": "parse", "args": args})
+                except OSError as err:
+                    self._discard(f"요청 전송 실패: {err}")
+                    raise ParserWorkerUnavailableError(self.last_error) from err
+
+                try:
+                    response = self._receive(timeout, on_output=on_output, idle_timeout=idle_timeout)
+                except TimeoutError as err:
+                    self._discard(str(err))
+                    raise
+                except EOFError:
+                    return self._handle_exit(started)
+            finally:
+                self._busy = False
+
+            self.requests += 1
+            if not response.get("ok"):
+                raise ParserWorkerError(response.get("error", ""))
+            return response.get("elapsed", time.perf_counter() - started)
+
+    def health_check(self, timeout: float = 5.0) -> bool:
+        """
+        워커 응답 확인 (파싱 중이면 프로세스 생존 여부로 판단)
+
+        Args:
+            timeout (float): 응답 대기 시간 (초)
+
+        Returns:
+            bool: 정상 여부
+        """
+        if not self._lock.acquire(blocking=False):
+            return self.is_alive()
+        try:
+            if not self.is_alive():
+                return False
+            self._conn.send({"op": "ping"})
+            try:
+                return self._receive(timeout).get("ok", False)
+            except TimeoutError:
+                # 늦게 도착한 응답이 다음 요청 응답으로 읽히지 않도록 워커 종료
+                self._discard(f"헬스 체크 응답 없음 ({timeout}초)")
+                return False
+        except (EOFError, OSError):
+            return False
+        finally:
+            self._lock.release()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "alive": self.is_alive(),
+            "pid": self._process.pid if self.is_alive() else None,
+            "busy": self._busy,
+            "requests": self.requests,
+            "restarts": self.restarts,
+            "last_error": self.last_error
+        }
+
+    def stop(self) -> None:
+        with self._lock:
+            if self.is_alive():
+                try:
+                    self._conn.send({"op": "stop"})
+                    self._process.join(timeout=5)
+                except OSError:
+                    pass
+            self._discard()
+            self._process = None
+
+    def _ensure_started(self) -> None:
+        if self.is_alive():
+            return
+        if self._process is not None:
+            # 비정상 종료(또는 System.exit) 이후 재기동
+            self.restarts += 1
+            PARSER_WORKER_RESTARTS.inc()
+            logger.warning(f"🔁 [PARSER_WORKER] 워커 재기동 (exit code: {self._process.exitcode}, 누적 {self.restarts}회)")
+            self._discard()
+        self._start()
+
+    def _start(self) -> None:
+        if not os.path.isfile(self.jar_path):
+            raise ParserWorkerUnavailableError(f"JAR 파일이 존재하지 않습니다: {self.jar_path}")
+        try:
+            main_class = read_main_class(self.jar_path)
+        except (OSError, KeyError, zipfile.BadZipFile) as err:
+            raise ParserWorkerUnavailableError(f"JAR 매니페스트 조회 실패: {err}") from err
+
+        # JVM은 fork 이후 사용할 수 없으므로 spawn으로 기동
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(target=_worker_main, args=(child_conn, self.jar_path, main_class, self.jvm_options), name="java-parser-worker", daemon=True)
+        started = time.perf_counter()
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, parent_conn
+
+        try:
+            ready = self._receive(self.start_timeout)
+        except EOFError:
+            ready = {"ok": False, "error": f"워커 기동 중 종료 (exit code: {process.exitcode})"}
+        except TimeoutError:
+            ready = {"ok": False, "error": f"워커 기동 시간 초과 ({self.start_timeout}초)"}
+
+        if not ready.get("ok"):
+            self._discard(ready.get("error", ""))
+            self._process = None
+            raise ParserWorkerUnavailableError(self.last_error)
+        logger.info(f"☕ [PARSER_WORKER] 워커 기동 완료 (pid: {ready.get('pid')}, main: {main_class}, {time.perf_counter() - started:.2f}초)")
+
+    def _receive(self, timeout: Optional[float], on_output: Optional[Callable[[str], None]] = None, idle_timeout: float = 0) -> Dict[str, Any]:
+        """
+        워커 응답 수신 (응답 전에 도착한 출력 메시지는 on_output으로 전달, 없으면 debug 로그)
+
+        Args:
+            timeout (Optional[float]): 전체 대기 시간 (초, None이면 무제한)
+            on_output (Optional[Callable[[str], None]]): 출력 줄 콜백
+            idle_timeout (float): 출력 없이 대기할 최대 시간 (초, 0이면 미사용)
+
+        Returns:
+            Dict[str, Any]: 응답
+
+        Raises:
+            TimeoutError: 전체 대기 시간 초과
+            ParserWorkerIdleTimeoutError: 출력 없음 시간 초과
+            EOFError: 워커 종료
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            waits = [wait for wait in (deadline - time.monotonic() if deadline is not None else None, idle_timeout or None) if wait is not None]
+            # 워커가 종료되어도 poll은 즉시 반환 (EOF)
+            if not self._conn.poll(max(min(waits), 0) if waits else None):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"실행 시간 초과 ({timeout}초)")
+                raise ParserWorkerIdleTimeoutError(f"파서 출력 없음 ({idle_timeout}초)")
+
+            message = self._conn.recv()
+            if "output" not in message:
+                return message
+            if on_output is not None:
+                on_output(message["output"])
+            else:
+                logger.debug(message["output"])
+
+    def _handle_exit(self, started: float) -> float:
+        self._process.join(timeout=5)
+        exitcode = self._process.exitcode
+        if exitcode == 0:
+            # 파서 main()의 System.exit(0) - 파싱은 완료, 다음 요청 시 재기동
+            self.requests += 1
+            self._discard()
+            return time.perf_counter() - started
+        self._discard(f"파싱 중 워커 종료 (exit code: {exitcode})")
+        if exitcode is not None and exitcode > 0:
+            raise ParserWorkerError(self.last_error)
+        # 시그널 종료(JVM 크래시 등)는 워커 문제로 보고 subprocess 실행으로 대체
+        raise ParserWorkerUnavailableError(self.last_error)
+
+    def _discard(self, error: str = "") -> None:
+        # 워커 프로세스/연결 정리 (프로세스 객체는 재기동 판단을 위해 유지)
+        if error:
+            self.last_error = error
+            logger.error(f"❌ [PARSER_WORKER] {error}")
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+            self._process.join(timeout=5)
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# 프로세스 공용 워커
+_worker: Optional[ParserWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_parser_worker() -> ParserWorker:
+    """
+    파서 워커 조회 (없으면 설정값으로 생성, 기동은 첫 요청 또는 warm_up 시점)
+
+    Returns:
+        ParserWorker: 파서 워커
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = ParserWorker(
+                jar_path=settings.JAVA_PARSER_JAR_PATH,
+                jvm_options=[option for option in settings.JAVA_PARSER_WORKER_JVM_OPTIONS.split() if option],
+                start_timeout=settings.JAVA_PARSER_WORKER_START_TIMEOUT
+            )
+            atexit.register(_worker.stop)
+        return _worker
+
+
+def get_parser_worker_status() -> Dict[str, Any]:
+    """
+    헬스 체크용 워커 상태 (미사용 시 enabled=False)
+    """
+    if not settings.JAVA_PARSER_WORKER_ENABLED:
+        return {"enabled": False}
+    worker = get_parser_worker()
+    return {"enabled": True, "healthy": worker.health_check(timeout=settings.JAVA_PARSER_WORKER_HEALTH_TIMEOUT), **worker.status()}
+
+
+def shutdown_parser_worker() -> None:
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+    if worker is not None:
+        worker.stop()
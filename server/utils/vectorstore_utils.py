@@ -5,13 +5,16 @@
 """
 
 import os
+import time
 import shutil
+import threading
 from typing import List, Optional
 from langchain.schema import Document
 from langchain.vectorstores import FAISS
 from langchain_core.vectorstores import VectorStore
 from langchain_openai import AzureOpenAIEmbeddings
 from server.utils.config import settings, get_embeddings
+from server.utils.metrics_utils import FAISS_LOAD_DURATION, FAISS_LOAD_BYTES, EMBEDDING_REQUESTS, EMBEDDING_DOCUMENTS
 from server.utils.logger import get_logger
 
 # 로거 선언
@@ -19,6 +22,14 @@ logger = get_logger(__name__)
 
 FAISS_FILENAME_TEMPLATE = "q_{project_id}_faiss_index"
 
+# 프로젝트별 인덱스 파일 잠금 (병렬 분기의 RAG 인덱싱이 동일 인덱스를 동시에 로드/저장하지 않도록 직렬화)
+_index_locks = {}
+_index_locks_guard = threading.Lock()
+
+def _get_index_lock(project_id: str) -> threading.RLock:
+    with _index_locks_guard:
+        return _index_locks.setdefault(project_id, threading.RLock())
+
 def load_faiss_vector_store(project_id: str, embeddings: Optional[AzureOpenAIEmbeddings] = None, path: Optional[str] = None) -> Optional[VectorStore]:
     """FAISS 벡터 스토어를 로드
 
@@ -29,22 +40,32 @@ def load_faiss_vector_store(project_id: str, embeddings: Optional[AzureOpenAIEmb
     Returns:
         VectorStore: FAISS 벡터 스토어 객체
     """
+    started = time.perf_counter()
+    load_result = "error"
     try:
         if not path:
             faiss_index_path = get_vectorstore_path(project_id=project_id)
         else:
             faiss_index_path = path
         
+        if not os.path.isdir(faiss_index_path):
+            load_result = "missing"
+        
         if not embeddings:
             # 임베딩 모델 생성
             embeddings = get_embeddings()
         
         logger.debug(f"📢 FIASS_INDEX_PATH: {faiss_index_path}")
-        vectorstore = FAISS.load_local(faiss_index_path, embeddings, allow_dangerous_deserialization=True)  # pickle 로딩 허용
+        with _get_index_lock(project_id):
+            vectorstore = FAISS.load_local(faiss_index_path, embeddings, allow_dangerous_deserialization=True)  # pickle 로딩 허용
+            FAISS_LOAD_BYTES.inc(_get_directory_size(faiss_index_path))
+        load_result = "success"
         return vectorstore
     except Exception as err:
         logger.warning(f"🌧️ 벡터스토어 로드 오류. error: {err}")
         return None
+    finally:
+        FAISS_LOAD_DURATION.observe(time.perf_counter() - started, result=load_result)
 
 def save_documents_to_faiss_vector_store(project_id:str, documents: List[Document]) -> Optional[VectorStore]:
     """FAISS 벡터 스토어 생성하고 문서를 저장
@@ -68,20 +89,32 @@ def save_documents_to_faiss_vector_store(project_id:str, documents: List[Documen
         # 임베딩 모델 생성
         embeddings: AzureOpenAIEmbeddings = get_embeddings()
         
-        # 벡터 저장소 로드
-        vectorstore = load_faiss_vector_store(project_id=project_id, embeddings=embeddings, path=faiss_index_path)
-        
-        if vectorstore:
-            vectorstore.add_documents(documents=documents)
-        else:
-            # 벡터 변환 및 FAISS 벡터 저장소 생성
-            vectorstore = FAISS.from_documents(documents=documents, embedding=embeddings, normalize_L2=True)
+        # 임베딩 요청 메트릭 기록
+        deployment = getattr(embeddings, "deployment", None) or getattr(embeddings, "model", None) or "unknown"
+        EMBEDDING_REQUESTS.inc(deployment=deployment)
+        EMBEDDING_DOCUMENTS.inc(len(documents), deployment=deployment)
         
-            # FAISS 저장 디렉토리 확인
-            os.makedirs(faiss_index_path, exist_ok=True)
+        # 벡터 변환은 잠금 밖에서 수행 (병렬 분기의 임베딩 호출은 동시에 진행)
+        texts = [doc.page_content for doc in documents]
+        metadatas = [doc.metadata for doc in documents]
+        ids = [doc.id for doc in documents] if any(doc.id for doc in documents) else None
+        text_embeddings = list(zip(texts, embeddings.embed_documents(texts)))
         
-        # 벡터 저장(local)
-        vectorstore.save_local(faiss_index_path)
+        # 인덱스 로드 → 추가 → 저장은 프로젝트 단위로 직렬화 (동시 저장 시 먼저 저장한 문서 유실 방지)
+        with _get_index_lock(project_id):
+            vectorstore = load_faiss_vector_store(project_id=project_id, embeddings=embeddings, path=faiss_index_path)
+            
+            if vectorstore:
+                vectorstore.add_embeddings(text_embeddings=text_embeddings, metadatas=metadatas, ids=ids)
+            else:
+                # FAISS 벡터 저장소 생성
+                vectorstore = FAISS.from_embeddings(text_embeddings=text_embeddings, embedding=embeddings, metadatas=metadatas, ids=ids, normalize_L2=True)
+            
+                # FAISS 저장 디렉토리 확인
+                os.makedirs(faiss_index_path, exist_ok=True)
+            
+            # 벡터 저장(local)
+            vectorstore.save_local(faiss_index_path)
         logger.debug(f"\n✅ FAISS 벡터 저장소 생성 완료! ({faiss_index_path})")
         
         return vectorstore
@@ -101,12 +134,41 @@ def get_vectorstore_path(project_id: str) -> str:
     """
     return os.path.join(settings.FIASS_INDEX_PATH, FAISS_FILENAME_TEMPLATE.format(project_id=project_id))
 
+def _get_directory_size(path: str) -> int:
+    # 인덱스 디렉토리(index.faiss, index.pkl) 파일 크기 합계
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
 def delete_faiss_index_by_project(project_id: str) -> bool:
     faiss_index_path = get_vectorstore_path(project_id=project_id)
-    if os.path.exists(faiss_index_path):
-        shutil.rmtree(faiss_index_path)
+    with _get_index_lock(project_id):
+        exists = os.path.exists(faiss_index_path)
+        if exists:
+            shutil.rmtree(faiss_index_path)
+    if exists:
         logger.info(f"🧹 FAISS index for project {project_id} deleted: {faiss_index_path}")
         return True
     else:
         logger.warning(f"❗ FAISS path not found: {faiss_index_path}")
         return False
+
+def copy_faiss_index(source_project_id: str, project_id: str) -> bool:
+    """
+    다른 프로젝트의 FAISS 인덱스를 복사 (동일 소스/옵션 분석 결과 재사용)
+
+    Args:
+        source_project_id (str): 원본 프로젝트 ID
+        project_id (str): 대상 프로젝트 ID
+
+    Returns:
+        bool: 복사 여부 (원본 인덱스가 없으면 False)
+    """
+    source_path = get_vectorstore_path(project_id=source_project_id)
+    target_path = get_vectorstore_path(project_id=project_id)
+    with _get_index_lock(source_project_id), _get_index_lock(project_id):
+        if not os.path.isdir(source_path):
+            logger.warning(f"❗ FAISS path not found: {source_path}")
+            return False
+        shutil.rmtree(target_path, ignore_errors=True)
+        shutil.copytree(source_path, target_path)
+    logger.info(f"📋 FAISS index copied: {source_project_id} -> {project_id}")
+    return True
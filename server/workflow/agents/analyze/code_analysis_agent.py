@@ -4,21 +4,18 @@
 코드 분석 에이전트
 """
 
-import os
-import time
 import asyncio
 from datetime import datetime
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
-from langchain.schema import Document
 from langchain.schema import SystemMessage, HumanMessage
 from langchain.prompts import PromptTemplate
 from openai import LengthFinishReasonError
 from server.utils.config import get_llm_with_custom
-from server.utils.constants import AgentType, AgentResultGroupKey, DirInfo, RagSourceType, IndexInputType, LLMModel
-from server.utils.document_retrieval_utils import load_documents_by_source_type
-from server.utils.file_utils import load_json
+from server.utils.constants import AgentType, AgentResultGroupKey, IndexInputType, LLMModel, AnalysisType, PipelineStage
+from server.utils.method_heuristic_utils import classify_trivial_method, build_heuristic_summary
 from server.workflow.agents.base.base_llm_agent import BaseLLMAgent, LLMAgentState
+from server.workflow.project_context import get_project_context
 from server.utils.config import settings
 
 class InsightLLMOutput(BaseModel):
@@ -121,7 +118,7 @@ class CodeAnalysisAgent(BaseLLMAgent):
         messages.append(HumanMessage(content=human_prompt_template.format(method_fqn=method_fqn, method_text=method_text, comment=comment, method_signature=method_signature, return_type=return_type, modifiers=modifiers, parameters=parameters, file_path=file_path, package_name=package_name, class_name=class_name)))
         return messages
     
-    def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
+    async def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
         agent_state = state["autodiagenti_state"]
         project_id = agent_state.get("project_id", "")
         project_name = agent_state.get("project_name", "")
@@ -132,33 +129,51 @@ class CodeAnalysisAgent(BaseLLMAgent):
         # 모델 선언
         llm_model = get_llm_with_custom(llm_model=model_info.model_name, llm_version=model_info.version)
         
-        # parser_documents 에서 모든 callEdges 수집, caller_set 설정
-        parser_documents: List[Document] = load_documents_by_source_type(project_id=project_id, source_type=RagSourceType.PARSER)
-        
-        all_call_edges = []
-        for doc in parser_documents:
-            meta = doc.metadata
+        # 분석 대상 메서드 선별 (휴리스틱 처리 포함, 벡터 스토어 로드는 스레드에서 실행)
+        heuristic_methods, llm_methods, heuristic_report = await asyncio.to_thread(self.prepare_target_methods, project_id=project_id, project_name=project_name)
             
-            # callEdges 수집
-            call_edges = meta.get("call_edges", [])
-            all_call_edges.extend(call_edges)
+        # LLM 실행
+        results = await self._analyze_all(llm=llm_model, schema=InsightLLMOutput, methods=llm_methods, max_concurrent=settings.MAX_CONCURRENT)
+        new_method_meta_list = heuristic_methods + results
         
-        caller_set = set(edge['caller'] for edge in all_call_edges)
+        code_analysis_result = self.build_code_analysis_result(llm=llm_model, method_meta_list=new_method_meta_list, heuristic_report=heuristic_report)
         
-        # method 데이터 추출
-        all_methods: List[Dict] = self._load_methods_from_rag(project_id=project_id)
+        # 그래프 상태에는 산출물 핸들만 전달
+        code_analysis_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.CODE_ANALYSIS_RESULT, code_analysis_result)
         
-        new_method_meta_list = []
+        result = {
+            AgentResultGroupKey.CURRENT_SOURCE_DATA: code_analysis_handle,
+            AgentResultGroupKey.CODE_ANALYSIS_RESULT: code_analysis_handle
+        }
+     
+        return self.wrap_multiple_sources(result)
+        
+    def prepare_target_methods(self, project_id: str, project_name: str) -> tuple[List[Dict], List[Dict], Dict]:
+        """
+        RAG에 저장된 메서드 중 분석 대상을 선별하고, 단순 메서드는 휴리스틱 요약으로 처리합니다.
+
+        Args:
+            project_id (str): 프로젝트 ID
+            project_name (str): 프로젝트명
+
+        Returns:
+            tuple[List[Dict], List[Dict], Dict]: (휴리스틱 처리 메서드, LLM 분석 대상 메서드, 휴리스틱 리포트)
+        """
+        # 프로젝트 산출물 컨텍스트 (PARSER 문서의 callEdges, CODE 문서, 메서드 FQN 목록 1회 로드)
+        context = get_project_context(project_id=project_id, project_name=project_name)
+        caller_set = context.caller_set
+        
+        # method 데이터 추출
+        all_methods: List[Dict] = context.code_methods
+        self.logger.info(f"[✅ RAG] project_id={project_id}, 총 {len(all_methods)}개 메서드 로딩 완료")
         
         # 메서드 FQN 목록 추출
-        output_dir = os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name)
-        method_fqn_path = os.path.join(output_dir, settings.ALL_METHODS_FILE_NAME)
-        valid_method_fqns: set[str] = set(load_json(method_fqn_path))
+        valid_method_fqns: set[str] = context.valid_method_fqns
         
         target_methods = []
         
-        # 메서드 별로 분석 실행
-        for idx, method_meta in enumerate(all_methods):
+        # 메서드 별로 분석 대상 여부 확인
+        for method_meta in all_methods:
             method_fqn = method_meta.get("method_fqn", "")
             
             if not method_fqn:
@@ -178,89 +193,133 @@ class CodeAnalysisAgent(BaseLLMAgent):
                     continue
             
             target_methods.append(method_meta)
-            
-        # LLM 실행
-        results = asyncio.run(self._analyze_all(llm=llm_model, schema=InsightLLMOutput, methods=target_methods, max_concurrent=settings.MAX_CONCURRENT))
-        new_method_meta_list = results
-            
-        code_analysis_result = {
+        
+        # 단순 메서드는 LLM 호출 없이 템플릿 요약 처리
+        heuristic_methods, llm_methods = self._split_heuristic_methods(target_methods)
+        heuristic_report = self._build_heuristic_report(heuristic_methods=heuristic_methods, llm_methods=llm_methods)
+        self.logger.info(f"📊 휴리스틱 분석 리포트: {heuristic_report}")
+        
+        return heuristic_methods, llm_methods, heuristic_report
+
+    def build_code_analysis_result(self, llm, method_meta_list: List[Dict], heuristic_report: Dict) -> Dict:
+        """
+        코드 분석 단계 결과값 구성
+        """
+        return {
             "input_type": IndexInputType.LLM_CODE,
-            "llm_model": llm_model.deployment_name,         
-            "llm_version": llm_model.openai_api_version,    
-            "llm_temperature": llm_model.temperature,
-            "code_analysis_info": new_method_meta_list
+            "llm_model": llm.deployment_name,         
+            "llm_version": llm.openai_api_version,    
+            "llm_temperature": llm.temperature,
+            "code_analysis_info": method_meta_list,
+            "heuristic_report": heuristic_report
         }
+    
+    def _split_heuristic_methods(self, methods: List[Dict]) -> tuple[List[Dict], List[Dict]]:
+        """
+        규칙 기반 분류기로 단순 메서드(추상 선언, 빈 본문, 단순 위임, 단순 매핑)를 골라 템플릿 요약을 채우고,
+        나머지 메서드만 LLM 분석 대상으로 반환합니다.
+
+        Args:
+            methods (List[Dict]): 분석 대상 메서드 메타 리스트
+
+        Returns:
+            tuple[List[Dict], List[Dict]]: (휴리스틱 처리 메서드, LLM 분석 대상 메서드)
+        """
+        if not settings.HEURISTIC_ANALYSIS_ENABLED:
+            return [], methods
         
-        result = {
-            AgentResultGroupKey.CURRENT_SOURCE_DATA: code_analysis_result,
-            AgentResultGroupKey.CODE_ANALYSIS_RESULT: code_analysis_result
+        heuristic_methods = []
+        llm_methods = []
+        
+        for method_meta in methods:
+            method_fqn = method_meta.get("method_fqn", "")
+            classified = classify_trivial_method(method_fqn, method_meta)
+            
+            if classified is None:
+                method_meta["analysis_type"] = AnalysisType.LLM
+                llm_methods.append(method_meta)
+                continue
+            
+            kind, detail = classified
+            summary, description = build_heuristic_summary(method_fqn, method_meta, kind, detail)
+            method_meta["analyzed_at"] = datetime.now().isoformat()
+            method_meta["summary"] = summary
+            method_meta["description"] = description
+            method_meta["analysis_type"] = AnalysisType.HEURISTIC
+            method_meta["heuristic_kind"] = kind
+            heuristic_methods.append(method_meta)
+            self.logger.info(f"📢 휴리스틱 요약 처리({kind}): [{method_fqn}]")
+        
+        return heuristic_methods, llm_methods
+    
+    def _build_heuristic_report(self, heuristic_methods: List[Dict], llm_methods: List[Dict]) -> Dict:
+        """
+        휴리스틱 처리로 절감한 LLM 호출 건수 리포트 생성
+        """
+        by_kind: Dict[str, int] = {}
+        for method_meta in heuristic_methods:
+            kind = method_meta.get("heuristic_kind", "")
+            by_kind[kind] = by_kind.get(kind, 0) + 1
+        
+        total = len(heuristic_methods) + len(llm_methods)
+        return {
+            "total_methods": total,
+            "llm_methods": len(llm_methods),
+            "heuristic_methods": len(heuristic_methods),
+            "avoided_llm_calls": len(heuristic_methods),
+            "avoided_ratio": round(len(heuristic_methods) / total, 4) if total else 0.0,
+            "by_kind": by_kind
         }
-     
-        return self.wrap_multiple_sources(result)
         
-    def _load_methods_from_rag(self, project_id: str) -> List[Dict]:
+    async def analyze_method(self, llm, schema, method_meta: Dict) -> Dict:
         """
-        project_id를 기준으로 RAG에 저장된 source_type='METHOD' 문서를 모두 불러와
-        MethodMeta 리스트로 변환합니다.
+        메서드 1건에 대한 LLM 분석 (동시성 제어는 호출측에서 처리)
 
         Args:
-            project_id (str): 프로젝트 또는 쿼리 ID
+            llm: LLM 모델
+            schema: 구조화 출력 스키마
+            method_meta (Dict): 메서드 메타 정보
 
         Returns:
-            List[Dict]: MethodMeta 리스트 (method_fqn, method_text 등 포함)
+            Dict: summary/description이 채워진 메서드 메타 정보 (실패 시 원본 유지)
         """
-        all_methods: List[Dict] = []
-        all_method_fqns = {}
-        
-        documents: List[Document] = load_documents_by_source_type(project_id=project_id, source_type=RagSourceType.CODE)
+        messages = self.get_prompt(method_meta=method_meta)
         
-        for doc in documents:
-            method_map = doc.metadata.get("methods", {})
+        try:
+            # LLM 호출
+            response = await self._call_llm_with_timeout(llm, schema, messages)
             
-            for method_fqn, method_info in method_map.items():
-                if "method_fqn" not in method_info:
-                    method_info["method_fqn"] = method_fqn  # 반드시 보강
-                        
-                if method_fqn not in all_method_fqns:
-                    all_method_fqns[method_fqn] = method_info
+            method_meta["analyzed_at"] = datetime.now().isoformat()
+            method_meta["summary"] = response.summary.strip().replace("\n", "")
+            method_meta["description"] = response.description.strip().replace("\n", "")
+            method_meta["analysis_type"] = AnalysisType.LLM
+        except asyncio.TimeoutError:
+            self.logger.warning(f"❌ [TIMEOUT] {method_meta['method_fqn']} 분석 시간 초과로 스킵됨")
+        except LengthFinishReasonError as err:
+            self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
+        except Exception as e:
+            self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
         
-        all_methods = list(all_method_fqns.values())
-        
-        self.logger.info(f"[✅ RAG] project_id={project_id}, 총 {len(all_methods)}개 메서드 로딩 완료")
-        return all_methods
+        return method_meta
     
     async def _analyze(self, llm, schema, method_meta, sem, max_concurrent, idx, total):
         async with sem:  # 동시 실행 제한
             current = sem._value                    # 남은 슬롯 개수
             active = max_concurrent - current       # 현재 실행 중 개수
             self.logger.info(f"🚀 method_meta: [{method_meta}]")
-            self.logger.info(f"🚀 [{idx+1}/{total}] 실행 시작: {method_meta["method_fqn"]} (동시 실행: {active})")
+            self.logger.info(f"🚀 [{idx+1}/{total}] 실행 시작: {method_meta['method_fqn']} (동시 실행: {active})")
 
-            messages = self.get_prompt(method_meta=method_meta)
-            
-            try:
-                # LLM 호출
-                response = await self._call_llm_with_timeout(llm, schema, messages)
-                
-                method_meta["analyzed_at"] = datetime.now().isoformat()
-                method_meta["summary"] = response.summary.strip().replace("\n", "")
-                method_meta["description"] = response.description.strip().replace("\n", "")
-            except asyncio.TimeoutError:
-                self.logger.warning(f"❌ [TIMEOUT] {method_meta['method_fqn']} 분석 시간 초과로 스킵됨")
-            except LengthFinishReasonError as err:
-                self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
-            except Exception as e:
-                self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
+            method_meta = await self.analyze_method(llm=llm, schema=schema, method_meta=method_meta)
             
             self.logger.info(f"✅ [{idx+1}/{total}] 실행 완료: {method_meta['method_fqn']} (남은 실행: {max_concurrent - sem._value})")
-            time.sleep(0.2)
+            await asyncio.sleep(0.2)
         
             return method_meta
     
     async def _analyze_all(self, methods, llm, schema, max_concurrent=settings.MAX_CONCURRENT):
         sem = asyncio.Semaphore(max_concurrent)
         tasks = [self._analyze(llm=llm, schema=schema, method_meta=m, sem=sem, max_concurrent=max_concurrent, idx=idx, total=len(methods)) for idx, m in enumerate(methods)]
-        return await asyncio.gather(*tasks)
+        return await self._gather_with_progress(stage=PipelineStage.METHOD, tasks=tasks)
     
 def is_getter_setter(method_fqn: str, meta: dict) -> bool:
     name = method_fqn.split('(')[0].split('.')[-1]  # 메서드명
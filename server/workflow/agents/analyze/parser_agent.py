@@ -5,19 +5,36 @@
 """
 
 import os
+import time
+import shutil
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Dict, List, Optional
 from server.workflow.agents.base.base_utility_agent import BaseUtilityAgent, AgentState
 from server.db.dao.entry_point_list_dao import insert_entry_points_bulk, delete_entry_points_by_project_and_date
 from server.db.schema import EntryPointCreate
 from server.db.database import run_with_db_session
-from server.utils.constants import AgentType, AgentResultGroupKey, IndexInputType, DirInfo
+from server.workflow.state import set_project_stage_progress
+from server.utils.constants import AgentType, AgentResultGroupKey, IndexInputType, DirInfo, PipelineStage, ParserBackend
 from server.utils.file_utils import load_json
 from server.utils.config import settings
+from server.utils.metrics_utils import PARSER_DURATION, PARSER_WORKER_FALLBACKS, PARSER_CACHE_FILES, PARSER_FILES, PARSER_IDLE_TIMEOUTS
+from server.utils.parser_worker_utils import ParserWorkerError, ParserWorkerIdleTimeoutError, ParserWorkerUnavailableError, get_parser_worker
+from server.utils.parser_shard_utils import ParserShard, plan_parser_shards, merge_shard_outputs, remove_shard_outputs
+from server.utils.parser_bundle_utils import remove_parser_bundle
+from server.utils.parser_progress_utils import ParserProgress, count_java_files
+from server.utils.parser_cache_utils import ParserCache, get_parser_version, build_parser_fingerprint, hash_source_files, split_output_by_source, rebase_entries, copy_source_subset, assemble_parser_output
+from server.utils.javalang_parser_utils import get_javalang_parser_version, run_javalang_parser
+
+# 파서 종료/진행 상황 확인 주기 (초)
+_PARSER_POLL_INTERVAL = 1.0
 
 class ParserAgent(BaseUtilityAgent):
     def __init__(self, session_id: str = None, project_id: str = None):
         super().__init__(role=AgentType.PARSER, session_id=session_id, project_id=project_id)
+        self._parser_progress: Optional[ParserProgress] = None
         
     def _run_internal(self, state: AgentState) -> AgentState:
         agent_state = state["autodiagenti_state"]
@@ -39,9 +56,35 @@ class ParserAgent(BaseUtilityAgent):
         exclude_packages = filter_options.get("exclude_packages", None)
         
         output_dir = os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id)
+        project_output_dir = os.path.join(output_dir, project_name)
+        
+        # 이전 분석의 번들이 새 산출물 대신 읽히지 않도록 삭제
+        remove_parser_bundle(project_output_dir)
+        
+        # 파서 진행 상황 (파서 출력으로 파싱/오류 파일 수를 집계하여 단계별 진행 상태에 반영)
+        self._parser_progress = ParserProgress(total=count_java_files(project_path) if os.path.isdir(project_path) else 0)
+        
+        # 증분 파싱 (캐시에 없는 파일만 파싱, 캐시 적중 파일이 없으면 None - 전체 파싱)
+        cache, sources = None, {}
+        result: Optional[bool] = None
+        if settings.JAVA_PARSER_CACHE_ENABLED and os.path.isdir(project_path):
+            cache = ParserCache(DirInfo.PARSER_CACHE_DIR, fingerprint=build_parser_fingerprint(self._parser_version(), include_method_text, exclude_packages, custom_annotations))
+            sources = hash_source_files(project_path)
+            result = self._run_parser_incremental(cache=cache, sources=sources, project_path=project_path, output_dir=output_dir, project_output_dir=project_output_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations)
+        
+        if result is None:
+            # Parser 호출 (멀티 모듈 프로젝트는 소스 루트 단위로 병렬 파싱 후 병합 - javalang 백엔드는 파일 단위로 병렬 파싱하므로 제외)
+            shards = plan_parser_shards(project_path) if settings.JAVA_PARSER_SHARDING_ENABLED and settings.JAVA_PARSER_BACKEND != ParserBackend.JAVALANG else []
+            if shards:
+                result = self._run_parser_shards(shards=shards, output_dir=output_dir, merged_dir=project_output_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations)
+            else:
+                result = self._run_parser(source_dir=project_path, output_dir=output_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations, bundle=settings.PARSER_BUNDLE_ENABLED)
+            
+            # 전체 파싱 결과를 파일별로 캐시
+            if result and cache is not None:
+                self._store_parser_cache(cache=cache, sources=sources, project_path=project_path, project_output_dir=project_output_dir)
         
-        # Parser 호출
-        result: bool = self._run_parser_jar(source_dir=project_path, output_dir=output_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations)
+        self._finish_parser_progress(success=bool(result))
         
         # Entry Point 저장
         if result:
@@ -49,7 +92,7 @@ class ParserAgent(BaseUtilityAgent):
         
         parser_result = {
             "input_type": IndexInputType.PARSER,
-            "output_dir": os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name),
+            "output_dir": project_output_dir,
             "success": result
         }
         
@@ -60,23 +103,211 @@ class ParserAgent(BaseUtilityAgent):
         
         return self.wrap_multiple_sources(result)
     
+    def _run_parser_incremental(self, cache: ParserCache, sources: Dict[str, str], project_path: str, output_dir: str, project_output_dir: str, include_method_text: bool = True, exclude_packages: str = "", custom_annotations: str = "") -> Optional[bool]:
+        """
+        변경된 파일만 파싱하고 나머지 파일은 캐시 결과로 전체 산출물을 구성한다.
+        (변경 파일은 하위 디렉토리 구조를 유지한 임시 소스 디렉토리로 복사하여 파싱)
+
+        Args:
+            cache (ParserCache): 파서 캐시 (파서 버전 + 분석 옵션 기준)
+            sources (Dict[str, str]): 소스 파일 상대 경로 → sha256
+            output_dir (str): 파서 출력 루트 (임시 산출물은 하위 .incremental 디렉토리에 저장)
+            project_output_dir (str): 산출물 디렉토리 (전체 파싱 시 산출물 위치와 동일)
+        Returns:
+            Optional[bool]: 성공 여부 (캐시 적중 파일이 없거나 산출물을 파일별로 분리할 수 없으면 None - 전체 파싱)
+        """
+        entries = cache.lookup(sources, project_path=project_path)
+        changed = sorted(set(sources) - set(entries))
+        PARSER_CACHE_FILES.inc(len(entries), result="hit")
+        PARSER_CACHE_FILES.inc(len(changed), result="miss")
+        if not entries:
+            return None
+        self.logger.info(f"♻️ JavaParser 증분 파싱: 전체 {len(sources)}개 중 변경 {len(changed)}개 파일 파싱")
+        self._parser_progress = ParserProgress(total=len(changed))
+
+        started = time.perf_counter()
+        work_dir = os.path.join(output_dir, ".incremental")
+        shutil.rmtree(work_dir, ignore_errors=True)
+        try:
+            if changed:
+                # 파서는 --output-dir 하위에 소스 디렉토리명으로 산출물을 생성하므로 프로젝트 디렉토리명 유지
+                source_dir = copy_source_subset(project_path, changed, os.path.join(work_dir, "src", os.path.basename(project_path)))
+                parsed_dir = os.path.join(work_dir, "out")
+                if not self._run_parser(source_dir=source_dir, output_dir=parsed_dir, include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations):
+                    return False
+
+                nested_dir = os.path.join(parsed_dir, os.path.basename(source_dir))
+                parsed = split_output_by_source(nested_dir if os.path.isdir(nested_dir) else parsed_dir, changed, source_dir=source_dir)
+                if parsed is None:
+                    self.logger.warning("⚠️ 변경 파일 산출물을 파일별로 분리할 수 없어 전체 파싱합니다.")
+                    return None
+                parsed = rebase_entries(parsed, source_dir=source_dir, project_path=project_path)
+                cache.store(sources, parsed, project_path=project_path)
+                entries.update(parsed)
+
+            shutil.rmtree(project_output_dir, ignore_errors=True)
+            report = assemble_parser_output(entries, project_output_dir, bundle=settings.PARSER_BUNDLE_ENABLED)
+            self.logger.info(f"✅ JavaParser 증분 파싱 완료 ({time.perf_counter() - started:.2f}초): {report}")
+            return True
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def _store_parser_cache(self, cache: ParserCache, sources: Dict[str, str], project_path: str, project_output_dir: str) -> None:
+        try:
+            entries = split_output_by_source(project_output_dir, sources.keys(), source_dir=project_path)
+            if entries is None:
+                self.logger.warning("⚠️ 파서 산출물을 파일별로 분리할 수 없어 캐시하지 않습니다.")
+                return
+            cache.store(sources, entries, project_path=project_path)
+        except Exception as e:
+            # 캐시 저장 실패는 분석 결과에 영향 없음
+            self.logger.warning(f"⚠️ 파서 캐시 저장 실패: {e}")
+
+    def _run_parser_shards(self, shards: List[ParserShard], output_dir: str, merged_dir: str, include_method_text: bool = True, exclude_packages: str = "", custom_annotations: str = "") -> bool:
+        """
+        모듈(샤드)별 파서를 병렬 실행하고 산출물을 merged_dir로 병합한다.
+        (샤드 중 하나라도 실패하면 산출물을 병합하지 않고 실패 처리)
+
+        Args:
+            shards (List[ParserShard]): 샤드 목록
+            output_dir (str): 파서 출력 루트 (샤드 산출물은 하위 .shards 디렉토리에 임시 저장)
+            merged_dir (str): 병합 산출물 디렉토리 (단일 파싱 시 산출물 위치와 동일)
+        Returns:
+            bool: 성공 여부
+        """
+        shard_root = os.path.join(output_dir, ".shards")
+        shard_output_dirs = {shard.name: os.path.join(shard_root, shard.name) for shard in shards}
+        max_workers = min(settings.JAVA_PARSER_SHARD_WORKERS or os.cpu_count() or 1, len(shards))
+        self.logger.info(f"🚀 JavaParser 샤드 병렬 실행: 샤드 {len(shards)}개, 동시 실행 {max_workers}개")
+
+        started = time.perf_counter()
+        remove_shard_outputs(shard_root)
+        try:
+            # 샤드는 각각 별도 JVM으로 실행 (상주 워커는 요청을 순차 처리하므로 사용하지 않음)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parser-shard") as executor:
+                results = list(executor.map(
+                    lambda shard: self._run_parser_jar(source_dir=shard.source_dir, output_dir=shard_output_dirs[shard.name], include_method_text=include_method_text, exclude_packages=exclude_packages, custom_annotations=custom_annotations, use_worker=False),
+                    shards
+                ))
+            failed = [shard.relative_path for shard, success in zip(shards, results) if not success]
+            if failed:
+                self.logger.error(f"❌ JavaParser 샤드 실행 실패: {failed}")
+                return False
+
+            shutil.rmtree(merged_dir, ignore_errors=True)
+            merge_shard_outputs(shards=shards, shard_output_dirs=shard_output_dirs, merged_dir=merged_dir, bundle=settings.PARSER_BUNDLE_ENABLED)
+            self.logger.info(f"✅ JavaParser 샤드 실행 및 병합 완료 ({time.perf_counter() - started:.2f}초)")
+            return True
+        except Exception as e:
+            self.logger.exception(f"⚠️ JavaParser 샤드 산출물 병합 오류: {e}")
+            return False
+        finally:
+            remove_shard_outputs(shard_root)
+
+    def _parser_version(self) -> str:
+        # 파서 캐시 핑거프린트용 파서 버전 (백엔드별 산출물이 다를 수 있으므로 백엔드 구분)
+        if settings.JAVA_PARSER_BACKEND == ParserBackend.JAVALANG:
+            return get_javalang_parser_version()
+        return get_parser_version(settings.JAVA_PARSER_JAR_PATH)
+
+    def _run_parser(self, bundle: bool = False, **kwargs) -> bool:
+        """
+        설정된 백엔드(settings.JAVA_PARSER_BACKEND)로 파서 실행 (인자는 _run_parser_jar와 동일)
+        - bundle: 산출물 번들 기록 여부 (javalang 백엔드만 기록, JAR 산출물은 파일 단위로 읽음)
+        """
+        if settings.JAVA_PARSER_BACKEND == ParserBackend.JAVALANG:
+            return self._run_parser_javalang(bundle=bundle, **kwargs)
+        return self._run_parser_jar(**kwargs)
+
+    def _run_parser_javalang(self,
+        source_dir: str,
+        output_dir: str,
+        include_method_text: bool = True,
+        exclude_packages: str = "",
+        custom_annotations: str = "",
+        timeout: int = None,
+        use_worker: bool = True,
+        bundle: bool = False
+    ) -> bool:
+        """
+        javalang 파서를 실행하여 JAR과 동일한 형식의 call tree 및 메서드 정보를 추출한다.
+        (파일 수가 settings.JAVA_PARSER_JAVALANG_MIN_POOL_FILES 이상이면 프로세스 풀에서 병렬 파싱)
+
+        Args:
+            source_dir (str): 분석 대상 Java 소스 루트 경로
+            include_method_text (bool): 메서드 본문 포함 여부
+            exclude_packages (str): 제외할 패키지 접두어 (쉼표 구분)
+            custom_annotations (str): 엔트리 포인트 구분용 사용자 정의 어노테이션 (쉼표 구분)
+            timeout (int): 미사용 (파싱 결과 없이 settings.JAVA_PARSER_IDLE_TIMEOUT 경과 시 실패 처리)
+            use_worker (bool): 미사용 (JAR 백엔드와 인자 호환)
+            bundle (bool): 클래스 단위 산출물 번들 기록 여부
+        Returns:
+            bool: 성공 여부 (True: 성공, False: 실패)
+        """
+        if not os.path.isdir(source_dir):
+            self.logger.error(f"❌ 소스 디렉토리가 존재하지 않습니다: {source_dir}")
+            return False
+
+        os.makedirs(output_dir, exist_ok=True)
+        progress = self._parser_progress or ParserProgress()
+        file_count = count_java_files(source_dir)
+        workers = settings.JAVA_PARSER_JAVALANG_WORKERS or os.cpu_count() or 1
+        if file_count < settings.JAVA_PARSER_JAVALANG_MIN_POOL_FILES:
+            workers = 1
+
+        def _on_file(unit: Dict) -> None:
+            progress.advance(error=bool(unit["error"]))
+            self._report_parser_progress(progress)
+
+        started = time.perf_counter()
+        parser_result = "error"
+        try:
+            self.logger.info(f"🚀 javalang 파서 실행 중... {source_dir} (파일 {file_count}개, 프로세스 {workers}개)")
+            report = run_javalang_parser(
+                source_dir=source_dir,
+                output_dir=output_dir,
+                include_method_text=include_method_text,
+                exclude_packages=exclude_packages,
+                custom_annotations=custom_annotations,
+                workers=workers,
+                on_file=_on_file,
+                idle_timeout=settings.JAVA_PARSER_IDLE_TIMEOUT,
+                bundle=bundle
+            )
+            self.logger.info(f"✅ javalang 파서 실행 완료: {report}")
+            parser_result = "success"
+            return True
+        except TimeoutError as e:
+            parser_result = "timeout"
+            PARSER_IDLE_TIMEOUTS.inc()
+            self.logger.error(f"⏰ javalang 파서 실행 시간 초과: {e}")
+        except Exception as e:
+            self.logger.exception(f"⚠️ javalang 파서 실행 오류: {e}")
+        finally:
+            PARSER_DURATION.observe(time.perf_counter() - started, backend=ParserBackend.JAVALANG, result=parser_result)
+
+        return False
+
     def _run_parser_jar(self,
         source_dir: str,
         output_dir: str,
         include_method_text: bool = True,
         exclude_packages: str = "", # ""java.,jakarta.,org.springframework.",
         custom_annotations: str = '',
-        timeout: int = 60
+        timeout: int = None,
+        use_worker: bool = True
     ) -> bool:
         """
-        JavaParser 분석기를 subprocess로 실행하여 call tree 및 메서드 정보를 추출한다.
+        JavaParser 분석기를 실행하여 call tree 및 메서드 정보를 추출한다.
+        (상주 워커 사용 설정 시 워커에서 실행하고, 워커를 사용할 수 없으면 subprocess로 실행)
 
         Args:
             source_dir (str): 분석 대상 Java 소스 루트 경로
             include_method_text (bool): 메서드 본문 포함 여부
             exclude_packages (str): 제외할 패키지 접두어 (쉼표 구분)
             custom_annotations (str): 엔트리 포인트 구분용 사용자 정의 어노테이션 (쉼표 구분)
-            timeout (int): 프로세스 타임아웃 (초)
+            timeout (int): 실행 타임아웃 (초, 기본값 settings.JAVA_PARSER_TIMEOUT)
+            use_worker (bool): 상주 워커 사용 여부 (settings.JAVA_PARSER_WORKER_ENABLED인 경우)
         Returns:
             bool: 성공 여부 (True: 성공, False: 실패)
         """
@@ -93,23 +324,31 @@ class ParserAgent(BaseUtilityAgent):
 
         os.makedirs(output_dir, exist_ok=True)
 
-        command = [
-            "java", 
-            "-Dfile.encoding=UTF-8",
-            "-jar", 
-            jar_path,
+        if timeout is None:
+            timeout = settings.JAVA_PARSER_TIMEOUT
+
+        args = [
             f"--source-dir={source_dir}",
             f"--output-dir={output_dir}",
             f"--include-method-text={str(include_method_text).lower()}"
         ]
 
         if exclude_packages:
-            command.append(f"--exclude-packages={exclude_packages}")
+            args.append(f"--exclude-packages={exclude_packages}")
         if custom_annotations:
-            command.append(f"--custom-annotations={custom_annotations}")
-            
+            args.append(f"--custom-annotations={custom_annotations}")
+        
+        if use_worker and settings.JAVA_PARSER_WORKER_ENABLED:
+            worker_result = self._run_parser_worker(args=args, timeout=timeout)
+            if worker_result is not None:
+                return worker_result
+            PARSER_WORKER_FALLBACKS.inc()
+
+        command = ["java", "-Dfile.encoding=UTF-8", "-jar", jar_path, *args]
         self.logger.info(f"📢📢📢 command: [{command}]")
 
+        started = time.perf_counter()
+        parser_result = "error"
         try:
             env = os.environ.copy()
             env["LANG"] = "ko_KR.UTF-8"
@@ -118,42 +357,136 @@ class ParserAgent(BaseUtilityAgent):
             self.logger.info(f"🚀 JavaParser 실행 중... \n{' '.join(command)}")
             self._run_with_live_log(command, timeout=timeout, env=env)
             self.logger.info("✅ JavaParser 실행 완료")
+            parser_result = "success"
             return True
         except subprocess.CalledProcessError as e:
             self.logger.error(f"❌ JavaParser 실행 실패 (exit code {e.returncode}): {e}")
         except subprocess.TimeoutExpired:
+            parser_result = "timeout"
             self.logger.error("⏰ JavaParser 실행 시간 초과")
         except Exception as e:
             self.logger.exception(f"⚠️ 예기치 못한 오류 발생: {e}")
+        finally:
+            PARSER_DURATION.observe(time.perf_counter() - started, backend="subprocess", result=parser_result)
 
         return False
     
-    def _run_with_live_log(self, command, timeout=None, env=None):
-        proc = None
-        
+    def _run_parser_worker(self, args: List[str], timeout: int) -> Optional[bool]:
+        """
+        상주 워커에서 파서 실행
+        - 워커 출력은 subprocess 실행과 같이 debug 로그로 기록하고 진행 상황에 반영
+        - settings.JAVA_PARSER_IDLE_TIMEOUT: 파서 출력이 없는 상태가 지속되면 정지(hang)로 보고 워커 종료
+
+        Returns:
+            Optional[bool]: 성공 여부 (워커를 사용할 수 없으면 None - subprocess 실행으로 대체)
+        """
+        progress = self._parser_progress or ParserProgress()
+
+        def _on_output(line: str) -> None:
+            self.logger.debug(line)
+            progress.feed(line, source="worker")
+            self._report_parser_progress(progress)
+
+        started = time.perf_counter()
+        parser_result = "error"
         try:
-            proc = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                bufsize=1,
-                env=env
-            )
+            self.logger.info(f"🚀 JavaParser 워커 실행 중... {args}")
+            self._report_parser_progress(progress)
+            elapsed = get_parser_worker().parse(args=args, timeout=timeout or None, on_output=_on_output, idle_timeout=settings.JAVA_PARSER_IDLE_TIMEOUT)
+            self.logger.info(f"✅ JavaParser 워커 실행 완료 ({elapsed:.2f}초)")
+            parser_result = "success"
+            return True
+        except ParserWorkerUnavailableError as err:
+            parser_result = "unavailable"
+            self.logger.warning(f"⚠️ JavaParser 워커를 사용할 수 없어 subprocess로 실행합니다: {err}")
+            return None
+        except ParserWorkerError as err:
+            self.logger.error(f"❌ JavaParser 워커 실행 실패: {err}")
+        except ParserWorkerIdleTimeoutError:
+            parser_result = "timeout"
+            PARSER_IDLE_TIMEOUTS.inc()
+            self.logger.error(f"⏰ JavaParser 워커 출력 없음 ({settings.JAVA_PARSER_IDLE_TIMEOUT}초, {progress.snapshot()})")
+        except TimeoutError:
+            parser_result = "timeout"
+            self.logger.error("⏰ JavaParser 워커 실행 시간 초과")
+        finally:
+            PARSER_DURATION.observe(time.perf_counter() - started, backend="worker", result=parser_result)
 
-            for line in proc.stdout:
-                print(line, end="")   # 실시간 로그 출력
+        return False
+    
+    def _run_with_live_log(self, command, timeout=None, env=None):
+        """
+        파서 subprocess 실행 (출력을 실시간 출력하면서 진행 상황에 반영)
+        - timeout: 전체 실행 시간 상한 (0 또는 None이면 미사용)
+        - settings.JAVA_PARSER_IDLE_TIMEOUT: 파서 출력이 없는 상태가 지속되면 정지(hang)로 보고 종료
+        """
+        progress = self._parser_progress or ParserProgress()
+        idle_timeout = settings.JAVA_PARSER_IDLE_TIMEOUT
+        last_output = [time.monotonic()]
 
-            proc.wait(timeout=timeout)
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            env=env
+        )
 
-            if proc.returncode != 0:
-                raise subprocess.CalledProcessError(proc.returncode, command)
+        def _read_output():
+            for line in proc.stdout:
+                self.logger.debug(line.rstrip("\n"))   # 진행 상황은 ParserProgress로 집계, 원본 출력은 debug 로그로만 기록
+                last_output[0] = time.monotonic()
+                progress.feed(line, source=proc.pid)
 
+        reader = threading.Thread(target=_read_output, name="parser-stdout", daemon=True)
+        reader.start()
+        self._report_parser_progress(progress)
+        started = time.monotonic()
+        try:
+            while True:
+                try:
+                    proc.wait(timeout=_PARSER_POLL_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    self._report_parser_progress(progress)
+                    now = time.monotonic()
+                    if timeout and now - started > timeout:
+                        self.logger.error(f"\n[ERROR] Timeout after {timeout} seconds")
+                        raise subprocess.TimeoutExpired(command, timeout)
+                    if idle_timeout > 0 and now - last_output[0] > idle_timeout:
+                        PARSER_IDLE_TIMEOUTS.inc()
+                        self.logger.error(f"\n[ERROR] No parser output for {idle_timeout} seconds ({progress.snapshot()})")
+                        raise subprocess.TimeoutExpired(command, idle_timeout)
         except subprocess.TimeoutExpired:
             proc.kill()
-            self.logger.error(f"\n[ERROR] Timeout after {timeout} seconds")
+            proc.wait()
             raise
+        finally:
+            reader.join(timeout=5)
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, command)
+
+    def _report_parser_progress(self, progress: ParserProgress) -> None:
+        snapshot = progress.snapshot()
+        set_project_stage_progress(project_id=self.project_id, stage=PipelineStage.PARSER, done=snapshot["parsed"], total=snapshot["total"], failed=snapshot["errors"])
+
+    def _finish_parser_progress(self, success: bool) -> None:
+        """
+        파서 단계 종료 시 진행 상황 확정 및 파일 수 메트릭 기록
+        (파일 단위 로그를 출력하지 않는 파서도 성공 시 전체 완료로 기록)
+        """
+        progress, self._parser_progress = self._parser_progress, None
+        if progress is None:
+            return
+        snapshot = progress.snapshot()
+        PARSER_FILES.inc(snapshot["parsed"], result="parsed")
+        PARSER_FILES.inc(snapshot["errors"], result="error")
+        done = snapshot["total"] if success else snapshot["parsed"]
+        set_project_stage_progress(project_id=self.project_id, stage=PipelineStage.PARSER, done=done, total=snapshot["total"], failed=snapshot["errors"])
+        self.logger.info(f"📊 JavaParser 진행 상황: {snapshot}")
         
     def _save_entry_point_to_db(self, project_id: str, project_name: str, session_id: str, analyzed_date: str, analyzed_at: str, file_path: str):
         try:
@@ -3,15 +3,11 @@
 """
 재귀적 호출 트리 분석 에이전트
 """
-import os
 from datetime import datetime
 from typing import List, Any, Dict, Set
-from langchain.schema import Document
 from server.workflow.agents.base.base_utility_agent import BaseUtilityAgent, AgentState
-from server.utils.constants import AgentType, IndexInputType, RagSourceType, DirInfo, AgentResultGroupKey
-from server.utils.document_retrieval_utils import load_documents_by_source_type
-from server.utils.config import settings
-from server.utils.file_utils import load_json
+from server.workflow.project_context import ProjectArtifactContext, get_project_context
+from server.utils.constants import AgentType, IndexInputType, AgentResultGroupKey
 
 class RecursiveCallTreeAgent(BaseUtilityAgent):
     def __init__(self, session_id: str = None, project_id: str = None):
@@ -22,25 +18,16 @@ class RecursiveCallTreeAgent(BaseUtilityAgent):
         project_name = state["autodiagenti_state"].get("project_name", "")
         max_depth = state["autodiagenti_state"].get("max_depth", -1)
         
-        # 1. PARSER 문서 전체 조회 (project_id 기준)
-        parser_documents = load_documents_by_source_type(project_id=project_id, source_type=RagSourceType.PARSER)
+        # 1. 프로젝트 산출물 컨텍스트 (PARSER 문서, EntryPoint, 메서드 FQN 목록 1회 로드)
+        context = get_project_context(project_id=project_id, project_name=project_name)
         
         # 2. EntryPoint 기준 반복 처리
-        output_dir = os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name)
-        entry_point_path = os.path.join(output_dir, settings.ENTRY_POINT_FILE_NAME)
-        entry_point_list = load_json(entry_point_path)
-        
-        # 3.메서드 FQN 목록 추출
-        method_fqn_path = os.path.join(output_dir, settings.ALL_METHODS_FILE_NAME)
-        valid_method_fqns: set[str] = set(load_json(method_fqn_path))
-        
         call_tree_list = []
-        for entry_point in entry_point_list:
-            # 4.Call Tree 구조 분석
+        for entry_point in context.entry_points:
+            # 3.Call Tree 구조 분석
             call_tree = self._prepare_recursive_calltree_input(
                 entry_point=entry_point,
-                parser_documents=parser_documents,
-                valid_method_fqns=valid_method_fqns,
+                context=context,
                 depth_limit=max_depth
             )
             call_tree_list.append(call_tree)
@@ -51,57 +38,40 @@ class RecursiveCallTreeAgent(BaseUtilityAgent):
             "call_tree_info": call_tree_list
         }
         
+        # 그래프 상태에는 산출물 핸들만 전달
+        call_tree_handle = self.store_artifact(AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT, call_tree_result)
+        
         result = {
-            AgentResultGroupKey.CURRENT_SOURCE_DATA: call_tree_result,
-            AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT: call_tree_result
+            AgentResultGroupKey.CURRENT_SOURCE_DATA: call_tree_handle,
+            AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT: call_tree_handle
         }
         
         return self.wrap_multiple_sources(result)
         
-    def _prepare_recursive_calltree_input(self, entry_point: str, parser_documents: List[Document], valid_method_fqns: set[str], depth_limit: int = 3) -> Dict[str, Any]:
+    def _prepare_recursive_calltree_input(self, entry_point: str, context: ProjectArtifactContext, depth_limit: int = 3) -> Dict[str, Any]:
         """
         entry_point를 시작점으로 callEdges 정보를 분석해서 하나의 calltree 데이터를 만드는 함수
         
         Args:
             entry_point (str): 분석 대상 메서드 (진입점)
-            parser_documents (List[Document]): Parser 문서 리스트
+            context (ProjectArtifactContext): 프로젝트 산출물 컨텍스트 (병합된 callEdges, methodMetaMap 인덱스)
             depth_limit (int): 최대 호출 깊이 제한 (기본값: 3)
             
         Returns:
             Dict[str, Any]: 재귀적 호출 트리 데이터
         """
         
-        # 1. parser_documents에서 모든 callEdges, methodMetaMap 수집 (merge)
-        all_call_edges = []
-        all_method_meta_map = {}
-        project_info = {}
-        
-        for doc in parser_documents:
-            meta = doc.metadata
-            
-            # callEdges 수집
-            call_edges = meta.get("call_edges", [])
-            all_call_edges.extend(call_edges)
-            
-            # methodMetaMap 수집
-            method_meta_map = meta.get("method_meta_map", {})
-            all_method_meta_map.update(method_meta_map)
-            
-            # 프로젝트 정보 수집 (첫 번째 문서 기준)
-            if not project_info:
-                project_info = {
-                    "project_name": meta.get("project_name", "UnknownProject"),
-                    "file_path": meta.get("file_path", ""),
-                    "analyzed_at": datetime.now().isoformat()
-                }
-                
-        caller_set = set(edge['caller'] for edge in all_call_edges)
+        # 1. 병합된 callEdges, methodMetaMap 인덱스
+        valid_method_fqns = context.valid_method_fqns
+        all_method_meta_map = context.method_meta_map
+        caller_set = context.caller_set
+        project_info = {**context.project_info, "analyzed_at": datetime.now().isoformat()}
             
         # 2. entry_point 기준으로 DFS → call_tree 생성
         call_tree = self._build_call_tree_recursive(
             method_name=entry_point, 
             valid_method_fqns=valid_method_fqns,
-            call_edges=all_call_edges, 
+            context=context, 
             caller_set=caller_set,
             method_meta_map=all_method_meta_map, 
             depth_limit=depth_limit, 
@@ -136,7 +106,7 @@ class RecursiveCallTreeAgent(BaseUtilityAgent):
         self,
         method_name: str, 
         valid_method_fqns: set[str],
-        call_edges: List[Dict], 
+        context: ProjectArtifactContext, 
         caller_set: Set,
         method_meta_map: Dict,
         depth_limit: int,
@@ -148,7 +118,7 @@ class RecursiveCallTreeAgent(BaseUtilityAgent):
         
         Args:
             method_name (str): 현재 메서드명
-            call_edges (List[Dict]): 모든 호출 엣지 정보
+            context (ProjectArtifactContext): caller → callee 인덱스를 제공하는 프로젝트 컨텍스트
             method_meta_map (Dict): 메서드 메타 정보 맵
             depth_limit (int): 최대 깊이 제한
             visited (set): 방문한 메서드 집합 (순환 참조 방지)
@@ -176,35 +146,32 @@ class RecursiveCallTreeAgent(BaseUtilityAgent):
         
         # 현재 메서드의 호출 대상들 찾기
         calls = []
-        for edge in call_edges:
-            if edge.get("caller") == method_name:
-                callee = edge.get("callee")
-                
-                # 유효하지 않은 callee면 무시
-                if callee not in valid_method_fqns:
-                    self.logger.info(f"📢 invalid callee: [{callee}]")
+        for callee in context.callees_of(method_name):
+            # 유효하지 않은 callee면 무시
+            if callee not in valid_method_fqns:
+                self.logger.info(f"📢 invalid callee: [{callee}]")
+                continue
+            
+            if callee not in caller_set:
+                # getter/setter 메서드는 제외
+                callee_meta = method_meta_map.get(callee, {})
+                if is_getter_setter(callee, callee_meta):
+                    self.logger.info(f"📢 getter/setter 제외: [{callee}]")
                     continue
-                
-                if callee not in caller_set:
-                    # getter/setter 메서드는 제외
-                    callee_meta = method_meta_map.get(callee, {})
-                    if is_getter_setter(callee, callee_meta):
-                        self.logger.info(f"📢 getter/setter 제외: [{callee}]")
-                        continue
-                
-                if callee:
-                    # 재귀적으로 하위 호출 트리 구성
-                    sub_tree = self._build_call_tree_recursive(
-                        method_name=callee, 
-                        valid_method_fqns=valid_method_fqns,
-                        call_edges=call_edges,
-                        caller_set=caller_set,
-                        method_meta_map=method_meta_map, 
-                        depth_limit=depth_limit, 
-                        visited=visited.copy(), 
-                        current_depth=current_depth + 1
-                    )
-                    calls.append(sub_tree)
+            
+            if callee:
+                # 재귀적으로 하위 호출 트리 구성
+                sub_tree = self._build_call_tree_recursive(
+                    method_name=callee, 
+                    valid_method_fqns=valid_method_fqns,
+                    context=context,
+                    caller_set=caller_set,
+                    method_meta_map=method_meta_map, 
+                    depth_limit=depth_limit, 
+                    visited=visited.copy(), 
+                    current_depth=current_depth + 1
+                )
+                calls.append(sub_tree)
         
         return {
             "method_fqn": method_name,
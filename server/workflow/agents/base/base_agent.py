@@ -1,14 +1,19 @@
 # server/workflow/agents/base/base_agent.py
 
+import time
 import asyncio
 import traceback
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, TypedDict
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+from typing import Awaitable, Dict, List, Any, TypedDict
+from openai import LengthFinishReasonError
+from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_not_exception_type, RetryCallState
 from server.workflow.state import AutoDiagentiAnalysisState
 from server.utils.constants import AgentType, AgentRunType
 from server.utils.config import settings
-from server.workflow.state import set_project_status
+from server.workflow.state import set_project_status, set_project_stage_progress
+from server.workflow.job_queue import AnalysisCancelledError, raise_if_cancelled, run_cancellable
+from server.workflow.artifact_store import save_artifact
+from server.utils.metrics_utils import AGENT_DURATION, LLM_REQUEST_DURATION, LLM_RETRIES, LLM_TIMEOUTS, LLM_LENGTH_LIMIT_SKIPS, LLMUsageCallbackHandler, get_llm_deployment
 from server.utils.logger import get_logger
 
 class AgentState(TypedDict):
@@ -18,6 +23,13 @@ class AgentState(TypedDict):
     messages: List[Any]  # LLM 기반 또는 기타 입력 메시지
     response: str
 
+# 진행 상태를 저장하지 않는 에이전트 (RAG 인덱서)
+_STATUS_EXCLUDED_ROLES = (AgentType.RAG_INDEXER, AgentType.CALL_TREE_INDEXER, AgentType.CODE_ANALYSIS_INDEXER)
+
+def _record_llm_retry(retry_state: RetryCallState) -> None:
+    # _call_llm_with_timeout(self, llm, ...) 재시도 대기 전 호출
+    LLM_RETRIES.inc(deployment=get_llm_deployment(retry_state.args[1]))
+
 class BaseAgent(ABC):
     """
     모든 Agent의 공통 추상 클래스.
@@ -30,28 +42,39 @@ class BaseAgent(ABC):
         self.project_id = project_id
         self.logger = get_logger(self.__class__.__name__)  # 클래스 이름 기준으로 로거 생성
     
-    def run(self, state: AutoDiagentiAnalysisState) -> AutoDiagentiAnalysisState:
+    async def run(self, state: AutoDiagentiAnalysisState) -> AutoDiagentiAnalysisState:
         result = {}
+        run_result = "success"
+        started = time.perf_counter()
         
         try:
             # 상태저장 (RAG 제외)
-            if self.role != AgentType.RAG_INDEXER:
+            if self.role not in _STATUS_EXCLUDED_ROLES:
                 set_project_status(project_id=self.project_id, role=self.role, runStatus=AgentRunType.START)
             
             self.logger.info(f"***** 수행 Agent: {self.role} *****")
+            # 취소된 작업은 다음 에이전트를 실행하지 않고 종료
+            raise_if_cancelled(self.project_id)
             internal_state = self._extract_internal_state(state)
-            result = self._run_internal(internal_state)
+            if asyncio.iscoroutinefunction(self._run_internal):
+                result = await self._run_internal(internal_state)
+            else:
+                # 블로킹 작업(파서 프로세스, FAISS 저장 등) 위주의 동기 에이전트는 스레드에서 실행하여 공유 이벤트 루프 점유 방지
+                result = await asyncio.to_thread(self._run_internal, internal_state)
         except Exception as err:
-            self.logger.error(f"❌ 에이전트 실행 중 예외 발생: {str(err)} - state: [{state}], role: [{self.role}], session_id: [{self.session_id}], project_id: [{self.project_id}]")
+            run_result = "cancelled" if isinstance(err, AnalysisCancelledError) else "error"
+            self.logger.error(f"❌ 에이전트 실행 중 예외 발생: {str(err)} - state keys: [{list(state.keys())}], role: [{self.role}], session_id: [{self.session_id}], project_id: [{self.project_id}]")
             self.logger.error(f"❌ Stacktrace:\n {traceback.format_exc()}")
             state["agent_error"] = True
             state["agent_error_message"] = str(err)    
+        finally:
+            AGENT_DURATION.observe(time.perf_counter() - started, agent=str(self.role), result=run_result)
         return self._update_state(state, result)
 
     @abstractmethod
     def _run_internal(self, state: AgentState) -> AgentState:
         """
-        Agent별 핵심 실행 로직을 구현하는 부분
+        Agent별 핵심 실행 로직을 구현하는 부분 (LLM 에이전트는 async def로 구현)
         """
         pass
 
@@ -59,7 +82,8 @@ class BaseAgent(ABC):
         """
         Graph용 상태(AutoDiagentiAnalysisState) → Agent 내부 상태(AgentState)로 변환
         """
-        self.logger.info(f'📢 _extract_internal_state: [{state}]')
+        # 상태 전체 출력 시 로그 크기가 프로젝트 크기에 비례하므로 키와 결과 핸들 목록만 출력
+        self.logger.info(f'📢 _extract_internal_state: keys={list(state.keys())}, agent_result={list((state.get("agent_result") or {}).keys())}')
         
         return {
             "autodiagenti_state": {**state}
@@ -67,30 +91,79 @@ class BaseAgent(ABC):
 
     def _update_state(self, original: AutoDiagentiAnalysisState, result: AgentState) -> AutoDiagentiAnalysisState:
         """
-        내부 처리 결과를 AutoDiagentiAnalysisState에 병합
+        내부 처리 결과를 AutoDiagentiAnalysisState 갱신 항목으로 변환
+        - 병렬 분기 노드가 같은 단계에서 상태를 갱신할 수 있도록 변경 항목만 반환 (agent_result는 상태 리듀서가 기존 결과와 병합)
         """
         
         # 상태저장 (RAG 제외)
-        if self.role != AgentType.RAG_INDEXER:
+        if self.role not in _STATUS_EXCLUDED_ROLES:
             set_project_status(project_id=self.project_id, role=self.role, runStatus=AgentRunType.END)
         
-        return {
-            **original,
-            "agent_result": {
-                **original.get("agent_result", {}),                         # 기존 결과 유지
-                **result.get("agent_state", {}).get("agent_result", {})     # 새로운 결과 추가
-            },
+        update = {
+            "agent_result": result.get("agent_state", {}).get("agent_result", {}),   # 새로운 결과
             "agent_role": self.role,    # 실행한 Agent의 role을 함께 기록
-            "prev_node": self.role      # 현재 실행 중인 노드/role 이름 (original 항목 값 업데이트)
+            "prev_node": self.role      # 현재 실행 중인 노드/role 이름
         }
+        if original.get("agent_error", False):
+            update["agent_error"] = True
+            update["agent_error_message"] = original.get("agent_error_message", "")
+        return update
     
     @retry(
         stop=stop_after_attempt(3),                     # 최대 3회 재시도
         wait=wait_fixed(2),                             # 실패 시 2초 대기 후 재시도
-        retry=retry_if_exception_type(Exception)        # 모든 예외에 대해 재시도
+        retry=retry_if_not_exception_type(AnalysisCancelledError),  # 작업 취소를 제외한 모든 예외에 대해 재시도
+        before_sleep=_record_llm_retry                              # 재시도 횟수 메트릭 기록
     )
     async def _call_llm_with_timeout(self, llm, schema, messages):
-        return await asyncio.wait_for(llm.with_structured_output(schema).ainvoke(messages), timeout=settings.LLM_TIMEOUT)
+        deployment = get_llm_deployment(llm)
+        usage = LLMUsageCallbackHandler()
+        call_result = "success"
+        started = time.perf_counter()
+        
+        try:
+            return await run_cancellable(llm.with_structured_output(schema).ainvoke(messages, config={"callbacks": [usage]}), project_id=self.project_id, timeout=settings.LLM_TIMEOUT)
+        except asyncio.TimeoutError:
+            call_result = "timeout"
+            LLM_TIMEOUTS.inc(deployment=deployment)
+            raise
+        except LengthFinishReasonError:
+            call_result = "length_limit"
+            LLM_LENGTH_LIMIT_SKIPS.inc(deployment=deployment)
+            raise
+        except AnalysisCancelledError:
+            call_result = "cancelled"
+            raise
+        except Exception:
+            call_result = "error"
+            raise
+        finally:
+            LLM_REQUEST_DURATION.observe(time.perf_counter() - started, deployment=deployment, result=call_result)
+            usage.observe(deployment)
+    
+    async def _gather_with_progress(self, stage: str, tasks: List[Awaitable[Any]]) -> List[Any]:
+        """
+        asyncio.gather와 동일하게 실행하면서 완료 건수를 단계별 진행 상태에 반영
+        """
+        total = len(tasks)
+        done = 0
+        set_project_stage_progress(project_id=self.project_id, stage=stage, done=0, total=total)
+
+        async def _track(task: Awaitable[Any]) -> Any:
+            nonlocal done
+            try:
+                return await task
+            finally:
+                done += 1
+                set_project_stage_progress(project_id=self.project_id, stage=stage, done=done, total=total)
+
+        return await asyncio.gather(*(_track(task) for task in tasks))
+    
+    def store_artifact(self, name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        단계 결과를 산출물 저장소에 저장하고 그래프 상태에 전달할 핸들(경로, 건수, 체크섬) 반환
+        """
+        return save_artifact(project_id=self.project_id, name=name, payload=payload)
     
     def wrap_agent_result(self, key: str, value: Dict[str, Any]) -> AgentState:
         return {
@@ -102,7 +175,7 @@ class BaseAgent(ABC):
         }
     
     def wrap_multiple_sources(self, values: Dict[str, Dict[str, Any]]) -> AgentState:
-        self.logger.info(f'📢📢 wrap_multiple_sources values: {values}')
+        self.logger.info(f'📢📢 wrap_multiple_sources keys: {list(values.keys())}')
         return {
             "agent_state": {
                 "agent_result": values
@@ -39,9 +39,9 @@ class BaseLLMAgent(BaseAgent):
         pass
     
     @abstractmethod
-    def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
+    async def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
         """
-        Agent별 실행 메서드.
+        Agent별 실행 메서드 (공유 이벤트 루프에서 실행).
         필요 시 self._run_simple_llm(state) 호출 가능.
         """
         pass
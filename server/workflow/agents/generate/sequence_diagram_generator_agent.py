@@ -4,21 +4,19 @@
 시퀀스 다이어그램 에이전트
 """
 
-import os
-import time
 import asyncio
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from langchain.schema import Document
 from langchain.schema import SystemMessage, HumanMessage
 from langchain.prompts import PromptTemplate
 from openai import LengthFinishReasonError
 from server.utils.config import settings, get_llm_with_custom
-from server.utils.constants import AgentType, AgentResultGroupKey, DirInfo, RagSourceType, IndexInputType, LLMModel
-from server.utils.document_retrieval_utils import load_call_tree_summary_doc, load_documents_by_source_type
-from server.utils.file_utils import load_json
+from server.utils.constants import AgentType, AgentResultGroupKey, IndexInputType, LLMModel, SequenceDiagramMode, DiagramValidationStatus, PipelineStage
+from server.utils.mermaid_utils import build_sequence_diagram, validate_sequence_diagram, repair_sequence_diagram, extract_display_name
 from server.workflow.agents.base.base_llm_agent import BaseLLMAgent, LLMAgentState
+from server.workflow.project_context import ProjectArtifactContext, get_project_context
 
 class DiagramLLMOutput(BaseModel):
     entry_point: str = Field(description="엔트리포인트(시작점)")
@@ -76,7 +74,7 @@ class SequenceDiagramGeneratorAgent(BaseLLMAgent):
     def _create_prompt(self, state: LLMAgentState) -> Optional[str]:
         pass
     
-    def get_prompt(self, entry_point: str, depth: int, call_tree: Dict, method_definitions: Dict, call_tree_summary_insight: str, call_tree_summary_reasoning: str) -> List:
+    def get_prompt(self, entry_point: str, depth: int, call_tree: Dict, method_definitions: Dict, call_tree_summary_insight: str, call_tree_summary_reasoning: str, draft_mermaid_code: str = "") -> List:
         # 프롬프트 템플릿을 위해 개별정의함
         messages = [SystemMessage(content=self.system_prompt)]
         
@@ -121,6 +119,7 @@ class SequenceDiagramGeneratorAgent(BaseLLMAgent):
                                             - 이는 Mermaid의 participant 선언과 일치해야 합니다.
                                         - 동일한 `class_name`은 participant로 중복 선언하지 마세요.
                                         - Mermaid 문법에 맞게 문법 오류 없이 시퀀스를 생성하세요.
+                                        - `draft_mermaid_code`가 주어지면 call_tree로부터 로컬에서 생성한 초안입니다. participant, 호출/리턴 화살표 구조는 유지하고, 누락되거나 어색한 부분만 보정하세요.
 
                                         다음 형식으로 정확히 출력하세요:
                                         {{
@@ -146,14 +145,53 @@ class SequenceDiagramGeneratorAgent(BaseLLMAgent):
 
                                         call_tree_summary_reasoning:  
                                         [{call_tree_summary_reasoning}]
+
+                                        draft_mermaid_code: (선택적)
+                                        [{draft_mermaid_code}]
                                     """
                                 )
     
-        messages.append(HumanMessage(content=human_prompt_template.format(entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning)))
+        messages.append(HumanMessage(content=human_prompt_template.format(entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning, draft_mermaid_code=draft_mermaid_code)))
         return messages
 
 
-    def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
+    def get_repair_prompt(self, entry_point: str, mermaid_code: str, errors: List[str]) -> List:
+        # 로컬 보정으로 해결되지 않은 구문 오류만 수정 요청
+        messages = [SystemMessage(content=self.system_prompt)]
+        
+        human_prompt_template = PromptTemplate(
+                                    input_variables=["entry_point", "mermaid_code", "errors"],
+                                    template = """
+                                        아래 Mermaid 시퀀스 다이어그램 코드에서 구문 오류가 검출되었습니다.
+
+                                        ## 꼭 지켜야 할 지침:
+                                        - 검출된 오류만 수정하고, participant, 호출/리턴 화살표, Note의 순서와 내용은 그대로 유지하세요.
+                                        - 허용 구문: `sequenceDiagram`, `participant`, `->>`, `-->>`, `Note right of`, `loop/alt/opt ... end`
+                                        - 모든 화살표와 Note는 `:` 뒤에 라벨을 작성하고, 라벨이 비어 있으면 ": " (콜론+스페이스)로 끝내세요.
+                                        - participant 이름에는 영문자, 숫자, `_`만 사용하세요.
+
+                                        다음 형식으로 정확히 출력하세요:
+                                        {{
+                                            "entry_point": "...",
+                                            "mermaid_code": "..."
+                                        }}
+
+                                        **입력값**:
+                                        entry_point:  
+                                        [{entry_point}]
+
+                                        errors:  
+                                        [{errors}]
+
+                                        mermaid_code:  
+                                        [{mermaid_code}]
+                                    """
+                                )
+    
+        messages.append(HumanMessage(content=human_prompt_template.format(entry_point=entry_point, mermaid_code=mermaid_code, errors="\n".join(errors))))
+        return messages
+
+    async def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
         agent_state = state["autodiagenti_state"]
         project_id = agent_state.get("project_id", "")
         project_name = agent_state.get("project_name", "")
@@ -164,82 +202,222 @@ class SequenceDiagramGeneratorAgent(BaseLLMAgent):
         # 모델 선언
         llm_model = get_llm_with_custom(llm_model=model_info.model_name, llm_version=model_info.version)
         
-        # 1.EntryPoint 목록 추출
-        output_dir = os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name)
-        entry_point_path = os.path.join(output_dir, settings.ENTRY_POINT_FILE_NAME)
-        entry_point_list = load_json(entry_point_path)
+        # 1.프로젝트 산출물 컨텍스트 (EntryPoint 목록, CALLTREE_SUMMARY/CODE_ANALYSIS 인덱스)
+        context = get_project_context(project_id=project_id, project_name=project_name)
+        await asyncio.to_thread(context.preload)
         
         sequence_diagram_infos = []
         
         # LLM 실행
-        results = asyncio.run(self._analyze_all(llm=llm_model, schema=DiagramLLMOutput, project_id=project_id, entry_point_list=entry_point_list, max_concurrent=settings.MAX_CONCURRENT))
+        results = await self._analyze_all(llm=llm_model, schema=DiagramLLMOutput, context=context, max_concurrent=settings.MAX_CONCURRENT)
         sequence_diagram_infos = results
             
-        sequence_diagram_result = {
-            "input_type": IndexInputType.SEQUENCE_DIAGRAM,
-            "llm_model": llm_model.deployment_name,         
-            "llm_version": llm_model.openai_api_version,    
-            "llm_temperature": llm_model.temperature,
-            "sequence_diagram_info": sequence_diagram_infos
-        }
+        sequence_diagram_result = self.build_sequence_diagram_result(llm=llm_model, sequence_diagram_infos=sequence_diagram_infos)
             
+        # 그래프 상태에는 산출물 핸들만 전달
+        sequence_diagram_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT, sequence_diagram_result)
+        
         result = {
-            AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT: sequence_diagram_result,
-            AgentResultGroupKey.CURRENT_SOURCE_DATA: sequence_diagram_result
+            AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT: sequence_diagram_handle,
+            AgentResultGroupKey.CURRENT_SOURCE_DATA: sequence_diagram_handle
         }
         
         return self.wrap_multiple_sources(result)
     
-    async def _analyze(self, llm, schema, entry_point, depth, call_tree, method_definitions, call_tree_summary_title, call_tree_summary_insight, call_tree_summary_reasoning, sem, max_concurrent, idx, total):
-        async with sem:  # 동시 실행 제한
-            current = sem._value                    # 남은 슬롯 개수
-            active = max_concurrent - current       # 현재 실행 중 개수
-            self.logger.info(f"🚀 entry_point: [{entry_point}]")
-            self.logger.info(f"🚀 [{idx+1}/{total}] 실행 시작: {entry_point} (동시 실행: {active})")
-            messages = self.get_prompt(entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning)
-            sequence_diagram_info = {}
+    async def generate_diagram(self, llm, schema, entry_point: str, depth: int, call_tree: Dict, method_definitions: Dict, call_tree_summary_title: str, call_tree_summary_insight: str, call_tree_summary_reasoning: str) -> Dict:
+        """
+        entry_point 1건의 시퀀스 다이어그램 생성 (동시성 제어는 호출측에서 처리)
+        
+        - call_tree와 method_definitions로 Mermaid 코드를 로컬에서 결정적으로 생성
+        - SEQUENCE_DIAGRAM_MODE가 LLM_REFINE이면 로컬 생성 결과를 초안으로 LLM 보정 (실패 시 초안 사용)
+
+        Returns:
+            Dict: 시퀀스 다이어그램 정보
+        """
+        draft_mermaid_code = build_sequence_diagram(entry_point=entry_point, call_tree=call_tree, method_definitions=method_definitions)
+        mermaid_code = draft_mermaid_code
+        generation_mode = SequenceDiagramMode.DETERMINISTIC
+        
+        if self.use_llm_refine():
+            messages = self.get_prompt(entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning, draft_mermaid_code=mermaid_code)
             
             try:
                 # LLM 호출
                 response = await self._call_llm_with_timeout(llm, schema, messages)
-                
-                sequence_diagram_info = {
-                                            "entry_point": entry_point,
-                                            "mermaid_code": response.mermaid_code,
-                                            "summary_title": call_tree_summary_title,
-                                            "insight": call_tree_summary_insight,
-                                            "reasoning": call_tree_summary_reasoning,
-                                            "method_definitions": method_definitions,
-                                            "analyzed_at": datetime.now().isoformat()
-                                        }
+                mermaid_code = response.mermaid_code
+                generation_mode = SequenceDiagramMode.LLM_REFINE
             except asyncio.TimeoutError:
-                self.logger.warning(f"❌ [TIMEOUT] {entry_point} 분석 시간 초과로 스킵됨")
+                self.logger.warning(f"❌ [TIMEOUT] {entry_point} 보정 시간 초과로 로컬 생성 결과 사용")
             except LengthFinishReasonError as err:
-                self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
+                self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 로컬 생성 결과 사용. error: {err}")
             except Exception as e:
-                self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
+                self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생, 로컬 생성 결과 사용: {e}")
+        
+        # 구문 검증 및 보정 (LLM 보정 결과만 재요청 대상)
+        refined = generation_mode == SequenceDiagramMode.LLM_REFINE
+        mermaid_code, validation = await self.ensure_valid_diagram(llm=llm if refined else None, schema=schema, entry_point=entry_point, mermaid_code=mermaid_code, fallback_code=draft_mermaid_code if refined else None)
+        
+        return {
+            "entry_point": entry_point,
+            "mermaid_code": mermaid_code,
+            "generation_mode": generation_mode,
+            "validation": validation,
+            "summary_title": call_tree_summary_title,
+            "insight": call_tree_summary_insight,
+            "reasoning": call_tree_summary_reasoning,
+            "method_definitions": method_definitions,
+            "analyzed_at": datetime.now().isoformat()
+        }
+    
+    async def ensure_valid_diagram(self, llm, schema, entry_point: str, mermaid_code: str, fallback_code: Optional[str] = None) -> Tuple[str, Dict]:
+        """
+        다이어그램 구문 검증 후 로컬 보정, 보정으로 해결되지 않으면 오류 내용을 포함해 재요청
+
+        Args:
+            llm: LLM 모델 (None이면 재요청하지 않음)
+            schema: 구조화 출력 스키마
+            entry_point (str): 엔트리포인트 FQN
+            mermaid_code (str): 검증 대상 Mermaid 코드
+            fallback_code (Optional[str]): 재요청 후에도 오류일 때 사용할 코드 (로컬 생성 초안)
+
+        Returns:
+            Tuple[str, Dict]: (최종 Mermaid 코드, 검증 결과 {status, errors, fixes})
+        """
+        errors = validate_sequence_diagram(mermaid_code)
+        if not errors:
+            return mermaid_code, {"status": DiagramValidationStatus.VALID, "errors": [], "fixes": []}
+        
+        # 1. 로컬 보정
+        repaired_code, fixes = repair_sequence_diagram(mermaid_code)
+        remaining = validate_sequence_diagram(repaired_code)
+        if not remaining:
+            self.logger.info(f"🔧 다이어그램 로컬 보정 완료: [{entry_point}] {fixes}")
+            return repaired_code, {"status": DiagramValidationStatus.REPAIRED, "errors": errors, "fixes": fixes}
+        
+        # 2. 오류 내용을 포함한 재요청
+        if llm is not None:
+            for attempt in range(settings.MERMAID_MAX_REPROMPTS):
+                self.logger.warning(f"🌧️ 다이어그램 구문 오류로 재요청 ({attempt + 1}/{settings.MERMAID_MAX_REPROMPTS}): [{entry_point}] {remaining}")
+                messages = self.get_repair_prompt(entry_point=entry_point, mermaid_code=repaired_code, errors=remaining)
+                
+                try:
+                    response = await self._call_llm_with_timeout(llm, schema, messages)
+                except Exception as e:
+                    self.logger.warning(f"❌ [FAIL] 다이어그램 재요청 실패: {e}")
+                    break
+                
+                repaired_code, retry_fixes = repair_sequence_diagram(response.mermaid_code)
+                remaining = validate_sequence_diagram(repaired_code)
+                if not remaining:
+                    return repaired_code, {"status": DiagramValidationStatus.REPROMPTED, "errors": errors, "fixes": fixes + retry_fixes}
+        
+        # 3. 로컬 생성 초안으로 대체
+        if fallback_code is not None and not validate_sequence_diagram(fallback_code):
+            self.logger.warning(f"🌧️ 다이어그램 구문 오류 미해결, 로컬 생성 결과 사용: [{entry_point}] {remaining}")
+            return fallback_code, {"status": DiagramValidationStatus.FALLBACK, "errors": errors, "fixes": fixes}
+        
+        self.logger.warning(f"❌ 다이어그램 구문 오류 미해결: [{entry_point}] {remaining}")
+        return repaired_code, {"status": DiagramValidationStatus.INVALID, "errors": remaining, "fixes": fixes}
+    
+    def build_validation_report(self, sequence_diagram_infos: List[Dict]) -> Dict:
+        """
+        다이어그램 검증 상태별 건수 및 유효 비율 리포트
+        """
+        infos = [info for info in sequence_diagram_infos if info]
+        by_status = {}
+        for info in infos:
+            status = (info.get("validation") or {}).get("status", DiagramValidationStatus.VALID)
+            by_status[status] = by_status.get(status, 0) + 1
+        
+        total = len(infos)
+        invalid = by_status.get(DiagramValidationStatus.INVALID, 0)
+        return {
+            "total": total,
+            "by_status": by_status,
+            "initial_valid_rate": round(by_status.get(DiagramValidationStatus.VALID, 0) / total, 4) if total else 0.0,
+            "valid_rate": round((total - invalid) / total, 4) if total else 0.0
+        }
+    
+    def use_llm_refine(self) -> bool:
+        """
+        다이어그램 생성에 LLM 보정을 사용하는지 여부
+        """
+        return settings.SEQUENCE_DIAGRAM_MODE == SequenceDiagramMode.LLM_REFINE
+    
+    def build_method_definitions(self, call_sequence: List[str], method_analyses: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        호출 흐름에 포함된 메서드의 분석 결과로 다이어그램용 method_definitions 구성
+
+        Args:
+            call_sequence (List[str]): 호출 순서 메서드 FQN 목록
+            method_analyses (Dict[str, Dict]): method_fqn → 코드 분석 결과(메타데이터)
+
+        Returns:
+            Dict[str, Dict]: method_fqn → method_definition
+        """
+        method_definitions = {}
+        for method_fqn in call_sequence:
+            analysis = method_analyses.get(method_fqn)
+            if analysis is None or method_fqn in method_definitions:
+                continue
+            
+            method_definitions[method_fqn] = {
+                "method_fqn": method_fqn,
+                "summary": analysis.get("summary", ""),
+                "class_name": analysis.get("class_name", ""),
+                "package_name": analysis.get("package_name", ""),
+                "return_type": analysis.get("return_type", ""),
+                "display_name": extract_display_name(method_fqn),
+            }
+        return method_definitions
+    
+    def build_sequence_diagram_result(self, llm, sequence_diagram_infos: List[Dict]) -> Dict:
+        """
+        시퀀스 다이어그램 단계 결과값 구성
+        """
+        validation_report = self.build_validation_report(sequence_diagram_infos)
+        self.logger.info(f"📊 다이어그램 검증 리포트: {validation_report}")
+        
+        return {
+            "input_type": IndexInputType.SEQUENCE_DIAGRAM,
+            "llm_model": llm.deployment_name,         
+            "llm_version": llm.openai_api_version,    
+            "llm_temperature": llm.temperature,
+            "sequence_diagram_info": sequence_diagram_infos,
+            "validation_report": validation_report
+        }
+    
+    async def _analyze(self, llm, schema, entry_point, depth, call_tree, method_definitions, call_tree_summary_title, call_tree_summary_insight, call_tree_summary_reasoning, sem, max_concurrent, idx, total):
+        async with sem:  # 동시 실행 제한
+            current = sem._value                    # 남은 슬롯 개수
+            active = max_concurrent - current       # 현재 실행 중 개수
+            self.logger.info(f"🚀 entry_point: [{entry_point}]")
+            self.logger.info(f"🚀 [{idx+1}/{total}] 실행 시작: {entry_point} (동시 실행: {active})")
+            
+            sequence_diagram_info = await self.generate_diagram(llm=llm, schema=schema, entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_title=call_tree_summary_title, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning)
             
             self.logger.info(f"✅ [{idx+1}/{total}] 실행 완료: {entry_point} (남은 실행: {max_concurrent - sem._value})")
-            time.sleep(0.2)
+            if self.use_llm_refine():
+                await asyncio.sleep(0.2)
         
             return sequence_diagram_info
 
-    async def _analyze_all(self, project_id, entry_point_list, llm, schema, max_concurrent=settings.MAX_CONCURRENT):
+    async def _analyze_all(self, context: ProjectArtifactContext, llm, schema, max_concurrent=settings.MAX_CONCURRENT):
         sem = asyncio.Semaphore(max_concurrent)
         tasks = []
+        entry_point_list = context.entry_points
         
         # EntryPoint 별로 Sequence Diagram 생성
         for idx, entry_point in enumerate(entry_point_list):
             
             # 2. CALLTREE_SUMMARY 문서 조회
-            call_tree_summary_doc: Optional[Document] = load_call_tree_summary_doc(project_id=project_id, entry_point=entry_point)
+            call_tree_summary_doc: Optional[Document] = context.call_tree_summary_doc(entry_point)
             
             if call_tree_summary_doc is None:
                 self.logger.warning(f"🌧️ call_tree_summary_doc is None.")
                 continue 
 
-            # 3. CODE_ANALYSIS 문서 조회
-            code_analysis_docs = load_documents_by_source_type(project_id=project_id, source_type=RagSourceType.CODE_ANALYSIS)
+            # 3. CODE_ANALYSIS 인덱스로 method_definitions 구성
             call_sequence: List = call_tree_summary_doc.metadata.get("call_sequence", [])
             depth: int = call_tree_summary_doc.metadata.get("depth", 0)
             call_tree: Dict = call_tree_summary_doc.metadata.get("call_tree", {})
@@ -247,35 +425,10 @@ class SequenceDiagramGeneratorAgent(BaseLLMAgent):
             call_tree_summary_insight: str = call_tree_summary_doc.metadata.get("insight", "")
             call_tree_summary_reasoning: str = call_tree_summary_doc.metadata.get("reasoning", "")
             
-            method_definitions = {}
-            for doc in code_analysis_docs:
-                method_fqn = doc.metadata.get("method_fqn")
-                if method_fqn in call_sequence:
-                    method_definition = {
-                        "method_fqn": method_fqn,
-                        "summary": doc.metadata.get("summary", ""),
-                        "class_name": doc.metadata.get("class_name", ""),
-                        "package_name": doc.metadata.get("package_name", ""),
-                        "return_type": doc.metadata.get("return_type", ""),
-                        "display_name": self._extract_method_name_with_args(method_fqn),
-                    }
-                    
-                    method_definitions[method_fqn] = method_definition
-                else:
-                    self.logger.warning(f"🌧️ It doesn't match the method_fqn. [{entry_point}] - [{method_fqn}]. call_sequence: [{call_sequence}]")
+            method_definitions = self.build_method_definitions(call_sequence=call_sequence, method_analyses=context.method_analyses)
             
             tasks.append(self._analyze(llm=llm, schema=schema, entry_point=entry_point, depth=depth, call_tree=call_tree, method_definitions=method_definitions, call_tree_summary_title=call_tree_summary_title, call_tree_summary_insight=call_tree_summary_insight, call_tree_summary_reasoning=call_tree_summary_reasoning, sem=sem, max_concurrent=max_concurrent, idx=idx, total=len(entry_point_list)))
             
-        return await asyncio.gather(*tasks)
-    
-    def _extract_method_name_with_args(self, fqn: str) -> str:
-        try:
-            name_part, args_part = fqn.split('(', 1)
-            name = name_part.split('.')[-1]
-            args = args_part
-            return f"{name}({args}"
-        except Exception as err:
-            self.logger.error(f"❌ _extract_method_name_with_args error: {err}")
-            return fqn
+        return await self._gather_with_progress(stage=PipelineStage.DIAGRAM, tasks=tasks)
 
 
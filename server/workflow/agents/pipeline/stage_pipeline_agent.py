@@ -0,0 +1,329 @@
+# server/workflow/agents/pipeline/stage_pipeline_agent.py
+
+"""
+단계 파이프라인 에이전트
+- 메서드 분석 → 호출 흐름 요약 → 시퀀스 다이어그램을 entry point 단위 의존성으로 연쇄 실행
+- 증분 분석(incremental) 시 입력이 바뀌지 않은 메서드/entry point는 이전 실행 결과(AnalysisMemo) 재사용
+"""
+
+import asyncio
+from functools import partial
+from typing import List, Optional, Dict, Any
+from langchain.schema import Document
+from server.utils.config import settings, get_llm_with_custom
+from server.utils.constants import AgentType, AgentResultGroupKey, RagSourceType, IndexInputType, LLMModel, PipelineStage
+from server.utils.call_tree_utils import collect_method_fqns, find_child_subtrees
+from server.workflow.state import AnalysisStatus, set_project_status_by_analysis_status, set_project_stage_progress
+from server.workflow.artifact_store import load_artifact
+from server.workflow.analysis_memo import AnalysisMemo
+from server.workflow.pipeline_scheduler import PipelineScheduler, PipelineTask, StageStats
+from server.workflow.agents.base.base_llm_agent import BaseLLMAgent, LLMAgentState
+from server.workflow.agents.analyze.code_analysis_agent import CodeAnalysisAgent, InsightLLMOutput as MethodInsightLLMOutput
+from server.workflow.agents.summarize.call_tree_summarizer_agent import CallTreeSummarizerAgent, InsightLLMOutput as CallTreeInsightLLMOutput
+from server.workflow.agents.generate.sequence_diagram_generator_agent import SequenceDiagramGeneratorAgent, DiagramLLMOutput
+
+# 슬롯 대기 우선순위 (하위 단계 작업을 먼저 실행하여 첫 다이어그램 완료 시간 단축)
+STAGE_PRIORITY = {
+    PipelineStage.DIAGRAM: 0,
+    PipelineStage.SUMMARY: 1,
+    PipelineStage.SUBTREE: 2,
+    PipelineStage.METHOD: 3
+}
+
+class StagePipelineAgent(BaseLLMAgent):
+    def __init__(self, code_analysis_agent: CodeAnalysisAgent, call_tree_summarizer_agent: CallTreeSummarizerAgent, sequence_diagram_agent: SequenceDiagramGeneratorAgent, session_id: str = None, project_id: str = None):
+        super().__init__(system_prompt="", role=AgentType.STAGE_PIPELINE, session_id=session_id, project_id=project_id)
+        self.code_analysis_agent = code_analysis_agent
+        self.call_tree_summarizer_agent = call_tree_summarizer_agent
+        self.sequence_diagram_agent = sequence_diagram_agent
+
+    def _create_prompt(self, state: LLMAgentState) -> Optional[str]:
+        pass
+
+    async def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
+        agent_state = state["autodiagenti_state"]
+        project_id = agent_state.get("project_id", "")
+        project_name = agent_state.get("project_name", "")
+        agent_result = agent_state.get("agent_result", {})
+
+        # 모델 정보
+        model_info: LLMModel = agent_state.get("llm_model_info")
+
+        # 모델 선언 (전체 단계가 하나의 동시성 예산 공유)
+        llm_model = get_llm_with_custom(llm_model=model_info.model_name, llm_version=model_info.version)
+
+        # 1. 분석 대상 메서드 선별 (휴리스틱 처리 포함)
+        heuristic_methods, llm_methods, heuristic_report = await asyncio.to_thread(self.code_analysis_agent.prepare_target_methods, project_id=project_id, project_name=project_name)
+
+        # 2. 호출 트리 목록
+        call_tree_result = await asyncio.to_thread(load_artifact, agent_result.get(AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT))
+        call_tree_info_list: List[Dict] = (call_tree_result or {}).get("call_tree_info", [])
+
+        # 3. 파이프라인 실행 (증분 분석 시 이전 실행 결과 재사용)
+        memo = AnalysisMemo(project_id=project_id, llm_key=f"{model_info.model_name}:{model_info.version}") if agent_state.get("incremental") else None
+        scheduler = PipelineScheduler(max_concurrent=settings.MAX_CONCURRENT, on_task_done=partial(self._on_task_done, project_id))
+        results = await self._run_pipeline(scheduler=scheduler, llm=llm_model, project_id=project_id, project_name=project_name, heuristic_methods=heuristic_methods, llm_methods=llm_methods, call_tree_info_list=call_tree_info_list, memo=memo)
+
+        pipeline_report = scheduler.report()
+        if memo is not None:
+            await asyncio.to_thread(memo.save)
+            pipeline_report["reused"] = dict(memo.reused)
+        self.logger.info(f"⏱️ 파이프라인 리포트: {pipeline_report}")
+
+        # 4. 단계별 결과 구성
+        analyzed_methods = [results.get(self._task_key(PipelineStage.METHOD, method_meta["method_fqn"])) or method_meta for method_meta in llm_methods]
+        call_tree_summary_docs = [doc for doc in (results.get(self._task_key(PipelineStage.SUMMARY, item.get("entry_point"))) for item in call_tree_info_list) if doc is not None]
+        sequence_diagram_infos = [info for info in (results.get(self._task_key(PipelineStage.DIAGRAM, item.get("entry_point"))) for item in call_tree_info_list) if info]
+
+        code_analysis_result = self.code_analysis_agent.build_code_analysis_result(llm=llm_model, method_meta_list=heuristic_methods + analyzed_methods, heuristic_report=heuristic_report)
+        call_tree_summary_result = self.call_tree_summarizer_agent.build_call_tree_summary_result(llm=llm_model, call_tree_docs=call_tree_summary_docs)
+        sequence_diagram_result = self.sequence_diagram_agent.build_sequence_diagram_result(llm=llm_model, sequence_diagram_infos=sequence_diagram_infos)
+
+        # 그래프 상태에는 산출물 핸들만 전달
+        code_analysis_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.CODE_ANALYSIS_RESULT, code_analysis_result)
+        call_tree_summary_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.CALL_TREE_SUMMARY, call_tree_summary_result)
+        sequence_diagram_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT, sequence_diagram_result)
+
+        pipeline_result = {
+            "input_type": IndexInputType.PIPELINE,
+            "sources": [code_analysis_handle, call_tree_summary_handle, sequence_diagram_handle],
+            "pipeline_report": pipeline_report
+        }
+
+        result = {
+            AgentResultGroupKey.CURRENT_SOURCE_DATA: pipeline_result,
+            AgentResultGroupKey.CODE_ANALYSIS_RESULT: code_analysis_handle,
+            AgentResultGroupKey.CALL_TREE_SUMMARY: call_tree_summary_handle,
+            AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT: sequence_diagram_handle,
+            AgentResultGroupKey.PIPELINE_RESULT: pipeline_report
+        }
+
+        return self.wrap_multiple_sources(result)
+
+    async def _run_pipeline(self, scheduler: PipelineScheduler, llm, project_id: str, project_name: str, heuristic_methods: List[Dict], llm_methods: List[Dict], call_tree_info_list: List[Dict], memo: Optional[AnalysisMemo] = None) -> Dict[str, Any]:
+        """
+        메서드/요약/다이어그램 작업을 의존성 그래프로 등록하고 실행
+
+        - 메서드 분석: 의존성 없음
+        - 하위 트리 요약(계층적 요약 모드): 하위 트리에 포함된 메서드 분석 및 자식 하위 트리 요약 완료 후 시작
+        - 흐름 요약: 해당 entry point의 call_sequence에 포함된 메서드 분석(및 최상위 하위 트리 요약) 완료 후 시작
+        - 다이어그램: 해당 entry point의 흐름 요약 완료 후 시작
+        - 증분 분석(memo): 이전 결과를 재사용하는 메서드/entry point는 작업을 등록하지 않고, 재사용하지 않는 entry point에 필요한 하위 트리만 요약
+        """
+        # 분석 결과 조회용 (메서드 분석은 method_meta를 직접 갱신하므로 동일 객체 참조)
+        method_analyses: Dict[str, Dict] = {method_meta["method_fqn"]: method_meta for method_meta in heuristic_methods + llm_methods}
+
+        # 이전 분석 결과 재사용 메서드 반영 (LLM 분석 대상에서 제외)
+        llm_method_map: Dict[str, Dict] = {}
+        for method_meta in llm_methods:
+            reused = memo.get_method(method_meta) if memo is not None else None
+            if reused:
+                method_meta.update(reused)
+            else:
+                llm_method_map[method_meta["method_fqn"]] = method_meta
+
+        # 앞선 entry point에 포함된 메서드부터 분석하도록 순서 정렬
+        ordered_fqns = list(dict.fromkeys(
+            [fqn for item in call_tree_info_list for fqn in item.get("call_sequence", []) if fqn in llm_method_map] + list(llm_method_map.keys())
+        ))
+
+        for method_fqn in ordered_fqns:
+            scheduler.add_task(
+                key=self._task_key(PipelineStage.METHOD, method_fqn),
+                stage=PipelineStage.METHOD,
+                coro_factory=partial(self._analyze_method, llm, llm_method_map[method_fqn]),
+                priority=STAGE_PRIORITY[PipelineStage.METHOD]
+            )
+
+        # 이전 흐름 요약/다이어그램 재사용 entry point (호출 트리와 포함 메서드 입력이 모두 같은 경우)
+        reused_results: Dict[str, Any] = {}
+        entry_point_keys: Dict[str, str] = {}
+        if memo is not None:
+            method_input_keys = {fqn: memo.method_key(method_meta) for fqn, method_meta in method_analyses.items()}
+            for call_tree_info in call_tree_info_list:
+                entry_point = call_tree_info.get("entry_point")
+                if not entry_point:
+                    continue
+                entry_point_keys[entry_point] = memo.entry_point_key(call_tree_info, method_input_keys)
+                reused = memo.get_entry_point(entry_point, entry_point_keys[entry_point])
+                if reused:
+                    reused_results[self._task_key(PipelineStage.SUMMARY, entry_point)], reused_results[self._task_key(PipelineStage.DIAGRAM, entry_point)] = reused
+        pending_call_tree_infos = [item for item in call_tree_info_list if self._task_key(PipelineStage.SUMMARY, item.get("entry_point")) not in reused_results]
+
+        # 계층적 요약 모드: 재사용 하위 트리 요약 작업 등록
+        subtrees: Dict[str, Dict] = {}
+        hash_memo: Dict[int, str] = {}
+        if settings.HIERARCHICAL_SUMMARY_ENABLED and pending_call_tree_infos:
+            subtrees = self.call_tree_summarizer_agent.build_subtree_plan([item.get("call_tree", {}) for item in call_tree_info_list])
+            if reused_results:
+                subtrees = self._required_subtrees(subtrees=subtrees, call_tree_info_list=pending_call_tree_infos, hash_memo=hash_memo)
+            for subtree_hash, subtree in subtrees.items():
+                scheduler.add_task(
+                    key=self._task_key(PipelineStage.SUBTREE, subtree_hash),
+                    stage=PipelineStage.SUBTREE,
+                    coro_factory=partial(self._summarize_subtree, llm, subtree, method_analyses),
+                    deps=[self._task_key(PipelineStage.METHOD, fqn) for fqn in collect_method_fqns(subtree["node"]) if fqn in llm_method_map]
+                        + [self._task_key(PipelineStage.SUBTREE, child_hash) for child_hash in subtree["child_hashes"]],
+                    priority=STAGE_PRIORITY[PipelineStage.SUBTREE]
+                )
+
+        for call_tree_info in pending_call_tree_infos:
+            entry_point = call_tree_info.get("entry_point")
+            if not entry_point:
+                continue
+
+            summary_key = self._task_key(PipelineStage.SUMMARY, entry_point)
+            method_keys = [self._task_key(PipelineStage.METHOD, fqn) for fqn in call_tree_info.get("call_sequence", []) if fqn in llm_method_map]
+            if subtrees and call_tree_info.get("call_tree"):
+                method_keys += [self._task_key(PipelineStage.SUBTREE, subtree_hash) for subtree_hash in find_child_subtrees(call_tree_info["call_tree"], set(subtrees), hash_memo)]
+
+            scheduler.add_task(
+                key=summary_key,
+                stage=PipelineStage.SUMMARY,
+                coro_factory=partial(self._summarize, llm, project_id, project_name, call_tree_info, method_analyses),
+                deps=method_keys,
+                priority=STAGE_PRIORITY[PipelineStage.SUMMARY]
+            )
+            scheduler.add_task(
+                key=self._task_key(PipelineStage.DIAGRAM, entry_point),
+                stage=PipelineStage.DIAGRAM,
+                coro_factory=partial(self._generate_diagram, llm, call_tree_info, method_analyses, summary_key),
+                deps=[summary_key],
+                priority=STAGE_PRIORITY[PipelineStage.DIAGRAM],
+                use_slot=self.sequence_diagram_agent.use_llm_refine()
+            )
+
+        self.logger.info(f"🚀 파이프라인 시작: 메서드 {len(ordered_fqns)}건, entry point {len(pending_call_tree_infos)}건 (동시 실행 한도: {scheduler.max_concurrent})")
+        if memo is not None:
+            self.logger.info(f"♻️ 증분 분석 재사용: 메서드 {memo.reused['methods']}건, entry point {memo.reused['entry_points']}건")
+        for stage, stage_stats in scheduler.stats.items():
+            set_project_stage_progress(project_id=project_id, stage=stage, done=0, total=stage_stats.total)
+        results = {**reused_results, **(await scheduler.run())}
+
+        # 다음 증분 분석용 결과 기록
+        if memo is not None:
+            for method_meta in llm_methods:
+                memo.put_method(method_meta)
+            for entry_point, entry_point_key in entry_point_keys.items():
+                memo.put_entry_point(entry_point, entry_point_key, results.get(self._task_key(PipelineStage.SUMMARY, entry_point)), results.get(self._task_key(PipelineStage.DIAGRAM, entry_point)))
+        return results
+
+    @staticmethod
+    def _required_subtrees(subtrees: Dict[str, Dict], call_tree_info_list: List[Dict], hash_memo: Dict[int, str]) -> Dict[str, Dict]:
+        """
+        주어진 entry point 요약에 필요한 하위 트리만 선별 (최상위 하위 트리와 그 자식 하위 트리 전체)
+        """
+        stack = [subtree_hash for item in call_tree_info_list if item.get("call_tree") for subtree_hash in find_child_subtrees(item["call_tree"], set(subtrees), hash_memo)]
+        required: Dict[str, Dict] = {}
+        while stack:
+            subtree_hash = stack.pop()
+            if subtree_hash in required or subtree_hash not in subtrees:
+                continue
+            required[subtree_hash] = subtrees[subtree_hash]
+            stack.extend(subtrees[subtree_hash]["child_hashes"])
+        return required
+
+    async def _analyze_method(self, llm, method_meta: Dict, dep_results: Dict) -> Dict:
+        return await self.code_analysis_agent.analyze_method(llm=llm, schema=MethodInsightLLMOutput, method_meta=method_meta)
+
+    async def _summarize(self, llm, project_id: str, project_name: str, call_tree_info: Dict, method_analyses: Dict[str, Dict], dep_results: Dict) -> Document:
+        entry_point = call_tree_info.get("entry_point")
+        call_tree_doc = self._to_call_tree_doc(project_id=project_id, project_name=project_name, call_tree_info=call_tree_info)
+
+        method_summary_map = self._build_method_summary_map(method_fqns=call_tree_info.get("call_sequence", []), method_analyses=method_analyses)
+        subtree_summaries = self._collect_subtree_summaries(dep_results)
+
+        return await self.call_tree_summarizer_agent.summarize_call_tree(llm=llm, schema=CallTreeInsightLLMOutput, entry_point=entry_point, call_tree_doc=call_tree_doc, method_summary_map=method_summary_map, subtree_summaries=subtree_summaries or None)
+
+    async def _summarize_subtree(self, llm, subtree: Dict, method_analyses: Dict[str, Dict], dep_results: Dict) -> str:
+        method_summary_map = self._build_method_summary_map(method_fqns=collect_method_fqns(subtree["node"]), method_analyses=method_analyses)
+        return await self.call_tree_summarizer_agent.summarize_subtree(llm=llm, schema=CallTreeInsightLLMOutput, subtree=subtree, subtree_summaries=self._collect_subtree_summaries(dep_results), method_summary_map=method_summary_map)
+
+    def _build_method_summary_map(self, method_fqns: List[str], method_analyses: Dict[str, Dict]) -> Dict[str, Dict]:
+        method_summary_map = {}
+        for method_fqn in method_fqns:
+            method_meta = method_analyses.get(method_fqn)
+            if method_meta and method_meta.get("summary"):
+                method_summary_map[method_fqn] = {
+                    "summary": method_meta.get("summary"),
+                    "parameters": method_meta.get("parameters", []),
+                    "return_type": method_meta.get("return_type", "void")
+                }
+        return method_summary_map
+
+    def _collect_subtree_summaries(self, dep_results: Dict) -> Dict[str, str]:
+        prefix = self._task_key(PipelineStage.SUBTREE, "")
+        return {key[len(prefix):]: summary for key, summary in dep_results.items() if key.startswith(prefix) and summary}
+
+    async def _generate_diagram(self, llm, call_tree_info: Dict, method_analyses: Dict[str, Dict], summary_key: str, dep_results: Dict) -> Dict:
+        entry_point = call_tree_info.get("entry_point")
+        call_tree_summary_doc: Optional[Document] = dep_results.get(summary_key)
+
+        # 흐름 요약이 없어도 호출 트리만으로 다이어그램 생성 가능
+        if call_tree_summary_doc is None:
+            self.logger.warning(f"🌧️ call_tree_summary_doc is None. 요약 없이 다이어그램 생성. entry_point: [{entry_point}]")
+        meta = call_tree_summary_doc.metadata if call_tree_summary_doc is not None else {}
+
+        method_definitions = self.sequence_diagram_agent.build_method_definitions(call_sequence=call_tree_info.get("call_sequence", []), method_analyses=method_analyses)
+
+        return await self.sequence_diagram_agent.generate_diagram(
+            llm=llm,
+            schema=DiagramLLMOutput,
+            entry_point=entry_point,
+            depth=call_tree_info.get("depth", 0),
+            call_tree=call_tree_info.get("call_tree", {}),
+            method_definitions=method_definitions,
+            call_tree_summary_title=meta.get("summary_title", ""),
+            call_tree_summary_insight=meta.get("insight", ""),
+            call_tree_summary_reasoning=meta.get("reasoning", "")
+        )
+
+    def _to_call_tree_doc(self, project_id: str, project_name: str, call_tree_info: Dict) -> Document:
+        """
+        호출 트리 분석 결과를 요약 에이전트 입력용 CALLTREE 문서로 변환
+        """
+        return Document(
+            page_content="\n".join(call_tree_info.get("call_sequence", [])),
+            metadata={
+                "source_type": RagSourceType.CALLTREE,
+                "project_id": project_id,
+                "project_name": call_tree_info.get("project_name") or project_name,
+                "file_path": call_tree_info.get("file_path"),
+                "entry_point": call_tree_info.get("entry_point"),
+                "call_sequence": call_tree_info.get("call_sequence", []),
+                "call_tree": call_tree_info.get("call_tree", {}),
+                "depth": call_tree_info.get("depth"),
+                "analyzed_at": call_tree_info.get("analyzed_at"),
+            }
+        )
+
+    def _on_task_done(self, project_id: str, task: PipelineTask, result: Any, stats: Dict[str, StageStats]) -> None:
+        """
+        작업 완료 시 단계별 진행 건수를 분석 상태에 반영
+        """
+        method = stats.get(PipelineStage.METHOD, StageStats())
+        summary = stats.get(PipelineStage.SUMMARY, StageStats())
+        diagram = stats.get(PipelineStage.DIAGRAM, StageStats())
+
+        if diagram.done > 0:
+            status = AnalysisStatus.DIAGRAM_STARTED
+        elif summary.done > 0:
+            status = AnalysisStatus.FLOW_SUMMARY_STARTED
+        else:
+            status = AnalysisStatus.CODE_ANALYSIS_STARTED
+
+        message = f"메서드 {method.done}/{method.total}, 흐름 요약 {summary.done}/{summary.total}, 다이어그램 {diagram.done}/{diagram.total}"
+        subtree = stats.get(PipelineStage.SUBTREE)
+        if subtree:
+            message = f"{message}, 하위 트리 요약 {subtree.done}/{subtree.total}"
+        set_project_status_by_analysis_status(project_id=project_id, status=status, custom_message=message)
+        stage_stats = stats.get(task.stage)
+        if stage_stats:
+            set_project_stage_progress(project_id=project_id, stage=task.stage, done=stage_stats.done, total=stage_stats.total, failed=stage_stats.failed)
+
+        if task.stage == PipelineStage.DIAGRAM and diagram.done == 1:
+            self.logger.info(f"⏱️ 첫 다이어그램 완료: {diagram.first_done_sec:.2f}초, entry_point: [{task.key}]")
+
+    @staticmethod
+    def _task_key(stage: str, key: str) -> str:
+        return f"{stage}::{key}"
@@ -5,7 +5,6 @@ RAG 인덱싱 에이전트
 """
 
 from datetime import datetime
-from pathlib import Path
 from typing import List, Dict, Any
 from langchain.schema import Document
 from server.workflow.agents.base.base_utility_agent import BaseUtilityAgent, AgentState
@@ -15,13 +14,21 @@ from server.db.model import EntryPoint
 from server.db.schema import AnalysisHistoryCreate
 from server.db.database import run_with_db_session
 from server.utils.document_utils import generate_document_id
-from server.utils.file_utils import load_json
+from server.utils.parser_bundle_utils import iter_parser_records
 from server.utils.vectorstore_utils import save_documents_to_faiss_vector_store, get_vectorstore_path
-from server.utils.constants import IndexInputType, RagSourceType, AgentType, AgentResultGroupKey
+from server.utils.constants import IndexInputType, RagSourceType, AgentType, AgentResultGroupKey, ParserRecordKind
+from server.workflow.project_context import invalidate_project_documents
+from server.workflow.artifact_store import load_artifact
 
 class RAGIndexingAgent(BaseUtilityAgent):
-    def __init__(self, session_id: str = None, project_id: str = None):
-        super().__init__(role=AgentType.RAG_INDEXER, session_id=session_id, project_id=project_id)
+    def __init__(self, session_id: str = None, project_id: str = None, role: AgentType = AgentType.RAG_INDEXER, source_key: str = AgentResultGroupKey.CURRENT_SOURCE_DATA):
+        """
+        Args:
+            role (AgentType): 노드 역할 (병렬 분기용 인덱서는 분기별 role 사용)
+            source_key (str): 인덱싱 대상 agent_result 키 (병렬 분기에서는 current_source_data 대신 분기 결과 키 지정)
+        """
+        super().__init__(role=role, session_id=session_id, project_id=project_id)
+        self.source_key = source_key
 
     def _run_internal(self, state: AgentState) -> AgentState:
         agent_state = state["autodiagenti_state"]
@@ -30,7 +37,7 @@ class RAGIndexingAgent(BaseUtilityAgent):
         analyzed_date = agent_state.get("analyzed_date", datetime.now().strftime("%Y%m%d"))
         
         agent_result = agent_state.get("agent_result", {})
-        source_data = agent_result.get(AgentResultGroupKey.CURRENT_SOURCE_DATA, {})
+        source_data = load_artifact(agent_result.get(self.source_key, {}))
         input_type = source_data.get("input_type", "")
         
         # 문서 생성 (split은 적용하지 않음 - 이미 메서드 단위 분할된 형태)
@@ -39,11 +46,15 @@ class RAGIndexingAgent(BaseUtilityAgent):
         # 벡터 변환 및 FAISS 벡터 스토어 저장
         save_documents_to_faiss_vector_store(project_id=project_id, documents=documents)
         
+        # 다음 에이전트가 추가된 문서를 조회하도록 프로젝트 컨텍스트 문서 캐시 초기화
+        invalidate_project_documents(project_id=project_id)
+        
         # 분석결과 데이터 저장
-        if input_type == IndexInputType.SEQUENCE_DIAGRAM:
+        if input_type in (IndexInputType.SEQUENCE_DIAGRAM, IndexInputType.PIPELINE):
             file_info = agent_state.get("file_info", {})
             filter_options = agent_state.get("filter_options", {})
-            self._save_analysis_result_to_db(project_id=project_id, project_name=project_name, analyzed_date=analyzed_date, file_info=file_info, filter_options=filter_options, docs=documents)
+            diagram_docs = [doc for doc in documents if doc.metadata.get("source_type") == RagSourceType.SEQUENCE_DIAGRAM]
+            self._save_analysis_result_to_db(project_id=project_id, project_name=project_name, analyzed_date=analyzed_date, file_info=file_info, filter_options=filter_options, docs=diagram_docs)
         
         result = {
             "project_id": project_id,
@@ -66,23 +77,17 @@ class RAGIndexingAgent(BaseUtilityAgent):
                 self.logger.warning(f"❌ 처리 대상 문서가 없습니다(output_dir is empty). input_type:[{input_type}]")
                 return []
             
-            files = Path(output_dir).rglob("*.json")
-            
-            # Document 변환
-            for file_path in files:
-                doc: Document = None            
-                if file_path.name.endswith("_call_tree.json"):
-                    doc = self._to_document_parser(file_path, project_id, project_name)
-                    if doc is not None:
-                        documents.append(doc)
-                elif file_path.name.endswith("_comments.json"):
-                    doc = self._to_document_comments(file_path, project_id, project_name)
-                    if doc is not None:
-                        documents.append(doc)
-                if file_path.name.endswith("_methods.json") and not file_path.name.startswith("all_"):
-                    doc = self._to_document_code(file_path, project_id, project_name)
-                    if doc is not None:
-                        documents.append(doc)
+            # Document 변환 (번들이 있으면 번들 레코드를 순차 읽기, 없으면 클래스 단위 JSON 파일)
+            for record in iter_parser_records(output_dir):
+                doc: Document = None
+                if record.kind == ParserRecordKind.CALL_TREE:
+                    doc = self._to_document_parser(record.data, project_id, project_name)
+                elif record.kind == ParserRecordKind.COMMENTS:
+                    doc = self._to_document_comments(record.data, record.name, project_id, project_name)
+                elif record.kind == ParserRecordKind.METHODS:
+                    doc = self._to_document_code(record.data, record.name, project_id, project_name)
+                if doc is not None:
+                    documents.append(doc)
         elif input_type == IndexInputType.CALLTREE: # 다건
             call_tree_info_list = source_data.get("call_tree_info")
             if call_tree_info_list is not None:
@@ -99,24 +104,25 @@ class RAGIndexingAgent(BaseUtilityAgent):
             sequence_diagram_result = source_data
             if sequence_diagram_result is not None:
                 documents = self._to_documents_llm_sequence_diagrams(project_id=project_id, project_name=project_name, sequence_diagram_result=sequence_diagram_result)
+        elif input_type == IndexInputType.PIPELINE: # 다건 (단계별 결과 묶음)
+            for source in source_data.get("sources", []):
+                source = load_artifact(source)
+                documents.extend(self._create_document(project_id=project_id, project_name=project_name, input_type=source.get("input_type", ""), source_data=source))
             
         return documents
 
-    def _to_document_parser(self, path: Path, project_id: str, project_name: str) -> Document:
+    def _to_document_parser(self, parser_json: Dict[str, Any], project_id: str, project_name: str) -> Document:
         """
-        PARSER 타입 JSON 파일을 LangChain Document 객체로 변환
+        PARSER 타입 레코드(*_call_tree.json)를 LangChain Document 객체로 변환
 
         Args:
-            path (Path): PARSER JSON 파일 경로
+            parser_json (Dict[str, Any]): PARSER JSON 내용
             project_id (str): 분석 세션에 해당하는 프로젝트 ID(쿼리 ID)
 
         Returns:
             Document: page_content와 metadata가 포함된 LangChain 문서 객체
         """
 
-        # JSON 파일 로딩
-        parser_json = load_json(path)
-        
         if not parser_json:
             return None
         
@@ -165,26 +171,23 @@ class RAGIndexingAgent(BaseUtilityAgent):
             }
         )
 
-    def _to_document_comments(self, path: Path, project_id: str, project_name: str) -> Document:
+    def _to_document_comments(self, comments_json: Dict[str, Any], file_name: str, project_id: str, project_name: str) -> Document:
         """
-        COMMENTS 타입 JSON 파일을 LangChain Document 객체로 변환
+        COMMENTS 타입 레코드(*_comments.json)를 LangChain Document 객체로 변환
 
         Args:
-            path (Path): COMMENTS JSON 파일 경로
+            comments_json (Dict[str, Any]): COMMENTS JSON 내용
+            file_name (str): 산출물 파일명
             project_id (str): 분석 세션에 해당하는 프로젝트 ID(쿼리 ID)
 
         Returns:
             Document: page_content와 metadata가 포함된 LangChain 문서 객체
         """
 
-        # JSON 파일 로딩
-        comments_json = load_json(path)
-        
         if not comments_json:
             return None
         
         # 기본 정보 유추
-        file_name = path.name
         analyzed_at = datetime.now().isoformat()
         file_path = comments_json.get("file_path", "")
         
@@ -224,27 +227,24 @@ class RAGIndexingAgent(BaseUtilityAgent):
             }
         )
 
-    def _to_document_code(self, path: Path, project_id: str, project_name:str) -> Document:
+    def _to_document_code(self, methods_json: Dict[str, Any], file_name: str, project_id: str, project_name:str) -> Document:
         """
-        CODE 타입 JSON 파일을 LangChain Document 객체로 변환
+        CODE 타입 레코드(*_methods.json)를 LangChain Document 객체로 변환
         (Java 메서드별 코드 정보)
 
         Args:
-            path (Path): methods.json 파일 경로
+            methods_json (Dict[str, Any]): methods JSON 내용
+            file_name (str): 산출물 파일명
             project_id (str): 분석 세션에 해당하는 프로젝트 ID(쿼리 ID)
 
         Returns:
             Document: page_content와 metadata가 포함된 LangChain 문서 객체
         """
 
-        # JSON 파일 로딩
-        methods_json = load_json(path)
-        
         if not methods_json:
             return None
         
         # 기본 정보 유추
-        file_name = path.name
         analyzed_at = datetime.now().isoformat()
         first_method = next(iter(methods_json.values()))
         file_path = first_method.get("file_path", "")
@@ -368,6 +368,8 @@ class RAGIndexingAgent(BaseUtilityAgent):
                 "return_type": item.get("return_type"),
                 "analyzed_at": item.get("analyzed_at"),
                 "description": item.get("description") if item.get("description") else None,
+                "analysis_type": item.get("analysis_type"),
+                "heuristic_kind": item.get("heuristic_kind"),
                 "llm_model": llm_model,
                 "llm_version": llm_version,
                 "llm_temperature": llm_temperature
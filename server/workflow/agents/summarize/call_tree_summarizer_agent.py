@@ -4,8 +4,6 @@
 콜트리 요약 에이전트
 """
 
-import os
-import time
 import asyncio
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -15,10 +13,10 @@ from langchain.schema import SystemMessage, HumanMessage
 from langchain.prompts import PromptTemplate
 from openai import LengthFinishReasonError
 from server.utils.config import settings, get_llm_with_custom
-from server.utils.constants import AgentType, AgentResultGroupKey, DirInfo, RagSourceType, IndexInputType, LLMModel
-from server.utils.document_retrieval_utils import load_call_tree_doc, load_documents_by_source_type
-from server.utils.file_utils import load_json
+from server.utils.constants import AgentType, AgentResultGroupKey, RagSourceType, IndexInputType, LLMModel, PipelineStage
+from server.utils.call_tree_utils import collect_reusable_subtrees, order_subtrees_bottom_up, compress_call_tree, collect_method_fqns
 from server.workflow.agents.base.base_llm_agent import BaseLLMAgent, LLMAgentState
+from server.workflow.project_context import ProjectArtifactContext, get_project_context
 
 class InsightLLMOutput(BaseModel):
     success: bool = Field(description="정상 분석여부")
@@ -47,6 +45,9 @@ class CallTreeSummarizerAgent(BaseLLMAgent):
         )
 
         super().__init__(system_prompt=system_prompt, role=AgentType.CALL_TREE_SUMMARIZER, session_id=session_id, project_id=project_id)
+        
+        # 하위 트리 해시 → 요약 문장 (계층적 요약 모드에서 entry point 간 공유)
+        self.subtree_summary_cache: Dict[str, str] = {}
 
     def _create_prompt(self, state: LLMAgentState) -> Optional[str]:
         pass
@@ -71,6 +72,7 @@ class CallTreeSummarizerAgent(BaseLLMAgent):
                                         - 설명(reasoning)은 호출 트리를 기반으로 한 상세 분석 이유를 분석하여 작성합니다.
                                         - 정상 분석 여부(success)는 call tree 데이터가 비어 있으면 False로 작성하고 , 이 외는 True로 작성합니다.
                                         - 메서드에 대한 요약(method_summary_map)은 제공되지 않을 수 있습니다. 제공되지 않는 경우, call_tree만 참고하여 가능한 최선의 분석을 수행하세요.
+                                        - call_tree 노드에 subtree_summary가 있으면 해당 메서드 이하 호출 흐름의 요약이므로, 하위 호출 대신 이 요약을 근거로 분석하세요.
                                         - **외부 지식이나 추측은 하지 말고, 제공된 정보에 근거하여 분석합니다.**
                                         - insight는 한 문장으로, reasoning은 2~3문장 이내로 작성합니다.
                                         - 마지막으로, entry_point에 해당하는 호출 흐름을 대표할 수 있는 한 줄 제목(summary_title) 을 작성하세요. 간결하고 직관적으로 표현하세요.
@@ -102,7 +104,7 @@ class CallTreeSummarizerAgent(BaseLLMAgent):
         return messages
 
 
-    def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
+    async def _run_internal(self, state: LLMAgentState) -> LLMAgentState:
         agent_state = state["autodiagenti_state"]
         project_id = agent_state.get("project_id", "")
         project_name = agent_state.get("project_name", "")
@@ -113,85 +115,209 @@ class CallTreeSummarizerAgent(BaseLLMAgent):
         # 모델 선언
         llm_model = get_llm_with_custom(llm_model=model_info.model_name, llm_version=model_info.version)
         
-        # 1.EntryPoint 목록 추출
-        output_dir = os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name)
-        entry_point_path = os.path.join(output_dir, settings.ENTRY_POINT_FILE_NAME)
-        entry_point_list = load_json(entry_point_path)
+        # 1.프로젝트 산출물 컨텍스트 (EntryPoint 목록, CALLTREE/CODE_ANALYSIS 인덱스)
+        context = get_project_context(project_id=project_id, project_name=project_name)
+        await asyncio.to_thread(context.preload)
         
         # LLM 실행
-        results = asyncio.run(self._analyze_all(llm=llm_model, schema=InsightLLMOutput, project_id=project_id, entry_point_list=entry_point_list, max_concurrent=settings.MAX_CONCURRENT))
+        results = await self._analyze_all(llm=llm_model, schema=InsightLLMOutput, context=context, max_concurrent=settings.MAX_CONCURRENT, hierarchical=settings.HIERARCHICAL_SUMMARY_ENABLED)
         new_call_tree_docs = results
             
-        call_tree_summary_result = {
-            "input_type": IndexInputType.CALLTREE_SUMMARY,
-            "llm_model": llm_model.deployment_name,         
-            "llm_version": llm_model.openai_api_version,    
-            "llm_temperature": llm_model.temperature,
-            "call_tree_summary_info": new_call_tree_docs
-        }
+        call_tree_summary_result = self.build_call_tree_summary_result(llm=llm_model, call_tree_docs=new_call_tree_docs)
             
+        # 그래프 상태에는 산출물 핸들만 전달
+        call_tree_summary_handle = await asyncio.to_thread(self.store_artifact, AgentResultGroupKey.CALL_TREE_SUMMARY, call_tree_summary_result)
+        
         result = {
-            AgentResultGroupKey.CALL_TREE_SUMMARY: call_tree_summary_result,
-            AgentResultGroupKey.CURRENT_SOURCE_DATA: call_tree_summary_result
+            AgentResultGroupKey.CALL_TREE_SUMMARY: call_tree_summary_handle,
+            AgentResultGroupKey.CURRENT_SOURCE_DATA: call_tree_summary_handle
         }
         
         return self.wrap_multiple_sources(result)
     
-    async def _analyze(self, llm, schema, entry_point, call_tree_doc, method_summary_map, sem, max_concurrent, idx, total):
+    async def summarize_call_tree(self, llm, schema, entry_point: str, call_tree_doc: Document, method_summary_map: Dict, subtree_summaries: Optional[Dict[str, str]] = None) -> Document:
+        """
+        entry_point 1건의 호출 흐름 요약 (동시성 제어는 호출측에서 처리)
+
+        Args:
+            llm: LLM 모델
+            schema: 구조화 출력 스키마
+            entry_point (str): 엔트리포인트 FQN
+            call_tree_doc (Document): CALLTREE 문서
+            method_summary_map (Dict): 호출 흐름에 포함된 메서드 요약 맵
+            subtree_summaries (Optional[Dict[str, str]]): 하위 트리 해시 → 요약 (계층적 요약 모드)
+
+        Returns:
+            Document: 요약 정보가 채워진 CALLTREE_SUMMARY 문서 (실패 시 원본 유지)
+        """
+        call_tree = call_tree_doc.metadata.get("call_tree", {})
+        
+        # 요약된 하위 트리는 원본 대신 요약으로 치환하여 프롬프트 크기 제한
+        if subtree_summaries and call_tree:
+            call_tree = compress_call_tree(call_tree, subtree_summaries)
+            method_summary_map = self._filter_method_summary_map(call_tree=call_tree, method_summary_map=method_summary_map)
+        
+        messages = self.get_prompt(entry_point=entry_point, call_tree=call_tree, method_summary_map=method_summary_map)
+        
+        try:
+            # LLM 호출
+            response = await self._call_llm_with_timeout(llm, schema, messages)
+            
+            call_tree_doc.metadata["success"] = response.success
+            call_tree_doc.metadata["summary_title"] = response.summary_title
+            if response.success:
+                call_tree_doc.metadata["insight"] = response.insight.strip().replace("\n", "")
+            else:
+                call_tree_doc.metadata["insight"] = ""
+            call_tree_doc.metadata["reasoning"] = response.reasoning.strip().replace("\n", "")
+            call_tree_doc.metadata["input_type"] = IndexInputType.CALLTREE_SUMMARY
+            call_tree_doc.metadata['source_type'] = RagSourceType.CALLTREE_SUMMARY
+            call_tree_doc.metadata['document_id'] = None
+            call_tree_doc.metadata['analyzed_at'] = datetime.now().isoformat()
+        except asyncio.TimeoutError:
+            self.logger.warning(f"❌ [TIMEOUT] {entry_point} 분석 시간 초과로 스킵됨")
+        except LengthFinishReasonError as err:
+            self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
+        except Exception as e:
+            self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
+        
+        return call_tree_doc
+    
+    async def summarize_subtree(self, llm, schema, subtree: Dict, subtree_summaries: Dict[str, str], method_summary_map: Dict) -> str:
+        """
+        재사용 하위 트리 1건 요약 (하위 트리 해시 기준 캐시, 동시성 제어는 호출측에서 처리)
+
+        Args:
+            llm: LLM 모델
+            schema: 구조화 출력 스키마
+            subtree (Dict): collect_reusable_subtrees 결과 항목
+            subtree_summaries (Dict[str, str]): 자식 하위 트리 해시 → 요약
+            method_summary_map (Dict): 메서드 요약 맵
+
+        Returns:
+            str: 하위 트리 요약 (실패 시 빈 문자열)
+        """
+        subtree_hash = subtree["subtree_hash"]
+        if subtree_hash in self.subtree_summary_cache:
+            return self.subtree_summary_cache[subtree_hash]
+        
+        method_fqn = subtree["method_fqn"]
+        call_tree = compress_call_tree(subtree["node"], subtree_summaries)
+        messages = self.get_prompt(entry_point=method_fqn, call_tree=call_tree, method_summary_map=self._filter_method_summary_map(call_tree=call_tree, method_summary_map=method_summary_map))
+        
+        summary = ""
+        try:
+            # LLM 호출
+            response = await self._call_llm_with_timeout(llm, schema, messages)
+            if response.success:
+                summary = f"{response.insight.strip()} {response.reasoning.strip()}".replace("\n", "").strip()
+        except asyncio.TimeoutError:
+            self.logger.warning(f"❌ [TIMEOUT] 하위 트리 {method_fqn} 요약 시간 초과로 스킵됨")
+        except LengthFinishReasonError as err:
+            self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
+        except Exception as e:
+            self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
+        
+        if summary:
+            self.subtree_summary_cache[subtree_hash] = summary
+        return summary
+    
+    def build_subtree_plan(self, call_trees: List[Dict]) -> Dict[str, Dict]:
+        """
+        계층적 요약 대상 하위 트리 선별 (공유 하위 트리 및 프롬프트 크기 초과 하위 트리)
+        """
+        subtrees = collect_reusable_subtrees(
+            call_trees=call_trees,
+            min_refs=settings.HIERARCHICAL_SUMMARY_MIN_REFS,
+            max_inline_nodes=settings.HIERARCHICAL_SUMMARY_MAX_INLINE_NODES
+        )
+        shared_refs = sum(subtree["ref_count"] for subtree in subtrees.values())
+        self.logger.info(f"🌲 계층적 요약 대상 하위 트리: {len(subtrees)}건 (entry point 참조 합계: {shared_refs})")
+        return subtrees
+    
+    def _filter_method_summary_map(self, call_tree: Dict, method_summary_map: Dict) -> Dict:
+        """
+        압축된 호출 트리에 노출된 메서드의 요약만 남김
+        """
+        visible_fqns = collect_method_fqns(call_tree)
+        return {fqn: method_summary_map[fqn] for fqn in visible_fqns if fqn in method_summary_map}
+    
+    def build_call_tree_summary_result(self, llm, call_tree_docs: List[Document]) -> Dict:
+        """
+        호출 흐름 요약 단계 결과값 구성
+        """
+        return {
+            "input_type": IndexInputType.CALLTREE_SUMMARY,
+            "llm_model": llm.deployment_name,         
+            "llm_version": llm.openai_api_version,    
+            "llm_temperature": llm.temperature,
+            "call_tree_summary_info": call_tree_docs
+        }
+    
+    async def _analyze(self, llm, schema, entry_point, call_tree_doc, method_summary_map, sem, max_concurrent, idx, total, subtree_summaries=None):
         async with sem:  # 동시 실행 제한
             current = sem._value                    # 남은 슬롯 개수
             active = max_concurrent - current       # 현재 실행 중 개수
             self.logger.info(f"🚀 entry_point: [{entry_point}]")
             self.logger.info(f"🚀 [{idx+1}/{total}] 실행 시작: {entry_point} (동시 실행: {active})")
-            messages = self.get_prompt(entry_point=entry_point, call_tree=call_tree_doc.metadata.get("call_tree", {}), method_summary_map=method_summary_map)
             
-            try:
-                # LLM 호출
-                response = await self._call_llm_with_timeout(llm, schema, messages)
-                
-                call_tree_doc.metadata["success"] = response.success
-                call_tree_doc.metadata["summary_title"] = response.summary_title
-                if response.success:
-                    call_tree_doc.metadata["insight"] = response.insight.strip().replace("\n", "")
-                else:
-                    call_tree_doc.metadata["insight"] = ""
-                call_tree_doc.metadata["reasoning"] = response.reasoning.strip().replace("\n", "")
-                call_tree_doc.metadata["input_type"] = IndexInputType.CALLTREE_SUMMARY
-                call_tree_doc.metadata['source_type'] = RagSourceType.CALLTREE_SUMMARY
-                call_tree_doc.metadata['document_id'] = None
-                call_tree_doc.metadata['analyzed_at'] = datetime.now().isoformat()
-            except asyncio.TimeoutError:
-                self.logger.warning(f"❌ [TIMEOUT] {entry_point} 분석 시간 초과로 스킵됨")
-            except LengthFinishReasonError as err:
-                self.logger.warning(f"❌ [SKIP] LengthFinishReasonError LengthLimit 초과. 응답 길이 제한으로 요약 생성 실패. error: {err}")
-            except Exception as e:
-                self.logger.warning(f"❌ [FAIL] 예기치 못한 오류 발생: {e}")
+            call_tree_doc = await self.summarize_call_tree(llm=llm, schema=schema, entry_point=entry_point, call_tree_doc=call_tree_doc, method_summary_map=method_summary_map, subtree_summaries=subtree_summaries)
             
             self.logger.info(f"✅ [{idx+1}/{total}] 실행 완료: {entry_point} (남은 실행: {max_concurrent - sem._value})")
-            time.sleep(0.2)
+            await asyncio.sleep(0.2)
         
             return call_tree_doc
         
-    async def _analyze_all(self, project_id, entry_point_list, llm, schema, max_concurrent=settings.MAX_CONCURRENT):
+    async def _analyze_subtrees(self, llm, schema, subtrees: Dict[str, Dict], method_summary_map: Dict, sem) -> Dict[str, str]:
+        """
+        하위 트리를 높이 순(역위상 순서)으로 요약. 같은 높이의 하위 트리는 병렬 처리
+        """
+        subtree_summaries: Dict[str, str] = {}
+        ordered = order_subtrees_bottom_up(subtrees)
+        
+        for height in sorted({subtrees[subtree_hash]["height"] for subtree_hash in ordered}):
+            level = [subtree_hash for subtree_hash in ordered if subtrees[subtree_hash]["height"] == height]
+            
+            async def _run(subtree_hash):
+                async with sem:
+                    return subtree_hash, await self.summarize_subtree(llm=llm, schema=schema, subtree=subtrees[subtree_hash], subtree_summaries=subtree_summaries, method_summary_map=method_summary_map)
+            
+            for subtree_hash, summary in await asyncio.gather(*(_run(subtree_hash) for subtree_hash in level)):
+                if summary:
+                    subtree_summaries[subtree_hash] = summary
+        
+        self.logger.info(f"🌲 하위 트리 요약 완료: {len(subtree_summaries)}/{len(subtrees)}건")
+        return subtree_summaries
+    
+    async def _analyze_all(self, context: ProjectArtifactContext, llm, schema, max_concurrent=settings.MAX_CONCURRENT, hierarchical=False):
         sem = asyncio.Semaphore(max_concurrent)
-        tasks = []
+        targets = []
         
-        # EntryPoint 별로 요약 실행
-        for idx, entry_point in enumerate(entry_point_list):
+        # EntryPoint 별로 요약 대상 수집
+        for entry_point in context.entry_points:
             # 2. CALLTREE 문서 조회
-            call_tree_doc: Optional[Document] = load_call_tree_doc(project_id=project_id, entry_point=entry_point)
+            call_tree_doc: Optional[Document] = context.call_tree_doc(entry_point)
             
             if call_tree_doc is None:
-                return None  # 해당 entry_point에 대한 call tree 문서가 없음
+                self.logger.warning(f"🌧️ call_tree_doc is None. entry_point: [{entry_point}]")
+                continue  # 해당 entry_point에 대한 call tree 문서가 없음
 
-            # 3. 선택적으로 CODE_ANALYSIS 문서 조회
-            code_analysis_docs = load_documents_by_source_type(project_id=project_id, source_type=RagSourceType.CODE_ANALYSIS)
-            method_summary_map = {}
+            # 3. 호출 흐름에 포함된 메서드의 CODE_ANALYSIS 요약 조회
+            method_summary_map = context.method_summary_map(call_tree_doc.metadata.get("call_sequence", []))
             
-            for doc in code_analysis_docs:
-                if doc.metadata.get("entry_point") == entry_point:
-                    method_summary_map.update(doc.page_content)  # 이미 Dict 형태라고 가정 (아닐 경우 json.loads)
-            
-            tasks.append(self._analyze(llm=llm, schema=schema, entry_point=entry_point, call_tree_doc=call_tree_doc, method_summary_map=method_summary_map, sem=sem, max_concurrent=max_concurrent, idx=idx, total=len(entry_point_list)))
-            
-        return await asyncio.gather(*tasks)
+            targets.append((entry_point, call_tree_doc, method_summary_map))
+        
+        # 4. 계층적 요약 모드: 재사용 하위 트리를 먼저 한 번씩만 요약
+        subtree_summaries = None
+        if hierarchical:
+            subtrees = self.build_subtree_plan([call_tree_doc.metadata.get("call_tree", {}) for _, call_tree_doc, _ in targets])
+            merged_summary_map = {}
+            for _, _, method_summary_map in targets:
+                merged_summary_map.update(method_summary_map)
+            subtree_summaries = await self._analyze_subtrees(llm=llm, schema=schema, subtrees=subtrees, method_summary_map=merged_summary_map, sem=sem)
+        
+        tasks = [
+            self._analyze(llm=llm, schema=schema, entry_point=entry_point, call_tree_doc=call_tree_doc, method_summary_map=method_summary_map, sem=sem, max_concurrent=max_concurrent, idx=idx, total=len(targets), subtree_summaries=subtree_summaries)
+            for idx, (entry_point, call_tree_doc, method_summary_map) in enumerate(targets)
+        ]
+        return await self._gather_with_progress(stage=PipelineStage.SUMMARY, tasks=tasks)
@@ -0,0 +1,122 @@
+# server/workflow/analysis_memo.py
+
+"""
+증분 분석 결과 저장 모듈
+- 같은 프로젝트를 다시 분석할 때(로컬 디렉토리 감시 모드 등) 입력이 바뀌지 않은 메서드 분석, 흐름 요약, 다이어그램 결과를 재사용
+- 메서드: 프롬프트 입력 항목(본문, 주석, 시그니처 등) 해시가 같으면 재사용
+- entry point: 호출 트리와 호출 흐름에 포함된 모든 메서드의 입력 해시가 같으면 흐름 요약/다이어그램 재사용
+- 실행마다 이번 실행 결과로 교체 저장 (삭제된 메서드/entry point는 제거)
+"""
+
+import os
+import json
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+from langchain.schema import Document
+from server.utils.constants import AnalysisType, DirInfo
+from server.utils.file_utils import load_json_if_exists
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 메서드 분석 프롬프트 입력 항목 (CodeAnalysisAgent.get_prompt)
+METHOD_INPUT_KEYS = ("method_fqn", "method_text", "comment", "method_signature", "return_type", "modifiers", "parameters", "file_path", "package_name", "class_name")
+
+# 재사용하는 메서드 분석 결과 항목
+METHOD_RESULT_KEYS = ("summary", "description", "analysis_type", "analyzed_at")
+
+
+def _sha256_json(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class AnalysisMemo:
+    """
+    프로젝트별 이전 실행의 단계 결과 (입력 해시 기준 재사용)
+    """
+
+    def __init__(self, project_id: str, llm_key: str):
+        """
+        Args:
+            project_id (str): 프로젝트 ID
+            llm_key (str): LLM 모델 식별값 (모델이 바뀌면 이전 결과 미사용)
+        """
+        self.path = os.path.join(DirInfo.ANALYSIS_MEMO_DIR, f"{project_id}.json")
+        self.llm_key = llm_key
+
+        previous = load_json_if_exists(self.path) or {}
+        if previous.get("llm_key") != llm_key:
+            previous = {}
+        self._previous_methods: Dict[str, Dict] = previous.get("methods") or {}
+        self._previous_entry_points: Dict[str, Dict] = previous.get("entry_points") or {}
+        self._methods: Dict[str, Dict] = {}
+        self._entry_points: Dict[str, Dict] = {}
+        self.reused = {"methods": 0, "entry_points": 0}
+
+    @staticmethod
+    def method_key(method_meta: Dict) -> str:
+        return _sha256_json({key: method_meta.get(key) for key in METHOD_INPUT_KEYS})
+
+    @staticmethod
+    def entry_point_key(call_tree_info: Dict, method_keys: Dict[str, str]) -> str:
+        return _sha256_json({
+            "call_tree": call_tree_info.get("call_tree"),
+            "methods": [method_keys.get(fqn, "") for fqn in call_tree_info.get("call_sequence", [])]
+        })
+
+    def get_method(self, method_meta: Dict) -> Optional[Dict]:
+        """
+        입력이 같은 이전 메서드 분석 결과 (없으면 None)
+        """
+        item = self._previous_methods.get(method_meta.get("method_fqn", ""))
+        if item is None or item.get("key") != self.method_key(method_meta):
+            return None
+        self.reused["methods"] += 1
+        return item["result"]
+
+    def put_method(self, method_meta: Dict) -> None:
+        # LLM 분석에 성공한 결과만 저장 (실패/시간 초과는 다음 실행에서 다시 분석)
+        if method_meta.get("analysis_type") != AnalysisType.LLM:
+            return
+        self._methods[method_meta["method_fqn"]] = {
+            "key": self.method_key(method_meta),
+            "result": {key: method_meta.get(key) for key in METHOD_RESULT_KEYS}
+        }
+
+    def get_entry_point(self, entry_point: str, key: str) -> Optional[Tuple[Document, Dict]]:
+        """
+        입력이 같은 이전 흐름 요약 문서와 다이어그램 정보 (없으면 None)
+        """
+        item = self._previous_entry_points.get(entry_point)
+        if item is None or item.get("key") != key:
+            return None
+        self.reused["entry_points"] += 1
+        return Document(page_content=item["summary"]["page_content"], metadata=item["summary"]["metadata"]), item["diagram"]
+
+    def put_entry_point(self, entry_point: str, key: str, summary_doc: Optional[Document], diagram: Optional[Dict]) -> None:
+        # 요약에 성공하고 다이어그램이 생성된 경우만 저장
+        if summary_doc is None or not summary_doc.metadata.get("summary_title") or not diagram:
+            return
+        self._entry_points[entry_point] = {
+            "key": key,
+            "summary": {"page_content": summary_doc.page_content, "metadata": summary_doc.metadata},
+            "diagram": diagram
+        }
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = json.dumps({"llm_key": self.llm_key, "methods": self._methods, "entry_points": self._entry_points}, ensure_ascii=False, default=str)
+
+        # 임시 파일에 기록 후 교체
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+        logger.info(f"💾 [MEMO] 증분 분석 결과 저장: {self.path} (메서드 {len(self._methods)}건, entry point {len(self._entry_points)}건, 재사용 {self.reused})")
+
+
+def delete_analysis_memo(project_id: str) -> None:
+    path = os.path.join(DirInfo.ANALYSIS_MEMO_DIR, f"{project_id}.json")
+    if os.path.isfile(path):
+        os.remove(path)
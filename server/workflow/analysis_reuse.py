@@ -0,0 +1,124 @@
+# server/workflow/analysis_reuse.py
+
+"""
+분석 결과 재사용 모듈
+- 완료된 분석을 분석 핑거프린트(소스 + 분석 옵션 + LLM 모델) 기준으로 기록하고,
+  동일 핑거프린트로 분석을 요청하면 파싱/LLM 호출 없이 기존 결과(entry point, 분석 이력, FAISS 인덱스)를 새 project_id로 복사
+"""
+
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy.orm import Session
+from server.db.model import AnalysisFingerprint
+from server.db.schema import AnalysisFingerprintCreate
+from server.db.dao.analysis_fingerprint_dao import get_analysis_fingerprint, upsert_analysis_fingerprint, delete_analysis_fingerprints_by_project
+from server.db.dao.analysis_history_dao import copy_analysis_histories
+from server.db.dao.entry_point_list_dao import copy_entry_points
+from server.workflow.state import AnalysisStatus, get_project_status, set_project_done_status
+from server.utils.analysis_fingerprint_utils import build_analysis_fingerprint
+from server.utils.vectorstore_utils import copy_faiss_index, get_vectorstore_path
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 파일 정보에 담아 그래프 상태로 전달하는 소스 핑거프린트 키
+SOURCE_FINGERPRINT_KEY = "source_fingerprint"
+
+
+def find_reusable_analysis(db: Session, fingerprint: str) -> Optional[AnalysisFingerprint]:
+    """
+    재사용 가능한 완료 분석 조회 (원본 벡터 스토어가 삭제된 기록은 제거)
+
+    Args:
+        db (Session): DB 세션
+        fingerprint (str): 분석 핑거프린트
+
+    Returns:
+        Optional[AnalysisFingerprint]: 재사용할 분석 (없으면 None)
+    """
+    record = get_analysis_fingerprint(db, fingerprint=fingerprint)
+    if record is None:
+        return None
+    if not os.path.isdir(get_vectorstore_path(project_id=record.project_id)):
+        logger.warning(f"❗ 재사용 대상 분석 결과 없음 (기록 삭제): {record.project_id}")
+        delete_analysis_fingerprints_by_project(db, analyzed_date=record.analyzed_date, project_id=record.project_id)
+        return None
+    return record
+
+
+def reuse_analysis_result(db: Session, record: AnalysisFingerprint, session_id: str, project_id: str, project_name: str, analyzed_date: str, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    완료된 분석 결과를 새 project_id로 복사하고 분석 완료 상태로 저장
+
+    Args:
+        db (Session): DB 세션
+        record (AnalysisFingerprint): 재사용할 분석
+        session_id (str): 세션 ID
+        project_id (str): 새 프로젝트 ID
+        project_name (str): 새 프로젝트명
+        analyzed_date (str): 새 분석 일자 (YYYYMMDD)
+        file_info (Dict[str, Any]): 새 업로드 파일 정보
+
+    Returns:
+        Optional[Dict[str, Any]]: {reused_from: {project_id, analyzed_date}, entry_points, histories} (복사 실패 시 None)
+    """
+    if not copy_faiss_index(source_project_id=record.project_id, project_id=project_id):
+        return None
+
+    entry_points = copy_entry_points(db, src_analyzed_date=record.analyzed_date, src_project_id=record.project_id, analyzed_date=analyzed_date, project_id=project_id, session_id=session_id)
+    histories = copy_analysis_histories(
+        db,
+        src_analyzed_date=record.analyzed_date,
+        src_project_id=record.project_id,
+        analyzed_date=analyzed_date,
+        project_id=project_id,
+        session_id=session_id,
+        project_name=project_name,
+        uploaded_path=file_info.get("file_path"),
+        file_name=file_info.get("file_name"),
+        orig_file_name=file_info.get("orig_file_name")
+    )
+    if entry_points < 0 or histories < 0:
+        return None
+
+    set_project_done_status(project_id=project_id)
+    logger.info(f"♻️ 분석 결과 재사용: {record.project_id}({record.analyzed_date}) -> {project_id}, entry points: {entry_points}, histories: {histories}")
+    return {
+        "reused_from": {"project_id": record.project_id, "analyzed_date": record.analyzed_date},
+        "entry_points": entry_points,
+        "histories": histories
+    }
+
+
+def register_completed_analysis(db: Session, state: Dict[str, Any]) -> bool:
+    """
+    정상 완료된 분석을 분석 핑거프린트로 기록 (소스 핑거프린트가 없거나 완료 상태가 아니면 기록하지 않음)
+
+    Args:
+        db (Session): DB 세션
+        state (Dict[str, Any]): 그래프 실행 결과 상태
+
+    Returns:
+        bool: 기록 여부
+    """
+    project_id = state.get("project_id")
+    source_fingerprint = (state.get("file_info") or {}).get(SOURCE_FINGERPRINT_KEY)
+    filter_options = state.get("filter_options") or {}
+    if not project_id or not source_fingerprint:
+        return False
+    if get_project_status(project_id=project_id).get("status") != AnalysisStatus.DONE.status:
+        return False
+
+    data = AnalysisFingerprintCreate(
+        fingerprint=build_analysis_fingerprint(source_fingerprint=source_fingerprint, filter_options=filter_options),
+        source_fingerprint=source_fingerprint,
+        analyzed_date=state.get("analyzed_date"),
+        project_id=project_id,
+        project_name=state.get("project_name"),
+        llm_model=filter_options.get("llm_model"),
+        llm_version=filter_options.get("llm_version"),
+        analyzed_at=datetime.now()
+    )
+    return upsert_analysis_fingerprint(db, data)
@@ -0,0 +1,119 @@
+# server/workflow/artifact_store.py
+
+"""
+단계 산출물 저장 모듈
+- 단계별 결과(메서드 분석, 호출 트리, 요약, 다이어그램)를 프로젝트별 JSON 파일로 저장하고,
+  그래프 상태에는 경로/건수/체크섬만 담은 핸들을 전달하여 노드마다 대용량 결과가 복사/체크포인트되지 않도록 함
+- LangChain Document(호출 흐름 요약 등)는 page_content/metadata로 저장 후 조회 시 Document로 복원, 그 외 JSON으로 저장할 수 없는 값은 오류
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from typing import Any, Dict, Optional
+from langchain.schema import Document
+from server.utils.constants import DirInfo
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 핸들 식별 키
+ARTIFACT_PATH_KEY = "artifact_path"
+
+# Document 직렬화 식별 키
+DOCUMENT_TYPE_KEY = "__document__"
+
+
+def is_artifact_handle(value: Any) -> bool:
+    return isinstance(value, dict) and ARTIFACT_PATH_KEY in value
+
+
+def get_artifact_dir(project_id: str) -> str:
+    return os.path.join(DirInfo.ARTIFACT_DIR, project_id)
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, Document):
+        return {DOCUMENT_TYPE_KEY: True, "page_content": value.page_content, "metadata": value.metadata}
+    raise TypeError(f"산출물로 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _decode_value(value: Dict[str, Any]) -> Any:
+    if value.get(DOCUMENT_TYPE_KEY) is True:
+        return Document(page_content=value["page_content"], metadata=value["metadata"])
+    return value
+
+
+def save_artifact(project_id: str, name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    단계 산출물을 저장하고 그래프 상태용 핸들 반환
+
+    Args:
+        project_id (str): 프로젝트 ID
+        name (str): 산출물명 (AgentResultGroupKey)
+        payload (Dict[str, Any]): 단계 결과
+
+    Returns:
+        Dict[str, Any]: {artifact_path, input_type, count, checksum, size_bytes}
+            - count: 결과의 첫 번째 목록 항목 건수 (code_analysis_info, call_tree_info 등)
+
+    Raises:
+        TypeError: 결과에 JSON/Document로 저장할 수 없는 값이 있는 경우
+    """
+    artifact_dir = get_artifact_dir(project_id)
+    os.makedirs(artifact_dir, exist_ok=True)
+    artifact_path = os.path.join(artifact_dir, f"{name}.json")
+
+    data = json.dumps(payload, ensure_ascii=False, default=_encode_value).encode("utf-8")
+    checksum = hashlib.sha256(data).hexdigest()
+
+    # 임시 파일에 기록 후 교체 (재개 시 쓰다 만 파일을 읽지 않도록)
+    tmp_path = f"{artifact_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, artifact_path)
+
+    count = next((len(value) for value in payload.values() if isinstance(value, list)), 0)
+    handle = {
+        ARTIFACT_PATH_KEY: artifact_path,
+        "input_type": payload.get("input_type"),
+        "count": count,
+        "checksum": checksum,
+        "size_bytes": len(data)
+    }
+    logger.info(f"💾 [ARTIFACT] 산출물 저장: {artifact_path} (count={count}, {len(data)} bytes)")
+    return handle
+
+
+def load_artifact(value: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    핸들이면 산출물 파일을 읽어 반환 (핸들이 아니면 그대로 반환 - 이전 버전 체크포인트 호환)
+
+    Args:
+        value (Optional[Dict[str, Any]]): 핸들 또는 단계 결과
+
+    Returns:
+        Optional[Dict[str, Any]]: 단계 결과
+
+    Raises:
+        ValueError: 산출물 파일 체크섬이 핸들과 다른 경우
+    """
+    if not is_artifact_handle(value):
+        return value
+
+    with open(value[ARTIFACT_PATH_KEY], "rb") as f:
+        data = f.read()
+
+    checksum = value.get("checksum")
+    if checksum and hashlib.sha256(data).hexdigest() != checksum:
+        raise ValueError(f"산출물 체크섬 불일치: {value[ARTIFACT_PATH_KEY]}")
+    return json.loads(data, object_hook=_decode_value)
+
+
+def delete_project_artifacts(project_id: str) -> None:
+    artifact_dir = get_artifact_dir(project_id)
+    if os.path.isdir(artifact_dir):
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+        logger.info(f"🧹 [ARTIFACT] 산출물 삭제: {artifact_dir}")
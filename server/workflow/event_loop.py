@@ -0,0 +1,58 @@
+# server/workflow/event_loop.py
+
+"""
+분석 이벤트 루프 모듈
+- 모든 분석 그래프 실행이 공유하는 단일 이벤트 루프를 전용 스레드에서 유지
+- 단계/프로젝트마다 이벤트 루프와 HTTP 연결 풀을 새로 만들지 않도록 LLM 클라이언트를 이 루프에서만 사용
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_analysis_loop() -> asyncio.AbstractEventLoop:
+    """
+    분석 이벤트 루프 조회 (최초 호출 시 전용 스레드에서 기동)
+
+    Returns:
+        asyncio.AbstractEventLoop: 분석 이벤트 루프
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            threading.Thread(target=_run, name="analysis-event-loop", daemon=True).start()
+            ready.wait()
+            _loop = loop
+            logger.info("🔁 분석 이벤트 루프 기동")
+        return _loop
+
+
+def submit_to_analysis_loop(coro: Coroutine[Any, Any, Any]) -> Future:
+    """
+    분석 이벤트 루프에 코루틴 실행 요청 (호출 스레드는 Future로 결과 대기)
+
+    Args:
+        coro (Coroutine): 실행할 코루틴
+
+    Returns:
+        Future: 실행 결과 Future
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_analysis_loop())
@@ -4,28 +4,41 @@
 LangGraph 워크플로우 그래프 생성 모듈
 """
 
-import os
 import uuid
-from typing import Dict
+from typing import Dict, List, Optional
 from datetime import datetime
 import traceback
 from langgraph.graph import StateGraph, END
 from langgraph.types import Command
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langchain_core.runnables import RunnableConfig
+from server.workflow.checkpointer import get_checkpointer
+from server.workflow.project_context import release_project_context
+from server.workflow.artifact_store import delete_project_artifacts
+from server.workflow.analysis_reuse import SOURCE_FINGERPRINT_KEY, register_completed_analysis
+from server.db.database import run_with_db_session
 from server.workflow.state import AutoDiagentiAnalysisState, get_project_status, set_project_done_status, set_project_fail_status
-from server.utils.constants import AgentType, IndexInputType, AgentResultGroupKey, DirInfo, LLMModel
+from server.utils.constants import AgentType, IndexInputType, AgentResultGroupKey, LLMModel
 from server.utils.vectorstore_utils import delete_faiss_index_by_project
+from server.utils.local_source_utils import is_local_source, resolve_project_path
+from server.utils.analysis_fingerprint_utils import build_source_fingerprint
 from server.utils.logger import get_logger
+from server.utils.config import settings
 from server.workflow.agents.retrieval.rag_indexing_agent import RAGIndexingAgent
 from server.workflow.agents.analyze.parser_agent import ParserAgent
 from server.workflow.agents.analyze.recursive_call_tree_agent import RecursiveCallTreeAgent
 from server.workflow.agents.analyze.code_analysis_agent import CodeAnalysisAgent
 from server.workflow.agents.summarize.call_tree_summarizer_agent import CallTreeSummarizerAgent
 from server.workflow.agents.generate.sequence_diagram_generator_agent import SequenceDiagramGeneratorAgent
+from server.workflow.agents.pipeline.stage_pipeline_agent import StagePipelineAgent
 
 # 로거 선언
 logger = get_logger(__name__)
 
-def create_autodiagenti_graph(session_id: str = "", project_id: str = ""):
+# 그래프 실행 재귀 제한
+GRAPH_RECURSION_LIMIT = 35
+
+def create_autodiagenti_graph(session_id: str = "", project_id: str = "", checkpointer: Optional[BaseCheckpointSaver] = None):
     # 그래프 생성
     workflow = StateGraph(AutoDiagentiAnalysisState)
 
@@ -36,6 +49,7 @@ def create_autodiagenti_graph(session_id: str = "", project_id: str = ""):
     call_tree_summarizer_agent = CallTreeSummarizerAgent(session_id=session_id, project_id=project_id)
     sequence_diagram_agent = SequenceDiagramGeneratorAgent(session_id=session_id, project_id=project_id)
     rag_indexing_agent = RAGIndexingAgent(session_id=session_id, project_id=project_id)
+    stage_pipeline_agent = StagePipelineAgent(code_analysis_agent=code_analysis_agent, call_tree_summarizer_agent=call_tree_summarizer_agent, sequence_diagram_agent=sequence_diagram_agent, session_id=session_id, project_id=project_id)
     
     # 노드 추가
     workflow.add_node(AgentType.SUSPERVISOR, supervisor_node)
@@ -45,21 +59,73 @@ def create_autodiagenti_graph(session_id: str = "", project_id: str = ""):
     workflow.add_node(AgentType.CALL_TREE_SUMMARIZER, call_tree_summarizer_agent.run)
     workflow.add_node(AgentType.SEQUENCE_DIAGRAM, sequence_diagram_agent.run)
     workflow.add_node(AgentType.RAG_INDEXER, rag_indexing_agent.run)
+    workflow.add_node(AgentType.STAGE_PIPELINE, stage_pipeline_agent.run)
 
     # 모든 분기 노드 종료 처리
     workflow.add_edge(AgentType.PARSER, AgentType.SUSPERVISOR)
-    workflow.add_edge(AgentType.RECURSIVE_CALL_TREE, AgentType.SUSPERVISOR)
-    workflow.add_edge(AgentType.CODE_ANALYSIS, AgentType.SUSPERVISOR)
     workflow.add_edge(AgentType.CALL_TREE_SUMMARIZER, AgentType.SUSPERVISOR)
     workflow.add_edge(AgentType.SEQUENCE_DIAGRAM, AgentType.SUSPERVISOR)
     workflow.add_edge(AgentType.RAG_INDEXER, AgentType.SUSPERVISOR)
     workflow.add_edge(AgentType.SUSPERVISOR, END)
     
+    if settings.PARALLEL_BRANCHES_ENABLED:
+        _add_parallel_branches(workflow=workflow, session_id=session_id, project_id=project_id)
+    else:
+        workflow.add_edge(AgentType.RECURSIVE_CALL_TREE, AgentType.SUSPERVISOR)
+        workflow.add_edge(AgentType.CODE_ANALYSIS, AgentType.SUSPERVISOR)
+        workflow.add_edge(AgentType.STAGE_PIPELINE, AgentType.SUSPERVISOR)
+    
     # Flow 구성
     workflow.set_entry_point(AgentType.PARSER)
 
-    # 그래프 컴파일
-    return workflow.compile()
+    # 그래프 컴파일 (체크포인트 저장소가 있으면 노드 실행마다 상태 저장)
+    return workflow.compile(checkpointer=checkpointer)
+
+def _add_parallel_branches(workflow: StateGraph, session_id: str, project_id: str) -> None:
+    """
+    호출 트리 구성/인덱싱과 메서드 분석을 동시에 실행하는 분기(fan-out) 및 합류(fan-in) 구성
+    - 단계 파이프라인: RECURSIVE_CALL_TREE → [CALL_TREE_INDEXER ∥ STAGE_PIPELINE] → BRANCH_JOIN
+      (파이프라인은 호출 트리 산출물을 직접 사용하므로 호출 트리 임베딩/인덱싱과 겹쳐 실행)
+    - 단계별 실행: SUPERVISOR → [RECURSIVE_CALL_TREE → CALL_TREE_INDEXER ∥ CODE_ANALYSIS → CODE_ANALYSIS_INDEXER] → BRANCH_JOIN
+      (메서드 분석은 파서 산출물에만 의존하므로 호출 트리 완료를 기다리지 않음)
+    - 분기 인덱서는 current_source_data 대신 분기 결과 키를 인덱싱 (동시에 갱신되는 current_source_data 미사용)
+    - 분기 노드에서 오류가 발생하면 후속 노드 대신 SUPERVISOR로 이동하여 종료 (실패한 분석에 LLM 호출을 이어가지 않음)
+    """
+    call_tree_indexer = RAGIndexingAgent(session_id=session_id, project_id=project_id, role=AgentType.CALL_TREE_INDEXER, source_key=AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT)
+    workflow.add_node(AgentType.CALL_TREE_INDEXER, call_tree_indexer.run)
+    workflow.add_node(AgentType.BRANCH_JOIN, branch_join_node)
+    
+    if settings.PIPELINE_SCHEDULER_ENABLED:
+        _add_branch_edges(workflow, AgentType.RECURSIVE_CALL_TREE, [AgentType.CALL_TREE_INDEXER, AgentType.STAGE_PIPELINE])
+        workflow.add_edge([AgentType.CALL_TREE_INDEXER, AgentType.STAGE_PIPELINE], AgentType.BRANCH_JOIN)
+        workflow.add_edge(AgentType.CODE_ANALYSIS, AgentType.SUSPERVISOR)
+    else:
+        code_analysis_indexer = RAGIndexingAgent(session_id=session_id, project_id=project_id, role=AgentType.CODE_ANALYSIS_INDEXER, source_key=AgentResultGroupKey.CODE_ANALYSIS_RESULT)
+        workflow.add_node(AgentType.CODE_ANALYSIS_INDEXER, code_analysis_indexer.run)
+        _add_branch_edges(workflow, AgentType.RECURSIVE_CALL_TREE, [AgentType.CALL_TREE_INDEXER])
+        _add_branch_edges(workflow, AgentType.CODE_ANALYSIS, [AgentType.CODE_ANALYSIS_INDEXER])
+        workflow.add_edge([AgentType.CALL_TREE_INDEXER, AgentType.CODE_ANALYSIS_INDEXER], AgentType.BRANCH_JOIN)
+        workflow.add_edge(AgentType.STAGE_PIPELINE, AgentType.SUSPERVISOR)
+    
+    workflow.add_edge(AgentType.BRANCH_JOIN, AgentType.SUSPERVISOR)
+
+def _add_branch_edges(workflow: StateGraph, source: str, targets: List[str]) -> None:
+    """
+    분기 노드 이후 이동 경로 (정상: targets 동시 실행, 에이전트 오류: SUPERVISOR)
+    """
+    def _route(state: AutoDiagentiAnalysisState):
+        if state.get("agent_error", False):
+            logger.info(f"**[이동] {source} 오류 -> SUPERVISOR (후속 분기 미실행: {targets}) **")
+            return AgentType.SUSPERVISOR
+        return targets
+    workflow.add_conditional_edges(source, _route, targets + [AgentType.SUSPERVISOR])
+
+def branch_join_node(state: AutoDiagentiAnalysisState) -> Dict:
+    """
+    병렬 분기 합류 노드 (모든 분기 완료 후 1회 실행, 이후 분기는 SUPERVISOR가 결정)
+    """
+    logger.info(f"[BRANCH_JOIN] 병렬 분기 완료 - agent_result keys: {list((state.get('agent_result') or {}).keys())}")
+    return {"prev_node": AgentType.BRANCH_JOIN}
 
 def supervisor_node(state: AutoDiagentiAnalysisState) -> Command:
     prev = state.get("prev_node")
@@ -104,12 +170,28 @@ def supervisor_node(state: AutoDiagentiAnalysisState) -> Command:
         elif prev == AgentType.SEQUENCE_DIAGRAM:
             logger.info("**[이동] SEQUENCE_DIAGRAM -> SUPERVISOR -> RAG_INDEXER **")
             return Command(goto=AgentType.RAG_INDEXER, update=update_state)
+        elif prev == AgentType.STAGE_PIPELINE:
+            logger.info("**[이동] STAGE_PIPELINE -> SUPERVISOR -> RAG_INDEXER **")
+            return Command(goto=AgentType.RAG_INDEXER, update=update_state)
+        elif prev == AgentType.BRANCH_JOIN:
+            if settings.PIPELINE_SCHEDULER_ENABLED:
+                # 합류 시점의 current_source_data는 STAGE_PIPELINE 결과 (호출 트리 인덱서는 current_source_data 미갱신)
+                logger.info("**[이동] BRANCH_JOIN -> SUPERVISOR -> RAG_INDEXER **")
+                return Command(goto=AgentType.RAG_INDEXER, update=update_state)
+            logger.info("**[이동] BRANCH_JOIN -> SUPERVISOR -> CALL_TREE_SUMMARIZER **")
+            return Command(goto=AgentType.CALL_TREE_SUMMARIZER, update=update_state)
         elif prev == AgentType.RAG_INDEXER:
             if input_type == IndexInputType.PARSER:
-                logger.info("**[이동] RAG_INDEXER.PARSER -> SUPERVISOR -> RECURSIVE_CALL_TREE **")
                 set_project_done_status(project_id=project_id)
+                if settings.PARALLEL_BRANCHES_ENABLED and not settings.PIPELINE_SCHEDULER_ENABLED:
+                    logger.info("**[이동] RAG_INDEXER.PARSER -> SUPERVISOR -> [RECURSIVE_CALL_TREE, CODE_ANALYSIS] **")
+                    return Command(goto=[AgentType.RECURSIVE_CALL_TREE, AgentType.CODE_ANALYSIS], update=update_state)
+                logger.info("**[이동] RAG_INDEXER.PARSER -> SUPERVISOR -> RECURSIVE_CALL_TREE **")
                 return Command(goto=AgentType.RECURSIVE_CALL_TREE, update=update_state)
             elif input_type == IndexInputType.CALLTREE:
+                if settings.PIPELINE_SCHEDULER_ENABLED:
+                    logger.info("**[이동] RAG_INDEXER.CALLTREE -> SUPERVISOR -> STAGE_PIPELINE **")
+                    return Command(goto=AgentType.STAGE_PIPELINE, update=update_state)
                 logger.info("**[이동] RAG_INDEXER.CALLTREE -> SUPERVISOR -> CODE_ANALYSIS **")
                 return Command(goto=AgentType.CODE_ANALYSIS, update=update_state)
             elif input_type == IndexInputType.LLM_CODE:
@@ -122,6 +204,10 @@ def supervisor_node(state: AutoDiagentiAnalysisState) -> Command:
                 logger.info("**[작업종료] RAG_INDEXER.SEQUENCE_DIAGRAM -> SUPERVISOR -> END **")
                 set_project_done_status(project_id=project_id)
                 return Command(goto=END)
+            elif input_type == IndexInputType.PIPELINE:
+                logger.info("**[작업종료] RAG_INDEXER.PIPELINE -> SUPERVISOR -> END **")
+                set_project_done_status(project_id=project_id)
+                return Command(goto=END)
             else:
                 logger.warning(f"**[비정상종료] RAG_INDEXER 처리 이후 분기 불가 - input_type 누락. input_type: {input_type}")
                 set_project_fail_status(project_id=project_id)
@@ -137,50 +223,158 @@ def supervisor_node(state: AutoDiagentiAnalysisState) -> Command:
     set_project_fail_status(project_id=project_id)
     return Command(goto=END)
 
-def run_autodiagenti_graph(session_id: str, project_id: str, project_name: str, analyzed_date: str, file_info: Dict, filter_options: Dict, llm_model_info: LLMModel):
+async def run_autodiagenti_graph(session_id: str, project_id: str, project_name: str, analyzed_date: str, file_info: Dict, filter_options: Dict, llm_model_info: LLMModel, incremental: bool = False):
     # 세션 ID 생성
     session_id = str(uuid.uuid4())
     result = {}
 
     try:
-        # 그래프 생성
-        graph = create_autodiagenti_graph(session_id=session_id, project_id=project_id)
+        # 그래프 생성 (체크포인트 thread는 project_id 단위, 새 분석은 이전 체크포인트 삭제 후 시작)
+        checkpointer = get_checkpointer()
+        if checkpointer is not None:
+            checkpointer.delete_thread(project_id)
+        graph = create_autodiagenti_graph(session_id=session_id, project_id=project_id, checkpointer=checkpointer)
+        
+        # 분석 대상 경로 (로컬 디렉토리는 실행 시점 소스 기준으로 재사용 핑거프린트 갱신 - 감시 모드 재분석 포함)
+        project_path = resolve_project_path(project_id=project_id, project_name=project_name, file_info=file_info)
+        if is_local_source(file_info) and settings.ANALYSIS_REUSE_ENABLED:
+            file_info = {**file_info, SOURCE_FINGERPRINT_KEY: build_source_fingerprint(project_path) or None}
 
         # 초기 상태 설정
         initial_state: AutoDiagentiAnalysisState = AutoDiagentiAnalysisState(
             project_id=project_id,
             project_name=project_name,
-            project_path=os.path.join(DirInfo.UNPACK_DIR, project_id, project_name),
+            project_path=project_path,
             analyzed_at=datetime.now().isoformat(),
             analyzed_date=analyzed_date,
             file_info=file_info,
             filter_options = filter_options,
-            llm_model_info=llm_model_info
+            llm_model_info=llm_model_info,
+            incremental=incremental
         )
         
-        # 분석 작업전 동일 프로젝트 ID 벡터 스토어 삭제
+        # 분석 작업전 동일 프로젝트 ID 벡터 스토어 및 단계 산출물 삭제
         delete_faiss_index_by_project(project_id=project_id)
+        delete_project_artifacts(project_id=project_id)
+        release_project_context(project_id=project_id)
         
-        graph_result = graph.invoke(input=initial_state, config={"recursion_limit": 35})
-        agent_error = graph_result.get("agent_error", False)
-        agent_error_message = graph_result.get("agent_error_message", "")
-        agent_result = graph_result.get("agent_result", {})
-        logger.info("✅ graph_result:", graph_result)
-        
-        if agent_error:
-            raise Exception(agent_error_message)
-        
-        # 결과값 처리
-        target_keys = [
-            AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT,
-            AgentResultGroupKey.CALL_TREE_SUMMARY
-        ]
-
-        result = {key: agent_result.get(key, {}) for key in target_keys }
-        logger.info("✅ 분석 완료:", result)
+        graph_result = await graph.ainvoke(input=initial_state, config=_build_graph_config(project_id=project_id))
+        result = _handle_graph_result(graph_result)
+        _register_completed_analysis(graph_result)
     except Exception as err:
         logger.error(f"❌ 분석 실패: {str(err)}")
         logger.error(f"❌ 분석 실패 Stacktrace:\n {traceback.format_exc()}")
         set_project_fail_status(project_id=project_id, error_message=f"cause: {str(err)}")
+    finally:
+        # 실행 단위 산출물 컨텍스트 해제
+        release_project_context(project_id=project_id)
+    return result
+
+async def resume_autodiagenti_graph(session_id: str, project_id: str):
+    """
+    마지막으로 완료된 노드 이후부터 분석 재개 (이전 단계 산출물과 벡터 스토어 재사용)
+
+    Args:
+        session_id (str): 세션 ID
+        project_id (str): 프로젝트 ID
+
+    Returns:
+        Dict: 분석 결과
+    """
+    result = {}
+
+    try:
+        checkpointer = get_checkpointer()
+        graph = create_autodiagenti_graph(session_id=session_id, project_id=project_id, checkpointer=checkpointer)
+        resume_config = find_resume_config(graph=graph, project_id=project_id)
+        
+        if resume_config is None:
+            raise Exception("재개할 체크포인트가 없습니다.")
+        
+        logger.info(f"🔁 분석 재개: project_id={project_id}, checkpoint_id={resume_config['configurable']['checkpoint_id']}")
+        release_project_context(project_id=project_id)
+        
+        graph_result = await graph.ainvoke(input=None, config={**resume_config, "recursion_limit": GRAPH_RECURSION_LIMIT})
+        result = _handle_graph_result(graph_result)
+        _register_completed_analysis(graph_result)
+    except Exception as err:
+        logger.error(f"❌ 분석 재개 실패: {str(err)}")
+        logger.error(f"❌ 분석 재개 실패 Stacktrace:\n {traceback.format_exc()}")
+        set_project_fail_status(project_id=project_id, error_message=f"cause: {str(err)}")
+    finally:
+        release_project_context(project_id=project_id)
+    return result
+
+def can_resume_autodiagenti_graph(project_id: str) -> bool:
+    """
+    재개 가능한 체크포인트 존재 여부
+
+    Args:
+        project_id (str): 프로젝트 ID
+
+    Returns:
+        bool: 재개 가능 여부
+    """
+    checkpointer = get_checkpointer()
+    if checkpointer is None:
+        return False
+    graph = create_autodiagenti_graph(project_id=project_id, checkpointer=checkpointer)
+    return find_resume_config(graph=graph, project_id=project_id) is not None
+
+def find_resume_config(graph, project_id: str) -> Optional[RunnableConfig]:
+    """
+    재개 지점 체크포인트 조회
+    - 다음 실행 노드가 남아 있고 에이전트 오류가 기록되지 않은 가장 최근 체크포인트 (실패한 노드 실행 직전 상태)
+
+    Args:
+        graph: 체크포인트 저장소와 함께 컴파일된 그래프
+        project_id (str): 프로젝트 ID (체크포인트 thread ID)
+
+    Returns:
+        Optional[RunnableConfig]: 재개할 체크포인트 config (없거나 이미 정상 완료된 경우 None)
+    """
+    if graph.checkpointer is None:
+        return None
+    
+    for snapshot in graph.get_state_history(_build_graph_config(project_id=project_id)):
+        if not snapshot.next:
+            # 오류 없이 종료된 실행은 재개 대상 아님
+            if not snapshot.values.get("agent_error", False):
+                return None
+            continue
+        if not snapshot.values.get("agent_error", False):
+            return snapshot.config
+    return None
+
+def _build_graph_config(project_id: str) -> RunnableConfig:
+    return {"recursion_limit": GRAPH_RECURSION_LIMIT, "configurable": {"thread_id": project_id}}
+
+def _handle_graph_result(graph_result: Dict) -> Dict:
+    agent_error = graph_result.get("agent_error", False)
+    agent_error_message = graph_result.get("agent_error_message", "")
+    agent_result = graph_result.get("agent_result", {})
+    logger.info(f"✅ graph_result keys: {list(graph_result.keys())}")
+    
+    if agent_error:
+        raise Exception(agent_error_message)
+    
+    # 결과값 처리
+    target_keys = [
+        AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT,
+        AgentResultGroupKey.CALL_TREE_SUMMARY
+    ]
+
+    # 단계 결과는 산출물 핸들(경로, 건수, 체크섬)로 반환 (필요 시 load_artifact로 조회)
+    result = {key: agent_result.get(key, {}) for key in target_keys }
+    logger.info(f"✅ 분석 완료: {result}")
     return result
 
+def _register_completed_analysis(graph_result: Dict) -> None:
+    # 완료된 분석을 재사용 대상으로 기록 (기록 실패는 분석 결과에 영향 없음)
+    if not settings.ANALYSIS_REUSE_ENABLED:
+        return
+    try:
+        if run_with_db_session(register_completed_analysis, graph_result):
+            logger.info(f"♻️ 분석 결과 재사용 대상 등록: {graph_result.get('project_id')}")
+    except Exception as err:
+        logger.warning(f"🌧️ 분석 결과 재사용 대상 등록 실패: {str(err)}")
@@ -0,0 +1,301 @@
+# server/workflow/job_queue.py
+
+"""
+분석 작업 큐 모듈
+- 고정 크기 워커 풀로 요청자별/전체 동시 실행 수와 대기열 크기를 제한하고, 분석 그래프(코루틴)는 공유 분석 이벤트 루프에서 실행
+- 실행 중인 작업은 취소 이벤트로 진행 중인 LLM 호출을 중단
+"""
+
+import time
+import uuid
+import asyncio
+import inspect
+import threading
+import traceback
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from server.utils.config import settings
+from server.utils.constants import JobStatus
+from server.workflow.event_loop import submit_to_analysis_loop
+from server.workflow.state import AnalysisStatus, set_project_status_by_analysis_status, set_project_cancel_status
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 실행 중 LLM 호출의 취소 여부 확인 주기 (초)
+CANCEL_POLL_INTERVAL = 0.2
+
+
+class JobQueueFullError(Exception):
+    """대기열이 가득 찬 경우"""
+
+
+class JobAlreadyExistsError(Exception):
+    """동일 프로젝트 작업이 이미 대기/실행 중인 경우"""
+
+
+class AnalysisCancelledError(Exception):
+    """분석 작업이 취소된 경우"""
+
+
+@dataclass
+class AnalysisJob:
+    project_id: str
+    tenant_id: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    job_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = JobStatus.QUEUED
+    enqueued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+
+class AnalysisJobQueue:
+    """
+    분석 작업 큐.
+
+    - max_workers: 동시에 실행되는 전체 분석 수 (워커 스레드 수)
+    - max_jobs_per_tenant: 요청자별 동시 실행 수 (한도에 걸린 요청자의 작업은 건너뛰고 다음 작업 실행)
+    - max_queue_size: 대기 작업 최대 수 (초과 시 JobQueueFullError)
+    """
+    def __init__(self, max_workers: int, max_queue_size: int, max_jobs_per_tenant: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max_queue_size
+        self.max_jobs_per_tenant = max(1, max_jobs_per_tenant)
+        self._pending: List[AnalysisJob] = []
+        self._running: Dict[str, AnalysisJob] = {}
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+
+    def submit(self, project_id: str, tenant_id: str, func: Callable[..., Any], *args) -> AnalysisJob:
+        """
+        작업 등록
+
+        Args:
+            project_id (str): 프로젝트 ID
+            tenant_id (str): 요청자 ID (동시 실행 수 제한 단위)
+            func (Callable): 워커에서 실행할 함수
+            *args: 함수 인자
+
+        Returns:
+            AnalysisJob: 등록된 작업
+
+        Raises:
+            JobAlreadyExistsError: 동일 프로젝트 작업이 대기/실행 중인 경우
+            JobQueueFullError: 대기열이 가득 찬 경우
+        """
+        with self._cond:
+            if project_id in self._running or any(job.project_id == project_id for job in self._pending):
+                raise JobAlreadyExistsError(f"이미 대기 또는 실행 중인 분석입니다: {project_id}")
+            if len(self._pending) >= self.max_queue_size:
+                raise JobQueueFullError(f"분석 대기열이 가득 찼습니다. (최대 {self.max_queue_size}건)")
+
+            job = AnalysisJob(project_id=project_id, tenant_id=tenant_id, func=func, args=args)
+            self._pending.append(job)
+            self._ensure_workers()
+            self._cond.notify_all()
+            position = len(self._pending)
+
+        set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.QUEUED, custom_message=f"대기 순번 {position}")
+        logger.info(f"📥 [JOB_QUEUE] 작업 등록: project_id={project_id}, tenant_id={tenant_id}, position={position}")
+        return job
+
+    def cancel(self, project_id: str) -> bool:
+        """
+        작업 취소 (대기 작업은 대기열에서 제거, 실행 중 작업은 취소 이벤트 설정)
+
+        Args:
+            project_id (str): 프로젝트 ID
+
+        Returns:
+            bool: 취소 대상 작업 존재 여부
+        """
+        with self._cond:
+            pending_job = next((job for job in self._pending if job.project_id == project_id), None)
+            if pending_job is not None:
+                self._pending.remove(pending_job)
+                pending_job.status = JobStatus.CANCELLED
+                pending_job.cancel_event.set()
+                pending_projects = [job.project_id for job in self._pending]
+            else:
+                running_job = self._running.get(project_id)
+                if running_job is None:
+                    return False
+                running_job.cancel_event.set()
+
+        if pending_job is not None:
+            set_project_cancel_status(project_id=project_id)
+            self._publish_positions(pending_projects)
+            logger.info(f"⛔ [JOB_QUEUE] 대기 작업 취소: project_id={project_id}")
+        else:
+            logger.info(f"⛔ [JOB_QUEUE] 실행 중 작업 취소 요청: project_id={project_id}")
+        return True
+
+    def get_job_info(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태와 대기 순번 조회 (대기 순번은 1부터, 실행 중이면 0)
+
+        Args:
+            project_id (str): 프로젝트 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보 (큐에 없으면 None)
+        """
+        with self._cond:
+            job = self._running.get(project_id)
+            position = 0
+            if job is None:
+                for idx, pending_job in enumerate(self._pending):
+                    if pending_job.project_id == project_id:
+                        job, position = pending_job, idx + 1
+                        break
+            if job is None:
+                return None
+            return {
+                "job_id": job.job_id,
+                "job_status": JobStatus.CANCELLED if job.cancel_event.is_set() else job.status,
+                "queue_position": position,
+                "queued_jobs": len(self._pending),
+                "running_jobs": len(self._running)
+            }
+
+    def get_cancel_event(self, project_id: str) -> Optional[threading.Event]:
+        with self._cond:
+            job = self._running.get(project_id)
+            return job.cancel_event if job is not None else None
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+    def _ensure_workers(self) -> None:
+        # 최초 작업 등록 시 워커 스레드 기동
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._worker_loop, name=f"analysis-worker-{len(self._workers) + 1}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _publish_positions(self, pending_projects: List[str]) -> None:
+        # 대기열이 줄어들면 남은 작업의 대기 순번을 상태 저장소에 반영 (다른 API 워커/SSE 구독자 조회용)
+        for idx, project_id in enumerate(pending_projects):
+            set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.QUEUED, custom_message=f"대기 순번 {idx + 1}")
+
+    def _next_job(self) -> Optional[AnalysisJob]:
+        running_by_tenant: Dict[str, int] = {}
+        for job in self._running.values():
+            running_by_tenant[job.tenant_id] = running_by_tenant.get(job.tenant_id, 0) + 1
+
+        for job in self._pending:
+            if running_by_tenant.get(job.tenant_id, 0) < self.max_jobs_per_tenant:
+                return job
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    self._cond.wait()
+                    job = self._next_job()
+                self._pending.remove(job)
+                job.status = JobStatus.RUNNING
+                job.started_at = time.time()
+                self._running[job.project_id] = job
+                pending_projects = [pending_job.project_id for pending_job in self._pending]
+
+            self._publish_positions(pending_projects)
+
+            logger.info(f"🚀 [JOB_QUEUE] 작업 시작: project_id={job.project_id}, 대기 {job.started_at - job.enqueued_at:.1f}s")
+            try:
+                if inspect.iscoroutinefunction(job.func):
+                    # 워커는 동시 실행 수만 제한하고, 그래프는 모든 작업이 공유하는 이벤트 루프에서 실행
+                    submit_to_analysis_loop(job.func(*job.args)).result()
+                else:
+                    job.func(*job.args)
+            except Exception as err:
+                logger.error(f"❌ [JOB_QUEUE] 작업 실행 실패: project_id={job.project_id}, {str(err)}")
+                logger.error(f"❌ Stacktrace:\n {traceback.format_exc()}")
+            finally:
+                if job.cancel_event.is_set():
+                    set_project_cancel_status(project_id=job.project_id)
+                with self._cond:
+                    job.status = JobStatus.CANCELLED if job.cancel_event.is_set() else JobStatus.DONE
+                    self._running.pop(job.project_id, None)
+                    self._cond.notify_all()
+                logger.info(f"🏁 [JOB_QUEUE] 작업 종료: project_id={job.project_id}, status={job.status}, 소요 {time.time() - job.started_at:.1f}s")
+
+
+# 프로세스 공용 작업 큐
+_job_queue: Optional[AnalysisJobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> AnalysisJobQueue:
+    """
+    분석 작업 큐 조회 (없으면 설정값으로 생성)
+
+    Returns:
+        AnalysisJobQueue: 분석 작업 큐
+    """
+    global _job_queue
+
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = AnalysisJobQueue(max_workers=settings.ANALYSIS_MAX_WORKERS, max_queue_size=settings.ANALYSIS_MAX_QUEUE_SIZE, max_jobs_per_tenant=settings.ANALYSIS_MAX_JOBS_PER_TENANT)
+        return _job_queue
+
+
+def is_project_cancelled(project_id: str) -> bool:
+    cancel_event = get_job_queue().get_cancel_event(project_id)
+    return cancel_event is not None and cancel_event.is_set()
+
+
+def raise_if_cancelled(project_id: str) -> None:
+    """
+    취소된 작업이면 AnalysisCancelledError 발생
+    """
+    if is_project_cancelled(project_id):
+        raise AnalysisCancelledError(f"분석이 취소되었습니다: {project_id}")
+
+
+async def run_cancellable(coro: Awaitable[Any], project_id: str, timeout: float) -> Any:
+    """
+    취소 이벤트를 주기적으로 확인하며 코루틴 실행 (취소 시 진행 중인 호출 중단)
+
+    Args:
+        coro (Awaitable[Any]): 실행할 코루틴
+        project_id (str): 프로젝트 ID
+        timeout (float): 타임아웃 (초)
+
+    Returns:
+        Any: 코루틴 결과
+
+    Raises:
+        AnalysisCancelledError: 작업이 취소된 경우
+        asyncio.TimeoutError: 타임아웃 초과
+    """
+    cancel_event = get_job_queue().get_cancel_event(project_id)
+    if cancel_event is None:
+        return await asyncio.wait_for(coro, timeout=timeout)
+
+    task = asyncio.ensure_future(coro)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    try:
+        while not task.done():
+            if cancel_event.is_set():
+                raise AnalysisCancelledError(f"분석이 취소되었습니다: {project_id}")
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            await asyncio.wait({task}, timeout=min(CANCEL_POLL_INTERVAL, remaining))
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await task
+    return task.result()
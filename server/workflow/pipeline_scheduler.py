@@ -0,0 +1,218 @@
+# server/workflow/pipeline_scheduler.py
+
+"""
+단계 파이프라인 스케줄러 모듈
+- 단계 간 전역 배리어 없이, 의존성이 충족된 작업부터 공유 LLM 동시성 한도 내에서 실행
+"""
+
+import time
+import heapq
+import asyncio
+import itertools
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+
+class PrioritySemaphore:
+    """
+    우선순위 대기열을 가진 세마포어.
+    슬롯이 반환되면 priority 값이 가장 작은(가장 하위 단계의) 대기 작업부터 깨웁니다.
+    """
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: List = []
+        self._seq = itertools.count()
+
+    @property
+    def available(self) -> int:
+        return self._value
+
+    async def acquire(self, priority: int = 0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소된 경우 슬롯 반환
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(True)
+                return
+        self._value += 1
+
+    def slot(self, priority: int = 0) -> "_PrioritySlot":
+        return _PrioritySlot(self, priority)
+
+
+class _PrioritySlot:
+    def __init__(self, semaphore: PrioritySemaphore, priority: int):
+        self._semaphore = semaphore
+        self._priority = priority
+
+    async def __aenter__(self):
+        await self._semaphore.acquire(self._priority)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+
+@dataclass
+class PipelineTask:
+    key: str
+    stage: str
+    coro_factory: Callable[[Dict[str, Any]], Awaitable[Any]]
+    deps: List[str] = field(default_factory=list)
+    priority: int = 0
+    use_slot: bool = True
+
+
+@dataclass
+class StageStats:
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    first_done_sec: Optional[float] = None
+    last_done_sec: Optional[float] = None
+
+
+class PipelineScheduler:
+    """
+    의존성 기반 작업 스케줄러.
+    - 각 작업은 deps로 지정한 작업이 모두 끝나면 즉시 시작 (단계 단위 배리어 없음)
+    - LLM 호출 작업은 하나의 PrioritySemaphore(동시성 예산)를 공유
+    - 실패한 작업의 결과는 None으로 기록되고, 후속 작업은 가능한 범위에서 계속 진행
+    """
+    def __init__(self, max_concurrent: int, on_task_done: Optional[Callable[[PipelineTask, Any, Dict[str, StageStats]], None]] = None):
+        self.max_concurrent = max_concurrent
+        self.on_task_done = on_task_done
+        self.tasks: Dict[str, PipelineTask] = {}
+        self.stats: Dict[str, StageStats] = {}
+        self.elapsed_sec: float = 0.0
+
+    def add_task(self, key: str, stage: str, coro_factory: Callable[[Dict[str, Any]], Awaitable[Any]], deps: Iterable[str] = (), priority: int = 0, use_slot: bool = True) -> None:
+        """
+        작업 등록
+
+        Args:
+            key (str): 작업 고유키
+            stage (str): 단계명 (통계 집계용)
+            coro_factory (Callable): 의존 작업 결과(Dict[key, result])를 받아 코루틴을 생성하는 함수
+            deps (Iterable[str]): 선행 작업 키 목록 (미등록 키는 무시)
+            priority (int): 슬롯 대기 우선순위 (작을수록 먼저)
+            use_slot (bool): LLM 동시성 예산 사용 여부
+        """
+        if key in self.tasks:
+            return
+        self.tasks[key] = PipelineTask(key=key, stage=stage, coro_factory=coro_factory, deps=list(dict.fromkeys(deps)), priority=priority, use_slot=use_slot)
+        self.stats.setdefault(stage, StageStats()).total += 1
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        등록된 모든 작업 실행
+
+        Returns:
+            Dict[str, Any]: 작업키 → 결과 (실패 시 None)
+        """
+        semaphore = PrioritySemaphore(self.max_concurrent)
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, asyncio.Future] = {key: loop.create_future() for key in self.tasks}
+        results: Dict[str, Any] = {}
+        started = time.perf_counter()
+
+        async def _run_task(task: PipelineTask):
+            deps = [dep for dep in task.deps if dep in futures]
+            if deps:
+                await asyncio.gather(*(futures[dep] for dep in deps))
+            dep_results = {dep: results.get(dep) for dep in deps}
+
+            result = None
+            failed = False
+            try:
+                if task.use_slot:
+                    async with semaphore.slot(task.priority):
+                        result = await task.coro_factory(dep_results)
+                else:
+                    result = await task.coro_factory(dep_results)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                failed = True
+                logger.warning(f"❌ [PIPELINE] 작업 실패: {task.key}, error: {err}")
+                logger.debug(traceback.format_exc())
+
+            results[task.key] = result
+            self._record(task, failed=failed, elapsed=time.perf_counter() - started)
+            futures[task.key].set_result(True)
+
+            if self.on_task_done:
+                try:
+                    self.on_task_done(task, result, self.stats)
+                except Exception as err:
+                    logger.warning(f"🌧️ [PIPELINE] on_task_done 처리 오류: {err}")
+
+        self._check_cycles()
+        await asyncio.gather(*(_run_task(task) for task in self.tasks.values()))
+        self.elapsed_sec = time.perf_counter() - started
+        return results
+
+    def report(self) -> Dict[str, Any]:
+        """
+        단계별 처리 건수 및 첫/마지막 완료 시각(초) 리포트
+        """
+        return {
+            "total_sec": round(self.elapsed_sec, 3),
+            "max_concurrent": self.max_concurrent,
+            "stages": {
+                stage: {
+                    "total": stat.total,
+                    "done": stat.done,
+                    "failed": stat.failed,
+                    "first_done_sec": round(stat.first_done_sec, 3) if stat.first_done_sec is not None else None,
+                    "last_done_sec": round(stat.last_done_sec, 3) if stat.last_done_sec is not None else None
+                }
+                for stage, stat in self.stats.items()
+            }
+        }
+
+    def _record(self, task: PipelineTask, failed: bool, elapsed: float) -> None:
+        stat = self.stats[task.stage]
+        stat.done += 1
+        if failed:
+            stat.failed += 1
+        if stat.first_done_sec is None:
+            stat.first_done_sec = elapsed
+        stat.last_done_sec = elapsed
+
+    def _check_cycles(self) -> None:
+        visiting, visited = set(), set()
+
+        def _visit(key: str):
+            if key in visited or key not in self.tasks:
+                return
+            if key in visiting:
+                raise ValueError(f"Pipeline dependency cycle detected: {key}")
+            visiting.add(key)
+            for dep in self.tasks[key].deps:
+                _visit(dep)
+            visiting.discard(key)
+            visited.add(key)
+
+        for key in self.tasks:
+            _visit(key)
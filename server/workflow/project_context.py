@@ -0,0 +1,261 @@
+# server/workflow/project_context.py
+
+"""
+프로젝트 분석 산출물 컨텍스트 모듈
+- 분석 실행(run) 단위로 파서 산출물과 벡터스토어 문서를 한 번만 로드하고, 에이전트 간 인덱스 조인을 공유
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from langchain.schema import Document
+from server.utils.config import settings
+from server.utils.constants import DirInfo, RagSourceType
+from server.utils.file_utils import load_json
+from server.utils.vectorstore_utils import load_faiss_vector_store
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+
+class ProjectArtifactContext:
+    """
+    프로젝트 1건의 분석 산출물 캐시.
+
+    - 파서 산출물(entry_point_fqns.json, all_methods.json)은 최초 접근 시 1회 로드
+    - 벡터스토어 문서는 1회 로드 후 source_type별로 분류하고, RAG 인덱싱으로 문서가 추가되면 invalidate_documents()로 재로드
+    - entry_point → 호출 트리, method_fqn → 코드 분석 결과, entry_point → method_definitions 조인 제공
+    """
+    def __init__(self, project_id: str, project_name: str, output_dir: Optional[str] = None):
+        self.project_id = project_id
+        self.project_name = project_name
+        self.output_dir = output_dir or os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project_name)
+        self._lock = threading.RLock()
+        self._file_cache: Dict[str, Any] = {}
+        self._doc_cache: Dict[str, Any] = {}
+
+    # ------------------------------------------------------------------
+    # 파서 산출물
+    # ------------------------------------------------------------------
+    @property
+    def entry_points(self) -> List[str]:
+        return self._cached(self._file_cache, "entry_points", lambda: load_json(os.path.join(self.output_dir, settings.ENTRY_POINT_FILE_NAME)) or [])
+
+    @property
+    def valid_method_fqns(self) -> set:
+        return self._cached(self._file_cache, "valid_method_fqns", lambda: set(load_json(os.path.join(self.output_dir, settings.ALL_METHODS_FILE_NAME)) or []))
+
+    # ------------------------------------------------------------------
+    # 벡터스토어 문서
+    # ------------------------------------------------------------------
+    def documents(self, source_type: str) -> List[Document]:
+        """
+        source_type별 문서 목록 (벡터스토어 1회 로드)
+        """
+        return self._cached(self._doc_cache, "documents_by_source_type", self._load_documents).get(source_type, [])
+
+    @property
+    def parser_documents(self) -> List[Document]:
+        return self.documents(RagSourceType.PARSER)
+
+    @property
+    def call_edges(self) -> List[Dict]:
+        return self._parser_index["call_edges"]
+
+    @property
+    def caller_set(self) -> set:
+        return self._parser_index["caller_set"]
+
+    @property
+    def method_meta_map(self) -> Dict[str, Dict]:
+        return self._parser_index["method_meta_map"]
+
+    def callees_of(self, caller: str) -> List[str]:
+        """
+        caller가 호출하는 callee 목록 (call_edges 순서 유지)
+        """
+        return self._parser_index["callees_by_caller"].get(caller, [])
+
+    @property
+    def project_info(self) -> Dict[str, str]:
+        return self._parser_index["project_info"]
+
+    @property
+    def code_methods(self) -> List[Dict]:
+        """
+        CODE 문서의 메서드 메타 목록 (method_fqn 기준 중복 제거, 호출측 수정이 캐시에 반영되지 않도록 복사본 반환)
+        """
+        methods = self._cached(self._doc_cache, "code_methods", self._build_code_methods)
+        return [dict(method_meta) for method_meta in methods]
+
+    def call_tree_doc(self, entry_point: str) -> Optional[Document]:
+        """
+        entry_point의 CALLTREE 문서 (요약 단계에서 metadata를 갱신하므로 복사본 반환)
+        """
+        doc = self._index_by_entry_point(RagSourceType.CALLTREE).get(entry_point)
+        return Document(page_content=doc.page_content, metadata=dict(doc.metadata)) if doc is not None else None
+
+    def call_tree_summary_doc(self, entry_point: str) -> Optional[Document]:
+        return self._index_by_entry_point(RagSourceType.CALLTREE_SUMMARY).get(entry_point)
+
+    @property
+    def method_analyses(self) -> Dict[str, Dict]:
+        """
+        method_fqn → CODE_ANALYSIS 문서 metadata
+        """
+        return self._cached(self._doc_cache, "method_analyses", self._build_method_analyses)
+
+    def method_analysis(self, method_fqn: str) -> Optional[Dict]:
+        return self.method_analyses.get(method_fqn)
+
+    def method_summary_map(self, call_sequence: List[str]) -> Dict[str, Dict]:
+        """
+        호출 흐름에 포함된 메서드의 요약 맵 (흐름 요약 프롬프트용)
+        """
+        method_summary_map = {}
+        for method_fqn in call_sequence:
+            analysis = self.method_analysis(method_fqn)
+            if analysis and analysis.get("summary"):
+                method_summary_map[method_fqn] = {
+                    "summary": analysis.get("summary"),
+                    "parameters": analysis.get("parameters") or [],
+                    "return_type": analysis.get("return_type") or "void"
+                }
+        return method_summary_map
+
+    def preload(self) -> None:
+        """
+        파서 산출물과 벡터스토어 문서 선로드 (블로킹 I/O를 이벤트 루프 밖에서 수행할 때 사용)
+        """
+        self.entry_points
+        self.documents(RagSourceType.PARSER)
+
+    def invalidate_documents(self) -> None:
+        """
+        벡터스토어 문서 기반 캐시 초기화 (RAG 인덱싱 후 호출)
+        """
+        with self._lock:
+            self._doc_cache.clear()
+
+    # ------------------------------------------------------------------
+    # 내부 함수
+    # ------------------------------------------------------------------
+    @property
+    def _parser_index(self) -> Dict[str, Any]:
+        return self._cached(self._doc_cache, "parser_index", self._build_parser_index)
+
+    def _index_by_entry_point(self, source_type: str) -> Dict[str, Document]:
+        def _build():
+            index = {}
+            for doc in self.documents(source_type):
+                # 동일 entry_point 문서가 여러 건이면 최초 문서 사용 (기존 단건 조회와 동일)
+                index.setdefault(doc.metadata.get("entry_point"), doc)
+            return index
+        return self._cached(self._doc_cache, f"entry_point_index::{source_type}", _build)
+
+    def _cached(self, cache: Dict[str, Any], key: str, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key not in cache:
+                cache[key] = loader()
+            return cache[key]
+
+    def _load_documents(self) -> Dict[str, List[Document]]:
+        vectorstore = load_faiss_vector_store(self.project_id)
+        if vectorstore is None:
+            return {}
+
+        documents_by_source_type: Dict[str, List[Document]] = {}
+        for doc in vectorstore.docstore._dict.values():
+            documents_by_source_type.setdefault(doc.metadata.get("source_type"), []).append(doc)
+
+        logger.info(f"📚 [CONTEXT] project_id={self.project_id}, 문서 로드: { {key: len(docs) for key, docs in documents_by_source_type.items()} }")
+        return documents_by_source_type
+
+    def _build_parser_index(self) -> Dict[str, Any]:
+        call_edges: List[Dict] = []
+        method_meta_map: Dict[str, Dict] = {}
+        project_info: Dict[str, str] = {}
+
+        for doc in self.parser_documents:
+            meta = doc.metadata
+            call_edges.extend(meta.get("call_edges", []))
+            method_meta_map.update(meta.get("method_meta_map", {}))
+
+            # 프로젝트 정보 (첫 번째 문서 기준)
+            if not project_info:
+                project_info = {
+                    "project_name": meta.get("project_name", "UnknownProject"),
+                    "file_path": meta.get("file_path", "")
+                }
+
+        callees_by_caller: Dict[str, List[str]] = {}
+        for edge in call_edges:
+            callees_by_caller.setdefault(edge.get("caller"), []).append(edge.get("callee"))
+
+        return {
+            "call_edges": call_edges,
+            "caller_set": set(callees_by_caller.keys()),
+            "callees_by_caller": callees_by_caller,
+            "method_meta_map": method_meta_map,
+            "project_info": project_info
+        }
+
+    def _build_code_methods(self) -> List[Dict]:
+        all_method_fqns: Dict[str, Dict] = {}
+        for doc in self.documents(RagSourceType.CODE):
+            for method_fqn, method_info in doc.metadata.get("methods", {}).items():
+                if "method_fqn" not in method_info:
+                    method_info["method_fqn"] = method_fqn  # 반드시 보강
+                all_method_fqns.setdefault(method_fqn, method_info)
+        return list(all_method_fqns.values())
+
+    def _build_method_analyses(self) -> Dict[str, Dict]:
+        method_analyses = {}
+        for doc in self.documents(RagSourceType.CODE_ANALYSIS):
+            method_fqn = doc.metadata.get("method_fqn")
+            if method_fqn:
+                method_analyses[method_fqn] = doc.metadata
+        return method_analyses
+
+
+# 실행 중인 프로젝트별 컨텍스트
+_contexts: Dict[str, ProjectArtifactContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_project_context(project_id: str, project_name: str) -> ProjectArtifactContext:
+    """
+    프로젝트 컨텍스트 조회 (없으면 생성)
+
+    Args:
+        project_id (str): 프로젝트 ID
+        project_name (str): 프로젝트명
+
+    Returns:
+        ProjectArtifactContext: 프로젝트 컨텍스트
+    """
+    with _contexts_lock:
+        context = _contexts.get(project_id)
+        if context is None or context.project_name != project_name:
+            context = ProjectArtifactContext(project_id=project_id, project_name=project_name)
+            _contexts[project_id] = context
+        return context
+
+
+def invalidate_project_documents(project_id: str) -> None:
+    """
+    벡터스토어에 문서가 추가된 프로젝트의 문서 캐시 초기화
+    """
+    with _contexts_lock:
+        context = _contexts.get(project_id)
+    if context is not None:
+        context.invalidate_documents()
+
+
+def release_project_context(project_id: str) -> None:
+    """
+    분석 종료 후 프로젝트 컨텍스트 해제
+    """
+    with _contexts_lock:
+        _contexts.pop(project_id, None)
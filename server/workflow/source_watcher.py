@@ -0,0 +1,197 @@
+# server/workflow/source_watcher.py
+
+"""
+로컬 소스 디렉토리 감시 모듈
+- 로컬 디렉토리(SourceType.LOCAL) 분석 시 watch 옵션을 켜면 Java 소스/빌드 설정 파일 변경을 감지하여 증분 재분석을 작업 큐에 등록
+- 저장이 연속되는 경우 마지막 변경 후 settings.LOCAL_WATCH_DEBOUNCE_SEC 동안 변경이 없을 때 1회만 등록
+- 같은 프로젝트 분석이 대기/실행 중이면 종료 후 다시 등록 (변경 사항 누락 방지)
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Set
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEvent, FileSystemEventHandler, EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED
+from server.utils.config import settings
+from server.utils.local_source_utils import is_watch_target
+from server.workflow.job_queue import get_job_queue, JobAlreadyExistsError, JobQueueFullError
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+# 재분석을 유발하는 이벤트 (opened/closed 등 읽기 이벤트 제외)
+CHANGE_EVENT_TYPES = {EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED}
+
+
+class _SourceChangeHandler(FileSystemEventHandler):
+    def __init__(self, watcher: "SourceWatcher", project_id: str, source_path: str):
+        self.watcher = watcher
+        self.project_id = project_id
+        self.source_path = source_path
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in CHANGE_EVENT_TYPES:
+            return
+        changed = [path for path in (event.src_path, getattr(event, "dest_path", "")) if path and is_watch_target(path, self.source_path)]
+        if changed:
+            self.watcher.notify_change(self.project_id, changed)
+
+
+class _WatchEntry:
+    def __init__(self, source_path: str, tenant_id: str, func: Callable[..., Any], args: tuple):
+        self.source_path = source_path
+        self.tenant_id = tenant_id
+        self.func = func
+        self.args = args
+        self.watch = None
+        self.timer: Optional[threading.Timer] = None
+        self.changed: Set[str] = set()
+
+
+class SourceWatcher:
+    """
+    프로젝트별 로컬 소스 디렉토리 감시 (Observer 1개 공유)
+    """
+
+    def __init__(self, debounce_sec: float, submit: Optional[Callable[..., Any]] = None):
+        """
+        Args:
+            debounce_sec (float): 마지막 변경 후 재분석 등록까지 대기 시간(초)
+            submit (Callable): 작업 등록 함수 (project_id, tenant_id, func, *args), 기본값은 분석 작업 큐
+        """
+        self.debounce_sec = debounce_sec
+        self._submit = submit or (lambda *args: get_job_queue().submit(*args))
+        self._entries: Dict[str, _WatchEntry] = {}
+        self._lock = threading.Lock()
+        self._observer: Optional[Observer] = None
+
+    def watch(self, project_id: str, source_path: str, tenant_id: str, func: Callable[..., Any], *args) -> None:
+        """
+        소스 디렉토리 감시 시작 (이미 감시 중이면 재분석 작업 정보만 교체)
+
+        Args:
+            project_id (str): 프로젝트 ID
+            source_path (str): 소스 디렉토리 경로
+            tenant_id (str): 작업 큐 테넌트 ID
+            func (Callable): 변경 시 실행할 분석 함수
+            *args: 분석 함수 인자
+        """
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is not None and entry.source_path == source_path:
+                entry.tenant_id, entry.func, entry.args = tenant_id, func, args
+                return
+            if entry is not None:
+                self._unschedule(project_id)
+
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+
+            entry = _WatchEntry(source_path=source_path, tenant_id=tenant_id, func=func, args=args)
+            entry.watch = self._observer.schedule(_SourceChangeHandler(self, project_id, source_path), source_path, recursive=True)
+            self._entries[project_id] = entry
+        logger.info(f"👀 [WATCH] 소스 디렉토리 감시 시작: project_id={project_id}, path={source_path}")
+
+    def stop(self, project_id: str) -> bool:
+        """
+        소스 디렉토리 감시 종료
+
+        Returns:
+            bool: 감시 중이었는지 여부
+        """
+        with self._lock:
+            stopped = self._unschedule(project_id)
+        if stopped:
+            logger.info(f"👀 [WATCH] 소스 디렉토리 감시 종료: project_id={project_id}")
+        return stopped
+
+    def is_watching(self, project_id: str) -> bool:
+        with self._lock:
+            return project_id in self._entries
+
+    def notify_change(self, project_id: str, paths: list) -> None:
+        """
+        변경 파일 기록 후 재분석 등록 타이머 재시작 (debounce)
+        """
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                return
+            entry.changed.update(paths)
+            self._schedule_submit(project_id, entry)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for project_id in list(self._entries):
+                self._unschedule(project_id)
+            observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    def _schedule_submit(self, project_id: str, entry: _WatchEntry) -> None:
+        if entry.timer is not None:
+            entry.timer.cancel()
+        entry.timer = threading.Timer(self.debounce_sec, self._submit_change, args=(project_id,))
+        entry.timer.daemon = True
+        entry.timer.start()
+
+    def _submit_change(self, project_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(project_id)
+            if entry is None:
+                return
+            changed, entry.changed = entry.changed, set()
+            entry.timer = None
+
+        try:
+            self._submit(project_id, entry.tenant_id, entry.func, *entry.args)
+            logger.info(f"👀 [WATCH] 변경 감지 재분석 등록: project_id={project_id}, 변경 파일 {len(changed)}건")
+        except (JobAlreadyExistsError, JobQueueFullError) as err:
+            # 분석 대기/실행 중이면 변경 내역을 유지한 채 다시 대기
+            logger.info(f"👀 [WATCH] 재분석 등록 보류 (재시도 예정): project_id={project_id}, {str(err)}")
+            with self._lock:
+                if self._entries.get(project_id) is entry:
+                    entry.changed.update(changed)
+                    self._schedule_submit(project_id, entry)
+        except Exception as err:
+            logger.error(f"❌ [WATCH] 재분석 등록 실패: project_id={project_id}, {str(err)}")
+
+    def _unschedule(self, project_id: str) -> bool:
+        entry = self._entries.pop(project_id, None)
+        if entry is None:
+            return False
+        if entry.timer is not None:
+            entry.timer.cancel()
+        if self._observer is not None and entry.watch is not None:
+            self._observer.unschedule(entry.watch)
+        return True
+
+
+# 프로세스 공용 감시자
+_watcher: Optional[SourceWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_source_watcher() -> SourceWatcher:
+    """
+    로컬 소스 감시자 조회 (없으면 설정값으로 생성)
+
+    Returns:
+        SourceWatcher: 로컬 소스 감시자
+    """
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = SourceWatcher(debounce_sec=settings.LOCAL_WATCH_DEBOUNCE_SEC)
+        return _watcher
+
+
+def shutdown_source_watcher() -> None:
+    global _watcher
+    with _watcher_lock:
+        watcher, _watcher = _watcher, None
+    if watcher is not None:
+        watcher.shutdown()
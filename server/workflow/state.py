@@ -3,16 +3,22 @@
 워크플로우 상태 관리 모듈
 """
 
+import time
+import threading
 from enum import Enum
 from datetime import datetime
-from typing import TypedDict, Optional
+from typing import Annotated, TypedDict, Optional
 from dataclasses import field
+from server.utils.config import settings
 from server.utils.constants import AgentType, AgentRunType, LLMModel
+from server.workflow.status_store import get_status_store
 
-# 상태 확인용 map
-status_map = {}
 TOTAL_STEPS = 13
 
+# 단계별 진행 건수 마지막 저장 시각 (project_id, stage) → time (저장 빈도 제한)
+_progress_saved_at = {}
+_progress_lock = threading.Lock()
+
 class AnalysisStatus(Enum):
     UPLOAD_STARTED = ("upload_started", 1, "🔄 업로드 중")
     UPLOAD_COMPLETE = ("upload_complete", 2, "✅ 업로드 완료")
@@ -30,6 +36,8 @@ class AnalysisStatus(Enum):
     RAG_INDEXING_STARTED = ("rag_indexing_started", -2, "")
     RAG_INDEXING_COMPLETE = ("rag_indexing_complete", -2, "")
     FAILED = ("failed", -1, "🌧️ 분석 실패")
+    QUEUED = ("queued", 0, "⏳ 분석 대기중")
+    CANCELLED = ("cancelled", -1, "⛔ 분석 취소")
     
     def __init__(self, status, step, description):
         self.status = status
@@ -62,6 +70,11 @@ def convert_role_to_status(role: AgentType, runStatus: AgentRunType) -> Analysis
             return AnalysisStatus.DIAGRAM_STARTED
         else:
             return AnalysisStatus.DIAGRAM_COMPLETE
+    elif role == AgentType.STAGE_PIPELINE:
+        if runStatus == AgentRunType.START:
+            return AnalysisStatus.CODE_ANALYSIS_STARTED
+        else:
+            return AnalysisStatus.DIAGRAM_COMPLETE
     elif role == AgentType.RAG_INDEXER:
         if runStatus == AgentRunType.START:
             return AnalysisStatus.RAG_INDEXING_STARTED
@@ -76,16 +89,42 @@ def convert_role_to_status(role: AgentType, runStatus: AgentRunType) -> Analysis
         return AnalysisStatus.FAILED
 
 def set_project_status_by_analysis_status(project_id: str, status: AnalysisStatus, custom_message: str=""):
-    status_map[project_id] = {
-        "status": status.status,
-        "step": status.step,
-        "total_steps": TOTAL_STEPS,
-        "updated_at": datetime.now().isoformat(),
-        "message": f"{status.description}({custom_message})" if custom_message else status.description
-    }
+    get_status_store().set_status(
+        project_id=project_id,
+        status=status.status,
+        step=status.step,
+        total_steps=TOTAL_STEPS,
+        message=f"{status.description}({custom_message})" if custom_message else status.description,
+        reset_progress=status in (AnalysisStatus.UPLOAD_STARTED, AnalysisStatus.QUEUED)    # 새 실행 시작 시 단계별 진행 건수 초기화
+    )
+
+def set_project_stage_progress(project_id: str, stage: str, done: int, total: int, failed: int = 0):
+    """
+    단계별 진행 건수 저장 (시작/완료 시점 외에는 STATUS_PROGRESS_MIN_INTERVAL 간격으로만 저장)
+
+    Args:
+        project_id (str): 프로젝트 ID
+        stage (str): 단계명 (PipelineStage)
+        done (int): 완료 건수
+        total (int): 전체 건수
+        failed (int): 실패 건수
+    """
+    now = time.time()
+    key = (project_id, stage)
+    with _progress_lock:
+        if 0 < done < total and now - _progress_saved_at.get(key, 0.0) < settings.STATUS_PROGRESS_MIN_INTERVAL:
+            return
+        _progress_saved_at[key] = now
+    get_status_store().set_stage_progress(project_id=project_id, stage=stage, done=done, total=total, failed=failed)
     
 def set_project_status(project_id: str, role: AgentType, runStatus: AgentRunType):
     status: AnalysisStatus = convert_role_to_status(role=role, runStatus=runStatus)
+    
+    # 병렬 분기 중 먼저 끝난 분기의 완료 상태가 더 진행된 단계 상태를 되돌리지 않도록 저장 생략
+    if runStatus == AgentRunType.END:
+        current = get_status_store().get_status(project_id)
+        if current and not is_terminal_status(current.get("status")) and current.get("step", 0) > status.step:
+            return
     set_project_status_by_analysis_status(project_id=project_id, status=status)
     
 def set_project_done_status(project_id: str):
@@ -94,6 +133,15 @@ def set_project_done_status(project_id: str):
 def set_project_fail_status(project_id: str, error_message: str=""):
     set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.FAILED, custom_message=error_message)
 
+def set_project_cancel_status(project_id: str):
+    set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.CANCELLED)
+
+def is_terminal_status(status: str) -> bool:
+    """
+    더 이상 변경되지 않는 종료 상태 여부 (완료/실패/취소)
+    """
+    return status in (AnalysisStatus.DONE.status, AnalysisStatus.FAILED.status, AnalysisStatus.CANCELLED.status)
+
 def get_project_status(project_id: str):
     default_status = {
         "status": "",
@@ -103,7 +151,25 @@ def get_project_status(project_id: str):
         "message": ""
     }
     
-    return status_map.get(project_id, default_status)
+    return get_status_store().get_status(project_id) or default_status
+
+def merge_agent_results(left: Optional[dict], right: Optional[dict]) -> dict:
+    """
+    agent_result 병합 리듀서 (병렬 분기 노드가 같은 단계에서 각자 결과를 추가해도 모두 유지)
+    """
+    return {**(left or {}), **(right or {})}
+
+def keep_last_value(left, right):
+    """
+    마지막 값 리듀서 (병렬 분기 노드의 동시 갱신 허용)
+    """
+    return right
+
+def merge_agent_error(left: Optional[bool], right: Optional[bool]) -> bool:
+    """
+    오류 여부 리듀서 (분기 중 하나라도 실패하면 오류 유지)
+    """
+    return bool(left) or bool(right)
 
 class AutoDiagentiAnalysisState(TypedDict, total=False):
     """
@@ -123,9 +189,13 @@ class AutoDiagentiAnalysisState(TypedDict, total=False):
     filter_options: Optional[dict] = field(default=None)
     llm_model_info: LLMModel
     
+    # 증분 분석 여부 (입력이 바뀌지 않은 메서드/entry point는 이전 실행 결과 재사용)
+    incremental: bool = False
+    
     # ✅ Agent 관련
-    agent_role: str
-    agent_error: bool = False
-    agent_error_message: str = ""
-    agent_result: dict
-    prev_node: str
\ No newline at end of file
+    # 병렬 분기 노드가 같은 단계에서 갱신하는 항목은 리듀서로 병합
+    agent_role: Annotated[str, keep_last_value]
+    agent_error: Annotated[bool, merge_agent_error] = False
+    agent_error_message: Annotated[str, keep_last_value] = ""
+    agent_result: Annotated[dict, merge_agent_results]
+    prev_node: Annotated[str, keep_last_value]
\ No newline at end of file
@@ -0,0 +1,166 @@
+# server/workflow/status_store.py
+
+"""
+분석 상태 저장 모듈
+- 프로젝트별 분석 상태와 단계별 진행 건수를 SQLite(WAL)에 저장하여 여러 API 워커/재시작 간 공유
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+from server.utils.config import settings
+from server.utils.logger import get_logger
+
+# 로거 선언
+logger = get_logger(__name__)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS analysis_status (
+    project_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    total_steps INTEGER NOT NULL,
+    message TEXT NOT NULL DEFAULT '',
+    stage_progress TEXT NOT NULL DEFAULT '{}',
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+class AnalysisStatusStore:
+    """
+    SQLite 기반 분석 상태 저장소.
+
+    - 상태(status/step/message)와 단계별 진행 건수(stage_progress)를 프로젝트당 1행으로 저장
+    - 변경 시마다 version을 증가시켜 구독자(SSE)가 변경 여부를 판단
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=10)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_CREATE_TABLE)
+            self._conn.commit()
+
+    def set_status(self, project_id: str, status: str, step: int, total_steps: int, message: str, reset_progress: bool = False) -> None:
+        """
+        분석 상태 저장 (reset_progress=True면 단계별 진행 건수 초기화)
+        """
+        updated_at = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO analysis_status (project_id, status, step, total_steps, message, stage_progress, version, updated_at) VALUES (?, ?, ?, ?, ?, '{}', 1, ?) "
+                "ON CONFLICT(project_id) DO UPDATE SET status = excluded.status, step = excluded.step, total_steps = excluded.total_steps, message = excluded.message, "
+                "stage_progress = CASE WHEN ? THEN '{}' ELSE stage_progress END, version = version + 1, updated_at = excluded.updated_at",
+                (project_id, status, step, total_steps, message, updated_at, 1 if reset_progress else 0)
+            )
+            self._conn.commit()
+
+    def set_stage_progress(self, project_id: str, stage: str, done: int, total: int, failed: int = 0) -> None:
+        """
+        단계별 진행 건수 저장 (최초 기록 시각 기준으로 처리량(건/초)/ETA 계산)
+
+        Args:
+            project_id (str): 프로젝트 ID
+            stage (str): 단계명
+            done (int): 완료 건수 (실패 포함)
+            total (int): 전체 건수
+            failed (int): 실패 건수
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT stage_progress FROM analysis_status WHERE project_id = ?", (project_id,)).fetchone()
+            if row is None:
+                return
+            stage_progress: Dict[str, Dict] = json.loads(row[0] or "{}")
+            previous = stage_progress.get(stage) or {}
+            started_at = previous.get("started_at") or now
+
+            stage_progress[stage] = {
+                "done": done,
+                "total": total,
+                "failed": failed,
+                "started_at": started_at,
+                "rate_per_sec": round(done / (now - started_at), 2) if done and now > started_at else None,
+                "eta_sec": estimate_eta_sec(started_at=started_at, now=now, done=done, total=total)
+            }
+            self._conn.execute(
+                "UPDATE analysis_status SET stage_progress = ?, version = version + 1, updated_at = ? WHERE project_id = ?",
+                (json.dumps(stage_progress, ensure_ascii=False), datetime.now().isoformat(), project_id)
+            )
+            self._conn.commit()
+
+    def get_status(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """
+        분석 상태 조회
+
+        Returns:
+            Optional[Dict[str, Any]]: {status, step, total_steps, message, stage_progress, eta_sec, version, updated_at} (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, step, total_steps, message, stage_progress, version, updated_at FROM analysis_status WHERE project_id = ?",
+                (project_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        status, step, total_steps, message, stage_progress_json, version, updated_at = row
+        stage_progress = json.loads(stage_progress_json or "{}")
+        pending_etas = [item["eta_sec"] for item in stage_progress.values() if item.get("eta_sec") is not None and item.get("done", 0) < item.get("total", 0)]
+        return {
+            "status": status,
+            "step": step,
+            "total_steps": total_steps,
+            "updated_at": updated_at,
+            "message": message,
+            "stage_progress": stage_progress,
+            "eta_sec": max(pending_etas) if pending_etas else None,
+            "version": version
+        }
+
+    def get_version(self, project_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM analysis_status WHERE project_id = ?", (project_id,)).fetchone()
+        return row[0] if row else 0
+
+
+def estimate_eta_sec(started_at: float, now: float, done: int, total: int) -> Optional[float]:
+    """
+    현재 처리 속도 기준 잔여 시간 (초) 추정 (완료 건수가 없으면 None)
+    """
+    if done <= 0 or total <= 0:
+        return None
+    if done >= total:
+        return 0.0
+    elapsed = max(now - started_at, 0.0)
+    return round(elapsed / done * (total - done), 1)
+
+
+# 프로세스 공용 상태 저장소
+_status_store: Optional[AnalysisStatusStore] = None
+_status_store_lock = threading.Lock()
+
+
+def get_status_store() -> AnalysisStatusStore:
+    """
+    분석 상태 저장소 조회 (없으면 설정값으로 생성)
+
+    Returns:
+        AnalysisStatusStore: 분석 상태 저장소
+    """
+    global _status_store
+
+    with _status_store_lock:
+        if _status_store is None:
+            _status_store = AnalysisStatusStore(db_path=settings.STATUS_DB_PATH)
+        return _status_store
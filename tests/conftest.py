@@ -7,6 +7,17 @@ Pytest 공통 픽스처
 import pytest
 import tempfile
 import os
+from server.utils.config import settings
+from server.workflow import status_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_status_store(tmp_path, monkeypatch):
+    """분석 상태 저장소를 테스트별 임시 DB로 교체 (작업 트리의 status.db 미생성)"""
+    monkeypatch.setattr(settings, "STATUS_DB_PATH", str(tmp_path / "status.db"))
+    monkeypatch.setattr(status_store, "_status_store", None)
+    yield
+    status_store._status_store = None
 
 
 @pytest.fixture
@@ -0,0 +1,131 @@
+# tests/test_analysis_reuse.py
+
+"""
+분석 결과 재사용 (analysis_fingerprint_utils, analysis_reuse) 테스트 코드
+"""
+
+import os
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from server.db.database import Base
+from server.db.model import AnalysisFingerprint, AnalysisHistory, EntryPoint
+from server.utils.config import settings
+from server.utils.constants import DirInfo
+from server.utils.analysis_fingerprint_utils import build_analysis_fingerprint, build_source_fingerprint, get_source_fingerprint
+from server.utils.vectorstore_utils import get_vectorstore_path
+from server.workflow.analysis_reuse import SOURCE_FINGERPRINT_KEY, find_reusable_analysis, register_completed_analysis, reuse_analysis_result
+from server.workflow.state import AnalysisStatus, get_project_status, set_project_done_status, set_project_status_by_analysis_status
+
+FILTER_OPTIONS = {"include_method_text": True, "exclude_packages": "com.ex.util, com.ex.job", "custom_annotations": None, "llm_model": "gpt-4o", "llm_version": "2024-08-01"}
+
+
+def _write_sources(root, sources: dict) -> str:
+    for relative_path, body in sources.items():
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+    return str(root)
+
+
+class TestSourceFingerprint:
+    """소스/분석 핑거프린트 테스트"""
+
+    def test_normalized_sources(self, tmp_path):
+        """최상위 폴더명, 줄바꿈, BOM, Java 외 파일 차이와 무관한 소스 핑거프린트 테스트"""
+        first = _write_sources(tmp_path / "release-1.0", {"src/A.java": b"class A {\n}\n", "README.md": b"v1"})
+        second = _write_sources(tmp_path / "copy", {"src/A.java": b"\xef\xbb\xbfclass A {\r\n}\r\n", "README.md": b"v2", ".git/B.java": b"x"})
+        changed = _write_sources(tmp_path / "changed", {"src/A.java": b"class A { int x; }\n"})
+        moved = _write_sources(tmp_path / "moved", {"main/A.java": b"class A {\n}\n"})
+
+        assert build_source_fingerprint(first) == build_source_fingerprint(second)
+        assert build_source_fingerprint(first) != build_source_fingerprint(changed)
+        assert build_source_fingerprint(first) != build_source_fingerprint(moved)
+
+    def test_analysis_fingerprint_options(self):
+        """분석 옵션 목록 순서 무관, 옵션/모델 변경 시 핑거프린트 변경 테스트"""
+        fingerprint = build_analysis_fingerprint("src", FILTER_OPTIONS)
+        assert build_analysis_fingerprint("src", {**FILTER_OPTIONS, "exclude_packages": "com.ex.job,com.ex.util"}) == fingerprint
+        assert build_analysis_fingerprint("src", {**FILTER_OPTIONS, "include_method_text": False}) != fingerprint
+        assert build_analysis_fingerprint("src", {**FILTER_OPTIONS, "llm_model": "gpt-4.1"}) != fingerprint
+        assert build_analysis_fingerprint("other", FILTER_OPTIONS) != fingerprint
+
+    def test_source_fingerprint_saved(self, tmp_path, monkeypatch):
+        """업로드 시 계산한 소스 핑거프린트 재사용 테스트"""
+        monkeypatch.setattr(DirInfo, "UNPACK_DIR", str(tmp_path / "unpacked"))
+        project_path = _write_sources(tmp_path / "unpacked" / "p1" / "demo", {"A.java": b"class A {}"})
+        fingerprint = get_source_fingerprint("p1", project_path)
+
+        (tmp_path / "unpacked" / "p1" / "demo" / "A.java").write_bytes(b"class B {}")
+        assert get_source_fingerprint("p1", project_path) == fingerprint
+        assert get_source_fingerprint("p2", str(tmp_path / "missing")) == ""
+
+
+@pytest.fixture
+def reuse_env(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(settings, "FIASS_INDEX_PATH", str(tmp_path / "faiss"))
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+def _completed_analysis(db, project_id: str) -> dict:
+    # 완료된 분석 (entry point, 분석 이력, 벡터 스토어, 완료 상태)
+    analyzed_at = datetime(2026, 1, 2, 3, 4, 5)
+    db.add(EntryPoint(analyzed_date="20260102", project_id=project_id, entry_point="a.B.c()", session_id="s1", api_name="/c", api_method="GET", analyzed_at=analyzed_at))
+    db.add(AnalysisHistory(analyzed_date="20260102", project_id=project_id, entry_point="a.B.c()", session_id="s1", project_name="demo", file_name=f"{project_id}.zip", llm_model="gpt-4o", llm_version="2024-08-01", mermaid_code="sequenceDiagram", analysis_results={"method_definitions": []}, analyzed_at=analyzed_at))
+    db.commit()
+    os.makedirs(get_vectorstore_path(project_id))
+    with open(os.path.join(get_vectorstore_path(project_id), "index.faiss"), "wb") as f:
+        f.write(b"index")
+
+    set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.QUEUED)
+    set_project_done_status(project_id=project_id)
+    return {"project_id": project_id, "project_name": "demo", "analyzed_date": "20260102", "file_info": {SOURCE_FINGERPRINT_KEY: "src-1"}, "filter_options": FILTER_OPTIONS}
+
+
+class TestAnalysisReuse:
+    """완료 분석 기록 및 결과 복사 테스트"""
+
+    def test_register_and_reuse(self, reuse_env):
+        """완료 분석 기록 후 동일 핑거프린트 요청 시 entry point/분석 이력/벡터 스토어 복사 테스트"""
+        db = reuse_env
+        assert register_completed_analysis(db, _completed_analysis(db, "reuse-src"))
+
+        set_project_status_by_analysis_status(project_id="reuse-dst", status=AnalysisStatus.UPLOAD_COMPLETE)
+        record = find_reusable_analysis(db, build_analysis_fingerprint("src-1", FILTER_OPTIONS))
+        file_info = {"file_name": "reuse-dst.zip", "file_path": "unpacked", "orig_file_name": "demo-copy"}
+        result = reuse_analysis_result(db, record=record, session_id="s2", project_id="reuse-dst", project_name="demo-copy", analyzed_date="20260103", file_info=file_info)
+
+        assert result == {"reused_from": {"project_id": "reuse-src", "analyzed_date": "20260102"}, "entry_points": 1, "histories": 1}
+        history = db.query(AnalysisHistory).filter_by(project_id="reuse-dst").one()
+        assert (history.analyzed_date, history.session_id, history.file_name, history.project_name) == ("20260103", "s2", "reuse-dst.zip", "demo-copy")
+        assert history.mermaid_code == "sequenceDiagram"
+        assert db.query(EntryPoint).filter_by(project_id="reuse-dst", analyzed_date="20260103").one().api_name == "/c"
+        assert os.path.isfile(os.path.join(get_vectorstore_path("reuse-dst"), "index.faiss"))
+        assert get_project_status("reuse-dst")["status"] == AnalysisStatus.DONE.status
+
+    def test_not_registered(self, reuse_env):
+        """소스 핑거프린트가 없거나 완료되지 않은 분석은 기록하지 않음 테스트"""
+        db = reuse_env
+        state = _completed_analysis(db, "reuse-failed")
+        assert not register_completed_analysis(db, {**state, "file_info": {}})
+
+        set_project_status_by_analysis_status(project_id="reuse-failed", status=AnalysisStatus.FAILED)
+        assert not register_completed_analysis(db, state)
+        assert find_reusable_analysis(db, build_analysis_fingerprint("src-1", FILTER_OPTIONS)) is None
+
+    def test_deleted_source_ignored(self, reuse_env):
+        """원본 벡터 스토어가 삭제된 분석은 재사용하지 않고 기록 삭제 테스트"""
+        db = reuse_env
+        state = _completed_analysis(db, "reuse-deleted")
+        assert register_completed_analysis(db, state)
+
+        os.remove(os.path.join(get_vectorstore_path("reuse-deleted"), "index.faiss"))
+        os.rmdir(get_vectorstore_path("reuse-deleted"))
+        fingerprint = build_analysis_fingerprint("src-1", FILTER_OPTIONS)
+        assert find_reusable_analysis(db, fingerprint) is None
+        assert db.query(AnalysisFingerprint).count() == 0
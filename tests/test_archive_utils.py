@@ -0,0 +1,80 @@
+# tests/test_archive_utils.py
+
+"""
+archive_utils 테스트 코드
+"""
+
+import os
+import zipfile
+import pytest
+from pathlib import Path
+from server.utils.config import settings
+from server.utils.archive_utils import UnsafeArchiveError, extract_project_archive
+
+SAMPLE_ZIP = Path(__file__).resolve().parents[1] / "data" / "sample_project-master.zip"
+
+
+def _make_zip(path: Path, members: dict) -> str:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, data in members.items():
+            zip_ref.writestr(name, data)
+    return str(path)
+
+
+def _files(root: str) -> set:
+    return {path.relative_to(root).as_posix() for path in Path(root).rglob("*") if path.is_file()}
+
+
+class TestExtractProjectArchive:
+    """extract_project_archive 함수 테스트"""
+
+    def test_selective_extract(self, tmp_path):
+        """Java 소스와 빌드 설정 파일만 해제, VCS/의존성/빌드 산출물 제외 테스트"""
+        zip_path = _make_zip(tmp_path / "p1.zip", {
+            "app/pom.xml": "<project/>",
+            "app/settings.gradle": "",
+            "app/src/main/java/com/ex/build/Builder.java": "class Builder {}",
+            "app/src/main/resources/application.yml": "a: 1",
+            "app/.git/objects/Foo.java": "x",
+            "app/node_modules/pkg/Bar.java": "x",
+            "app/target/generated/Gen.java": "x",
+            "app/lib/dep.jar": b"\x00" * 100,
+        })
+        info = extract_project_archive(zip_path, str(tmp_path / "out"))
+
+        assert info["extract_root"] == os.path.realpath(tmp_path / "out" / "p1")
+        assert _files(info["extract_root"]) == {"app/pom.xml", "app/settings.gradle", "app/src/main/java/com/ex/build/Builder.java"}
+        assert (info["extracted"], info["skipped"]) == (3, 5)
+
+    def test_parallel_same_as_sequential(self, tmp_path):
+        """병렬 해제와 순차 해제 결과 동일 및 진행 상황 콜백 테스트"""
+        progress = []
+        sequential = extract_project_archive(str(SAMPLE_ZIP), str(tmp_path / "sequential"), workers=1)
+        parallel = extract_project_archive(str(SAMPLE_ZIP), str(tmp_path / "parallel"), workers=4, on_progress=lambda done, total: progress.append((done, total)))
+
+        files = _files(sequential["extract_root"])
+        assert len([name for name in files if name.endswith(".java")]) == 18
+        assert _files(parallel["extract_root"]) == files
+        for name in files:
+            assert (Path(parallel["extract_root"]) / name).read_bytes() == (Path(sequential["extract_root"]) / name).read_bytes()
+        assert sorted(progress) == [(done, len(files)) for done in range(1, len(files) + 1)]
+
+    def test_zip_slip_rejected(self, tmp_path):
+        """해제 경로를 벗어나는 항목 거부 테스트"""
+        zip_path = _make_zip(tmp_path / "p2.zip", {"../../evil/Evil.java": "class Evil {}"})
+        with pytest.raises(UnsafeArchiveError):
+            extract_project_archive(zip_path, str(tmp_path / "out"))
+        assert not (tmp_path / "evil").exists()
+
+    @pytest.mark.parametrize("setting, value", [
+        ("ARCHIVE_MAX_ENTRIES", 1),
+        ("ARCHIVE_MAX_TOTAL_BYTES", 1024 ** 2),
+        ("ARCHIVE_MAX_COMPRESSION_RATIO", 10.0),
+    ])
+    def test_limits(self, tmp_path, monkeypatch, setting, value):
+        """항목 수/전체 크기/압축률 상한 초과 시 해제 전 거부 테스트"""
+        monkeypatch.setattr(settings, setting, value)
+        zip_path = _make_zip(tmp_path / "p3.zip", {"src/A.java": "a" * 2 * 1024 ** 2, "src/B.java": "class B {}"})
+        with pytest.raises(UnsafeArchiveError):
+            extract_project_archive(zip_path, str(tmp_path / "out"))
+        assert not (tmp_path / "out").exists()
@@ -0,0 +1,77 @@
+# tests/test_artifact_store.py
+
+"""
+artifact_store 테스트 코드
+"""
+
+import os
+import pytest
+from datetime import datetime
+from langchain.schema import Document
+from server.utils.constants import AgentResultGroupKey, DirInfo, IndexInputType
+from server.workflow.agents.retrieval.rag_indexing_agent import RAGIndexingAgent
+from server.workflow.artifact_store import save_artifact, load_artifact, is_artifact_handle, delete_project_artifacts, get_artifact_dir
+
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(DirInfo, "ARTIFACT_DIR", str(tmp_path / "artifacts"))
+
+
+class TestArtifactStore:
+    """단계 산출물 저장소 테스트"""
+
+    def test_save_and_load(self):
+        """산출물 저장 후 핸들로 조회 테스트"""
+        payload = {
+            "input_type": IndexInputType.CALLTREE,
+            "call_tree_info": [{"entry_point": "a.A.run()"}, {"entry_point": "a.B.run()"}]
+        }
+        handle = save_artifact(project_id="p1", name=AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT, payload=payload)
+
+        assert is_artifact_handle(handle)
+        assert handle["input_type"] == IndexInputType.CALLTREE
+        assert handle["count"] == 2
+        assert "call_tree_info" not in handle
+        assert load_artifact(handle) == payload
+
+    def test_call_tree_summary_documents(self):
+        """호출 흐름 요약 Document 저장/복원 후 RAG 문서 변환 테스트"""
+        payload = {
+            "input_type": IndexInputType.CALLTREE_SUMMARY,
+            "llm_model": "gpt-4o",
+            "llm_version": "2024-08-01",
+            "llm_temperature": 0.0,
+            "call_tree_summary_info": [Document(page_content="주문 생성 흐름", metadata={"entry_point": "a.A.run()", "summary_title": "주문 생성"})]
+        }
+        loaded = load_artifact(save_artifact(project_id="p1", name=AgentResultGroupKey.CALL_TREE_SUMMARY, payload=payload))
+
+        assert loaded == payload
+        documents = RAGIndexingAgent(project_id="p1")._create_document(project_id="p1", project_name="shop", input_type=loaded["input_type"], source_data=loaded)
+        assert [(doc.page_content, doc.metadata["entry_point"], doc.metadata["llm_model"]) for doc in documents] == [("주문 생성 흐름", "a.A.run()", "gpt-4o")]
+
+    def test_unsupported_value(self):
+        """JSON으로 저장할 수 없는 값은 문자열로 바꾸지 않고 오류 테스트"""
+        with pytest.raises(TypeError):
+            save_artifact(project_id="p1", name=AgentResultGroupKey.CODE_ANALYSIS_RESULT, payload={"code_analysis_info": [datetime.now()]})
+
+    def test_inline_value_passthrough(self):
+        """핸들이 아닌 결과(이전 체크포인트) 그대로 반환 테스트"""
+        inline = {"input_type": IndexInputType.PARSER, "success": True}
+        assert load_artifact(inline) is inline
+        assert load_artifact(None) is None
+
+    def test_checksum_mismatch(self):
+        """산출물 파일 변경 시 체크섬 오류 테스트"""
+        handle = save_artifact(project_id="p1", name=AgentResultGroupKey.CODE_ANALYSIS_RESULT, payload={"code_analysis_info": []})
+        with open(handle["artifact_path"], "w", encoding="utf-8") as f:
+            f.write('{"code_analysis_info": [1]}')
+
+        with pytest.raises(ValueError):
+            load_artifact(handle)
+
+    def test_delete_project_artifacts(self):
+        """프로젝트 산출물 삭제 테스트"""
+        save_artifact(project_id="p2", name=AgentResultGroupKey.CALL_TREE_SUMMARY, payload={"call_tree_summary_info": []})
+        delete_project_artifacts(project_id="p2")
+        assert not os.path.exists(get_artifact_dir("p2"))
@@ -0,0 +1,112 @@
+# tests/test_benchmark_harness.py
+
+"""
+benchmarks 하네스 테스트 코드
+"""
+
+import os
+import pytest
+from benchmarks.synthetic_project import SIZE_PRESETS, SyntheticProjectSpec, generate_spring_project
+from benchmarks.stub_models import StubCallStats, StubEmbeddings, create_stub_factories, STUB_MERMAID_CODE
+from benchmarks.run_benchmark import StageProfiler, run_benchmark
+from server.utils.config import settings, set_model_factories
+from server.utils.constants import AgentType, DirInfo, ParserBackend
+from server.workflow.agents.base.base_agent import BaseAgent
+from server.workflow.agents.analyze.code_analysis_agent import InsightLLMOutput
+from server.workflow.agents.generate.sequence_diagram_generator_agent import DiagramLLMOutput
+
+
+class _StubLLMAgent(BaseAgent):
+    async def _run_internal(self, state):
+        llm = settings.get_llm_with_custom(llm_model="gpt-4o-mini", llm_version="2024-10-21")
+        response = await self._call_llm_with_timeout(llm, InsightLLMOutput, ["method"])
+        return self.wrap_agent_result("summary", response.summary)
+
+
+class TestSyntheticProject:
+    """합성 Spring 프로젝트 생성 테스트"""
+
+    def test_generate_deterministic(self, tmp_path):
+        """동일 규모 프로젝트 동일 소스 생성 테스트"""
+        spec = SyntheticProjectSpec(domains=3, endpoints_per_domain=2, helper_lines=2)
+        first = generate_spring_project(str(tmp_path / "a"), "bench", spec)
+        second = generate_spring_project(str(tmp_path / "b"), "bench", spec)
+
+        assert first == second
+        assert first["files"] == 12
+        assert first["entry_points"] == 6
+
+        relative = os.path.join("src", "main", "java", "com", "example", "bench", "service", "OrderService.java")
+        source = (tmp_path / "a" / relative).read_text(encoding="utf-8")
+        assert source == (tmp_path / "b" / relative).read_text(encoding="utf-8")
+        assert "customerService.processCustomer0(id);" in source
+
+
+class TestStubModels:
+    """오프라인 대체 모델 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_structured_output_deterministic(self):
+        """동일 입력 동일 응답 및 호출 건수 집계 테스트"""
+        stats = StubCallStats()
+        llm_factory, _ = create_stub_factories(llm_latency=0, embedding_latency=0, embedding_dimension=8, stats=stats)
+        llm = llm_factory(llm_model="gpt-4o-mini", llm_version="2024-10-21", temperature=0.3, max_tokens=1500)
+
+        first = await llm.with_structured_output(InsightLLMOutput).ainvoke(["same prompt"])
+        second = await llm.with_structured_output(InsightLLMOutput).ainvoke(["same prompt"])
+        diagram = await llm.with_structured_output(DiagramLLMOutput).ainvoke(["other prompt"])
+
+        assert first == second
+        assert diagram.mermaid_code == STUB_MERMAID_CODE
+        assert stats.snapshot()["llm_calls_by_schema"] == {"InsightLLMOutput": 2, "DiagramLLMOutput": 1}
+
+    def test_embeddings_normalized(self):
+        """임베딩 벡터 결정성 및 정규화 테스트"""
+        embeddings = StubEmbeddings(deployment="embedding", dimension=16, latency=0, stats=StubCallStats())
+        vectors = embeddings.embed_documents(["a", "b", "a"])
+
+        assert vectors[0] == vectors[2]
+        assert vectors[0] != vectors[1]
+        assert abs(sum(value * value for value in vectors[0]) - 1.0) < 1e-6
+
+
+class TestStageProfiler:
+    """단계별 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_profile_agent_with_stub_factories(self):
+        """모델 생성 함수 교체 후 에이전트 단계 집계 테스트"""
+        stats = StubCallStats()
+        set_model_factories(*create_stub_factories(llm_latency=0, embedding_latency=0, embedding_dimension=8, stats=stats))
+        profiler = StageProfiler(stats=stats, trace_memory=False)
+        try:
+            with profiler.patch_agents():
+                state = await _StubLLMAgent(role=AgentType.CODE_ANALYSIS, project_id="bench-p1").run({"project_id": "bench-p1"})
+        finally:
+            set_model_factories(None, None)
+
+        assert state["agent_result"]["summary"].startswith("[stub] summary")
+        assert profiler.stages[AgentType.CODE_ANALYSIS]["runs"] == 1
+        assert profiler.stages[AgentType.CODE_ANALYSIS]["llm_calls"] == 1
+        assert BaseAgent.run.__name__ == "run"
+
+
+class TestRunBenchmark:
+    """벤치마크 전체 실행 테스트"""
+
+    def test_small_preset_javalang(self, tmp_path, monkeypatch):
+        """javalang 백엔드로 Java 런타임 없이 전체 분석 그래프 실행 테스트"""
+        for name in ["UNPACK_DIR", "PARSER_OUTPUT_DIR", "PARSER_CACHE_DIR", "ARTIFACT_DIR", "ANALYSIS_MEMO_DIR"]:
+            monkeypatch.setattr(DirInfo, name, str(tmp_path / name.lower()))
+        monkeypatch.setattr(settings, "FIASS_INDEX_PATH", str(tmp_path / "faiss_db"))
+        monkeypatch.setattr(settings, "CHECKPOINT_ENABLED", False)
+        monkeypatch.setattr(settings, "JAVA_PARSER_JAR_PATH", str(tmp_path / "missing.jar"))
+        backend = settings.JAVA_PARSER_BACKEND
+
+        report = run_benchmark(spec=SIZE_PRESETS["small"], llm_latency=0, embedding_latency=0, embedding_dimension=8)
+
+        assert report["status"] == "done"
+        assert report["config"]["parser_backend"] == ParserBackend.JAVALANG
+        assert report["calls"]["llm_calls"] > 0
+        assert settings.JAVA_PARSER_BACKEND == backend
+        assert {"PARSER_AGENT", "RAG_INDEXER_AGENT"} <= set(report["stages"])
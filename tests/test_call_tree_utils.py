@@ -0,0 +1,94 @@
+# tests/test_call_tree_utils.py
+
+"""
+call_tree_utils 테스트 코드
+"""
+
+from server.utils.call_tree_utils import (
+    compute_subtree_hash,
+    collect_reusable_subtrees,
+    order_subtrees_bottom_up,
+    compress_call_tree,
+    collect_method_fqns
+)
+
+
+def _node(method_fqn, *calls):
+    return {"method_fqn": method_fqn, "calls": list(calls)}
+
+
+def _service_subtree():
+    return _node("svc.UserService.getUser()", _node("dao.UserDAO.find()", _node("mapper.UserMapper.select()")))
+
+
+class TestComputeSubtreeHash:
+    """compute_subtree_hash 함수 테스트"""
+
+    def test_same_structure_same_hash(self):
+        """동일 구조 동일 해시 테스트"""
+        assert compute_subtree_hash(_service_subtree()) == compute_subtree_hash(_service_subtree())
+
+    def test_child_order_changes_hash(self):
+        """자식 순서 변경 시 해시 변경 테스트"""
+        a = _node("A.a()", _node("B.b()"), _node("C.c()"))
+        b = _node("A.a()", _node("C.c()"), _node("B.b()"))
+        assert compute_subtree_hash(a) != compute_subtree_hash(b)
+
+
+class TestCollectReusableSubtrees:
+    """collect_reusable_subtrees 함수 테스트"""
+
+    def test_shared_subtree_selected_once(self):
+        """여러 entry point가 공유하는 하위 트리 선별 테스트"""
+        trees = [
+            _node("ctrl.UserController.get()", _service_subtree()),
+            _node("ctrl.AdminController.get()", _service_subtree()),
+            _node("ctrl.HealthController.ping()")
+        ]
+        subtrees = collect_reusable_subtrees(trees, min_refs=2, max_inline_nodes=100)
+
+        fqns = sorted(subtree["method_fqn"] for subtree in subtrees.values())
+        assert fqns == ["dao.UserDAO.find()", "svc.UserService.getUser()"]
+        assert all(subtree["ref_count"] == 2 for subtree in subtrees.values())
+
+    def test_bottom_up_order_and_child_hashes(self):
+        """역위상 순서 및 자식 하위 트리 연결 테스트"""
+        trees = [_node("X.x()", _service_subtree()), _node("Y.y()", _service_subtree())]
+        subtrees = collect_reusable_subtrees(trees, min_refs=2, max_inline_nodes=100)
+        ordered = order_subtrees_bottom_up(subtrees)
+
+        assert [subtrees[h]["method_fqn"] for h in ordered] == ["dao.UserDAO.find()", "svc.UserService.getUser()"]
+        assert subtrees[ordered[1]]["child_hashes"] == [ordered[0]]
+
+    def test_oversized_tree_is_split(self):
+        """공유되지 않더라도 크기 제한을 넘는 트리의 하위 트리 선별 테스트"""
+        big = _node("S.big()", *[_node(f"L.leaf{i}()") for i in range(5)])
+        small = _node("S.small()", _node("L.only()"))
+        tree = _node("E.entry()", big, small)
+        subtrees = collect_reusable_subtrees([tree], min_refs=2, max_inline_nodes=5)
+
+        assert [subtree["method_fqn"] for subtree in subtrees.values()] == ["S.big()"]
+
+    def test_leaf_and_root_not_selected(self):
+        """단말 노드와 루트는 선별 제외 테스트"""
+        trees = [_node("A.a()", _node("L.leaf()")), _node("B.b()", _node("L.leaf()"))]
+        assert collect_reusable_subtrees(trees, min_refs=2, max_inline_nodes=100) == {}
+
+
+class TestCompressCallTree:
+    """compress_call_tree 함수 테스트"""
+
+    def test_replace_summarized_subtree(self):
+        """요약된 하위 트리 치환 테스트"""
+        service = _service_subtree()
+        tree = _node("ctrl.UserController.get()", service)
+        compressed = compress_call_tree(tree, {compute_subtree_hash(service): "사용자를 조회합니다."})
+
+        assert compressed["calls"] == [{"method_fqn": "svc.UserService.getUser()", "subtree_summary": "사용자를 조회합니다."}]
+        assert collect_method_fqns(compressed) == ["ctrl.UserController.get()", "svc.UserService.getUser()"]
+
+    def test_root_is_never_replaced(self):
+        """루트 노드는 치환하지 않음 테스트"""
+        service = _service_subtree()
+        compressed = compress_call_tree(service, {compute_subtree_hash(service): "요약"})
+        assert compressed["calls"][0]["method_fqn"] == "dao.UserDAO.find()"
@@ -0,0 +1,123 @@
+# tests/test_cassette_utils.py
+
+"""
+cassette_utils 테스트 코드
+"""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from server.utils.config import settings
+from server.utils.constants import CassetteMode
+from server.utils.cassette_utils import Cassette, CassetteMissError, RecordingChatModel, ReplayChatModel, RecordingEmbeddings, ReplayEmbeddings, close_cassettes
+from server.utils.metrics_utils import LLMUsageCallbackHandler
+from server.workflow.agents.analyze.code_analysis_agent import InsightLLMOutput
+
+
+class _FakeStructuredLLM:
+    def __init__(self, llm):
+        self.llm = llm
+
+    async def ainvoke(self, messages, config=None):
+        self.llm.calls += 1
+        message = AIMessage(content="", usage_metadata={"input_tokens": 100, "output_tokens": 20, "total_tokens": 120})
+        for callback in (config or {}).get("callbacks", []):
+            callback.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+        return InsightLLMOutput(method_fqn="a.A.run()", summary=f"summary {self.llm.calls}", description="desc")
+
+
+class _FakeLLM:
+    deployment_name = "gpt-4o-mini"
+    openai_api_version = "2024-10-21"
+    temperature = 0.3
+
+    def __init__(self):
+        self.calls = 0
+
+    def with_structured_output(self, schema, **kwargs):
+        return _FakeStructuredLLM(self)
+
+
+class _FakeEmbeddings(Embeddings):
+    def embed_documents(self, texts):
+        return [[float(len(text)), 0.5, 0.25] for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+MESSAGES = [SystemMessage(content="system"), HumanMessage(content="method a.A.run()")]
+
+
+class TestCassette:
+    """카세트 기록/재생 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_llm_record_and_replay(self, tmp_path):
+        """LLM 응답 기록 후 순서대로 재생 테스트"""
+        path = str(tmp_path / "cassette.jsonl.gz")
+        recorder = Cassette(path=path, mode=CassetteMode.RECORD)
+        llm = RecordingChatModel(llm=_FakeLLM(), cassette=recorder)
+        first = await llm.with_structured_output(InsightLLMOutput).ainvoke(MESSAGES)
+        second = await llm.with_structured_output(InsightLLMOutput).ainvoke(MESSAGES)
+        recorder.close()
+
+        assert llm.deployment_name == "gpt-4o-mini"
+
+        replay = ReplayChatModel(deployment_name="gpt-4o-mini", openai_api_version="2024-10-21", temperature=0.3, max_tokens=1500, cassette=Cassette(path=path, mode=CassetteMode.REPLAY), replay_latency=False)
+        structured = replay.with_structured_output(InsightLLMOutput)
+        assert await structured.ainvoke(MESSAGES) == first
+        assert await structured.ainvoke(MESSAGES) == second
+        # 기록 건수 소진 후 마지막 응답 반복
+        assert await structured.ainvoke(MESSAGES) == second
+
+    @pytest.mark.asyncio
+    async def test_replay_miss(self, tmp_path):
+        """기록되지 않은 요청 재생 오류 테스트"""
+        replay = ReplayChatModel(deployment_name="gpt-4o-mini", openai_api_version="2024-10-21", temperature=0.3, max_tokens=1500, cassette=Cassette(path=str(tmp_path / "empty.jsonl.gz"), mode=CassetteMode.REPLAY), replay_latency=False)
+        with pytest.raises(CassetteMissError):
+            await replay.with_structured_output(InsightLLMOutput).ainvoke(MESSAGES)
+
+    @pytest.mark.asyncio
+    async def test_replay_usage_callback(self, tmp_path):
+        """재생 시 기록된 토큰 사용량 콜백 전달 테스트"""
+        path = str(tmp_path / "cassette.jsonl.gz")
+        recorder = Cassette(path=path, mode=CassetteMode.RECORD)
+        response = await RecordingChatModel(llm=_FakeLLM(), cassette=recorder).with_structured_output(InsightLLMOutput).ainvoke(MESSAGES)
+        recorder.close()
+
+        replay = ReplayChatModel(deployment_name="gpt-4o-mini", openai_api_version="2024-10-21", temperature=0.3, max_tokens=1500, cassette=Cassette(path=path, mode=CassetteMode.REPLAY), replay_latency=False)
+        usage = LLMUsageCallbackHandler()
+        assert await replay.with_structured_output(InsightLLMOutput).ainvoke(MESSAGES, config={"callbacks": [usage]}) == response
+        assert (usage.input_tokens, usage.output_tokens) == (100, 20)
+
+    def test_embedding_record_and_replay(self, tmp_path):
+        """임베딩 텍스트 단위 기록 및 배치 구성과 무관한 재생 테스트"""
+        path = str(tmp_path / "cassette.jsonl.gz")
+        recorder = Cassette(path=path, mode=CassetteMode.RECORD)
+        embeddings = RecordingEmbeddings(embeddings=_FakeEmbeddings(), deployment="embedding", cassette=recorder)
+        vectors = embeddings.embed_documents(["a", "bb", "a"])
+        recorder.close()
+
+        replay = ReplayEmbeddings(deployment="embedding", cassette=Cassette(path=path, mode=CassetteMode.REPLAY), replay_latency=False)
+        assert replay.embed_documents(["bb", "a"]) == [vectors[1], vectors[0]]
+        assert replay.embed_query("a") == vectors[0]
+
+
+class TestConfigCassetteHook:
+    """설정 기반 카세트 클라이언트 교체 테스트"""
+
+    def test_replay_clients(self, tmp_path, monkeypatch):
+        """재생 모드 LLM/임베딩 클라이언트 반환 테스트"""
+        monkeypatch.setattr(settings, "LLM_CASSETTE_MODE", CassetteMode.REPLAY)
+        monkeypatch.setattr(settings, "LLM_CASSETTE_PATH", str(tmp_path / "cassette.jsonl.gz"))
+        try:
+            llm = settings.get_llm_with_custom(llm_model="gpt-4o", llm_version="2024-10-21")
+            embeddings = settings.get_embeddings()
+        finally:
+            close_cassettes()
+
+        assert isinstance(llm, ReplayChatModel)
+        assert llm.deployment_name == "gpt-4o"
+        assert isinstance(embeddings, ReplayEmbeddings)
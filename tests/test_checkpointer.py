@@ -0,0 +1,90 @@
+# tests/test_checkpointer.py
+
+"""
+checkpointer 테스트 코드
+"""
+
+from typing import TypedDict
+from langgraph.graph import StateGraph, END
+from server.utils.constants import LLMModel
+from server.workflow.checkpointer import SQLiteCheckpointSaver
+from server.workflow.graph import find_resume_config
+
+
+class _State(TypedDict, total=False):
+    calls: list
+    agent_error: bool
+    agent_error_message: str
+
+
+def _build_graph(saver, fail_nodes, executed):
+    def _node(name):
+        def _run(state):
+            executed.append(name)
+            if name in fail_nodes:
+                # BaseAgent.run과 동일하게 예외를 상태에 기록
+                return {"agent_error": True, "agent_error_message": f"{name} failed"}
+            return {"calls": [*state.get("calls", []), name]}
+        return _run
+
+    workflow = StateGraph(_State)
+    for name in ("parse", "analyze", "diagram"):
+        workflow.add_node(name, _node(name))
+    workflow.set_entry_point("parse")
+    workflow.add_conditional_edges("parse", lambda state: END if state.get("agent_error") else "analyze")
+    workflow.add_conditional_edges("analyze", lambda state: END if state.get("agent_error") else "diagram")
+    workflow.add_edge("diagram", END)
+    return workflow.compile(checkpointer=saver)
+
+
+class TestSQLiteCheckpointSaver:
+    """SQLiteCheckpointSaver 클래스 테스트"""
+
+    def test_state_persisted_across_instances(self, tmp_path):
+        """DB 재연결 후 상태 조회 테스트"""
+        db_path = str(tmp_path / "checkpoints.db")
+        config = {"configurable": {"thread_id": "p1"}}
+        _build_graph(SQLiteCheckpointSaver(db_path), set(), []).invoke({"calls": []}, config)
+
+        graph = _build_graph(SQLiteCheckpointSaver(db_path), set(), [])
+        assert graph.get_state(config).values["calls"] == ["parse", "analyze", "diagram"]
+        assert len(list(graph.get_state_history(config))) > 3
+
+    def test_delete_thread(self, tmp_path):
+        """thread 체크포인트 삭제 테스트"""
+        saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+        config = {"configurable": {"thread_id": "p1"}}
+        _build_graph(saver, set(), []).invoke({"calls": []}, config)
+
+        saver.delete_thread("p1")
+        assert saver.get_tuple(config) is None
+
+    def test_llm_model_round_trip(self, tmp_path):
+        """LLMModel 상태값 직렬화/역직렬화 테스트"""
+        saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+        assert saver.serde.loads_typed(saver.serde.dumps_typed(LLMModel.AZURE_GPT_4O_MINI)) is LLMModel.AZURE_GPT_4O_MINI
+
+
+class TestFindResumeConfig:
+    """find_resume_config 함수 테스트"""
+
+    def test_resume_from_failed_node(self, tmp_path):
+        """실패 노드부터 재개 테스트"""
+        saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db"))
+        config = {"configurable": {"thread_id": "p1"}}
+        _build_graph(saver, {"diagram"}, []).invoke({"calls": []}, config)
+
+        executed = []
+        graph = _build_graph(saver, set(), executed)
+        resume_config = find_resume_config(graph=graph, project_id="p1")
+        result = graph.invoke(None, resume_config)
+
+        assert executed == ["diagram"]
+        assert result["calls"] == ["parse", "analyze", "diagram"]
+        assert not result.get("agent_error")
+        assert find_resume_config(graph=graph, project_id="p1") is None
+
+    def test_no_resume_without_checkpoint(self, tmp_path):
+        """체크포인트 없는 경우 테스트"""
+        graph = _build_graph(SQLiteCheckpointSaver(str(tmp_path / "checkpoints.db")), set(), [])
+        assert find_resume_config(graph=graph, project_id="unknown") is None
@@ -0,0 +1,65 @@
+# tests/test_event_loop.py
+
+"""
+event_loop 테스트 코드
+"""
+
+import asyncio
+import threading
+import pytest
+from server.utils.config import settings
+from server.utils.constants import AgentType
+from server.workflow.agents.base.base_agent import BaseAgent
+from server.workflow.event_loop import get_analysis_loop, submit_to_analysis_loop
+
+
+class _SyncAgent(BaseAgent):
+    def _run_internal(self, state):
+        return self.wrap_agent_result("thread", threading.current_thread().name)
+
+
+class _AsyncAgent(BaseAgent):
+    async def _run_internal(self, state):
+        await asyncio.sleep(0)
+        return self.wrap_agent_result("loop", id(asyncio.get_running_loop()))
+
+
+class TestAnalysisEventLoop:
+    """분석 이벤트 루프 테스트"""
+
+    def test_single_loop_shared(self):
+        """여러 작업의 동일 루프 공유 테스트"""
+        async def _loop_id():
+            return id(asyncio.get_running_loop())
+
+        first = submit_to_analysis_loop(_loop_id()).result(timeout=5)
+        second = submit_to_analysis_loop(_loop_id()).result(timeout=5)
+        assert first == second == id(get_analysis_loop())
+
+    def test_llm_client_reused(self):
+        """LLM 클라이언트 및 배포별 연결 풀 재사용 테스트"""
+        llm = settings.get_llm_with_custom(llm_model="gpt-4o", llm_version="2024-10-21")
+        assert settings.get_llm_with_custom(llm_model="gpt-4o", llm_version="2024-10-21") is llm
+
+        other = settings.get_llm_with_custom(llm_model="gpt-4o", llm_version="2024-10-21", temperature=0.0)
+        assert other is not llm
+        assert other.http_async_client is llm.http_async_client
+
+
+class TestBaseAgentAsyncRun:
+    """BaseAgent 비동기 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sync_agent_runs_in_thread(self):
+        """동기 에이전트 스레드 실행 테스트"""
+        agent = _SyncAgent(role=AgentType.RAG_INDEXER, project_id="p1")
+        state = await agent.run({"project_id": "p1"})
+        assert state["agent_result"]["thread"] != threading.current_thread().name
+        assert state["prev_node"] == AgentType.RAG_INDEXER
+
+    @pytest.mark.asyncio
+    async def test_async_agent_runs_on_loop(self):
+        """비동기 에이전트 현재 루프 실행 테스트"""
+        agent = _AsyncAgent(role=AgentType.RAG_INDEXER, project_id="p1")
+        state = await agent.run({"project_id": "p1"})
+        assert state["agent_result"]["loop"] == id(asyncio.get_running_loop())
@@ -10,8 +10,10 @@ import tempfile
 import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+import hashlib
 from fastapi import UploadFile
 from server.utils.file_utils import (
+    UploadTooLargeError,
     save_upload_file,
     unzip_file,
     ensure_directory_exists,
@@ -33,7 +35,7 @@ class TestSaveUploadFile:
             
             # Mock UploadFile 생성
             mock_file = MagicMock(spec=UploadFile)
-            mock_file.read.return_value = b"test content"
+            mock_file.read.side_effect = [b"test content", b""]
             
             await save_upload_file(mock_file, dest_path)
             
@@ -49,7 +51,7 @@ class TestSaveUploadFile:
             dest_path = os.path.join(temp_dir, "nested", "deep", "test_file.txt")
             
             mock_file = MagicMock(spec=UploadFile)
-            mock_file.read.return_value = b"nested content"
+            mock_file.read.side_effect = [b"nested content", b""]
             
             await save_upload_file(mock_file, dest_path)
             
@@ -64,7 +66,7 @@ class TestSaveUploadFile:
             dest_path = os.path.join(temp_dir, "empty_file.txt")
             
             mock_file = MagicMock(spec=UploadFile)
-            mock_file.read.return_value = b""
+            mock_file.read.side_effect = [b""]
             
             await save_upload_file(mock_file, dest_path)
             
@@ -72,6 +74,53 @@ class TestSaveUploadFile:
             with open(dest_path, "rb") as f:
                 assert f.read() == b""
 
+    
+    @pytest.mark.asyncio
+    async def test_save_upload_file_streams_chunks(self):
+        """청크 단위 저장 및 sha256 계산 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "chunked.zip")
+            content = os.urandom(10_000)
+            
+            chunks = [content[idx:idx + 4096] for idx in range(0, len(content), 4096)]
+            mock_file = MagicMock(spec=UploadFile)
+            mock_file.size = None
+            mock_file.read.side_effect = chunks + [b""]
+            
+            info = await save_upload_file(mock_file, dest_path, chunk_size=4096)
+            
+            assert info == {"size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+            assert all(call.args == (4096,) for call in mock_file.read.call_args_list)
+            with open(dest_path, "rb") as f:
+                assert f.read() == content
+    
+    @pytest.mark.asyncio
+    async def test_save_upload_file_too_large(self):
+        """크기 상한 초과 시 중단 및 기록 중인 파일 삭제 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "large.zip")
+            
+            mock_file = MagicMock(spec=UploadFile)
+            mock_file.size = None
+            mock_file.read.side_effect = [b"x" * 8, b"x" * 8, b"x" * 8, b""]
+            
+            with pytest.raises(UploadTooLargeError):
+                await save_upload_file(mock_file, dest_path, max_bytes=12, chunk_size=8)
+            
+            assert mock_file.read.call_count == 2
+            assert not os.path.exists(dest_path)
+    
+    @pytest.mark.asyncio
+    async def test_save_upload_file_declared_size_too_large(self):
+        """선언된 크기가 상한을 초과하면 읽기 전에 거부 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mock_file = MagicMock(spec=UploadFile)
+            mock_file.size = 100
+            
+            with pytest.raises(UploadTooLargeError):
+                await save_upload_file(mock_file, os.path.join(temp_dir, "large.zip"), max_bytes=10)
+            
+            mock_file.read.assert_not_called()
 
 class TestUnzipFile:
     """unzip_file 함수 테스트"""
@@ -0,0 +1,130 @@
+# tests/test_graph_branches.py
+
+"""
+graph 병렬 분기(fan-out/fan-in) 테스트 코드
+"""
+
+import time
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from langchain.schema import Document
+from benchmarks.stub_models import StubCallStats, create_stub_factories
+from server.utils.config import settings, set_model_factories
+from server.utils.vectorstore_utils import save_documents_to_faiss_vector_store, load_faiss_vector_store, delete_faiss_index_by_project
+from server.utils.constants import AgentResultGroupKey, IndexInputType
+from server.workflow.graph import create_autodiagenti_graph
+from server.workflow.state import get_project_status
+from server.workflow.agents.retrieval.rag_indexing_agent import RAGIndexingAgent
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+from server.workflow.agents.analyze.recursive_call_tree_agent import RecursiveCallTreeAgent
+from server.workflow.agents.analyze.code_analysis_agent import CodeAnalysisAgent
+from server.workflow.agents.summarize.call_tree_summarizer_agent import CallTreeSummarizerAgent
+from server.workflow.agents.generate.sequence_diagram_generator_agent import SequenceDiagramGeneratorAgent
+from server.workflow.agents.pipeline.stage_pipeline_agent import StagePipelineAgent
+
+
+def _source_agent(result_key: str, input_type: str, events: list, delay: float = 0.0):
+    async def _run_internal(self, state):
+        events.append(("start", input_type, time.perf_counter()))
+        await asyncio.sleep(delay)
+        events.append(("end", input_type, time.perf_counter()))
+        source = {"input_type": input_type, "success": True}
+        return self.wrap_multiple_sources({result_key: source, AgentResultGroupKey.CURRENT_SOURCE_DATA: source})
+    return _run_internal
+
+
+@pytest.fixture
+def fake_agents(monkeypatch):
+    events = []
+
+    def _index(self, state):
+        source = state["autodiagenti_state"]["agent_result"].get(self.source_key, {})
+        events.append(("index", source.get("input_type"), time.perf_counter()))
+        return self.wrap_agent_result(AgentResultGroupKey.RAG_INDEXING_RESULT, {"input_type": source.get("input_type")})
+
+    monkeypatch.setattr(ParserAgent, "_run_internal", _source_agent(AgentResultGroupKey.PARSER_RESULT, IndexInputType.PARSER, events))
+    monkeypatch.setattr(RecursiveCallTreeAgent, "_run_internal", _source_agent(AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT, IndexInputType.CALLTREE, events, delay=0.1))
+    monkeypatch.setattr(CodeAnalysisAgent, "_run_internal", _source_agent(AgentResultGroupKey.CODE_ANALYSIS_RESULT, IndexInputType.LLM_CODE, events, delay=0.1))
+    monkeypatch.setattr(CallTreeSummarizerAgent, "_run_internal", _source_agent(AgentResultGroupKey.CALL_TREE_SUMMARY, IndexInputType.CALLTREE_SUMMARY, events))
+    monkeypatch.setattr(SequenceDiagramGeneratorAgent, "_run_internal", _source_agent(AgentResultGroupKey.SEQUENCE_DIAGRAM_RESULT, IndexInputType.SEQUENCE_DIAGRAM, events))
+    monkeypatch.setattr(StagePipelineAgent, "_run_internal", _source_agent(AgentResultGroupKey.PIPELINE_RESULT, IndexInputType.PIPELINE, events, delay=0.1))
+    monkeypatch.setattr(RAGIndexingAgent, "_run_internal", _index)
+    monkeypatch.setattr(settings, "PARALLEL_BRANCHES_ENABLED", True)
+    return events
+
+
+def _time_of(events: list, kind: str, input_type: str) -> float:
+    return next(at for event_kind, event_type, at in events if event_kind == kind and event_type == input_type)
+
+
+class TestParallelBranches:
+    """병렬 분기 그래프 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_staged_branches_overlap(self, fake_agents, monkeypatch):
+        """호출 트리 분기와 메서드 분석 분기 동시 실행 후 합류 테스트"""
+        monkeypatch.setattr(settings, "PIPELINE_SCHEDULER_ENABLED", False)
+        graph = create_autodiagenti_graph(project_id="branch-p1")
+        result = await graph.ainvoke({"project_id": "branch-p1", "agent_result": {}})
+
+        # 메서드 분석이 호출 트리 완료를 기다리지 않고 시작
+        assert _time_of(fake_agents, "start", IndexInputType.LLM_CODE) < _time_of(fake_agents, "end", IndexInputType.CALLTREE)
+        # 흐름 요약은 두 분기 인덱싱이 모두 끝난 뒤 시작
+        summary_started = _time_of(fake_agents, "start", IndexInputType.CALLTREE_SUMMARY)
+        assert _time_of(fake_agents, "index", IndexInputType.CALLTREE) < summary_started
+        assert _time_of(fake_agents, "index", IndexInputType.LLM_CODE) < summary_started
+
+        assert [event[1] for event in fake_agents if event[0] == "index"][-1] == IndexInputType.SEQUENCE_DIAGRAM
+        assert not result.get("agent_error", False)
+        assert {AgentResultGroupKey.RECURSIVE_CALL_TREE_RESULT, AgentResultGroupKey.CODE_ANALYSIS_RESULT} <= set(result["agent_result"].keys())
+        assert get_project_status(project_id="branch-p1")["status"] == "done"
+
+    @pytest.mark.asyncio
+    async def test_pipeline_overlaps_call_tree_indexing(self, fake_agents, monkeypatch):
+        """호출 트리 인덱싱과 단계 파이프라인 동시 실행 후 파이프라인 결과 인덱싱 테스트"""
+        monkeypatch.setattr(settings, "PIPELINE_SCHEDULER_ENABLED", True)
+        graph = create_autodiagenti_graph(project_id="branch-p2")
+        result = await graph.ainvoke({"project_id": "branch-p2", "agent_result": {}})
+
+        assert _time_of(fake_agents, "index", IndexInputType.CALLTREE) < _time_of(fake_agents, "end", IndexInputType.PIPELINE)
+        assert [event[1] for event in fake_agents if event[0] == "index"] == [IndexInputType.PARSER, IndexInputType.CALLTREE, IndexInputType.PIPELINE]
+        assert not result.get("agent_error", False)
+        assert get_project_status(project_id="branch-p2")["status"] == "done"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pipeline_enabled", [True, False])
+    async def test_call_tree_failure_stops_branches(self, fake_agents, monkeypatch, pipeline_enabled):
+        """호출 트리 실패 시 후속 분기(인덱싱, 파이프라인, 흐름 요약) 미실행 후 실패 종료 테스트"""
+        async def _fail(self, state):
+            fake_agents.append(("start", IndexInputType.CALLTREE, time.perf_counter()))
+            raise RuntimeError("call tree failed")
+
+        monkeypatch.setattr(RecursiveCallTreeAgent, "_run_internal", _fail)
+        monkeypatch.setattr(settings, "PIPELINE_SCHEDULER_ENABLED", pipeline_enabled)
+        project_id = f"branch-fail-{pipeline_enabled}"
+        graph = create_autodiagenti_graph(project_id=project_id)
+        result = await graph.ainvoke({"project_id": project_id, "agent_result": {}})
+
+        started = {event[1] for event in fake_agents if event[0] == "start"}
+        assert IndexInputType.PIPELINE not in started
+        assert IndexInputType.CALLTREE_SUMMARY not in started
+        assert [event[1] for event in fake_agents if event[0] == "index"] == [IndexInputType.PARSER] + ([] if pipeline_enabled else [IndexInputType.LLM_CODE])
+        assert result.get("agent_error", False)
+        assert get_project_status(project_id=project_id)["status"] == "failed"
+
+
+class TestConcurrentIndexing:
+    """병렬 분기 RAG 인덱싱 동시 저장 테스트"""
+
+    def test_concurrent_saves_keep_all_documents(self):
+        """동일 프로젝트 인덱스 동시 저장 시 문서 유실 없음 테스트"""
+        set_model_factories(*create_stub_factories(llm_latency=0, embedding_latency=0.02, embedding_dimension=8, stats=StubCallStats()))
+        try:
+            delete_faiss_index_by_project(project_id="branch-vs")
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda idx: save_documents_to_faiss_vector_store(project_id="branch-vs", documents=[Document(page_content=f"doc {idx}-{n}") for n in range(3)]), range(6)))
+            assert load_faiss_vector_store(project_id="branch-vs").index.ntotal == 18
+        finally:
+            delete_faiss_index_by_project(project_id="branch-vs")
+            set_model_factories(None, None)
@@ -0,0 +1,200 @@
+# tests/test_javalang_parser_utils.py
+
+"""
+javalang_parser_utils 테스트 코드
+"""
+
+import os
+import re
+import shutil
+import zipfile
+import pytest
+from pathlib import Path
+from server.utils.config import settings
+from server.utils.constants import DirInfo, ParserBackend, PipelineStage
+from server.utils.file_utils import load_json
+from server.utils.javalang_parser_utils import run_javalang_parser
+from server.utils.parser_bundle_utils import get_bundle_path, iter_parser_bundle, iter_parser_files
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+from server.workflow.state import AnalysisStatus, set_project_status_by_analysis_status, get_project_status
+
+SAMPLE_ZIP = Path(__file__).resolve().parents[1] / "data" / "sample_project-master.zip"
+LOGIN_CHAIN = [
+    "sg.sample.controller.AuthController.login(java.util.Map<java.lang.String, java.lang.String>)",
+    "sg.sample.service.AuthService.login(java.lang.String, java.lang.String)",
+    "sg.sample.dao.UserDAO.findUserByUsername(java.lang.String)",
+    "sg.sample.mapper.UserMapper.selectUserByUsername(java.lang.String)"
+]
+
+
+@pytest.fixture(scope="module")
+def sample_project(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("sample")
+    with zipfile.ZipFile(SAMPLE_ZIP) as zip_ref:
+        zip_ref.extractall(root)
+    return root / "sample_project-master"
+
+
+def _load_outputs(project_output_dir: str) -> dict:
+    # 산출물 파일별 내용 (생성 시각 제외)
+    outputs = {}
+    for path in sorted(Path(project_output_dir).rglob("*.json")):
+        data = load_json(str(path))
+        if isinstance(data, dict):
+            data.pop("analyzed_at", None)
+        outputs[path.relative_to(project_output_dir).as_posix()] = data
+    return outputs
+
+
+def _call_edges(project_output_dir: str) -> set:
+    return {
+        (edge["caller"], edge["callee"])
+        for path in Path(project_output_dir).rglob("*_call_tree.json")
+        for edge in load_json(str(path))["call_edges"]
+    }
+
+
+class TestJavalangParser:
+    """javalang 파서 산출물 테스트 (샘플 프로젝트)"""
+
+    def test_entry_points(self, sample_project, tmp_path):
+        """샘플 프로젝트 콜트리 문서의 API 목록과 엔트리 포인트 일치 테스트 (상수 참조 경로 해석 포함)"""
+        report = run_javalang_parser(str(sample_project), str(tmp_path))
+        assert (report["files"], report["errors"]) == (18, 0)
+
+        documented = set(re.findall(r"^### \d+\. (GET|POST|PUT|DELETE) `([^`]+)`", (sample_project / "calltree.md").read_text(encoding="utf-8"), re.M))
+        entry_points = load_json(os.path.join(report["output_dir"], settings.ENTRY_POINT_INFO_FILE_NAME))
+        assert {(item["api_method"], item["api_name"]) for item in entry_points} == documented
+        assert load_json(os.path.join(report["output_dir"], settings.ENTRY_POINT_FILE_NAME)) == [item["method_fqn"] for item in entry_points]
+        assert entry_points[0]["annotation"] == '@PostMapping("/login")'
+
+    def test_call_edges_and_methods(self, sample_project, tmp_path):
+        """Controller → Service → DAO → Mapper 호출 관계 및 메서드 메타 정보 테스트"""
+        report = run_javalang_parser(str(sample_project), str(tmp_path))
+        edges = _call_edges(report["output_dir"])
+        assert all((caller, callee) in edges for caller, callee in zip(LOGIN_CHAIN, LOGIN_CHAIN[1:]))
+
+        all_methods = load_json(os.path.join(report["output_dir"], settings.ALL_METHODS_FILE_NAME))
+        assert set(LOGIN_CHAIN) <= set(all_methods)
+        assert {callee for _, callee in edges} <= set(all_methods)
+
+        methods = load_json(os.path.join(report["output_dir"], "sg", "sample", "controller", "AuthController_methods.json"))
+        login = methods[LOGIN_CHAIN[0]]
+        assert login["file_path"] == "src/main/java/sg/sample/controller/AuthController.java"
+        assert login["return_type"] == "ResponseEntity<Map<String, Object>>"
+        assert login["parameters"] == [{"name": "loginRequest", "type": "Map<String, String>"}]
+        assert login["method_text"].startswith('@PostMapping("/login")\npublic ResponseEntity')
+        assert login["method_text"].endswith("}")
+        assert "사용자 로그인 API" in login["comment"]
+
+    def test_pool_same_output(self, sample_project, tmp_path):
+        """프로세스 풀 병렬 파싱과 순차 파싱 산출물 동일 테스트"""
+        sequential = run_javalang_parser(str(sample_project), str(tmp_path / "sequential"), workers=1)
+        parallel = run_javalang_parser(str(sample_project), str(tmp_path / "parallel"), workers=2)
+        assert _load_outputs(parallel["output_dir"]) == _load_outputs(sequential["output_dir"])
+
+    def test_options(self, tmp_path):
+        """메서드 본문 제외, 패키지 제외, 사용자 정의 어노테이션, 파싱 오류 파일 건너뛰기 테스트"""
+        sources = {
+            "com/ex/job/Batch.java": "package com.ex.job;\nimport com.ex.util.Helper;\npublic class Batch {\n    @Scheduled(cron = \"0 0 * * *\")\n    public void run() { Helper.help(1); }\n}\n",
+            "com/ex/util/Helper.java": "package com.ex.util;\npublic class Helper {\n    public static void help(int count) {}\n}\n",
+            "com/ex/Broken.java": "package com.ex;\npublic class Broken { void x( }\n"
+        }
+        for relative_path, body in sources.items():
+            path = tmp_path / "src" / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(body, encoding="utf-8")
+
+        report = run_javalang_parser(str(tmp_path / "src"), str(tmp_path / "out"), include_method_text=False, custom_annotations="@Scheduled")
+        assert (report["parsed"], report["errors"]) == (2, 1)
+        methods = load_json(os.path.join(report["output_dir"], "com", "ex", "job", "Batch_methods.json"))
+        assert methods["com.ex.job.Batch.run()"]["method_text"] == ""
+        assert load_json(os.path.join(report["output_dir"], settings.ENTRY_POINT_FILE_NAME)) == ["com.ex.job.Batch.run()"]
+        assert _call_edges(report["output_dir"]) == {("com.ex.job.Batch.run()", "com.ex.util.Helper.help(int)")}
+
+        # 제외 패키지 메서드 호출은 프로젝트 루트 패키지 타입이므로 미해석 callee로 기록
+        report = run_javalang_parser(str(tmp_path / "src"), str(tmp_path / "excluded"), exclude_packages="com.ex.util")
+        assert load_json(os.path.join(report["output_dir"], settings.ALL_METHODS_FILE_NAME)) == ["com.ex.job.Batch.run()"]
+        assert _call_edges(report["output_dir"]) == {("com.ex.job.Batch.run()", "com.ex.util.Helper.help(?)")}
+
+
+@pytest.fixture
+def javalang_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(DirInfo, "PARSER_OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(DirInfo, "PARSER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(settings, "JAVA_PARSER_BACKEND", ParserBackend.JAVALANG)
+    monkeypatch.setattr(settings, "JAVA_PARSER_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "STATUS_PROGRESS_MIN_INTERVAL", 0)
+    monkeypatch.setattr(ParserAgent, "_save_entry_point_to_db", lambda self, **kwargs: None)
+    return tmp_path
+
+
+def _analyze(project: Path, project_id: str) -> str:
+    set_project_status_by_analysis_status(project_id=project_id, status=AnalysisStatus.QUEUED)
+    state = {"autodiagenti_state": {"project_id": project_id, "project_name": project.name, "project_path": str(project)}}
+    ParserAgent(project_id=project_id)._run_internal(state)
+    return os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project.name)
+
+
+class TestJavalangParserAgent:
+    """ParserAgent javalang 백엔드 테스트"""
+
+    def test_backend_selected(self, javalang_env, sample_project, monkeypatch):
+        """설정으로 javalang 백엔드 선택 및 진행 상황 반영 테스트 (JAR 미실행)"""
+        monkeypatch.setattr(ParserAgent, "_run_parser_jar", lambda self, **kwargs: pytest.fail("JAR 백엔드 실행"))
+        project = javalang_env / sample_project.name
+        shutil.copytree(sample_project, project)
+
+        output_dir = _analyze(project, "javalang-p1")
+        assert len(load_json(os.path.join(output_dir, settings.ENTRY_POINT_FILE_NAME))) == 14
+        # 번들은 산출물 저장 시점에 함께 기록 (파일 단위 산출물과 동일 레코드)
+        bundled = sorted(iter_parser_bundle(get_bundle_path(output_dir)), key=lambda record: record.path)
+        assert bundled and bundled == list(iter_parser_files(output_dir))
+        progress = get_project_status("javalang-p1")["stage_progress"][PipelineStage.PARSER]
+        assert (progress["done"], progress["total"]) == (18, 18)
+
+    def test_incremental(self, javalang_env, sample_project):
+        """변경 파일만 파싱한 산출물과 전체 파싱 산출물의 호출 관계 일치 테스트"""
+        project = javalang_env / sample_project.name
+        shutil.copytree(sample_project, project)
+        full_dir = _analyze(project, "javalang-p2")
+
+        controller = project / "src" / "main" / "java" / "sg" / "sample" / "controller" / "AuthController.java"
+        controller.write_text(controller.read_text(encoding="utf-8") + "\n// changed\n", encoding="utf-8")
+        incremental_dir = _analyze(project, "javalang-p3")
+
+        # 단독 파싱된 AuthController의 미해석 callee(파라미터 수만 표기)는 병합 시 재해석
+        assert _call_edges(incremental_dir) == _call_edges(full_dir)
+        progress = get_project_status("javalang-p3")["stage_progress"][PipelineStage.PARSER]
+        assert (progress["done"], progress["total"]) == (1, 1)
+
+
+@pytest.mark.skipif(not os.path.isfile(settings.JAVA_PARSER_JAR_PATH) or shutil.which("java") is None, reason="JavaParser JAR 또는 Java 런타임 없음")
+class TestParserBackendEquivalence:
+    """JAR 백엔드와 javalang 백엔드 산출물 비교 테스트 (샘플 프로젝트)"""
+
+    def test_same_output(self, sample_project, tmp_path):
+        """메서드 목록, 엔트리 포인트, 프로젝트 메서드 간 호출 관계, 메서드 메타 정보 일치 테스트"""
+        agent = ParserAgent(project_id="equivalence-p1")
+        assert agent._run_parser_jar(source_dir=str(sample_project), output_dir=str(tmp_path / "jar"), use_worker=False)
+        jar_dir = str(tmp_path / "jar" / sample_project.name)
+        javalang_dir = run_javalang_parser(str(sample_project), str(tmp_path / "javalang"))["output_dir"]
+
+        jar_methods = set(load_json(os.path.join(jar_dir, settings.ALL_METHODS_FILE_NAME)))
+        assert set(load_json(os.path.join(javalang_dir, settings.ALL_METHODS_FILE_NAME))) == jar_methods
+        assert set(load_json(os.path.join(javalang_dir, settings.ENTRY_POINT_FILE_NAME))) == set(load_json(os.path.join(jar_dir, settings.ENTRY_POINT_FILE_NAME)))
+
+        def _apis(output_dir):
+            return {(item["method_fqn"], item.get("api_method"), item.get("api_name")) for item in load_json(os.path.join(output_dir, settings.ENTRY_POINT_INFO_FILE_NAME))}
+        assert _apis(javalang_dir) == _apis(jar_dir)
+
+        # JAR 산출물의 라이브러리 메서드 호출은 비교 대상에서 제외
+        assert _call_edges(javalang_dir) == {edge for edge in _call_edges(jar_dir) if edge[1] in jar_methods}
+
+        def _metas(output_dir):
+            metas = {}
+            for path in Path(output_dir).rglob("*_call_tree.json"):
+                for method_fqn, meta in load_json(str(path))["method_meta_map"].items():
+                    metas[method_fqn] = (meta.get("return_type"), len(meta.get("parameters") or []), bool(meta.get("entry_point")))
+            return metas
+        assert _metas(javalang_dir) == _metas(jar_dir)
@@ -0,0 +1,125 @@
+# tests/test_job_queue.py
+
+"""
+job_queue 테스트 코드
+"""
+
+import asyncio
+import threading
+import pytest
+from unittest.mock import patch
+from server.utils.constants import JobStatus
+from server.workflow.job_queue import AnalysisJobQueue, AnalysisCancelledError, JobQueueFullError, JobAlreadyExistsError, run_cancellable
+from server.workflow.state import get_project_status
+
+
+def _blocking_job(started: threading.Event, release: threading.Event):
+    def _run():
+        started.set()
+        release.wait(timeout=5)
+    return _run
+
+
+def _wait_until(predicate, timeout=5.0):
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return True
+        event.wait(0.01)
+    return predicate()
+
+
+class TestAnalysisJobQueue:
+    """AnalysisJobQueue 클래스 테스트"""
+
+    def test_queue_full_and_duplicate(self):
+        """대기열 초과 및 중복 등록 테스트"""
+        queue = AnalysisJobQueue(max_workers=1, max_queue_size=1, max_jobs_per_tenant=1)
+        started, release = threading.Event(), threading.Event()
+        queue.submit("p1", "t1", _blocking_job(started, release))
+        assert started.wait(timeout=5)
+
+        queue.submit("p2", "t2", lambda: None)
+        with pytest.raises(JobQueueFullError):
+            queue.submit("p3", "t3", lambda: None)
+        with pytest.raises(JobAlreadyExistsError):
+            queue.submit("p1", "t1", lambda: None)
+
+        assert queue.get_job_info("p2")["queue_position"] == 1
+        assert get_project_status("p2")["status"] == "queued"
+        release.set()
+
+    def test_tenant_cap_skips_to_next_tenant(self):
+        """요청자별 동시 실행 제한 테스트"""
+        queue = AnalysisJobQueue(max_workers=2, max_queue_size=10, max_jobs_per_tenant=1)
+        started_a, release_a = threading.Event(), threading.Event()
+        started_c = threading.Event()
+        queue.submit("a", "t1", _blocking_job(started_a, release_a))
+        assert started_a.wait(timeout=5)
+
+        queue.submit("b", "t1", lambda: None)
+        queue.submit("c", "t2", _blocking_job(started_c, threading.Event()))
+
+        # t1은 한도에 걸려 b는 대기, 다른 요청자의 c가 먼저 실행
+        assert started_c.wait(timeout=5)
+        assert queue.get_job_info("b")["job_status"] == JobStatus.QUEUED
+        assert queue.get_job_info("b")["queue_position"] == 1
+
+        release_a.set()
+        assert _wait_until(lambda: queue.get_job_info("b") is None)
+        queue.cancel("c")
+
+    def test_cancel_pending_job(self):
+        """대기 작업 취소 테스트"""
+        queue = AnalysisJobQueue(max_workers=1, max_queue_size=10, max_jobs_per_tenant=1)
+        started, release = threading.Event(), threading.Event()
+        executed = []
+        queue.submit("p1", "t1", _blocking_job(started, release))
+        assert started.wait(timeout=5)
+        queue.submit("p2", "t2", lambda: executed.append("p2"))
+
+        assert queue.cancel("p2") is True
+        assert queue.get_job_info("p2") is None
+        assert get_project_status("p2")["status"] == "cancelled"
+        assert queue.cancel("unknown") is False
+
+        release.set()
+        assert _wait_until(lambda: queue.get_job_info("p1") is None)
+        assert executed == []
+
+
+class TestRunCancellable:
+    """run_cancellable 함수 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts_in_flight_call(self):
+        """실행 중 취소 시 진행 중 호출 중단 테스트"""
+        cancel_event = threading.Event()
+        cancelled = []
+
+        async def _slow_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with patch("server.workflow.job_queue.AnalysisJobQueue.get_cancel_event", return_value=cancel_event):
+            asyncio.get_running_loop().call_later(0.1, cancel_event.set)
+            with pytest.raises(AnalysisCancelledError):
+                await run_cancellable(_slow_call(), project_id="p1", timeout=5)
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """타임아웃 테스트"""
+        with patch("server.workflow.job_queue.AnalysisJobQueue.get_cancel_event", return_value=threading.Event()):
+            with pytest.raises(asyncio.TimeoutError):
+                await run_cancellable(asyncio.sleep(10), project_id="p1", timeout=0.1)
+
+    @pytest.mark.asyncio
+    async def test_result_without_job(self):
+        """큐 작업이 아닌 경우 결과 반환 테스트"""
+        async def _call():
+            return "ok"
+        assert await run_cancellable(_call(), project_id="no-job", timeout=1) == "ok"
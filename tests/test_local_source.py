@@ -0,0 +1,141 @@
+# tests/test_local_source.py
+
+"""
+로컬 디렉토리 분석 (local_source_utils, analysis_memo, source_watcher) 테스트 코드
+"""
+
+import os
+import time
+import threading
+import pytest
+from langchain.schema import Document
+from server.utils.config import settings
+from server.utils.constants import AnalysisType, DirInfo, SourceType
+from server.utils.local_source_utils import LocalSourceError, is_watch_target, resolve_local_source, resolve_project_path
+from server.workflow.analysis_memo import AnalysisMemo
+from server.workflow.job_queue import JobAlreadyExistsError
+from server.workflow.source_watcher import SourceWatcher
+
+
+def _method_meta(fqn: str, body: str) -> dict:
+    return {"method_fqn": fqn, "method_text": body, "comment": "", "method_signature": fqn, "return_type": "void", "parameters": [], "file_path": "A.java", "package_name": "a", "class_name": "A"}
+
+
+class TestLocalSourcePath:
+    """로컬 소스 경로 검증 테스트"""
+
+    def test_resolve_allowed_root(self, tmp_path, monkeypatch):
+        """허용 루트 하위 디렉토리만 허용 (심볼릭 링크 해석 후 확인) 테스트"""
+        root = tmp_path / "workspace"
+        (root / "demo").mkdir(parents=True)
+        (tmp_path / "secret").mkdir()
+        os.symlink(tmp_path / "secret", root / "link")
+        monkeypatch.setattr(settings, "LOCAL_SOURCE_ROOTS", f" {root} , ")
+
+        assert resolve_local_source(str(root / "demo")) == os.path.realpath(root / "demo")
+        for path in [str(root / "link"), str(tmp_path / "secret"), str(root / "missing"), "demo", str(root / "demo" / ".." / ".." / "secret")]:
+            with pytest.raises(LocalSourceError):
+                resolve_local_source(path)
+
+    def test_disabled_and_project_path(self, tmp_path, monkeypatch):
+        """허용 루트 미설정 시 거부, 업로드/로컬 프로젝트 경로 결정 테스트"""
+        monkeypatch.setattr(settings, "LOCAL_SOURCE_ROOTS", "")
+        with pytest.raises(LocalSourceError):
+            resolve_local_source(str(tmp_path))
+
+        monkeypatch.setattr(settings, "LOCAL_SOURCE_ROOTS", str(tmp_path))
+        assert resolve_project_path("p1", "demo", {"source_type": SourceType.LOCAL, "source_path": str(tmp_path)}) == os.path.realpath(tmp_path)
+        assert resolve_project_path("p1", "demo", {"file_name": "p1.zip"}) == os.path.join(DirInfo.UNPACK_DIR, "p1", "demo")
+
+    def test_watch_target(self, tmp_path):
+        """Java 소스/빌드 설정 파일만 감시 대상, 숨김/빌드 산출물 디렉토리 제외 테스트"""
+        root = str(tmp_path)
+        assert is_watch_target(os.path.join(root, "src", "main", "java", "A.java"), root)
+        assert is_watch_target(os.path.join(root, "api", "pom.xml"), root)
+        assert is_watch_target(os.path.join(root, "src", "main", "java", "build", "A.java"), root)
+        assert not is_watch_target(os.path.join(root, "src", "main", "resources", "app.yml"), root)
+        assert not is_watch_target(os.path.join(root, "target", "generated", "A.java"), root)
+        assert not is_watch_target(os.path.join(root, ".idea", "A.java"), root)
+        assert not is_watch_target(os.path.join(root, "src", "A.java~"), root)
+
+
+class TestAnalysisMemo:
+    """증분 분석 결과 재사용 테스트"""
+
+    def test_method_and_entry_point(self, tmp_path, monkeypatch):
+        """입력이 같은 메서드/entry point만 재사용, 모델 변경 시 미사용 테스트"""
+        monkeypatch.setattr(DirInfo, "ANALYSIS_MEMO_DIR", str(tmp_path))
+        method = {**_method_meta("a.A.run()", "run();"), "summary": "실행", "description": "설명", "analysis_type": AnalysisType.LLM}
+        failed = {**_method_meta("a.A.stop()", "stop();"), "analysis_type": AnalysisType.HEURISTIC}
+        call_tree_info = {"entry_point": "a.A.run()", "call_tree": {"method_fqn": "a.A.run()", "calls": []}, "call_sequence": ["a.A.run()"]}
+        method_keys = {"a.A.run()": AnalysisMemo.method_key(method)}
+
+        memo = AnalysisMemo("p1", llm_key="gpt-4o:1")
+        memo.put_method(method)
+        memo.put_method(failed)
+        entry_point_key = memo.entry_point_key(call_tree_info, method_keys)
+        memo.put_entry_point("a.A.run()", entry_point_key, Document(page_content="흐름", metadata={"summary_title": "제목"}), {"mermaid_code": "sequenceDiagram"})
+        memo.put_entry_point("a.A.stop()", "k", Document(page_content="", metadata={}), {"mermaid_code": "sequenceDiagram"})
+        memo.save()
+
+        memo = AnalysisMemo("p1", llm_key="gpt-4o:1")
+        assert memo.get_method(_method_meta("a.A.run()", "run();"))["summary"] == "실행"
+        assert memo.get_method(_method_meta("a.A.run()", "run(); log();")) is None
+        assert memo.get_method(_method_meta("a.A.stop()", "stop();")) is None
+        summary_doc, diagram = memo.get_entry_point("a.A.run()", entry_point_key)
+        assert (summary_doc.page_content, summary_doc.metadata["summary_title"], diagram["mermaid_code"]) == ("흐름", "제목", "sequenceDiagram")
+        assert memo.get_entry_point("a.A.run()", memo.entry_point_key(call_tree_info, {"a.A.run()": "changed"})) is None
+        assert memo.get_entry_point("a.A.stop()", "k") is None
+        assert memo.reused == {"methods": 1, "entry_points": 1}
+
+        assert AnalysisMemo("p1", llm_key="gpt-4o-mini:1").get_method(_method_meta("a.A.run()", "run();")) is None
+
+
+class TestSourceWatcher:
+    """로컬 소스 감시 테스트"""
+
+    def test_debounce_and_retry(self, tmp_path):
+        """연속 변경은 1회만 등록, 분석 중이면 재시도 테스트"""
+        calls = []
+        busy = threading.Event()
+        busy.set()
+
+        def submit(project_id, tenant_id, func, *args):
+            if busy.is_set():
+                busy.clear()
+                raise JobAlreadyExistsError(project_id)
+            calls.append((project_id, tenant_id, args))
+
+        watcher = SourceWatcher(debounce_sec=0.1, submit=submit)
+        try:
+            watcher.watch("p1", str(tmp_path), "s1", print, "a", True)
+            assert watcher.is_watching("p1")
+            for name in ["A.java", "B.java", "A.java"]:
+                watcher.notify_change("p1", [str(tmp_path / name)])
+
+            deadline = time.time() + 3
+            while not calls and time.time() < deadline:
+                time.sleep(0.05)
+            time.sleep(0.3)
+            assert calls == [("p1", "s1", ("a", True))]
+
+            assert watcher.stop("p1")
+            assert not watcher.stop("p1")
+        finally:
+            watcher.shutdown()
+
+    def test_file_event(self, tmp_path):
+        """감시 디렉토리의 Java 파일 저장 시 재분석 등록 테스트"""
+        calls = []
+        watcher = SourceWatcher(debounce_sec=0.1, submit=lambda *args: calls.append(args[0]))
+        try:
+            watcher.watch("p1", str(tmp_path), "s1", print)
+            (tmp_path / "notes.txt").write_text("x")
+            (tmp_path / "A.java").write_text("class A {}")
+
+            deadline = time.time() + 5
+            while not calls and time.time() < deadline:
+                time.sleep(0.05)
+            assert calls == ["p1"]
+        finally:
+            watcher.shutdown()
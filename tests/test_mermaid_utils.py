@@ -0,0 +1,141 @@
+# tests/test_mermaid_utils.py
+
+"""
+mermaid_utils 테스트 코드
+"""
+
+from server.utils.mermaid_utils import (
+    build_sequence_diagram,
+    is_message_method,
+    extract_class_name,
+    extract_display_name,
+    sanitize_participant,
+    sanitize_text,
+    validate_sequence_diagram,
+    repair_sequence_diagram
+)
+
+ENTRY_POINT = "sg.sample.UserController.getUser(java.lang.Long)"
+
+CALL_TREE = {
+    "method_fqn": ENTRY_POINT,
+    "calls": [
+        {
+            "method_fqn": "sg.sample.UserService.findUser(java.lang.Long)",
+            "calls": [
+                {"method_fqn": "sg.sample.UserDAO.selectUser(java.lang.Long)", "calls": []}
+            ]
+        },
+        {"method_fqn": "org.springframework.kafka.core.KafkaTemplate.send(java.lang.String)", "calls": []}
+    ]
+}
+
+METHOD_DEFINITIONS = {
+    ENTRY_POINT: {"class_name": "UserController", "summary": "사용자 조회 API", "return_type": "UserDto", "display_name": "getUser(java.lang.Long)"},
+    "sg.sample.UserService.findUser(java.lang.Long)": {"class_name": "UserService", "summary": "사용자를 조회합니다.", "return_type": "User", "display_name": "findUser(java.lang.Long)"},
+    "sg.sample.UserDAO.selectUser(java.lang.Long)": {"class_name": "UserDAO", "summary": "", "return_type": "void", "display_name": "selectUser(java.lang.Long)"}
+}
+
+
+class TestBuildSequenceDiagram:
+    """build_sequence_diagram 함수 테스트"""
+
+    def test_full_diagram(self):
+        """participant/호출/노트/리턴 생성 테스트"""
+        code = build_sequence_diagram(ENTRY_POINT, CALL_TREE, METHOD_DEFINITIONS)
+
+        assert code.splitlines() == [
+            "sequenceDiagram",
+            "    participant UserController",
+            "    participant UserService",
+            "    participant UserDAO",
+            "    participant KafkaTemplate",
+            "    Note right of UserController: 사용자 조회 API",
+            "    UserController->>UserService: findUser(java.lang.Long)",
+            "    Note right of UserService: 사용자를 조회합니다.",
+            "    UserService->>UserDAO: selectUser(java.lang.Long)",
+            "    UserDAO-->>UserService: ",
+            "    UserService-->>UserController: User",
+            "    UserController->>KafkaTemplate: send(java.lang.String)",
+        ]
+
+    def test_deterministic(self):
+        """동일 입력 동일 출력 테스트"""
+        assert build_sequence_diagram(ENTRY_POINT, CALL_TREE, METHOD_DEFINITIONS) == build_sequence_diagram(ENTRY_POINT, CALL_TREE, METHOD_DEFINITIONS)
+
+    def test_empty_call_tree(self):
+        """호출 트리가 비어 있으면 entry point participant만 생성 테스트"""
+        assert build_sequence_diagram(ENTRY_POINT, {}, {}) == "sequenceDiagram\n    participant UserController"
+
+
+class TestMermaidHelpers:
+    """보조 함수 테스트"""
+
+    def test_is_message_method(self):
+        """메시지 발신 메서드 판별 테스트"""
+        assert is_message_method("org.springframework.kafka.core.KafkaTemplate.send(java.lang.String)")
+        assert not is_message_method("sg.sample.MailService.send(java.lang.String)")
+
+    def test_extract_names(self):
+        """클래스명/표시명 추출 테스트"""
+        assert extract_class_name("sg.sample.UserService.findUser(java.lang.Long)") == "UserService"
+        assert extract_display_name("sg.sample.UserService.findUser(java.lang.Long)") == "findUser(java.lang.Long)"
+
+    def test_sanitize(self):
+        """participant/텍스트 정리 테스트"""
+        assert sanitize_participant("Repository<User>") == "Repository"
+        assert sanitize_text("a;b\nc #1") == "a#59;b c #35;1"
+        assert sanitize_text("a#59;b") == "a#59;b"
+
+
+class TestValidateSequenceDiagram:
+    """validate_sequence_diagram 함수 테스트"""
+
+    def test_generated_diagram_is_valid(self):
+        """로컬 생성 다이어그램 유효성 테스트"""
+        assert validate_sequence_diagram(build_sequence_diagram(ENTRY_POINT, CALL_TREE, METHOD_DEFINITIONS)) == []
+
+    def test_block_syntax_is_valid(self):
+        """loop/alt 블록 구문 테스트"""
+        code = "sequenceDiagram\n    participant A\n    loop retry\n    A->>B: call()\n    end"
+        assert validate_sequence_diagram(code) == []
+
+    def test_detect_errors(self):
+        """헤더 누락/구분자 누락/미종료 블록 검출 테스트"""
+        errors = validate_sequence_diagram("A->>B call\nNote right of B summary\nalt ok")
+        assert len(errors) == 4
+
+    def test_unknown_statement(self):
+        """알 수 없는 구문 검출 테스트"""
+        errors = validate_sequence_diagram("sequenceDiagram\n    UserService calls UserDAO")
+        assert errors == ["line 2: 알 수 없는 구문 [UserService calls UserDAO]"]
+
+
+class TestRepairSequenceDiagram:
+    """repair_sequence_diagram 함수 테스트"""
+
+    def test_repair_common_breakages(self):
+        """흔한 구문 오류 보정 테스트"""
+        broken = "```mermaid\nsequenceDiagram\nparticipant A\nparticipant A\nA->>User-Svc: find; all\nUser-Svc-->>A\nnote right of A done\nend\n```"
+        repaired, fixes = repair_sequence_diagram(broken)
+
+        assert validate_sequence_diagram(repaired) == []
+        assert repaired.splitlines() == [
+            "sequenceDiagram",
+            "    participant A",
+            "    participant User_Svc",
+            "    A->>User_Svc: find#59; all",
+            "    User_Svc-->>A: ",
+            "    Note right of A: done",
+        ]
+        assert fixes
+
+    def test_escaped_newlines(self):
+        """이스케이프된 줄바꿈 보정 테스트"""
+        repaired, _ = repair_sequence_diagram("sequenceDiagram\\n    A->>B: call()")
+        assert validate_sequence_diagram(repaired) == []
+
+    def test_unknown_statement_is_kept(self):
+        """알 수 없는 구문은 재요청 대상으로 유지 테스트"""
+        repaired, _ = repair_sequence_diagram("sequenceDiagram\n    UserService calls UserDAO")
+        assert validate_sequence_diagram(repaired)
@@ -0,0 +1,140 @@
+# tests/test_method_heuristic_utils.py
+
+"""
+method_heuristic_utils 테스트 코드
+"""
+
+from server.utils.constants import HeuristicKind
+from server.utils.method_heuristic_utils import (
+    classify_trivial_method,
+    build_heuristic_summary,
+    extract_method_body,
+    split_statements,
+    strip_comments
+)
+
+
+class TestClassifyTrivialMethod:
+    """classify_trivial_method 함수 테스트"""
+
+    def test_abstract_modifier(self):
+        """abstract 제어자 메서드 테스트"""
+        meta = {"modifiers": ["public", "abstract"], "method_text": ""}
+        kind, _ = classify_trivial_method("sg.sample.Base.run()", meta)
+        assert kind == HeuristicKind.ABSTRACT
+
+    def test_interface_declaration(self):
+        """본문 없는 인터페이스 선언 테스트"""
+        meta = {"method_text": "User selectUserById(@Param(\"id\") Long id);"}
+        kind, _ = classify_trivial_method("sg.sample.mapper.UserMapper.selectUserById(java.lang.Long)", meta)
+        assert kind == HeuristicKind.ABSTRACT
+
+    def test_empty_body(self):
+        """빈 본문 테스트"""
+        meta = {"method_text": "public void init() {\n    // nothing to do\n}"}
+        kind, _ = classify_trivial_method("sg.sample.Service.init()", meta)
+        assert kind == HeuristicKind.EMPTY_BODY
+
+    def test_delegation_with_return(self):
+        """반환값이 있는 단순 위임 테스트"""
+        meta = {"method_text": "public User findUserById(Long id) {\n    return userMapper.selectUserById(id);\n}"}
+        kind, detail = classify_trivial_method("sg.sample.dao.UserDAO.findUserById(java.lang.Long)", meta)
+        assert kind == HeuristicKind.DELEGATION
+        assert detail == {"target": "userMapper.selectUserById", "returns": True}
+
+    def test_delegation_without_return(self):
+        """반환값이 없는 단순 위임 테스트"""
+        meta = {"method_text": "public void deleteUser(Long id) { this.userMapper.deleteUser(id); }"}
+        kind, detail = classify_trivial_method("sg.sample.dao.UserDAO.deleteUser(java.lang.Long)", meta)
+        assert kind == HeuristicKind.DELEGATION
+        assert detail["target"] == "this.userMapper.deleteUser"
+        assert detail["returns"] is False
+
+    def test_delegation_with_annotation_braces(self):
+        """어노테이션 중괄호가 있는 메서드 테스트"""
+        meta = {"method_text": "@GetMapping(value = {\"/a\", \"/b\"})\npublic List<User> list() { return userService.getAllUsers(); }"}
+        kind, detail = classify_trivial_method("sg.sample.UserController.list()", meta)
+        assert kind == HeuristicKind.DELEGATION
+        assert detail["target"] == "userService.getAllUsers"
+
+    def test_nested_call_argument_is_not_trivial(self):
+        """중첩 호출 인자는 LLM 대상 테스트"""
+        meta = {"method_text": "public User get(Long id) { return userMapper.select(convert(id, 1)); }"}
+        assert classify_trivial_method("sg.sample.UserDAO.get(java.lang.Long)", meta) is None
+
+    def test_control_flow_is_not_trivial(self):
+        """제어문 포함 메서드는 LLM 대상 테스트"""
+        meta = {"method_text": "public User get(Long id) {\n if (id == null) { return null; }\n return userMapper.select(id);\n}"}
+        assert classify_trivial_method("sg.sample.UserDAO.get(java.lang.Long)", meta) is None
+
+    def test_simple_mapper_with_setters(self):
+        """setter 기반 단순 매핑 테스트"""
+        meta = {"method_text": """
+            public UserDto toDto(User user) {
+                UserDto dto = new UserDto();
+                dto.setId(user.getId());
+                dto.setName(user.getName());
+                return dto;
+            }
+        """}
+        kind, detail = classify_trivial_method("sg.sample.Mapper.toDto(sg.sample.User)", meta)
+        assert kind == HeuristicKind.SIMPLE_MAPPER
+        assert detail == {"target_type": "UserDto", "field_count": 2}
+
+    def test_simple_mapper_with_constructor(self):
+        """생성자 기반 단순 매핑 테스트"""
+        meta = {"method_text": "public UserDto toDto(User u) { return new UserDto(u.getId(), u.getName()); }"}
+        kind, detail = classify_trivial_method("sg.sample.Mapper.toDto(sg.sample.User)", meta)
+        assert kind == HeuristicKind.SIMPLE_MAPPER
+        assert detail["field_count"] == 2
+
+    def test_missing_method_text(self):
+        """메서드 본문이 없으면 판단 불가 테스트"""
+        assert classify_trivial_method("sg.sample.A.b()", {"method_text": ""}) is None
+
+
+class TestBuildHeuristicSummary:
+    """build_heuristic_summary 함수 테스트"""
+
+    def test_delegation_summary(self):
+        """위임 요약 생성 테스트"""
+        summary, description = build_heuristic_summary(
+            "sg.sample.dao.UserDAO.findUserById(java.lang.Long)",
+            {"class_name": "UserDAO", "return_type": "User"},
+            HeuristicKind.DELEGATION,
+            {"target": "userMapper.selectUserById", "returns": True}
+        )
+        assert "userMapper.selectUserById" in summary
+        assert "반환" in summary
+        assert description
+
+    def test_summary_prefers_comment(self):
+        """주석 첫 문장 포함 테스트"""
+        summary, _ = build_heuristic_summary(
+            "sg.sample.A.init()",
+            {"comment": "/**\n * 초기화 훅\n * @since 1.0\n */"},
+            HeuristicKind.EMPTY_BODY,
+            {}
+        )
+        assert summary.startswith("초기화 훅.")
+
+    def test_unknown_kind(self):
+        """알 수 없는 분류 테스트"""
+        assert build_heuristic_summary("sg.sample.A.b()", {}, "UNKNOWN", {}) == ("", "")
+
+
+class TestBodyHelpers:
+    """본문 추출 보조 함수 테스트"""
+
+    def test_extract_method_body(self):
+        """본문 추출 테스트"""
+        assert extract_method_body("void a() { b(); }", "a").strip() == "b();"
+        assert extract_method_body("void a();", "a") is None
+
+    def test_split_statements_ignores_nested_semicolons(self):
+        """문자열/괄호 내부 세미콜론 무시 테스트"""
+        assert split_statements("a(\"x;y\"); b(c(1), 2);") == ["a(\"x;y\")", "b(c(1), 2)"]
+
+    def test_strip_comments_keeps_strings(self):
+        """주석 제거 시 문자열 유지 테스트"""
+        assert strip_comments("a(\"//keep\"); // drop\n/* drop */b();") == "a(\"//keep\"); \nb();"
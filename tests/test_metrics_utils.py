@@ -0,0 +1,89 @@
+# tests/test_metrics_utils.py
+
+"""
+metrics_utils 테스트 코드
+"""
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from server.utils.constants import AgentType
+from server.utils.metrics_utils import Counter, Histogram, MetricsRegistry, AGENT_DURATION, LLM_REQUEST_DURATION, LLM_TOKENS
+from server.workflow.agents.base.base_agent import BaseAgent
+
+
+class _FakeStructuredLLM:
+    async def ainvoke(self, messages, config=None):
+        message = AIMessage(content="ok", usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150})
+        for callback in config["callbacks"]:
+            callback.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+        return {"summary": "ok"}
+
+
+class _FakeLLM:
+    deployment_name = "test-deployment"
+
+    def with_structured_output(self, schema):
+        return _FakeStructuredLLM()
+
+
+class _LLMAgent(BaseAgent):
+    async def _run_internal(self, state):
+        response = await self._call_llm_with_timeout(_FakeLLM(), dict, [])
+        return self.wrap_agent_result("response", response)
+
+
+class TestMetricsRegistry:
+    """MetricsRegistry 텍스트 포맷 테스트"""
+
+    def test_render_counter_and_histogram(self):
+        """카운터/히스토그램 Prometheus 포맷 출력 테스트"""
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("test_calls_total", "호출 수", ["name"]))
+        histogram = registry.register(Histogram("test_duration_seconds", "실행 시간", ["name"], buckets=(1.0, 5.0)))
+
+        counter.inc(name="a")
+        counter.inc(2, name="a")
+        histogram.observe(0.5, name="a")
+        histogram.observe(3.0, name="a")
+
+        text = registry.render()
+        assert "# TYPE test_calls_total counter" in text
+        assert 'test_calls_total{name="a"} 3' in text
+        assert 'test_duration_seconds_bucket{name="a",le="1"} 1' in text
+        assert 'test_duration_seconds_bucket{name="a",le="5"} 2' in text
+        assert 'test_duration_seconds_bucket{name="a",le="+Inf"} 2' in text
+        assert 'test_duration_seconds_sum{name="a"} 3.5' in text
+        assert 'test_duration_seconds_count{name="a"} 2' in text
+
+    def test_label_mismatch(self):
+        """레이블 불일치 예외 테스트"""
+        counter = Counter("test_mismatch_total", "호출 수", ["name"])
+        with pytest.raises(ValueError):
+            counter.inc(other="a")
+
+    def test_duplicate_register(self):
+        """중복 등록 예외 테스트"""
+        registry = MetricsRegistry()
+        registry.register(Counter("test_dup_total", "호출 수"))
+        with pytest.raises(ValueError):
+            registry.register(Counter("test_dup_total", "호출 수"))
+
+
+class TestAgentMetrics:
+    """BaseAgent 메트릭 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_agent_and_llm_metrics_recorded(self):
+        """에이전트 실행 시간, LLM 응답 시간 및 토큰 수 기록 테스트"""
+        agent_count = AGENT_DURATION.get_count(agent=AgentType.RAG_INDEXER, result="success")
+        llm_count = LLM_REQUEST_DURATION.get_count(deployment="test-deployment", result="success")
+        input_tokens = LLM_TOKENS.get_sum(deployment="test-deployment", direction="input")
+
+        agent = _LLMAgent(role=AgentType.RAG_INDEXER, project_id="metrics-p1")
+        state = await agent.run({"project_id": "metrics-p1"})
+
+        assert state["agent_result"]["response"] == {"summary": "ok"}
+        assert AGENT_DURATION.get_count(agent=AgentType.RAG_INDEXER, result="success") == agent_count + 1
+        assert LLM_REQUEST_DURATION.get_count(deployment="test-deployment", result="success") == llm_count + 1
+        assert LLM_TOKENS.get_sum(deployment="test-deployment", direction="input") == input_tokens + 120
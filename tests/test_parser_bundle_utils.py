@@ -0,0 +1,83 @@
+# tests/test_parser_bundle_utils.py
+
+"""
+parser_bundle_utils 테스트 코드
+"""
+
+import os
+import pytest
+from server.utils.config import settings
+from server.utils.constants import IndexInputType, ParserRecordKind
+from server.utils.file_utils import save_json
+from server.utils.parser_bundle_utils import ParserBundleWriter, get_bundle_path, iter_parser_bundle, iter_parser_files, iter_parser_records
+from server.workflow.agents.retrieval.rag_indexing_agent import RAGIndexingAgent
+
+CREATE_FQN = "com.ex.order.OrderController.create(java.lang.String)"
+
+
+def _write_parser_outputs(output_dir, bundle: bool = True) -> str:
+    output_dir = str(output_dir)
+    with ParserBundleWriter(output_dir, enabled=bundle) as writer:
+        _save_class_outputs(writer.save, output_dir)
+    save_json([CREATE_FQN], os.path.join(output_dir, settings.ALL_METHODS_FILE_NAME))
+    return output_dir
+
+
+def _save_class_outputs(save, output_dir: str) -> None:
+    save({"file_path": "com/ex/order/OrderController.java", "package_name": "com.ex.order", "call_edges": [], "method_meta_map": {CREATE_FQN: {"entry_point": True}}}, os.path.join(output_dir, "com", "ex", "order", "OrderController_call_tree.json"))
+    save({CREATE_FQN: {"comment": "주문 생성\n(관리자 전용)", "entry_point": True}}, os.path.join(output_dir, "com", "ex", "order", "OrderController_comments.json"))
+    save({CREATE_FQN: {"file_path": "com/ex/order/OrderController.java", "body": "public void create(String id) {\n    save(id);\n}"}}, os.path.join(output_dir, "com", "ex", "order", "OrderController_methods.json"))
+
+
+class TestParserBundle:
+    """파서 산출물 번들 테스트"""
+
+    def test_bundle_matches_files(self, tmp_path):
+        """저장과 함께 기록한 번들 레코드와 파일 단위 산출물 레코드 일치 테스트 (집계 파일 제외, 개행 보존)"""
+        output_dir = _write_parser_outputs(tmp_path)
+
+        bundled = list(iter_parser_bundle(get_bundle_path(output_dir)))
+        assert bundled == list(iter_parser_files(output_dir))
+        assert [record.kind for record in bundled] == [ParserRecordKind.CALL_TREE, ParserRecordKind.COMMENTS, ParserRecordKind.METHODS]
+        assert bundled[2].data[CREATE_FQN]["body"].count("\n") == 2
+
+    def test_kind_filter(self, tmp_path):
+        """요청한 종류의 레코드만 조회 테스트"""
+        output_dir = _write_parser_outputs(tmp_path)
+        records = list(iter_parser_records(output_dir, kinds=[ParserRecordKind.METHODS]))
+        assert [record.path for record in records] == ["com/ex/order/OrderController_methods.json"]
+
+    def test_empty_bundle(self, tmp_path):
+        """빈 번들 조회 테스트"""
+        with ParserBundleWriter(str(tmp_path)) as writer:
+            pass
+        assert writer.count == 0
+        assert list(iter_parser_records(str(tmp_path))) == []
+
+    def test_disabled_and_failed_writer(self, tmp_path):
+        """번들 미사용 시 파일만 저장, 저장 중 오류 시 번들 미생성 테스트"""
+        output_dir = _write_parser_outputs(tmp_path / "disabled", bundle=False)
+        assert not os.path.exists(get_bundle_path(output_dir))
+        assert len(list(iter_parser_records(output_dir))) == 3
+
+        output_dir = str(tmp_path / "failed")
+        with pytest.raises(RuntimeError):
+            with ParserBundleWriter(output_dir) as writer:
+                _save_class_outputs(writer.save, output_dir)
+                raise RuntimeError("파싱 실패")
+        assert os.listdir(output_dir) == ["com"]
+
+
+class TestRAGIndexingParserRecords:
+    """RAG 인덱싱 파서 산출물 문서 변환 테스트"""
+
+    def test_same_documents_with_bundle(self, tmp_path):
+        """번들 유무와 관계없이 동일 문서 생성 테스트"""
+        agent = RAGIndexingAgent(project_id="bundle-p1")
+        from_files = agent._create_document(project_id="bundle-p1", project_name="shop", input_type=IndexInputType.PARSER, source_data={"input_type": IndexInputType.PARSER, "output_dir": _write_parser_outputs(tmp_path / "files", bundle=False)})
+        from_bundle = agent._create_document(project_id="bundle-p1", project_name="shop", input_type=IndexInputType.PARSER, source_data={"input_type": IndexInputType.PARSER, "output_dir": _write_parser_outputs(tmp_path / "bundle")})
+
+        assert len(from_files) == 3
+        assert [doc.page_content for doc in from_bundle] == [doc.page_content for doc in from_files]
+        # document_id 끝의 uuid는 생성 시마다 다름
+        assert [doc.metadata["document_id"].rsplit("::", 1)[0] for doc in from_bundle] == [doc.metadata["document_id"].rsplit("::", 1)[0] for doc in from_files]
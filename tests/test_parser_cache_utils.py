@@ -0,0 +1,144 @@
+# tests/test_parser_cache_utils.py
+
+"""
+parser_cache_utils 테스트 코드
+"""
+
+import os
+import pytest
+from pathlib import Path
+from server.utils.config import settings
+from server.utils.constants import DirInfo
+from server.utils.file_utils import load_json, save_json
+from server.utils.parser_cache_utils import PROJECT_ROOT_TOKEN, ParserCache, build_parser_fingerprint
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+
+SOURCES = {
+    "A": "class A { void run() {} }",
+    "B": "class B { void run() { new A().run(); } }",
+    "C": "class C { void run() {} }"
+}
+
+
+def _write_sources(project, sources):
+    for name, body in sources.items():
+        path = project / "src" / "main" / "java" / "com" / "ex" / f"{name}.java"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+
+
+def _fake_parser(parsed_files: list):
+    # 소스 디렉토리의 .java 파일별 산출물 생성 (파싱 대상에 없는 클래스 호출은 미해석 callee로 기록)
+    def _run_parser_jar(source_dir, output_dir, include_method_text=True, exclude_packages="", custom_annotations="", timeout=None, use_worker=True):
+        project_dir = os.path.join(output_dir, os.path.basename(source_dir))
+        java_files = sorted(Path(source_dir).rglob("*.java"))
+        class_names = {path.stem for path in java_files}
+        all_methods = []
+        for path in java_files:
+            parsed_files.append(path.name)
+            relative_path = path.relative_to(source_dir).as_posix()
+            method_fqn = f"com.ex.{path.stem}.run()"
+            callees = [f"com.ex.{name}.run()" if name in class_names else f"{name}.run()" for name in ("A",) if f"new {name}()" in path.read_text(encoding="utf-8")]
+            out_dir = os.path.join(project_dir, "com", "ex")
+            save_json({"file_path": relative_path, "call_edges": [{"caller": method_fqn, "callee": callee} for callee in callees], "method_meta_map": {method_fqn: {}}}, os.path.join(out_dir, f"{path.stem}_call_tree.json"))
+            save_json({method_fqn: {"file_path": relative_path, "body": path.read_text(encoding="utf-8") if include_method_text else ""}}, os.path.join(out_dir, f"{path.stem}_methods.json"))
+            save_json({method_fqn: {"comment": ""}}, os.path.join(out_dir, f"{path.stem}_comments.json"))
+            all_methods.append(method_fqn)
+        save_json(all_methods, os.path.join(project_dir, settings.ALL_METHODS_FILE_NAME))
+        save_json(all_methods[:1], os.path.join(project_dir, settings.ENTRY_POINT_FILE_NAME))
+        save_json([{"method_fqn": all_methods[0], "file_path": "x"}] if all_methods else [], os.path.join(project_dir, settings.ENTRY_POINT_INFO_FILE_NAME))
+        return True
+    return _run_parser_jar
+
+
+@pytest.fixture
+def parser_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(DirInfo, "PARSER_OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(DirInfo, "PARSER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(DirInfo, "ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    monkeypatch.setattr(settings, "JAVA_PARSER_CACHE_ENABLED", True)
+    monkeypatch.setattr(ParserAgent, "_save_entry_point_to_db", lambda self, **kwargs: None)
+    parsed_files = []
+    monkeypatch.setattr(ParserAgent, "_run_parser_jar", lambda self, **kwargs: _fake_parser(parsed_files)(**kwargs))
+    return tmp_path, parsed_files
+
+
+def _analyze(project, project_id, include_method_text=True) -> str:
+    agent = ParserAgent(project_id=project_id)
+    state = {"autodiagenti_state": {"project_id": project_id, "project_name": project.name, "project_path": str(project), "filter_options": {"include_method_text": include_method_text}}}
+    agent._run_internal(state)
+    return os.path.join(DirInfo.PARSER_OUTPUT_DIR, project_id, project.name)
+
+
+class TestParserCacheFingerprint:
+    """캐시 핑거프린트 테스트"""
+
+    def test_options_change_fingerprint(self):
+        """파서 버전/분석 옵션 변경 시 핑거프린트 변경 테스트"""
+        base = build_parser_fingerprint("v1", True, "java.", None)
+        assert base == build_parser_fingerprint("v1", True, "java.", "")
+        assert base != build_parser_fingerprint("v2", True, "java.", None)
+        assert base != build_parser_fingerprint("v1", False, "java.", None)
+        assert base != build_parser_fingerprint("v1", True, "java.,jakarta.", None)
+
+
+class TestParserCacheEntries:
+    """프로젝트 간 캐시 공유 테스트"""
+
+    def test_project_root_rebased(self, tmp_path):
+        """프로젝트 루트 절대 경로는 치환값으로 저장하고 조회한 프로젝트 경로로 복원 테스트"""
+        cache = ParserCache(str(tmp_path / "cache"), fingerprint=build_parser_fingerprint("v1", True, None, None))
+        sources = {"src/main/java/com/ex/A.java": "hash-a"}
+        first, second = str(tmp_path / "p1" / "shop"), str(tmp_path / "p2" / "shop")
+        entry = {"records": [{"kind": "call_tree", "data": {"file_path": os.path.join(first, "src", "main", "java", "com", "ex", "A.java"), "note": first + "2/A.java"}}]}
+        cache.store(sources, {"src/main/java/com/ex/A.java": entry}, project_path=first)
+
+        cached_files = list((tmp_path / "cache").rglob("*.json"))
+        assert len(cached_files) == 1
+        assert load_json(str(cached_files[0]))["records"][0]["data"]["file_path"] == os.path.join(PROJECT_ROOT_TOKEN, "src", "main", "java", "com", "ex", "A.java")
+
+        data = cache.lookup(sources, project_path=second)["src/main/java/com/ex/A.java"]["records"][0]["data"]
+        assert data["file_path"] == os.path.join(second, "src", "main", "java", "com", "ex", "A.java")
+        # 같은 접두어의 다른 디렉토리 경로는 치환하지 않음
+        assert data["note"] == first + "2/A.java"
+
+
+class TestIncrementalParsing:
+    """증분 파싱 테스트"""
+
+    def test_only_changed_files_parsed(self, parser_env):
+        """변경 파일만 파싱하고 전체 산출물 구성 테스트"""
+        tmp_path, parsed_files = parser_env
+        project = tmp_path / "shop"
+        _write_sources(project, SOURCES)
+        first_dir = _analyze(project, "cache-p1")
+        assert sorted(parsed_files) == ["A.java", "B.java", "C.java"]
+
+        parsed_files.clear()
+        _write_sources(project, {"B": SOURCES["B"] + "\n// changed"})
+        second_dir = _analyze(project, "cache-p2")
+        assert parsed_files == ["B.java"]
+
+        # 캐시 결과와 변경 파일 결과로 구성한 산출물이 전체 파싱 결과와 동일 (단독 파싱된 B의 callee는 재해석)
+        assert load_json(os.path.join(second_dir, settings.ALL_METHODS_FILE_NAME)) == load_json(os.path.join(first_dir, settings.ALL_METHODS_FILE_NAME))
+        call_tree = load_json(os.path.join(second_dir, "com", "ex", "B_call_tree.json"))
+        assert call_tree["file_path"] == "src/main/java/com/ex/B.java"
+        assert call_tree["call_edges"][0]["callee"] == "com.ex.A.run()"
+        assert "changed" in load_json(os.path.join(second_dir, "com", "ex", "B_methods.json"))["com.ex.B.run()"]["body"]
+        assert os.path.isfile(os.path.join(second_dir, settings.PARSER_BUNDLE_FILE_NAME))
+        assert not os.path.exists(os.path.join(DirInfo.PARSER_OUTPUT_DIR, "cache-p2", ".incremental"))
+
+    def test_option_change_full_parse(self, parser_env):
+        """분석 옵션 변경 시 전체 파싱 테스트"""
+        tmp_path, parsed_files = parser_env
+        project = tmp_path / "shop"
+        _write_sources(project, SOURCES)
+        _analyze(project, "cache-p3")
+
+        parsed_files.clear()
+        _analyze(project, "cache-p4", include_method_text=False)
+        assert sorted(parsed_files) == ["A.java", "B.java", "C.java"]
+
+        parsed_files.clear()
+        _analyze(project, "cache-p5", include_method_text=False)
+        assert parsed_files == []
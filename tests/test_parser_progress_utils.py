@@ -0,0 +1,91 @@
+# tests/test_parser_progress_utils.py
+
+"""
+parser_progress_utils 테스트 코드
+"""
+
+import sys
+import time
+import subprocess
+import threading
+import pytest
+from server.utils.config import settings
+from server.utils.constants import PipelineStage
+from server.utils.metrics_utils import PARSER_IDLE_TIMEOUTS
+from server.utils.parser_progress_utils import ParserProgress
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+from server.workflow.state import AnalysisStatus, set_project_status_by_analysis_status, get_project_status
+
+
+def _python_command(script: str) -> list:
+    return [sys.executable, "-u", "-c", script]
+
+
+class TestParserProgress:
+    """파서 출력 집계 테스트"""
+
+    def test_feed(self):
+        """발견 파일 수, 진행 카운터, 파일 처리 로그, 오류 집계 테스트"""
+        progress = ParserProgress(total=2)
+        for line in ["Found 4 java files", "Parsing com/ex/A.java", "Parsing com/ex/B.java", "ERROR failed to parse com/ex/C.java", "0 errors"]:
+            progress.feed(line)
+        snapshot = progress.snapshot()
+        assert (snapshot["total"], snapshot["parsed"], snapshot["errors"]) == (4, 2, 1)
+        assert snapshot["eta_sec"] is not None
+
+        progress.feed("[4/4] done")
+        assert progress.snapshot()["parsed"] == 4
+
+    def test_shared_between_parsers(self):
+        """샤드별 파서 출력 합산 테스트"""
+        progress = ParserProgress()
+
+        def _feed(total):
+            progress.feed(f"Found {total} files", source=total)
+            progress.feed(f"[{total - 1}/{total}]", source=total)
+
+        threads = [threading.Thread(target=_feed, args=(total,)) for total in (3, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        snapshot = progress.snapshot()
+        assert (snapshot["total"], snapshot["parsed"]) == (8, 6)
+
+
+class TestParserLiveLog:
+    """파서 subprocess 출력 처리 테스트"""
+
+    def test_progress_in_status(self, monkeypatch):
+        """파서 출력 진행 상황을 분석 상태에 반영 테스트"""
+        monkeypatch.setattr(settings, "STATUS_PROGRESS_MIN_INTERVAL", 0)
+        set_project_status_by_analysis_status(project_id="progress-p1", status=AnalysisStatus.QUEUED)
+        agent = ParserAgent(project_id="progress-p1")
+        agent._parser_progress = ParserProgress()
+
+        agent._run_with_live_log(_python_command("import time\nprint('Found 3 java files')\nprint('[1/3] Parsing A.java')\ntime.sleep(1.5)\nprint('[2/3] Parsing B.java')"))
+        progress = get_project_status("progress-p1")["stage_progress"][PipelineStage.PARSER]
+        assert (progress["done"], progress["total"]) == (1, 3)
+        assert progress["rate_per_sec"] is not None
+
+        agent._finish_parser_progress(success=True)
+        assert get_project_status("progress-p1")["stage_progress"][PipelineStage.PARSER]["done"] == 3
+        assert agent._parser_progress is None
+
+    def test_idle_timeout(self, monkeypatch):
+        """출력 없는 상태 지속 시 파서 종료 테스트"""
+        monkeypatch.setattr(settings, "JAVA_PARSER_IDLE_TIMEOUT", 1)
+        idle_timeouts = PARSER_IDLE_TIMEOUTS.get()
+        agent = ParserAgent(project_id="progress-p2")
+
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            agent._run_with_live_log(_python_command("import time\nprint('Found 3 java files')\ntime.sleep(30)"), timeout=60)
+        assert time.monotonic() - started < 10
+        assert PARSER_IDLE_TIMEOUTS.get() == idle_timeouts + 1
+
+    def test_exit_code(self):
+        """파서 실패 종료 코드 처리 테스트"""
+        agent = ParserAgent(project_id="progress-p3")
+        with pytest.raises(subprocess.CalledProcessError):
+            agent._run_with_live_log(_python_command("import sys\nprint('ERROR boom')\nsys.exit(2)"))
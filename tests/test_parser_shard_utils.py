@@ -0,0 +1,154 @@
+# tests/test_parser_shard_utils.py
+
+"""
+parser_shard_utils 테스트 코드
+"""
+
+import os
+import threading
+from server.utils.config import settings
+from server.utils.file_utils import load_json, save_json
+from server.utils.parser_bundle_utils import get_bundle_path, iter_parser_bundle, iter_parser_files
+from server.utils.parser_shard_utils import CrossModuleResolver, merge_shard_outputs, method_signature_key, plan_parser_shards
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("")
+
+
+def _make_multi_module_project(root) -> str:
+    project = os.path.join(str(root), "shop")
+    _touch(os.path.join(project, "pom.xml"))
+    _touch(os.path.join(project, "order", "pom.xml"))
+    _touch(os.path.join(project, "order", "src", "main", "java", "com", "ex", "order", "OrderController.java"))
+    _touch(os.path.join(project, "order", "target", "generated-sources", "src", "main", "java", "Gen.java"))
+    _touch(os.path.join(project, "customer", "build.gradle"))
+    _touch(os.path.join(project, "customer", "src", "main", "java", "com", "ex", "customer", "CustomerService.java"))
+    return project
+
+
+def _write_shard_output(project_dir, all_methods, entry_points, call_tree_files):
+    save_json(all_methods, os.path.join(project_dir, settings.ALL_METHODS_FILE_NAME))
+    save_json(entry_points, os.path.join(project_dir, settings.ENTRY_POINT_FILE_NAME))
+    save_json([{"method_fqn": fqn, "file_path": "x.java"} for fqn in entry_points], os.path.join(project_dir, settings.ENTRY_POINT_INFO_FILE_NAME))
+    for name, payload in call_tree_files.items():
+        save_json(payload, os.path.join(project_dir, name))
+
+
+ORDER_CREATE = "com.ex.order.OrderController.create(java.util.Map<java.lang.String, java.lang.String>)"
+CUSTOMER_FIND = "com.ex.customer.CustomerService.find(java.lang.String)"
+
+
+def _fake_shard_outputs(shards, shard_output_dirs):
+    # order 모듈은 customer 모듈 메서드를 해석하지 못한 callee로 기록
+    for shard in shards:
+        project_dir = os.path.join(shard_output_dirs[shard.name], os.path.basename(shard.source_dir))
+        if shard.relative_path.startswith("order"):
+            _write_shard_output(project_dir, [ORDER_CREATE], [ORDER_CREATE], {
+                "OrderController_call_tree.json": {"file_path": "src/main/java/com/ex/order/OrderController.java", "call_edges": [{"caller": ORDER_CREATE, "callee": "CustomerService.find(String)"}], "method_meta_map": {ORDER_CREATE: {"entry_point": True}}}
+            })
+        else:
+            _write_shard_output(project_dir, [CUSTOMER_FIND], [], {
+                "CustomerService_call_tree.json": {"file_path": "src/main/java/com/ex/customer/CustomerService.java", "call_edges": [], "method_meta_map": {CUSTOMER_FIND: {}}}
+            })
+
+
+class TestPlanParserShards:
+    """샤드 실행 계획 테스트"""
+
+    def test_detect_module_source_roots(self, tmp_path):
+        """모듈 단위 샤드 구성 (같은 모듈의 main/test 소스 루트는 한 샤드) 테스트"""
+        project = _make_multi_module_project(tmp_path)
+        _touch(os.path.join(project, "order", "src", "test", "java", "com", "ex", "order", "OrderControllerTest.java"))
+        shards = plan_parser_shards(project)
+        assert [shard.relative_path for shard in shards] == ["customer", "order"]
+        assert shards[1].source_dir == os.path.join(project, "order")
+
+    def test_single_module_not_sharded(self, tmp_path):
+        """단일 모듈 프로젝트는 main/test 소스 루트가 있어도 전체 파싱 테스트"""
+        project = os.path.join(str(tmp_path), "app")
+        _touch(os.path.join(project, "pom.xml"))
+        _touch(os.path.join(project, "src", "main", "java", "com", "ex", "App.java"))
+        _touch(os.path.join(project, "src", "test", "java", "com", "ex", "AppTest.java"))
+        assert plan_parser_shards(project) == []
+
+    def test_nested_module_not_sharded(self, tmp_path):
+        """루트 모듈에도 소스가 있으면(모듈 디렉토리 중첩) 전체 파싱 테스트"""
+        project = _make_multi_module_project(tmp_path)
+        _touch(os.path.join(project, "src", "main", "java", "com", "ex", "Root.java"))
+        assert plan_parser_shards(project) == []
+
+    def test_sources_outside_roots(self, tmp_path):
+        """소스 루트 밖 Java 파일이 있으면 전체 파싱 테스트"""
+        project = _make_multi_module_project(tmp_path)
+        _touch(os.path.join(project, "scripts", "Tool.java"))
+        assert plan_parser_shards(project) == []
+
+
+class TestCrossModuleResolver:
+    """모듈 간 호출 재해석 테스트"""
+
+    def test_signature_key(self):
+        """제네릭 파라미터 수 계산 테스트"""
+        assert method_signature_key(ORDER_CREATE) == ("OrderController", "create", 1)
+        assert method_signature_key("com.ex.A.run()") == ("A", "run", 0)
+        assert method_signature_key("run") is None
+
+    def test_ambiguous_callee_kept(self):
+        """후보가 여러 개면 callee 유지 테스트"""
+        resolver = CrossModuleResolver(["a.Service.find(String)", "b.Service.find(Long)"])
+        assert resolver.resolve("Service.find(x)") == "Service.find(x)"
+        assert resolver.unresolved == 1
+
+
+class TestMergeShardOutputs:
+    """샤드 산출물 병합 테스트"""
+
+    def test_merge(self, tmp_path):
+        """집계 파일 병합, file_path 보정, 모듈 간 callee 재해석 테스트"""
+        shards = plan_parser_shards(_make_multi_module_project(tmp_path))
+        shard_output_dirs = {shard.name: str(tmp_path / "shards" / shard.name) for shard in shards}
+        _fake_shard_outputs(shards, shard_output_dirs)
+
+        merged_dir = str(tmp_path / "merged")
+        report = merge_shard_outputs(shards=shards, shard_output_dirs=shard_output_dirs, merged_dir=merged_dir, bundle=True)
+
+        assert report["resolved_edges"] == 1
+        assert load_json(os.path.join(merged_dir, settings.ALL_METHODS_FILE_NAME)) == [CUSTOMER_FIND, ORDER_CREATE]
+        assert load_json(os.path.join(merged_dir, settings.ENTRY_POINT_FILE_NAME)) == [ORDER_CREATE]
+
+        call_tree = load_json(os.path.join(merged_dir, "order", "OrderController_call_tree.json"))
+        assert call_tree["call_edges"][0]["callee"] == CUSTOMER_FIND
+        assert call_tree["file_path"] == os.path.join("order", "src", "main", "java", "com/ex/order/OrderController.java")
+        assert sorted(iter_parser_bundle(get_bundle_path(merged_dir)), key=lambda record: record.path) == list(iter_parser_files(merged_dir))
+
+
+class TestParserAgentShards:
+    """ParserAgent 샤드 병렬 실행 테스트"""
+
+    def test_run_parser_shards(self, tmp_path, monkeypatch):
+        """샤드별 파서 병렬 실행 후 병합 및 임시 산출물 삭제 테스트"""
+        shards = plan_parser_shards(_make_multi_module_project(tmp_path))
+        output_dir = str(tmp_path / "out")
+        barrier = threading.Barrier(len(shards), timeout=5)
+        calls = []
+
+        def _fake_run_parser_jar(source_dir, output_dir, include_method_text=True, exclude_packages="", custom_annotations="", timeout=None, use_worker=True):
+            # 모든 샤드가 동시에 실행 중이어야 통과
+            barrier.wait()
+            calls.append(use_worker)
+            shard = next(shard for shard in shards if shard.source_dir == source_dir)
+            _fake_shard_outputs([shard], {shard.name: output_dir})
+            return True
+
+        agent = ParserAgent(project_id="shard-p1")
+        monkeypatch.setattr(agent, "_run_parser_jar", _fake_run_parser_jar)
+        monkeypatch.setattr(settings, "JAVA_PARSER_SHARD_WORKERS", len(shards))
+
+        assert agent._run_parser_shards(shards=shards, output_dir=output_dir, merged_dir=os.path.join(output_dir, "shop"))
+        assert calls == [False, False]
+        assert not os.path.exists(os.path.join(output_dir, ".shards"))
+        assert load_json(os.path.join(output_dir, "shop", settings.ENTRY_POINT_FILE_NAME)) == [ORDER_CREATE]
@@ -0,0 +1,198 @@
+# tests/test_parser_worker_utils.py
+
+"""
+parser_worker_utils 테스트 코드
+"""
+
+import zipfile
+import threading
+import multiprocessing
+import pytest
+from server.utils.config import settings
+from server.utils.metrics_utils import PARSER_IDLE_TIMEOUTS, PARSER_WORKER_FALLBACKS
+from server.utils.parser_worker_utils import ParserWorker, ParserWorkerIdleTimeoutError, ParserWorkerUnavailableError, read_main_class
+from server.workflow.agents.analyze import parser_agent
+from server.workflow.agents.analyze.parser_agent import ParserAgent
+
+
+def _write_jar(path, manifest: str) -> str:
+    with zipfile.ZipFile(path, "w") as jar:
+        jar.writestr("META-INF/MANIFEST.MF", manifest)
+    return str(path)
+
+
+class _UnavailableWorker:
+    def parse(self, args, timeout, **kwargs):
+        raise ParserWorkerUnavailableError("JVM 없음")
+
+
+# 파서 main()이 표준 출력/오류(fd 1, 2)에 직접 기록하는 jpype 대체 모듈
+FAKE_JPYPE = """
+import os
+
+class _Stream:
+    def flush(self):
+        pass
+
+class _Main:
+    @staticmethod
+    def main(args):
+        os.write(1, b"Found 1 Java files\\n[1/1] Parsed A.java\\n")
+        os.write(2, ("warning: " + " ".join(args) + "\\n").encode("utf-8"))
+
+class _System:
+    out = _Stream()
+    err = _Stream()
+
+def startJVM(*args, **kwargs):
+    pass
+
+def JClass(name):
+    return _System if name == "java.lang.System" else _Main
+
+def JArray(item_type):
+    return list
+
+JString = str
+"""
+
+
+def _connected_worker(respond) -> ParserWorker:
+    # 기동된 워커 대신 파이프 반대편 스레드가 요청을 처리하는 워커
+    worker = ParserWorker(jar_path="parser.jar", jvm_options=[], start_timeout=5)
+    worker._conn, child_conn = multiprocessing.Pipe()
+    worker._ensure_started = lambda: None
+    threading.Thread(target=respond, args=(child_conn,), daemon=True).start()
+    return worker
+
+
+class TestReadMainClass:
+    """JAR 매니페스트 Main-Class 조회 테스트"""
+
+    def test_continuation_line(self, tmp_path):
+        """72바이트 초과 항목 이어쓰기 줄 처리 테스트"""
+        jar_path = _write_jar(tmp_path / "parser.jar", "Manifest-Version: 1.0\r\nMain-Class: sg.custom.parser.very.long.package.name.that.exceeds.the.manifest.li\r\n mit.ParserMain\r\n\r\n")
+        assert read_main_class(jar_path) == "sg.custom.parser.very.long.package.name.that.exceeds.the.manifest.limit.ParserMain"
+
+    def test_missing_main_class(self, tmp_path):
+        """Main-Class 누락 시 워커 사용 불가 처리 테스트"""
+        jar_path = _write_jar(tmp_path / "lib.jar", "Manifest-Version: 1.0\r\n\r\n")
+        with pytest.raises(ParserWorkerUnavailableError):
+            read_main_class(jar_path)
+
+
+class TestParserWorker:
+    """파서 상주 워커 테스트"""
+
+    def test_missing_jar_unavailable(self, tmp_path):
+        """JAR 파일 누락 시 워커 사용 불가 처리 테스트"""
+        worker = ParserWorker(jar_path=str(tmp_path / "none.jar"), jvm_options=[], start_timeout=5)
+        with pytest.raises(ParserWorkerUnavailableError):
+            worker.parse(args=["--source-dir=x"], timeout=5)
+        assert not worker.is_alive()
+        assert worker.restarts == 0
+
+    def test_jvm_start_failure_unavailable(self, tmp_path):
+        """워커 JVM 기동 실패 시 사용 불가 처리 및 상태 조회 테스트"""
+        jar_path = _write_jar(tmp_path / "parser.jar", "Manifest-Version: 1.0\r\nMain-Class: sg.missing.ParserMain\r\n\r\n")
+        worker = ParserWorker(jar_path=jar_path, jvm_options=[], start_timeout=60)
+        with pytest.raises(ParserWorkerUnavailableError):
+            worker.parse(args=["--source-dir=x"], timeout=5)
+
+        status = worker.status()
+        assert status["alive"] is False
+        assert status["requests"] == 0
+        assert status["last_error"]
+        assert worker.health_check(timeout=1) is False
+
+
+class TestParserWorkerOutput:
+    """워커 출력 전달 및 출력 없음 타임아웃 테스트"""
+
+    def test_output_forwarded_before_response(self):
+        """응답 전에 도착한 파서 출력 줄 전달 테스트"""
+        def _respond(conn):
+            conn.recv()
+            conn.send({"output": "Found 2 Java files"})
+            conn.send({"output": "[1/2] Parsed A.java"})
+            conn.send({"ok": True, "elapsed": 0.5})
+
+        lines = []
+        worker = _connected_worker(_respond)
+        assert worker.parse(args=["--source-dir=x"], timeout=5, on_output=lines.append, idle_timeout=5) == 0.5
+        assert lines == ["Found 2 Java files", "[1/2] Parsed A.java"]
+        assert worker.requests == 1
+
+    def test_idle_timeout(self):
+        """출력 없이 idle_timeout 경과 시 워커 종료 테스트"""
+        def _respond(conn):
+            conn.recv()
+            conn.send({"output": "Found 2 Java files"})
+            # 응답 없이 연결 유지 (워커 종료 시 EOF)
+            try:
+                conn.recv()
+            except EOFError:
+                pass
+
+        lines = []
+        worker = _connected_worker(_respond)
+        with pytest.raises(ParserWorkerIdleTimeoutError):
+            worker.parse(args=["--source-dir=x"], timeout=30, on_output=lines.append, idle_timeout=0.3)
+        assert lines == ["Found 2 Java files"]
+        assert "출력 없음" in worker.last_error
+        assert worker._conn is None
+
+    def test_agent_progress_and_idle_timeout(self, tmp_path, monkeypatch):
+        """워커 실행 시 진행 상황 반영 및 출력 없음 타임아웃 실패 처리 테스트"""
+        class _Worker:
+            def parse(self, args, timeout, on_output=None, idle_timeout=0):
+                on_output("[1/2] Parsed A.java")
+                raise ParserWorkerIdleTimeoutError("파서 출력 없음")
+
+        reports = []
+        monkeypatch.setattr(settings, "JAVA_PARSER_IDLE_TIMEOUT", 1)
+        monkeypatch.setattr(parser_agent, "get_parser_worker", lambda: _Worker())
+        agent = ParserAgent(project_id="worker-p2")
+        monkeypatch.setattr(agent, "_report_parser_progress", lambda progress: reports.append(progress.snapshot()["parsed"]))
+        idle_timeouts = PARSER_IDLE_TIMEOUTS.get()
+
+        assert agent._run_parser_worker(args=["--source-dir=x"], timeout=10) is False
+        assert reports[-1] == 1
+        assert PARSER_IDLE_TIMEOUTS.get() == idle_timeouts + 1
+
+
+    def test_worker_process_output(self, tmp_path, monkeypatch):
+        """워커 프로세스 표준 출력/오류를 서버 표준 출력 대신 요청 측으로 전달 테스트 (jpype 대체 모듈)"""
+        (tmp_path / "jpype.py").write_text(FAKE_JPYPE, encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        jar_path = _write_jar(tmp_path / "parser.jar", "Manifest-Version: 1.0\r\nMain-Class: sg.ParserMain\r\n\r\n")
+        worker = ParserWorker(jar_path=jar_path, jvm_options=[], start_timeout=60)
+        try:
+            lines = []
+            worker.parse(args=["--source-dir=x"], timeout=60, on_output=lines.append, idle_timeout=30)
+            assert lines == ["Found 1 Java files", "[1/1] Parsed A.java", "warning: --source-dir=x"]
+        finally:
+            worker.stop()
+
+
+class TestParserAgentFallback:
+    """워커 사용 불가 시 subprocess 실행 대체 테스트"""
+
+    def test_fallback_to_subprocess(self, tmp_path, monkeypatch):
+        """워커 사용 불가 시 java -jar 명령 실행 테스트"""
+        jar_path = _write_jar(tmp_path / "parser.jar", "Manifest-Version: 1.0\r\nMain-Class: sg.ParserMain\r\n\r\n")
+        commands = []
+        monkeypatch.setattr(settings, "JAVA_PARSER_JAR_PATH", jar_path)
+        monkeypatch.setattr(settings, "JAVA_PARSER_WORKER_ENABLED", True)
+        monkeypatch.setattr(parser_agent, "get_parser_worker", lambda: _UnavailableWorker())
+
+        agent = ParserAgent(project_id="worker-p1")
+        monkeypatch.setattr(agent, "_run_with_live_log", lambda command, timeout=None, env=None: commands.append((command, timeout)))
+        fallbacks = PARSER_WORKER_FALLBACKS.get()
+
+        assert agent._run_parser_jar(source_dir=str(tmp_path), output_dir=str(tmp_path / "out"), exclude_packages="java.")
+        command, timeout = commands[0]
+        assert command[:4] == ["java", "-Dfile.encoding=UTF-8", "-jar", jar_path]
+        assert "--exclude-packages=java." in command
+        assert timeout == settings.JAVA_PARSER_TIMEOUT
+        assert PARSER_WORKER_FALLBACKS.get() == fallbacks + 1
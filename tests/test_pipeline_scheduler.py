@@ -0,0 +1,105 @@
+# tests/test_pipeline_scheduler.py
+
+"""
+pipeline_scheduler 테스트 코드
+"""
+
+import asyncio
+import pytest
+from server.workflow.pipeline_scheduler import PipelineScheduler, PrioritySemaphore
+
+
+class TestPipelineScheduler:
+    """PipelineScheduler 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_dependency_results_passed(self):
+        """선행 작업 결과 전달 테스트"""
+        scheduler = PipelineScheduler(max_concurrent=2)
+
+        async def _method(dep_results):
+            return "analyzed"
+
+        async def _summary(dep_results):
+            return f"summary({dep_results['METHOD::a']})"
+
+        scheduler.add_task("METHOD::a", "METHOD", _method)
+        scheduler.add_task("SUMMARY::ep", "SUMMARY", _summary, deps=["METHOD::a"])
+        results = await scheduler.run()
+
+        assert results["SUMMARY::ep"] == "summary(analyzed)"
+        assert scheduler.report()["stages"]["SUMMARY"]["done"] == 1
+
+    @pytest.mark.asyncio
+    async def test_downstream_starts_before_all_methods_done(self):
+        """entry point 단위로 후속 단계가 먼저 시작되는지 테스트 (전역 배리어 없음)"""
+        scheduler = PipelineScheduler(max_concurrent=2)
+        order = []
+
+        def _factory(name, delay):
+            async def _run(dep_results):
+                await asyncio.sleep(delay)
+                order.append(name)
+                return name
+            return _run
+
+        scheduler.add_task("METHOD::fast", "METHOD", _factory("METHOD::fast", 0.01))
+        scheduler.add_task("METHOD::slow", "METHOD", _factory("METHOD::slow", 0.2))
+        scheduler.add_task("SUMMARY::ep1", "SUMMARY", _factory("SUMMARY::ep1", 0.01), deps=["METHOD::fast"])
+        await scheduler.run()
+
+        assert order.index("SUMMARY::ep1") < order.index("METHOD::slow")
+
+    @pytest.mark.asyncio
+    async def test_failed_task_returns_none(self):
+        """실패 작업 결과 None 및 후속 작업 진행 테스트"""
+        scheduler = PipelineScheduler(max_concurrent=1)
+
+        async def _fail(dep_results):
+            raise RuntimeError("boom")
+
+        async def _next(dep_results):
+            return dep_results["A"] is None
+
+        scheduler.add_task("A", "METHOD", _fail)
+        scheduler.add_task("B", "SUMMARY", _next, deps=["A", "UNKNOWN"])
+        results = await scheduler.run()
+
+        assert results == {"A": None, "B": True}
+        assert scheduler.stats["METHOD"].failed == 1
+
+    @pytest.mark.asyncio
+    async def test_cycle_detected(self):
+        """순환 의존성 검출 테스트"""
+        scheduler = PipelineScheduler(max_concurrent=1)
+
+        async def _noop(dep_results):
+            return None
+
+        scheduler.add_task("A", "METHOD", _noop, deps=["B"])
+        scheduler.add_task("B", "METHOD", _noop, deps=["A"])
+        with pytest.raises(ValueError):
+            await scheduler.run()
+
+
+class TestPrioritySemaphore:
+    """PrioritySemaphore 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_lower_priority_value_wakes_first(self):
+        """우선순위 값이 작은 대기자부터 슬롯 획득 테스트"""
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+        order = []
+
+        async def _wait(name, priority):
+            async with semaphore.slot(priority):
+                order.append(name)
+
+        waiters = [asyncio.create_task(_wait("method", 2)), asyncio.create_task(_wait("diagram", 0))]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*waiters)
+
+        assert order == ["diagram", "method"]
+        assert semaphore.available == 1
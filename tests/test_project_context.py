@@ -0,0 +1,99 @@
+# tests/test_project_context.py
+
+"""
+project_context 테스트 코드
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+from langchain.schema import Document
+from server.utils.constants import RagSourceType
+from server.workflow.project_context import ProjectArtifactContext, get_project_context, invalidate_project_documents, release_project_context
+
+
+def _vectorstore(docs):
+    return SimpleNamespace(docstore=SimpleNamespace(_dict={str(idx): doc for idx, doc in enumerate(docs)}))
+
+
+def _docs():
+    return [
+        Document(page_content="parser", metadata={
+            "source_type": RagSourceType.PARSER,
+            "project_name": "demo",
+            "call_edges": [
+                {"caller": "A.a()", "callee": "B.b()"},
+                {"caller": "A.a()", "callee": "C.c()"},
+                {"caller": "B.b()", "callee": "C.c()"}
+            ],
+            "method_meta_map": {"A.a()": {"class_name": "A"}}
+        }),
+        Document(page_content="code", metadata={
+            "source_type": RagSourceType.CODE,
+            "methods": {"B.b()": {"class_name": "B"}}
+        }),
+        Document(page_content="tree", metadata={
+            "source_type": RagSourceType.CALLTREE,
+            "entry_point": "A.a()",
+            "call_sequence": ["A.a()", "B.b()", "C.c()"]
+        }),
+        Document(page_content="analysis", metadata={
+            "source_type": RagSourceType.CODE_ANALYSIS,
+            "method_fqn": "B.b()",
+            "summary": "B 처리",
+            "class_name": "B",
+            "return_type": "String"
+        })
+    ]
+
+
+class TestProjectArtifactContext:
+    """ProjectArtifactContext 클래스 테스트"""
+
+    def test_parser_files_loaded_once(self, tmp_path):
+        """파서 산출물 1회 로드 테스트"""
+        (tmp_path / "entry_point_fqns.json").write_text(json.dumps(["A.a()"]), encoding="utf-8")
+        context = ProjectArtifactContext(project_id="p1", project_name="demo", output_dir=str(tmp_path))
+
+        with patch("server.workflow.project_context.load_json", return_value=["A.a()"]) as mock_load:
+            assert context.entry_points == ["A.a()"]
+            assert context.entry_points == ["A.a()"]
+        assert mock_load.call_count == 1
+
+    def test_indexes_built_from_single_load(self):
+        """벡터스토어 1회 로드 후 인덱스 조인 테스트"""
+        context = ProjectArtifactContext(project_id="p1", project_name="demo", output_dir="/tmp")
+
+        with patch("server.workflow.project_context.load_faiss_vector_store", return_value=_vectorstore(_docs())) as mock_load:
+            assert context.callees_of("A.a()") == ["B.b()", "C.c()"]
+            assert context.caller_set == {"A.a()", "B.b()"}
+            assert context.code_methods == [{"class_name": "B", "method_fqn": "B.b()"}]
+            assert context.call_tree_doc("A.a()").metadata["call_sequence"] == ["A.a()", "B.b()", "C.c()"]
+            assert context.call_tree_doc("X.x()") is None
+            assert list(context.method_summary_map(["A.a()", "B.b()"])) == ["B.b()"]
+            assert context.method_analysis("B.b()")["summary"] == "B 처리"
+        assert mock_load.call_count == 1
+
+    def test_call_tree_doc_returns_copy(self):
+        """CALLTREE 문서 복사본 반환 테스트"""
+        context = ProjectArtifactContext(project_id="p1", project_name="demo", output_dir="/tmp")
+
+        with patch("server.workflow.project_context.load_faiss_vector_store", return_value=_vectorstore(_docs())):
+            context.call_tree_doc("A.a()").metadata["summary_title"] = "변경"
+            assert "summary_title" not in context.call_tree_doc("A.a()").metadata
+
+    def test_invalidate_reloads_documents(self):
+        """문서 캐시 초기화 후 재로드 테스트"""
+        release_project_context("p2")
+        context = get_project_context(project_id="p2", project_name="demo")
+
+        with patch("server.workflow.project_context.load_faiss_vector_store", return_value=_vectorstore(_docs())) as mock_load:
+            context.documents(RagSourceType.CODE)
+            invalidate_project_documents("p2")
+            context.documents(RagSourceType.CODE)
+        assert mock_load.call_count == 2
+        assert get_project_context(project_id="p2", project_name="demo") is context
+
+        release_project_context("p2")
+        assert get_project_context(project_id="p2", project_name="demo") is not context
+        release_project_context("p2")
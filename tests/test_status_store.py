@@ -0,0 +1,87 @@
+# tests/test_status_store.py
+
+"""
+status_store 테스트 코드
+"""
+
+import json
+import pytest
+from server.utils.constants import PipelineStage
+from server.workflow.status_store import AnalysisStatusStore, estimate_eta_sec
+from server.workflow.state import AnalysisStatus, set_project_status_by_analysis_status, set_project_stage_progress, get_project_status
+
+
+class _ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+class TestAnalysisStatusStore:
+    """AnalysisStatusStore 클래스 테스트"""
+
+    def test_status_shared_across_connections(self, tmp_path):
+        """다른 연결(워커)에서 상태 조회 테스트"""
+        db_path = str(tmp_path / "status.db")
+        AnalysisStatusStore(db_path).set_status(project_id="p1", status="parsing_started", step=3, total_steps=13, message="파싱중")
+
+        status = AnalysisStatusStore(db_path).get_status("p1")
+        assert status["status"] == "parsing_started"
+        assert status["step"] == 3
+        assert status["message"] == "파싱중"
+
+    def test_version_increments_and_progress_reset(self, tmp_path):
+        """변경 version 증가 및 진행 건수 초기화 테스트"""
+        store = AnalysisStatusStore(str(tmp_path / "status.db"))
+        store.set_status(project_id="p1", status="queued", step=0, total_steps=13, message="")
+        store.set_stage_progress(project_id="p1", stage=PipelineStage.METHOD, done=1, total=4)
+        version = store.get_version("p1")
+
+        store.set_status(project_id="p1", status="code_analysis_started", step=7, total_steps=13, message="")
+        assert store.get_version("p1") == version + 1
+        assert PipelineStage.METHOD in store.get_status("p1")["stage_progress"]
+
+        store.set_status(project_id="p1", status="queued", step=0, total_steps=13, message="", reset_progress=True)
+        assert store.get_status("p1")["stage_progress"] == {}
+
+    def test_progress_without_status_ignored(self, tmp_path):
+        """상태 미등록 프로젝트 진행 건수 무시 테스트"""
+        store = AnalysisStatusStore(str(tmp_path / "status.db"))
+        store.set_stage_progress(project_id="unknown", stage=PipelineStage.METHOD, done=1, total=2)
+        assert store.get_status("unknown") is None
+
+
+class TestEstimateEtaSec:
+    """estimate_eta_sec 함수 테스트"""
+
+    def test_eta(self):
+        """처리 속도 기준 잔여 시간 테스트"""
+        assert estimate_eta_sec(started_at=100.0, now=110.0, done=5, total=10) == 10.0
+        assert estimate_eta_sec(started_at=100.0, now=110.0, done=0, total=10) is None
+        assert estimate_eta_sec(started_at=100.0, now=110.0, done=10, total=10) == 0.0
+
+
+class TestProjectStatus:
+    """state 모듈 상태 함수 테스트"""
+
+    def test_stage_progress_in_status(self):
+        """단계별 진행 건수 조회 테스트"""
+        set_project_status_by_analysis_status(project_id="status-p1", status=AnalysisStatus.QUEUED)
+        set_project_stage_progress(project_id="status-p1", stage=PipelineStage.DIAGRAM, done=0, total=3)
+        set_project_stage_progress(project_id="status-p1", stage=PipelineStage.DIAGRAM, done=3, total=3)
+
+        status = get_project_status("status-p1")
+        assert status["status"] == "queued"
+        assert status["stage_progress"][PipelineStage.DIAGRAM]["done"] == 3
+        assert status["eta_sec"] is None
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_on_terminal_status(self):
+        """SSE 종료 상태 전송 후 종료 테스트"""
+        from server.routers.analysis import _status_events
+
+        set_project_status_by_analysis_status(project_id="status-p2", status=AnalysisStatus.DONE)
+        events = [event async for event in _status_events(project_id="status-p2", request=_ConnectedRequest())]
+
+        assert len(events) == 1
+        assert events[0].startswith("event: status\ndata: ")
+        assert json.loads(events[0].split("data: ", 1)[1])["status"] == "done"